@@ -30,6 +30,7 @@
 #
 #------------------------------------------------------------------------
 import time
+from collections import deque
 
 #------------------------------------------------------------------------
 #
@@ -40,8 +41,8 @@ from gramps.gui.plug.tool import Tool
 from gramps.gui.plug import MenuToolOptions, PluginWindows
 from gramps.gen.plug.menu import BooleanOption, NumberOption, StringOption, \
                          FilterOption, PersonOption, EnumeratedListOption
-from gramps.gen.lib import (Date, Event, EventType, EventRef, Source,
-                            Citation, Note, NoteType)
+from gramps.gen.lib import (Date, Event, EventType, EventRef, EventRoleType,
+                            Source, Citation, Note, NoteType)
 from gramps.gen.db import DbTxn
 from gramps.gen.config import config
 from gramps.gen.display.name import displayer as name_displayer
@@ -50,7 +51,6 @@ from gramps.gen.simple import make_basic_stylesheet, SimpleAccess, SimpleDoc
 from gramps.gui.plug.quick import QuickTable, TextBufDoc
 from gramps.gui.dialog import QuestionDialog
 from gramps.gen.utils.id import create_id
-from gramps.gen.utils.alive import probably_alive_range
 from gramps.gen.datehandler import displayer as date_displayer
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 try:
@@ -59,6 +59,183 @@ except ValueError:
     _trans = glocale.translation
 _ = _trans.gettext
 
+#------------------------------------------------------------------------
+#
+# Date estimation engine
+#
+#------------------------------------------------------------------------
+class DateEstimator(object):
+    """
+    Estimate the birth and death years of all the people of a database at
+    once.
+
+    The events, people and families are read once. The birth years are
+    then propagated across the family graph, breadth first from the people
+    having a birth date: the first step gives an estimate to their
+    parents, children and siblings, the next step to the relatives of
+    these, and so on up to MAX_STEPS steps. An estimate is never replaced
+    by one found in a later step, so that the closest relatives win.
+    """
+    #: Maximum number of relations between a person and the date used
+    MAX_STEPS = 5
+
+    BIRTH_TYPES = (EventType.BIRTH, EventType.BAPTISM, EventType.CHRISTEN)
+    DEATH_TYPES = (EventType.DEATH, EventType.BURIAL, EventType.CREMATION)
+
+    def __init__(self, db, max_sib_age_diff, max_age_prob_alive,
+                 avg_generation_gap):
+        self.db = db
+        self.max_age = max_age_prob_alive
+        # Relation of the relative whose date is used ->
+        # (birth year offset, death year offset, explanations for a
+        # known and an estimated date of the relative)
+        self.relations = {
+            'parent': (avg_generation_gap,
+                       avg_generation_gap + max_age_prob_alive,
+                       _("ancestor birth date"),
+                       _("ancestor estimated birth date")),
+            'child': (-avg_generation_gap,
+                      -avg_generation_gap + max_age_prob_alive,
+                      _("descendant birth date"),
+                      _("descendant estimated birth date")),
+            'sibling': (-max_sib_age_diff,
+                        max_sib_age_diff + max_age_prob_alive,
+                        _("sibling birth date"),
+                        _("sibling estimated birth date")),
+            }
+        # Person handle -> (birth year, death year, explanation,
+        #                   other person handle)
+        self.estimates = {}
+
+    def read(self, step=None):
+        """
+        Read the database and estimate the dates. step is called after
+        each object read.
+        """
+        # Event handle -> (is a birth event, year) of the dated events
+        # giving a birth or a death
+        event_years = {}
+        for event in self.db.iter_events():
+            year = event.get_date_object().get_year()
+            if year:
+                if event.get_type() in self.BIRTH_TYPES:
+                    event_years[event.handle] = (True, year)
+                elif event.get_type() in self.DEATH_TYPES:
+                    event_years[event.handle] = (False, year)
+            if step:
+                step()
+
+        births = {}
+        deaths = {}
+        fallback = set()
+        for person in self.db.iter_people():
+            birth, death = self._get_years(person, event_years)
+            handle = person.handle
+            if birth:
+                births[handle] = birth[0]
+                if birth[1]:
+                    fallback.add(handle)
+            if death:
+                deaths[handle] = death[0]
+            if step:
+                step()
+        del event_years
+
+        # Person handle -> list of (relative handle, relation of the
+        # relative)
+        relatives = {}
+        for family in self.db.iter_families():
+            parents = [handle for handle in (family.get_father_handle(),
+                                             family.get_mother_handle())
+                       if handle]
+            children = [child_ref.ref
+                        for child_ref in family.get_child_ref_list()]
+            for child in children:
+                links = relatives.setdefault(child, [])
+                links.extend((parent, 'parent') for parent in parents)
+                links.extend((sibling, 'sibling') for sibling in children
+                             if sibling != child)
+            for parent in parents:
+                relatives.setdefault(parent, []).extend(
+                    (child, 'child') for child in children)
+            if step:
+                step()
+
+        self._propagate(births, deaths, fallback, relatives)
+
+    def _get_years(self, person, event_years):
+        """
+        Get the birth and death of a person as (year, is a fallback) or
+        None, from the birth and death events or else from the baptism,
+        burial, etc.
+        """
+        retval = [None, None]
+        for (index, event_ref) in ((0, person.get_birth_ref()),
+                                   (1, person.get_death_ref())):
+            if event_ref and event_ref.ref in event_years:
+                retval[index] = (event_years[event_ref.ref][1], False)
+        for event_ref in person.get_event_ref_list():
+            if event_ref.get_role() != EventRoleType.PRIMARY:
+                continue
+            event = event_years.get(event_ref.ref)
+            if event:
+                index = 0 if event[0] else 1
+                if retval[index] is None:
+                    retval[index] = (event[1], True)
+        return retval
+
+    def _propagate(self, births, deaths, fallback, relatives):
+        estimates = self.estimates
+        queue = deque()
+        for (handle, year) in births.items():
+            if handle in fallback:
+                explain = _("birth-related date")
+            else:
+                explain = _("birth date")
+            estimates[handle] = (year, deaths.get(handle, year + self.max_age),
+                                 explain, None)
+            queue.append((handle, 0))
+        # The people with a death date only get an estimate from it, but do
+        # not give estimates to their relatives
+        for (handle, year) in deaths.items():
+            if handle not in estimates:
+                estimates[handle] = (year - self.max_age, year,
+                                     _("death date"), None)
+        while queue:
+            handle, steps = queue.popleft()
+            if steps >= self.MAX_STEPS:
+                continue
+            year = estimates[handle][0]
+            known = handle in births
+            for (relative, relation) in relatives.get(handle, ()):
+                if relative in estimates:
+                    continue
+                birth_offset, death_offset, explain, explain_estimated = \
+                    self.relations[relation]
+                estimates[relative] = (year + birth_offset,
+                                       year + death_offset,
+                                       explain if known else explain_estimated,
+                                       handle)
+                queue.append((relative, steps + 1))
+
+    def estimate(self, handle):
+        """
+        Get the estimates of a person, as (birth date, death date,
+        explanation, other person handle), the dates being None if unknown.
+        """
+        if handle not in self.estimates:
+            return (None, None, None, None)
+        birth, death, explain, other = self.estimates[handle]
+        return (self._make_date(birth), self._make_date(death), explain, other)
+
+    @staticmethod
+    def _make_date(year):
+        if year <= 0:
+            return None
+        date = Date()
+        date.set_yr_mon_day(year, 0, 0)
+        return date
+
 #------------------------------------------------------------------------
 #
 # Tool Classes
@@ -165,6 +342,7 @@ class CalcEstDateOptions(MenuToolOptions):
 class CalcToolManagedWindow(PluginWindows.ToolManagedWindowBatch):
 
     def __init__(self, *args, **kwargs):
+        self.source_index = None # source title -> source handles
         PluginWindows.ToolManagedWindowBatch.__init__(self, *args, **kwargs)
         if self.fail: return
         self.help_page = self.add_page(_("Help"))
@@ -222,6 +400,7 @@ class CalcToolManagedWindow(PluginWindows.ToolManagedWindowBatch):
         current_date = Date()
         current_date.set_yr_mon_day(*time.localtime(time.time())[0:3])
         self.action = {}
+        self.source_index = None
         widget = self.add_results_frame(_("Select"))
         document = TextBufDoc(make_basic_stylesheet(), None)
         document.dbstate = self.dbstate
@@ -253,6 +432,18 @@ class CalcToolManagedWindow(PluginWindows.ToolManagedWindowBatch):
             with DbTxn("", self.db, batch=True) as self.trans:
                 self.db.disable_signals()
                 self.results_write(_("Removing old estimations... "))
+                # The estimated events are the events citing the source
+                sources = self.find_sources(source_text)
+                citations = set()
+                events = set()
+                for source in sources:
+                    for (obj_type, citation_handle) in \
+                            self.db.find_backlink_handles(source.handle,
+                                                          ['Citation']):
+                        citations.add(citation_handle)
+                        events.update(event_handle for (obj_type, event_handle)
+                                      in self.db.find_backlink_handles(
+                                          citation_handle, ['Event']))
                 self.progress.set_pass((_("Removing '%s'...") % source_text), 
                                        num_people)
                 for person_handle in people:
@@ -260,59 +451,35 @@ class CalcToolManagedWindow(PluginWindows.ToolManagedWindowBatch):
                     pupdate = 0
                     person = self.db.get_person_from_handle(person_handle)
                     birth_ref = person.get_birth_ref()
-                    if birth_ref:
-                        birth = self.db.get_event_from_handle(birth_ref.ref)
-                        for citation_handle in birth.get_citation_list():
-                            citation = self.db.get_citation_from_handle(citation_handle)
-                            source_handle = citation.get_reference_handle()
-                            #print "birth handle:", source_handle
-                            source = self.db.get_source_from_handle(source_handle)
-                            if source:
-                                #print "birth source:", source, source.get_title()
-                                if source.get_title() == source_text:
-                                    person.set_birth_ref(None)
-                                    person.remove_handle_references('Event',[birth_ref.ref])
-                                    # remove note
-                                    note_list = birth.get_referenced_note_handles()
-                                    birth.remove_handle_references('Note', 
-                                      [note_handle for (obj_type, note_handle) in note_list])
-                                    for (obj_type, note_handle) in note_list:
-                                        self.db.remove_note(note_handle, self.trans)
-                                    self.db.remove_event(birth_ref.ref, self.trans)
-                                    self.db.commit_source(source, self.trans)
-                                    pupdate = 1
-                                    break
+                    if birth_ref and birth_ref.ref in events:
+                        person.set_birth_ref(None)
+                        self.remove_event(person, birth_ref.ref, citations)
+                        pupdate = 1
                     death_ref = person.get_death_ref()
-                    if death_ref:
-                        death = self.db.get_event_from_handle(death_ref.ref)
-                        for citation_handle in death.get_citation_list():
-                            citation = self.db.get_citation_from_handle(citation_handle)
-                            source_handle = citation.get_reference_handle()
-                            #print "death handle:", source_handle
-                            source = self.db.get_source_from_handle(source_handle)
-                            if source:
-                                #print "death source:", source, source.get_title()
-                                if source.get_title() == source_text:
-                                    person.set_death_ref(None)
-                                    person.remove_handle_references('Event',[death_ref.ref])
-                                    # remove note
-                                    note_list = death.get_referenced_note_handles()
-                                    birth.remove_handle_references('Note', 
-                                      [note_handle for (obj_type, note_handle) in note_list])
-                                    for (obj_type, note_handle) in note_list:
-                                        self.db.remove_note(note_handle, self.trans)
-                                    self.db.remove_event(death_ref.ref, self.trans)
-                                    self.db.commit_source(source, self.trans)
-                                    pupdate = 1
-                                    break
+                    if death_ref and death_ref.ref in events:
+                        person.set_death_ref(None)
+                        self.remove_event(person, death_ref.ref, citations)
+                        pupdate = 1
                     if pupdate == 1:
                         self.db.commit_person(person, self.trans)
-                if source:
+                for source in sources:
                     self.db.remove_source(source.handle, self.trans)
+                self.source_index = None
                 self.results_write(_("done!\n"))
                 self.db.enable_signals()
                 self.db.request_rebuild()
         if add_birth or add_death:
+            self.results_write(_("Estimating dates... "))
+            self.progress.set_pass(_('Estimating dates...'),
+                                   self.db.get_number_of_events() +
+                                   num_people +
+                                   self.db.get_number_of_families())
+            self.estimator = DateEstimator(self.db,
+                                           self.MAX_SIB_AGE_DIFF,
+                                           self.MAX_AGE_PROB_ALIVE,
+                                           self.AVG_GENERATION_GAP)
+            self.estimator.read(self.progress.step)
+            self.results_write(_("done!\n"))
             self.results_write(_("Selecting... \n\n"))
             self.progress.set_pass(_('Selecting...'), 
                                    num_people)
@@ -424,6 +591,7 @@ class CalcToolManagedWindow(PluginWindows.ToolManagedWindowBatch):
         # Do not add birth or death event if one exists, no matter what
         if self.table.treeview.get_model() is None:
             return
+        self.source_index = None
         with DbTxn("", self.db, batch=True) as self.trans:
             self.pre_run()
             source_text = self.options.handler.options_dict['source_text']
@@ -505,17 +673,45 @@ class CalcToolManagedWindow(PluginWindows.ToolManagedWindowBatch):
             else:
                 return Date.MOD_BEFORE
 
+    def find_sources(self, source_text):
+        """
+        Get the sources having a title. The index of the source titles is
+        built at the first call of each run.
+        """
+        if self.source_index is None:
+            self.source_index = {}
+            for source in self.db.iter_sources():
+                self.source_index.setdefault(source.get_title(),
+                                             []).append(source.handle)
+        sources = [self.db.get_source_from_handle(source_handle)
+                   for source_handle in self.source_index.get(source_text, [])]
+        return [source for source in sources if source]
+
     def get_or_create_source(self, source_text):
-        source_list = self.db.get_source_handles()
-        for source_handle in source_list:
-            source = self.db.get_source_from_handle(source_handle)
-            if source.get_title() == source_text:
-                return source
+        sources = self.find_sources(source_text)
+        if sources:
+            return sources[0]
         source = Source()
         source.set_title(source_text)
         self.db.add_source(source, self.trans)
+        self.source_index.setdefault(source_text, []).append(source.handle)
         return source
 
+    def remove_event(self, person, event_handle, citations):
+        """
+        Remove an estimated event of a person, with its notes and its
+        citations of the estimates source.
+        """
+        person.remove_handle_references('Event', [event_handle])
+        event = self.db.get_event_from_handle(event_handle)
+        if event:
+            for (obj_type, note_handle) in event.get_referenced_note_handles():
+                self.db.remove_note(note_handle, self.trans)
+            for citation_handle in event.get_citation_list():
+                if citation_handle in citations:
+                    self.db.remove_citation(citation_handle, self.trans)
+        self.db.remove_event(event_handle, self.trans)
+
     def create_event(self, description=_("Estimated date"), 
                      type=None, date=None, source=None, 
                      note_text="", modifier=None):
@@ -540,12 +736,11 @@ class CalcToolManagedWindow(PluginWindows.ToolManagedWindowBatch):
             citation.set_reference_handle(source.get_handle())
             self.db.add_citation(citation, self.trans)
             event.add_citation(citation.get_handle())
-            self.db.commit_source(source, self.trans)
         self.db.add_event(event, self.trans)
         return event
 
     def calc_estimates(self, person):
-        return probably_alive_range(person, self.db,
-                         self.MAX_SIB_AGE_DIFF, 
-                         self.MAX_AGE_PROB_ALIVE, 
-                         self.AVG_GENERATION_GAP)
+        birth, death, explain, other = self.estimator.estimate(person.handle)
+        if other:
+            other = self.db.get_person_from_handle(other)
+        return (birth, death, explain, other)
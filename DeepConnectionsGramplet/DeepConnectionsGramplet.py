@@ -26,6 +26,8 @@
 # Python modules
 #
 #------------------------------------------------------------------------
+from collections import defaultdict, deque
+
 from gi.repository import Gtk
 
 #------------------------------------------------------------------------
@@ -44,6 +46,315 @@ except ValueError:
     _trans = glocale.translation
 _ = _trans.gettext
 
+#------------------------------------------------------------------------
+#
+# Kinship index
+#
+#------------------------------------------------------------------------
+class KinshipIndex(object):
+    """
+    In-memory index of the links between the people of a database:
+    family links (parents, children, siblings, spouses), associations and
+    people mentioned in the notes of people and families.
+
+    Only the handles are kept, so that the links of a person are found
+    without reading the database. The index is built once, then kept up
+    to date with the database signals (see update_* and remove_*).
+    """
+    def __init__(self, db):
+        self.db = db
+        self.built = False
+        # person handle -> (families, parent families,
+        #                   associations as (handle, relation), notes)
+        self.persons = {}
+        # family handle -> (father, mother, children, notes)
+        self.families = {}
+        # note handle -> people mentioned in the note
+        self.note_links = {}
+        # Reverse links, for the search from the end of a path
+        self.assoc_rev = defaultdict(set)
+        self.mention_rev = defaultdict(set)
+        self.note_owners = defaultdict(set)
+
+    def build(self, step=1000):
+        """
+        Build the index. This is a generator, yielding every step objects.
+        """
+        for count, person in enumerate(self.db.iter_people()):
+            self._set_person(person)
+            if count % step == 0:
+                yield True
+        for count, family in enumerate(self.db.iter_families()):
+            self._set_family(family)
+            if count % step == 0:
+                yield True
+        for count, note in enumerate(self.db.iter_notes()):
+            self._set_note(note)
+            if count % step == 0:
+                yield True
+        self.built = True
+
+    def update_persons(self, handles):
+        for handle in handles:
+            person = self.db.get_person_from_handle(handle)
+            if person:
+                self._set_person(person)
+            else:
+                self._unset_person(handle)
+
+    def remove_persons(self, handles):
+        for handle in handles:
+            self._unset_person(handle)
+
+    def update_families(self, handles):
+        for handle in handles:
+            family = self.db.get_family_from_handle(handle)
+            if family:
+                self._set_family(family)
+            else:
+                self._unset_family(handle)
+
+    def remove_families(self, handles):
+        for handle in handles:
+            self._unset_family(handle)
+
+    def update_notes(self, handles):
+        for handle in handles:
+            note = self.db.get_note_from_handle(handle)
+            if note:
+                self._set_note(note)
+            else:
+                self._unset_note(handle)
+
+    def remove_notes(self, handles):
+        for handle in handles:
+            self._unset_note(handle)
+
+    def _set_person(self, person):
+        handle = person.handle
+        self._unset_person(handle)
+        entry = (tuple(person.get_family_handle_list()),
+                 tuple(person.get_parent_family_handle_list()),
+                 tuple((assoc.get_reference_handle(), assoc.get_relation())
+                       for assoc in person.get_person_ref_list()),
+                 tuple(person.get_note_list()))
+        self.persons[handle] = entry
+        for assoc in entry[2]:
+            self.assoc_rev[assoc[0]].add((handle, assoc[1]))
+        for note_handle in entry[3]:
+            self.note_owners[note_handle].add(("Person", handle))
+
+    def _unset_person(self, handle):
+        entry = self.persons.pop(handle, None)
+        if entry is None:
+            return
+        for assoc in entry[2]:
+            self._discard(self.assoc_rev, assoc[0], (handle, assoc[1]))
+        for note_handle in entry[3]:
+            self._discard(self.note_owners, note_handle, ("Person", handle))
+
+    def _set_family(self, family):
+        handle = family.handle
+        self._unset_family(handle)
+        entry = (family.get_father_handle(),
+                 family.get_mother_handle(),
+                 tuple(child_ref.ref for child_ref in family.get_child_ref_list()),
+                 tuple(family.get_note_list()))
+        self.families[handle] = entry
+        for note_handle in entry[3]:
+            self.note_owners[note_handle].add(("Family", handle))
+
+    def _unset_family(self, handle):
+        entry = self.families.pop(handle, None)
+        if entry is None:
+            return
+        for note_handle in entry[3]:
+            self._discard(self.note_owners, note_handle, ("Family", handle))
+
+    def _set_note(self, note):
+        handle = note.handle
+        self._unset_note(handle)
+        mentioned = tuple(link[3] for link in note.get_links()
+                          if link[0] == "gramps" and link[1] == "Person"
+                          and link[2] == "handle")
+        if mentioned:
+            self.note_links[handle] = mentioned
+            for person_handle in mentioned:
+                self.mention_rev[person_handle].add(handle)
+
+    def _unset_note(self, handle):
+        for person_handle in self.note_links.pop(handle, ()):
+            self._discard(self.mention_rev, person_handle, handle)
+
+    @staticmethod
+    def _discard(index, key, value):
+        values = index.get(key)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del index[key]
+
+    def _mentions(self, note_list, handle):
+        return [(mentioned, (_("mentioned in note"), handle))
+                for note_handle in note_list
+                for mentioned in self.note_links.get(note_handle, ())]
+
+    def neighbours(self, handle):
+        """
+        Get the people linked to a person, as a list of
+        (person handle, step), step being (relation, handle[, parents]).
+        """
+        entry = self.persons.get(handle)
+        if entry is None:
+            return []
+        families, parent_families, assocs, notes = entry
+        retval = []
+        for family_handle in families:
+            family = self.families.get(family_handle)
+            if family:
+                husband, wife, children, family_notes = family
+                retval.extend((child, (_("child"), handle, husband, wife))
+                              for child in children)
+                if husband and husband != handle:
+                    retval.append((husband, (_("husband"), handle)))
+                if wife and wife != handle:
+                    retval.append((wife, (_("wife"), handle)))
+                retval.extend(self._mentions(family_notes, handle))
+        for family_handle in parent_families:
+            family = self.families.get(family_handle)
+            if family:
+                husband, wife, children, family_notes = family
+                retval.extend((child, (_("sibling"), handle, husband, wife))
+                              for child in children if child != handle)
+                if husband and husband != handle:
+                    retval.append((husband, (_("father"), handle, wife)))
+                if wife and wife != handle:
+                    retval.append((wife, (_("mother"), handle, husband)))
+                retval.extend(self._mentions(family_notes, handle))
+        for assoc_handle, relation in assocs:
+            retval.append((assoc_handle,
+                           (_("%s (association)") % relation, handle)))
+        retval.extend(self._mentions(notes, handle))
+        return retval
+
+    def predecessors(self, handle):
+        """
+        Get the people a person is linked from: the reverse of neighbours,
+        with the steps as given by neighbours for these people.
+        """
+        entry = self.persons.get(handle)
+        if entry is None:
+            return []
+        families, parent_families = entry[0], entry[1]
+        retval = []
+        for family_handle in parent_families:
+            family = self.families.get(family_handle)
+            if family:
+                husband, wife, children = family[0:3]
+                retval.extend((parent, (_("child"), parent, husband, wife))
+                              for parent in (husband, wife) if parent)
+                retval.extend((child, (_("sibling"), child, husband, wife))
+                              for child in children if child != handle)
+        for family_handle in families:
+            family = self.families.get(family_handle)
+            if family:
+                husband, wife, children = family[0:3]
+                if handle == husband:
+                    if wife and wife != handle:
+                        retval.append((wife, (_("husband"), wife)))
+                    retval.extend((child, (_("father"), child, wife))
+                                  for child in children if child != handle)
+                elif handle == wife:
+                    if husband and husband != handle:
+                        retval.append((husband, (_("wife"), husband)))
+                    retval.extend((child, (_("mother"), child, husband))
+                                  for child in children if child != handle)
+        for person_handle, relation in self.assoc_rev.get(handle, ()):
+            retval.append((person_handle,
+                           (_("%s (association)") % relation, person_handle)))
+        for note_handle in self.mention_rev.get(handle, ()):
+            for obj_type, obj_handle in self.note_owners.get(note_handle, ()):
+                if obj_type == "Person":
+                    members = (obj_handle, )
+                else:
+                    family = self.families.get(obj_handle)
+                    if not family:
+                        continue
+                    members = (family[0], family[1]) + family[2]
+                retval.extend((member, (_("mentioned in note"), member))
+                              for member in members if member)
+        return retval
+
+    def shortest_paths(self, source, target):
+        """
+        Find the shortest paths from source to target, searching from both
+        people at once (the smallest frontier is expanded first).
+        This is a generator of the paths, each path being the list of
+        (person handle, step) from source to target.
+        """
+        if source == target:
+            yield []
+            return
+        fwd, bwd = {source: 0}, {target: 0}
+        fwd_preds, bwd_succs = defaultdict(list), defaultdict(list)
+        fwd_frontier, bwd_frontier = [source], [target]
+        meeting = []
+        while fwd_frontier and bwd_frontier and not meeting:
+            if len(fwd_frontier) <= len(bwd_frontier):
+                fwd_frontier = self._expand(fwd_frontier, fwd, fwd_preds,
+                                            self.neighbours)
+                meeting = [handle for handle in fwd_frontier if handle in bwd]
+            else:
+                bwd_frontier = self._expand(bwd_frontier, bwd, bwd_succs,
+                                            self.predecessors)
+                meeting = [handle for handle in bwd_frontier if handle in fwd]
+        if not meeting:
+            return
+        length = min(fwd[handle] + bwd[handle] for handle in meeting)
+        for handle in meeting:
+            if fwd[handle] + bwd[handle] != length:
+                continue
+            for head in self._paths_to(handle, fwd_preds):
+                for tail in self._paths_from(handle, bwd_succs):
+                    yield head + tail
+
+    @staticmethod
+    def _expand(frontier, dist, links, get_links):
+        """
+        Expand the frontier of a breadth-first search by one level,
+        keeping all the links to each person found at this level.
+        """
+        next_frontier = []
+        depth = dist[frontier[0]] + 1
+        for handle in frontier:
+            for other, step in get_links(handle):
+                if other is None:
+                    continue
+                other_depth = dist.get(other)
+                if other_depth is None:
+                    dist[other] = depth
+                    next_frontier.append(other)
+                elif other_depth != depth:
+                    continue
+                links[other].append((handle, step))
+        return next_frontier
+
+    def _paths_to(self, handle, preds):
+        if not preds.get(handle):
+            yield []
+            return
+        for pred, step in preds[handle]:
+            for path in self._paths_to(pred, preds):
+                yield path + [(handle, step)]
+
+    def _paths_from(self, handle, succs):
+        if not succs.get(handle):
+            yield []
+            return
+        for succ, step in succs[handle]:
+            for path in self._paths_from(succ, succs):
+                yield [(succ, step)] + path
+
 #------------------------------------------------------------------------
 #
 # The Gramplet
@@ -55,6 +366,7 @@ class DeepConnectionsGramplet(Gramplet):
     """
     def init(self):
         self.selected_handles = set()
+        self.index = None
         self.relationship_calc = get_relationship_calculator()
         self.set_tooltip(_("Double-click name for details"))
         self.set_text(_("No Family Tree loaded."))
@@ -77,71 +389,20 @@ class DeepConnectionsGramplet(Gramplet):
         self.gui.get_container_widget().add_with_viewport(vbox)
         vbox.show_all()
 
-    def get_links_from_notes(self, obj, path, relation, person_handle):
-        """
-        Get anyone mentioned in any note attached to this object.
-        """
-        retval = []
-        note_list = obj.get_note_list()
-        for note_handle in note_list: 
-            note = self.dbstate.db.get_note_from_handle(note_handle)
-            if note:
-                links = note.get_links()
-                for link in links:
-                    if link[0] == "gramps" and link[1] == "Person":
-                        relation = _("mentioned in note")
-                        if link[2] == "handle":
-                            retval += [(link[3], (path, (relation, person_handle)))]
-        return retval
-
-    def get_relatives(self, person_handle, path):
+    def db_changed(self):
         """
-        Gets all of the relations of person_handle.
+        Connect the signals keeping the kinship index up to date.
         """
-        retval = []
-        person = self.dbstate.db.get_person_from_handle(person_handle)
-        if person is None: return []
-        family_list = person.get_family_handle_list()
-        for family_handle in family_list:
-            family = self.dbstate.db.get_family_from_handle(family_handle)
-            if family:
-                children = family.get_child_ref_list()
-                husband = family.get_father_handle()
-                wife = family.get_mother_handle()
-                retval.extend((child_ref.ref, (path, (_("child"), person_handle, 
-                                                      husband, wife)))
-                              for child_ref in children)
-                if husband and husband != person_handle:
-                    retval += [(husband, (path, (_("husband"), person_handle)))]
-                if wife and wife != person_handle:
-                    retval += [(wife, (path, (_("wife"), person_handle)))]
-                retval += self.get_links_from_notes(family, path, _("Note on Family"), person_handle)
-
-        parent_family_list = person.get_parent_family_handle_list()
-        for family_handle in parent_family_list:
-            family = self.dbstate.db.get_family_from_handle(family_handle)
-            if family:
-                children = family.get_child_ref_list()
-                husband = family.get_father_handle()
-                wife = family.get_mother_handle()
-                retval.extend((child_ref.ref, (path, 
-                                    (_("sibling"), person_handle, husband, wife)))
-                              for child_ref in children if child_ref.ref != person_handle)
-                if husband and husband != person_handle:
-                    retval += [(husband, 
-                                (path, (_("father"), person_handle, wife)))]
-                if wife and wife != person_handle:
-                    retval += [(wife, 
-                                (path, (_("mother"), person_handle, husband)))]
-                retval += self.get_links_from_notes(family, path, _("Note on Parent Family"), person_handle)
-        assoc_list = person.get_person_ref_list()
-        for assoc in assoc_list:
-            relation = _("%s (association)") % assoc.get_relation()
-            assoc_handle = assoc.get_reference_handle()
-            retval += [(assoc_handle, (path, (relation, person_handle)))]
-
-        retval += self.get_links_from_notes(person, path, _("Note on Person"), person_handle)
-        return retval
+        self.index = KinshipIndex(self.dbstate.db)
+        self.dbstate.db.connect('person-add', self.index.update_persons)
+        self.dbstate.db.connect('person-update', self.index.update_persons)
+        self.dbstate.db.connect('person-delete', self.index.remove_persons)
+        self.dbstate.db.connect('family-add', self.index.update_families)
+        self.dbstate.db.connect('family-update', self.index.update_families)
+        self.dbstate.db.connect('family-delete', self.index.remove_families)
+        self.dbstate.db.connect('note-add', self.index.update_notes)
+        self.dbstate.db.connect('note-update', self.index.update_notes)
+        self.dbstate.db.connect('note-delete', self.index.remove_notes)
 
     def active_changed(self, handle):
         """
@@ -193,9 +454,6 @@ class DeepConnectionsGramplet(Gramplet):
         if active_person == None:
             self.set_text(_("No Active Person set."))
             return
-        self.cache = set() 
-        self.queue = [(self.default_person.handle, 
-                       (None, (_("self"), self.default_person.handle, [])))]
         default_name = self.default_person.get_primary_name()
         active_name = active_person.get_primary_name()
         self.set_text("")
@@ -205,37 +463,65 @@ class DeepConnectionsGramplet(Gramplet):
                          (name_displayer.display_name(default_name), 
                           name_displayer.display_name(active_name)))
         yield True
+        if self.index is None:
+            self.index = KinshipIndex(self.dbstate.db)
+        if not self.index.built:
+            for step in self.index.build():
+                yield True
         relationship = self.relationship_calc.get_one_relationship(
             self.dbstate.db, self.default_person, active_person)
-        while self.queue:
-            current_handle, current_path = self.queue.pop(0)
-            if current_handle == active_person.handle: 
-                self.total_relations_found += 1
-                self.append_text(_("Found relation #%d: \n   ") % self.total_relations_found)
-
-                self.link(name_displayer.display_name(active_name), "Person", active_person.handle)
-                if relationship:
-                    self.append_text(" [%s]" % relationship)
-                self.selected_handles.clear()
-                self.selected_handles.add(active_person.handle)
-                self.pretty_print(current_path)
-                self.append_text("\n")
-                if self.default_person.handle != active_person.handle:
+        start_path = (None, (_("self"), self.default_person.handle, []))
+        # The shortest relations, found by searching from both people
+        shortest = None
+        for steps in self.index.shortest_paths(self.default_person.handle,
+                                               active_person.handle):
+            shortest = len(steps)
+            current_path = start_path
+            for person_handle, step in steps:
+                current_path = (current_path, step)
+            self.print_relation(active_person, active_name, relationship,
+                                current_path)
+            if self.default_person.handle == active_person.handle:
+                break
+            self.append_text(_("Paused.\nPress Continue to search for additional relations.\n"))
+            self.pause()
+            yield False
+        if shortest is not None and shortest > 0:
+            # Longer relations, in breadth-first order from the home person
+            self.cache = set()
+            self.queue = deque([(self.default_person.handle, start_path, 0)])
+            count = 0
+            while self.queue:
+                current_handle, current_path, length = self.queue.popleft()
+                if current_handle == active_person.handle and length > shortest:
+                    self.print_relation(active_person, active_name,
+                                        relationship, current_path)
                     self.append_text(_("Paused.\nPress Continue to search for additional relations.\n"))
                     self.pause()
                     yield False
-                else:
-                    break
-            elif current_handle in self.cache: 
-                continue
-            self.cache.add(current_handle)
-            relatives = self.get_relatives(current_handle, current_path)
-            for items in relatives:
-                person_handle = items[0]
-                path = items[1] 
-                if person_handle is not None: # and person_handle not in self.cache: 
-                    self.queue.append((person_handle, path))
-            yield True
+                elif current_handle in self.cache:
+                    continue
+                self.cache.add(current_handle)
+                for person_handle, step in self.index.neighbours(current_handle):
+                    if person_handle is not None:
+                        self.queue.append((person_handle,
+                                           (current_path, step), length + 1))
+                count += 1
+                if count % 1000 == 0:
+                    yield True
         self.append_text(_("\nSearch completed. %d relations found.") % self.total_relations_found)
         yield False
 
+    def print_relation(self, active_person, active_name, relationship, path):
+        """
+        Print a relation found between the home person and the active person.
+        """
+        self.total_relations_found += 1
+        self.append_text(_("Found relation #%d: \n   ") % self.total_relations_found)
+        self.link(name_displayer.display_name(active_name), "Person", active_person.handle)
+        if relationship:
+            self.append_text(" [%s]" % relationship)
+        self.selected_handles.clear()
+        self.selected_handles.add(active_person.handle)
+        self.pretty_print(path)
+        self.append_text("\n")
@@ -196,6 +196,7 @@ class _cnsts:
     INTER_DASH_LENGTH_COLUMN = 3
     CONFIDENCE_COLUMN = 0
     COLOR_COLUMN = 1
+    OUTPUT_BUFFER_SIZE = 256*1024
 
     mouse_events = [
         (ONCLICK, "onclick"),
@@ -246,12 +247,66 @@ def list_of_strings2list_of_lists(data_obj):
             rv.append(eval(i))
         return rv
 
+def run_walker(walker):
+    """Run a tree walker and return its result.
+
+    A tree walker is a generator that yields the walker of each relative
+    and is sent back its result. The walkers are kept on an explicit
+    stack, so that deep trees do not hit the recursion limit."""
+    stack = [walker]
+    result = None
+    while stack:
+        try:
+            relative_walker = stack[-1].send(result)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+            continue
+        stack.append(relative_walker)
+        result = None
+    return result
+
+class CachedDatabase(object):
+    """Database keeping the objects it has read, for the time of a report.
+
+    The chart reads the same objects many times: people reachable along
+    several lines, the events, places, sources, notes and photos they
+    share, the people of the families of every person. The results of the
+    get_*_from_handle methods and of find_backlink_handles are kept, all
+    other attributes are those of the database."""
+    def __init__(self, database):
+        self.database = database
+
+    def __getattr__(self, name):
+        method = getattr(self.database, name)
+        if name.startswith('get_') and name.endswith('_from_handle'):
+            cache = {}
+            def cached(handle):
+                try:
+                    return cache[handle]
+                except KeyError:
+                    obj = cache[handle] = method(handle)
+                    return obj
+        elif name == 'find_backlink_handles':
+            cache = {}
+            def cached(handle, include_classes=None):
+                key = (handle, tuple(include_classes or ()))
+                try:
+                    return cache[key]
+                except KeyError:
+                    backlinks = cache[key] = list(method(handle, include_classes))
+                    return backlinks
+        else:
+            return method
+        setattr(self, name, cached)
+        return cached
+
 class DenominoVisoReport(Report):
     def __init__(self, database, options_class, user):
         Report.__init__(self, database, options_class, user)
         self.options = {}
         menu = options_class.menu
-        self.database = database
+        self.database = CachedDatabase(database)
         for name in menu.get_all_option_names():
             self.options[name] = menu.get_option_by_name(name).get_value()
         self.options['DNMexl_private'] = not self.options['DNMuse_privacy']
@@ -351,6 +406,7 @@ class DenominoVisoReport(Report):
         self.person_imgs = set([]) # makes images being shown only once.
         self.person_img_srcs = []
         self.copied_imgs = {}
+        self.person_txts = {}
         self.search_subjects = {}
         self.sort = Sort(self.database)
 
@@ -370,7 +426,8 @@ class DenominoVisoReport(Report):
         #if self.options['DNMold_browser_output']:
         #    self.write_old_browser_output()
         try:
-            with codecs.open(self.target_path, 'w', encoding='UTF-8') as f:
+            with open(self.target_path, 'w', encoding='UTF-8',
+                      buffering=_cnsts.OUTPUT_BUFFER_SIZE) as f:
                 startup = {}
                 startup[_cnsts.FAN] = ((0,-pi,pi), (0,0,2*pi), \
                         (0,pi/2,5*pi/2), (0,-pi/2,3*pi/2))
@@ -389,16 +446,16 @@ class DenominoVisoReport(Report):
                     return
                 if self.options['DNMchart_type'] == _cnsts.REGULAR:
                     if self.options['DNMchart_mode'] == _cnsts.DESCENDANT:
-                        self.walk_the_tree_depth_desc(f, start_handle, 0)
+                        run_walker(self.walk_the_tree_depth_desc(f, start_handle, 0))
                     else:
-                        self.walk_the_tree_depth_asc(f, start_handle, 0)
+                        run_walker(self.walk_the_tree_depth_asc(f, start_handle, 0))
                 else:
                     if self.options['DNMchart_mode'] == _cnsts.DESCENDANT:
-                        self.walk_the_tree_desc(f, start_handle, 0,\
-                                startup[self.options['DNMchart_type']][self.options['DNMtime_dir']])
+                        run_walker(self.walk_the_tree_desc(f, start_handle, 0,\
+                                startup[self.options['DNMchart_type']][self.options['DNMtime_dir']]))
                     else:
-                        self.walk_the_tree_asc(f, start_handle, 0,\
-                                startup[self.options['DNMchart_type']][self.options['DNMtime_dir']])
+                        run_walker(self.walk_the_tree_asc(f, start_handle, 0,\
+                                startup[self.options['DNMchart_type']][self.options['DNMtime_dir']]))
                 self.end_page(f)
         except IOError as msg:
             ErrorDialog(_('Failure writing %s: %s') % (self.target_path,str(msg)))
@@ -406,7 +463,8 @@ class DenominoVisoReport(Report):
 
     # I need four tree-walking routines: for ascestor/descendant mode and for
     # depth-first or not. So they are all quite similar but not similar enough
-    # to merge them.
+    # to merge them. They are generators run by run_walker: they yield the
+    # walker of a relative instead of calling it.
     def walk_the_tree_depth_asc(self,f,person_handle,generation):
         """Traverse the ancestor tree depth first and call the necessary
         functions to write the data to file.
@@ -416,7 +474,7 @@ class DenominoVisoReport(Report):
         person_handle   Database handle of the present person.
         generation      Integer indicating the generation of person (x-coord).
 
-        It takes one step in the recursive traversal, returning the new \
+        It takes one step in the traversal, returning the new \
         cross-coordinate."""
 
         if not person_handle:
@@ -442,10 +500,10 @@ class DenominoVisoReport(Report):
             else:
                 raise DatabaseError("Can't find person " + 
                     person.get_gramps_id()+" in family "+family.get_gramps_id())
-            father_coord = self.walk_the_tree_depth_asc(f,family.get_father_handle(),\
+            father_coord = yield self.walk_the_tree_depth_asc(f,family.get_father_handle(),\
                     generation+1)
             self.advance += advance_incr
-            mother_coord = self.walk_the_tree_depth_asc(f,family.get_mother_handle(),\
+            mother_coord = yield self.walk_the_tree_depth_asc(f,family.get_mother_handle(),\
                     generation+1)
             if father_coord and mother_coord:
                 cross_coord = (father_coord + mother_coord)/2.0
@@ -489,7 +547,7 @@ class DenominoVisoReport(Report):
                                 prel.append(child_ref.get_mother_relation())
                             else:
                                 prel.append(child_ref.get_father_relation())
-                            cross_coord_child.append(self.walk_the_tree_depth_desc(f,child_ref.ref,generation-1))
+                            cross_coord_child.append((yield self.walk_the_tree_depth_desc(f,child_ref.ref,generation-1)))
         if len(cross_coord_child) > 0:
             if len(cross_coord_child) > 1 and parent_in_middle:
                 cross_coord = (cross_coord_child[0] + cross_coord_child[-1])/2.0
@@ -515,9 +573,9 @@ class DenominoVisoReport(Report):
             nr_attachees = 2
             attach_points = self.add_personal_data(f,person,generation,\
                     attachment_segment,nr_attachees)
-            self.walk_the_tree_asc(f,family.get_father_handle(),generation+1,\
+            yield self.walk_the_tree_asc(f,family.get_father_handle(),generation+1,\
                     attach_points[0])
-            self.walk_the_tree_asc(f,family.get_mother_handle(),generation+1,\
+            yield self.walk_the_tree_asc(f,family.get_mother_handle(),generation+1,\
                     attach_points[1])
         else:
             self.add_personal_data(f,person,generation,attachment_segment)
@@ -545,7 +603,7 @@ class DenominoVisoReport(Report):
             attach_points = self.add_personal_data(f,person,generation,\
                     attachment_segment,nr_attachees)
         for i,ref in enumerate(child_refs):
-            self.walk_the_tree_desc(f,ref.ref,generation-1,attach_points[i])
+            yield self.walk_the_tree_desc(f,ref.ref,generation-1,attach_points[i])
         return
 
     def sort_family_list(self, family_id):
@@ -779,41 +837,11 @@ class DenominoVisoReport(Report):
         the persons details."""
 
         child_att = []
-        self.person_srcs = []
-        self.person_imgs.clear()
-        self.person_img_srcs = []
-        person_name = self.escbacka(_nd.display(person))
-        person_txt = "{person_name:'" + person_name + "'" 
-        self.search_subjects['Name'] = 'person_name'
-        person_img = self.pack_person_img(person)
-        if person_img:
-            person_txt += ',' + person_img
-        person_url = self.pack_person_url(person)
-        if person_url:
-            person_txt += ',' + person_url
-        event_data = self.pack_event_data(person)
-        if event_data:
-            person_txt += "," + event_data
-        attribute_data = self.pack_attribute_data(person)
-        if attribute_data:
-            person_txt += "," + attribute_data
-        address_data = self.pack_address_data(person)
-        if address_data:
-            person_txt += "," + address_data
-        note_data = self.pack_note_data(person)
-        if note_data:
-            person_txt += "," + note_data
-        source_data = self.pack_source_data(person)
-        if source_data:
-            person_txt += "," + source_data
-
-        if len(self.person_img_srcs) > 0:
-            person_txt += "," + "img_sources:['" + \
-                    "','".join(map(self.escbacka,self.person_img_srcs)) + "']"
-
-        person_txt = "activate(this," + person_txt + "})"
-        person_txt = quoteattr(person_txt)
-        person_name = escape(person_name)
+        person_name = escape(self.escbacka(_nd.display(person)))
+        person_txt = self.person_txts.get(person.get_handle())
+        if person_txt is None:
+            person_txt = self.pack_person_data(person)
+            self.person_txts[person.get_handle()] = person_txt
         person_gender = ['female','male','unknown'][int(person.get_gender())]
 
         if self.options['DNMchart_type'] == _cnsts.FAN:
@@ -850,6 +878,47 @@ class DenominoVisoReport(Report):
                     (attachment_segment[0]-self.rect_width/2.0,self.generation2coord(generation)-self.rect_height/2.0,self.rect_width, self.rect_height, person_gender, self.mouse_event_handler(person_txt), person_name))
         return child_att
 
+    def pack_person_data(self,person):
+        """Return the quoted JavaScript call activating a person, with the
+            object packed with the persons details as argument. A person
+            reachable along several lines is only packed once, see
+            add_personal_data."""
+        self.person_srcs = []
+        self.person_imgs.clear()
+        self.person_img_srcs = []
+        person_name = self.escbacka(_nd.display(person))
+        person_txt = "{person_name:'" + person_name + "'" 
+        self.search_subjects['Name'] = 'person_name'
+        person_img = self.pack_person_img(person)
+        if person_img:
+            person_txt += ',' + person_img
+        person_url = self.pack_person_url(person)
+        if person_url:
+            person_txt += ',' + person_url
+        event_data = self.pack_event_data(person)
+        if event_data:
+            person_txt += "," + event_data
+        attribute_data = self.pack_attribute_data(person)
+        if attribute_data:
+            person_txt += "," + attribute_data
+        address_data = self.pack_address_data(person)
+        if address_data:
+            person_txt += "," + address_data
+        note_data = self.pack_note_data(person)
+        if note_data:
+            person_txt += "," + note_data
+        source_data = self.pack_source_data(person)
+        if source_data:
+            person_txt += "," + source_data
+
+        if len(self.person_img_srcs) > 0:
+            person_txt += "," + "img_sources:['" + \
+                    "','".join(map(self.escbacka,self.person_img_srcs)) + "']"
+
+        person_txt = "activate(this," + person_txt + "})"
+        person_txt = quoteattr(person_txt)
+        return person_txt
+
     def mouse_event_handler(self,person_txt):
         if self.options['DNMclick_over'] == _cnsts.ONCLICK:
             return "onclick=%s" % person_txt
@@ -8,8 +8,9 @@ register(QUICKREPORT,
          fname="DescendantCount.py",
          authors=["Douglas S. Blank"],
          authors_email=["doug.blank@gmail.com"],
-         version = '1.0.23',
+         version = '1.0.24',
          gramps_target_version = "5.0",
+         depends_on = ["libdescendants"],
          )
 
 register(GRAMPLET, 
@@ -24,8 +25,9 @@ register(GRAMPLET,
          gramplet_title=_("Descendant Count"),
          detached_width = 600,
          detached_height = 400,
-         version = '1.0.24',
+         version = '1.0.25',
          gramps_target_version = "5.0",
+         depends_on = ["libdescendants"],
          help_url="Descendant_Count_Gramplet",
          )
 
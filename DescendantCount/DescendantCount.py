@@ -34,8 +34,7 @@ except ValueError:
 _ = _trans.gettext
 from gramps.gui.plug.quick import QuickTable, run_quick_report_by_name
 from gramps.gen.simple import SimpleAccess, SimpleDoc
-
-cache = {}
+from libdescendants import DescendantGraph
 
 #------------------------------------------------------------------------
 #
@@ -55,27 +54,10 @@ class DescendantCountGramplet(Gramplet):
 # Functions
 #
 #------------------------------------------------------------------------
-def countem(db, person_handle, count):
-    global cache
-    if person_handle not in cache:
-        total = count
-        person = db.get_person_from_handle(person_handle)
-        for fam_handle in person.get_family_handle_list():
-            fam = db.get_family_from_handle(fam_handle)
-            for child_ref in fam.get_child_ref_list():
-                total += countem(db, child_ref.ref, 1)
-        cache[person_handle] = total
-    else:
-        total = cache[person_handle]
-    return total
-
 def run(database, document, person):
     """
-    Loops through the families that the person is a child in, and display
-    the information about the other children.
+    Display the number of distinct descendants of each person.
     """
-    global cache
-    cache = {}
     # setup the simple access functions
     sdb = SimpleAccess(database)
     sdoc = SimpleDoc(document)
@@ -84,14 +66,12 @@ def run(database, document, person):
     sdoc.title(_("Descendent Count"))
     sdoc.paragraph("")
     stab.columns(_("Person"), _("Number of Descendants"))
-    people = database.get_person_handles(sort_handles=False)
-    for person_handle in people:
-        countem(database, person_handle, 1)
+    graph = DescendantGraph.from_database(database)
+    counts = graph.count_descendants()
     matches = 0
-    for person_handle in cache:
+    for (number, person_handle) in enumerate(graph.handles):
         person = database.get_person_from_handle(person_handle)
-        stab.row(person, cache[person_handle] - 1) # remove self
+        stab.row(person, counts[number])
         matches += 1
     sdoc.paragraph(_("There are %d people.\n") % matches)
     stab.write(sdoc)
-                    
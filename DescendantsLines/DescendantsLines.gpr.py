@@ -24,7 +24,7 @@ register(REPORT,
          id    = 'Descendants Lines',
          name  = _("Descendants Lines"),
          description =  _("Produces descendants lines of a person"),
-         version = '1.0.3',
+         version = '1.0.4',
          gramps_target_version = "5.0",
          status = STABLE,
          fname = 'DescendantsLines.py',
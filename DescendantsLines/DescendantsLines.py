@@ -166,6 +166,22 @@ ctx = None
 font_name = 'sans-serif'
 base_font_size = 12
 
+# Largest PNG drawn on one cairo surface (cairo limit), and size of the
+# tiles of larger charts
+MAX_SURFACE_SIZE = 32767
+TILE_SIZE = 8192
+# Rectangle (x0, y0, x1, y1) of the tile being drawn: the branches out of
+# it are skipped. None when the whole chart is drawn
+draw_area = None
+# Margin around the branches, for the width of the lines
+DRAW_MARGIN = 4
+
+# Font metrics by relative size and by (line, size), and decoded images by
+# path, filled while the chart is laid out and reused to draw it
+_font_extents = {}
+_text_extents = {}
+_image_cache = {}
+
 _event_cache = {}
 
 def find_event(database, handle):
@@ -389,7 +405,16 @@ class DescendantsLinesReport(Report):
         p = load_gramps(pid)
           
         # traverses tree and generates the chart with "person" boxes and the "family" relationship lines.
-        draw_file(p, self.output_fn, PNGWriter())   
+        tiles = draw_file(p, self.output_fn, PNGWriter())
+        if tiles:
+            (base, ext) = os.path.splitext(self.output_fn)
+            self._user.info(_('Descendants Lines'),
+                            _('The chart is too large for one image: it was '
+                              'drawn as %(tiles)d tiles, %(base)s-<row>-'
+                              '<column>%(ext)s. %(file)s is an overview of '
+                              'the chart.') %
+                            {'tiles': tiles, 'base': base,
+                             'ext': ext or '.png', 'file': self.output_fn})
         
 def draw_text(text, x, y, total_w, top_centered_lines=0):
     """
@@ -399,13 +424,12 @@ def draw_text(text, x, y, total_w, top_centered_lines=0):
     overrides the Text alignment set in options menu for the specified # of
     lines. This allows centering of the first line containing the user's name
     """
-    #(total_w, total_h) = size_text(text, ctx)
+    #(total_w, total_h) = size_text(text)
     n = 1
     for (size, color, line) in text:
-        ctx.select_font_face(font_name)
         ctx.set_font_size(base_font_size * size)
-        (ascent, _, height, _, _) = ctx.font_extents()
-        (lx, _, width, _, _, _,) = ctx.text_extents(line)
+        (ascent, height) = font_extents(size)
+        (lx, width) = text_extents(line, size)
         if ((TEXT_ALIGNMENT == 'center') or (n <= top_centered_lines)):
             ctx.move_to(x - lx + TEXT_PAD + (total_w - width + lx) / 2, y
                          + ascent + TEXT_PAD)
@@ -419,7 +443,33 @@ def draw_text(text, x, y, total_w, top_centered_lines=0):
         y += height + TEXT_LINE_PAD
         n += 1
 
-def size_text(text, cntx):
+def font_extents(size):
+    """
+    Ascent and height of the font at a relative size, measured once on the
+    dummy context.
+    """
+    extents = _font_extents.get(size)
+    if extents is None:
+        dctx.set_font_size(base_font_size * size)
+        (ascent, descent, height, max_x_advance, max_y_advance) = \
+            dctx.font_extents()
+        extents = _font_extents[size] = (ascent, height)
+    return extents
+
+def text_extents(line, size):
+    """
+    X bearing and width of a line of text at a relative size, measured
+    once on the dummy context.
+    """
+    extents = _text_extents.get((line, size))
+    if extents is None:
+        dctx.set_font_size(base_font_size * size)
+        (lx, ly, width, height, x_advance, y_advance) = \
+            dctx.text_extents(line)
+        extents = _text_extents[(line, size)] = (lx, width)
+    return extents
+
+def size_text(text):
     text_width = 0
     text_height = 0
     first = True
@@ -428,10 +478,8 @@ def size_text(text, cntx):
             first = False
         else:
             text_height += TEXT_LINE_PAD
-        cntx.select_font_face(font_name)
-        cntx.set_font_size(base_font_size * size)
-        (_, _, height, _, _) = cntx.font_extents()
-        (lx, _, width, _, _, _,) = cntx.text_extents(line)
+        (ascent, height) = font_extents(size)
+        (lx, width) = text_extents(line, size)
         text_width = max(text_width, width - lx)
         text_height += height
     text_width += 2 * TEXT_PAD
@@ -458,28 +506,33 @@ def calc_image_scale(iw, ih):
 # 			log.debug('Calc Scale, min of  H=%f, W=%f', MAX_IMAGE_H/ih, MAX_IMAGE_W/iw)
 			return (min(MAX_IMAGE_W/iw, MAX_IMAGE_H/ih))
 
+def load_image(image_path):
+    """
+    Gets the image surface of a PNG file, decoded only once
+    """
+    image = _image_cache.get(image_path)
+    if image is None:
+        image = cairo.ImageSurface.create_from_png(image_path)
+        _image_cache[image_path] = image
+    return image
+
 def size_image(image_path):
     """
     Gets the size of the image
-    
-    Need to use a dummy CTX (dctx) as using the final ctx to get this information
-    seems to ruin the final image.
     """
-    dctx.save()
     iw = 0
     ih = 0
-    image = cairo.ImageSurface.create_from_png(image_path)
+    image = load_image(image_path)
     if image:
-        iw = cairo.ImageSurface.get_width(image)
-        ih = cairo.ImageSurface.get_height(image)
+        iw = image.get_width()
+        ih = image.get_height()
     log.debug('Image Size (unscaled): height=%d width=%d', ih, iw)
-    dctx.restore()
     return (iw, ih) 
 
 def draw_image(image_path, ix, iy, iw, ih, scale_factor):
 #     log.debug('Draw Image at x=%d y=%d, w=%d, h=%d, to be scaled by %d', ix, iy, iw, ih, scale_factor)
     ctx.save()
-    image = cairo.ImageSurface.create_from_png(image_path)
+    image = load_image(image_path)
     if scale_factor != 1.0:
         log.debug('Draw Image: scale factor=%f; result: H=%f, W=%f', scale_factor, ih, iw)
         ctx.scale(scale_factor, scale_factor)
@@ -545,7 +598,7 @@ class Person_Block:
         self.ipath = None   #Path to (thumbnail) image
         self.iscale = 1.0    #Scaling factor to use on thumbnail image
         
-        (self.tw, self.th) = size_text(self.text, dctx)
+        (self.tw, self.th) = size_text(self.text)
         if (INC_IMAGE and (phandle != None)):
             self.ipath = get_image(self.phandle)
             if self.ipath:
@@ -629,6 +682,9 @@ class Person(Memorised):
         self.families.append(fam)
 
     def draw(self):
+        if not in_draw_area(self.get('x'), self.get('y'), self.get('w'), self.get('h')):
+            # the person, the families and their descendants are out of the tile
+            return
         #set_bg_style(ctx)
         #ctx.set_source_rgba(1, 0, 0, 0.1)  #very pale red
         #ctx.rectangle(self.get('x'), self.get('y'), self.get('w'), self.get('h'))
@@ -1187,10 +1243,24 @@ def set_line_style(ctx):
 
 
 def init_file(fn, writer):
-    """dummy surface for image size calculations, to avoid mucking up final image"""
+    """dummy surface for text size calculations, to avoid mucking up final image"""
     global dctx
     surface = writer.start(fn, 10, 10)
     dctx = cairo.Context(surface)
+    dctx.select_font_face(font_name)
+    _font_extents.clear()
+    _text_extents.clear()
+    _image_cache.clear()
+
+def in_draw_area(x, y, w, h):
+    """
+    Whether a rectangle of the chart is in the tile being drawn
+    """
+    if draw_area is None:
+        return True
+    (x0, y0, x1, y1) = draw_area
+    return (x - DRAW_MARGIN < x1 and x + w + DRAW_MARGIN > x0 and
+            y - DRAW_MARGIN < y1 and y + h + DRAW_MARGIN > y0)
 
 def draw_tree(head):
     ctx.select_font_face(font_name)
@@ -1237,21 +1307,74 @@ def draw_file(p, fn, writer):
     """
     called by write_report to generate the chart
     Uses the tree of person & family records, "p", created by load_gramps
+    Returns the number of tiles of a chart too large for one PNG, else 0
     """
     global ctx
 
-    surface = writer.start(fn, 10, 10) # 1st pass is just to get size of chart
-    ctx = cairo.Context(surface)
-    draw_tree(p)
+    # the layout only depends on the sizes measured while loading the tree:
+    # it is computed (and memorised) before drawing, in one pass
     (w, h) = (p.get('w'), p.get('h'))
-    log.debug('### End of 1st Pass. Surface w=%d, h=%d', w, h)
+    log.debug('### Layout done. Surface w=%d, h=%d', w, h)
+
+    if OUTPUT_FMT == 'PNG' and max(w, h) + 1 > MAX_SURFACE_SIZE:
+        tiles = draw_tiles(p, fn, w, h)
+        _image_cache.clear()
+        return tiles
 
     surface = writer.start(fn, w, h)
     ctx = cairo.Context(surface)
     draw_tree(p)
     ctx.show_page()
     writer.finish()
- 
+    _image_cache.clear()
+    return 0
+
+def draw_tiles(p, fn, w, h):
+    """
+    Draws a PNG chart too large for one cairo surface, as tiles of at most
+    TILE_SIZE pixels written to <fn>-<row>-<column>.png, each tile only
+    drawing the branches in it. fn gets an overview of the chart, scaled
+    down to TILE_SIZE pixels.
+    Returns the number of tiles
+    """
+    global ctx, draw_area
+
+    (base, ext) = os.path.splitext(fn)
+    (width, height) = (int(w + 1), int(h + 1))
+    rows = (height + TILE_SIZE - 1) // TILE_SIZE
+    columns = (width + TILE_SIZE - 1) // TILE_SIZE
+    log.debug('Tiled chart: %d rows, %d columns', rows, columns)
+    for row in range(rows):
+        for column in range(columns):
+            (x, y) = (column * TILE_SIZE, row * TILE_SIZE)
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32,
+                                         min(TILE_SIZE, width - x),
+                                         min(TILE_SIZE, height - y))
+            ctx = cairo.Context(surface)
+            ctx.translate(-x, -y)
+            (tw, th) = (surface.get_width(), surface.get_height())
+            ctx.rectangle(x, y, tw, th)
+            ctx.clip()
+            draw_area = (x, y, x + tw, y + th)
+            try:
+                draw_tree(p)
+            finally:
+                draw_area = None
+            surface.write_to_png('%s-%d-%d%s' % (base, row + 1, column + 1,
+                                                 ext or '.png'))
+            surface.finish()
+
+    scale = float(TILE_SIZE) / max(width, height)
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32,
+                                 max(1, int(width * scale)),
+                                 max(1, int(height * scale)))
+    ctx = cairo.Context(surface)
+    ctx.scale(scale, scale)
+    draw_tree(p)
+    surface.write_to_png(fn)
+    surface.finish()
+    return rows * columns
+
 
 #------------------------------------------------------------------------
 #
@@ -34,7 +34,7 @@ register(TOOL,
 id    = 'downloadmedia',
 name  = _("Download media files from the internet"),
 description =  _("This tool downloads media files form the internet"),
-version = '1.0.2',
+version = '1.0.3',
 gramps_target_version = "5.0",
 status = STABLE,
 fname = 'DownloadMedia.py',
@@ -30,8 +30,7 @@
 import os
 import logging
 LOG = logging.getLogger(".downloadmedia")
-from urllib import urlopen
-from urlparse import urlparse
+from urllib.parse import urlparse, unquote
 import re
 
 #-------------------------------------------------------------------------
@@ -59,6 +58,8 @@ _ = _trans.gettext
 from gramps.gen.db import DbTxn
 from gramps.gen.mime import get_type
 
+from downloader import Downloader
+
 class DownloadMedia(tool.Tool, ManagedWindow):
     """
     Gramplet that downloads media from the internet.
@@ -72,14 +73,18 @@ class DownloadMedia(tool.Tool, ManagedWindow):
         tool.Tool.__init__(self, dbstate, options_class, name)
         
         self.num_downloads = 0
+        self.num_failures = 0
         dialog = self.display()
         response = dialog.run()
         dialog.destroy()
         
         if response == Gtk.ResponseType.ACCEPT:
             self.on_ok_clicked()
-            OkDialog(_('Media downloaded'),
-                     _("%d media files downloaded") % self.num_downloads)
+            message = _("%d media files downloaded") % self.num_downloads
+            if self.num_failures:
+                message += "\n" + (_("%d media files could not be downloaded")
+                                   % self.num_failures)
+            OkDialog(_('Media downloaded'), message)
 
         self.close()
 
@@ -128,8 +133,6 @@ class DownloadMedia(tool.Tool, ManagedWindow):
         """
         Method that is run when you click the OK button.
         """
-        downloaded = {}
-        
         # Get a directory to put the media files in. If the media path in
         # preferences is not just the user's home, then we will use that. If it
         # is the user's home, we create a new directory below that, so we don't
@@ -139,52 +142,80 @@ class DownloadMedia(tool.Tool, ManagedWindow):
             media_path = os.path.join(USER_HOME, "mediadir")
         if not os.path.isdir(media_path):
             os.makedirs(media_path)
-        
-        # Many thanks to 'sirex' from whom I have taken the code he submitted as
-        # part of bug 0003553: Import media files from GEDCOM
-        file_pattern = re.compile(r'.*\.(png|jpg|jpeg|gif)$')
-        
-        def fetch_file(url, filename):
-            LOG.debug("Downloading url %s to file %s" % (url, filename))
-            fr = urlopen(url)
-            fw = open(filename, 'wb')
-            for block in fr:
-                fw.write(block)
-            fw.close()
-            fr.close()
 
         self.progress = ProgressMeter(
-            _('Downloading files'), '')
-        self.progress.set_pass(_('Downloading files'),
-                               self.db.get_number_of_media_objects())
-        
+            _('Downloading files'), '', can_cancel=True)
+        media_by_url = self.collect_urls()
+        if media_by_url is None:
+            self.progress.close()
+            return
+
+        # Each url is downloaded once, into a file of its own
+        jobs = []
+        filenames = set()
+        for url in media_by_url:
+            filename = unquote(urlparse(url).path.split('/')[-1])
+            root, ext = os.path.splitext(filename)
+            number = 0
+            while filename in filenames:
+                number += 1
+                filename = "%s-%d%s" % (root, number, ext)
+            filenames.add(filename)
+            jobs.append((url, os.path.join(media_path, filename)))
+
+        downloaded = {}
+        self.progress.set_pass(_('Downloading files'), len(jobs))
+        results = Downloader().download_files(jobs)
+        for url, full_path, error in results:
+            if error is None:
+                downloaded[url] = full_path
+                self.num_downloads += 1
+            else:
+                LOG.warning("Downloading url %s failed: %s" % (url, error))
+                self.num_failures += 1
+            self.progress.step()
+            if self.progress.get_cancelled():
+                results.close()
+                break
+
+        # The paths of the media downloaded are all changed at once
+        self.progress.set_pass(_('Updating media paths'), len(downloaded))
         self.db.disable_signals()
-        with DbTxn('Download files', self.db) as trans:
-            for media_handle in self.db.media_map.keys():
-                media = self.db.get_object_from_handle(media_handle)
-                url = media.get_path()
-                res = urlparse(url)
-                LOG.debug(res)
-                if res.scheme == "http" or res.scheme == "https":
-                    if file_pattern.match(url):
-                        if url in downloaded:
-                            full_path = downloaded[url]
-                        else:
-                            filename = url.split('/')[-1]
-                            full_path = os.path.join(media_path, filename)
-                            fetch_file(url, full_path)
-                            downloaded[url] = full_path
-                            self.num_downloads += 1
-                        media.set_path(full_path)
-                        media.set_mime_type(get_type(full_path))
-                        self.db.commit_media_object(media, trans)
-                
+        with DbTxn(_('Download files'), self.db) as trans:
+            for url, full_path in downloaded.items():
+                for media_handle in media_by_url[url]:
+                    media = self.db.get_object_from_handle(media_handle)
+                    media.set_path(full_path)
+                    media.set_mime_type(get_type(full_path))
+                    self.db.commit_media_object(media, trans)
                 self.progress.step()
-            
         self.db.enable_signals()
         self.db.request_rebuild()
         self.progress.close()
-        
+
+    def collect_urls(self):
+        """
+        Return the handles of the media to download by url, or None if
+        cancelled.
+        """
+        # Many thanks to 'sirex' from whom I have taken the code he submitted as
+        # part of bug 0003553: Import media files from GEDCOM
+        file_pattern = re.compile(r'.*\.(png|jpg|jpeg|gif)$')
+
+        media_by_url = {}
+        self.progress.set_pass(_('Collecting media'),
+                               self.db.get_number_of_media_objects())
+        for media in self.db.iter_media_objects():
+            url = media.get_path()
+            res = urlparse(url)
+            if res.scheme == "http" or res.scheme == "https":
+                if file_pattern.match(url):
+                    media_by_url.setdefault(url, []).append(media.get_handle())
+            self.progress.step()
+            if self.progress.get_cancelled():
+                return None
+        return media_by_url
+
 #        self.options.handler.options_dict['name'] = name
 #        self.options.handler.options_dict['password'] = password
 #        # Save options
@@ -0,0 +1,312 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2015       Tim G L Lyons
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+"""
+Download engine of the Download Media tool. It imports no Gramps module,
+so that it can be tested on its own (see downloader_test.py).
+"""
+
+#------------------------------------------------------------------------
+#
+# Python modules
+#
+#------------------------------------------------------------------------
+import os
+import json
+import threading
+import http.client
+from urllib.parse import urlsplit, urljoin
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import logging
+LOG = logging.getLogger(".downloadmedia")
+
+#------------------------------------------------------------------------
+#
+# Constants
+#
+#------------------------------------------------------------------------
+# Number of files downloaded at the same time
+MAX_WORKERS = 8
+# Number of times a failed transfer is tried again
+RETRIES = 3
+# Delay in seconds before the first retry, doubled at each retry
+BACKOFF = 1.0
+# Timeout in seconds of the network operations
+TIMEOUT = 30
+# Size of the blocks in which the files are written
+BLOCK_SIZE = 64 * 1024
+MAX_REDIRECTS = 5
+# Suffix of the files being downloaded, kept to resume a transfer
+PART_SUFFIX = '.part'
+# Suffix of the file keeping the url and the validator (ETag or
+# Last-Modified) of a part file, checked by the server to resume it
+META_SUFFIX = '.meta'
+
+class DownloadError(Exception):
+    """
+    A download that failed, and is not worth trying again.
+    """
+
+class TransientError(DownloadError):
+    """
+    A download that failed, and may succeed if tried again.
+    """
+
+class Downloader(object):
+    """
+    Download files in a pool of threads.
+
+    Each thread keeps its connection to a host open for the following files
+    of this host. The failed transfers are tried again after an increasing
+    delay, and resume from the part of the file already received when the
+    server accepts ranges and the file did not change (If-Range).
+    """
+    def __init__(self, max_workers=MAX_WORKERS, retries=RETRIES,
+                 backoff=BACKOFF, timeout=TIMEOUT):
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.bytes_read = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._stop = threading.Event()
+
+    def download_files(self, jobs):
+        """
+        Generator of (url, filename, error) for the given (url, filename)
+        jobs, in the order the downloads finish. Only a few files are
+        downloaded ahead, so that the generator can be closed at any time:
+        the transfers in progress are then stopped.
+        """
+        self._stop.clear()
+        try:
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                pending = {}
+                try:
+                    for url, filename in jobs:
+                        future = executor.submit(self.download, url, filename)
+                        pending[future] = (url, filename)
+                        if len(pending) >= 2 * self.max_workers:
+                            for result in self._finished(pending):
+                                yield result
+                    while pending:
+                        for result in self._finished(pending):
+                            yield result
+                finally:
+                    self._stop.set()
+        finally:
+            self.close()
+
+    def _finished(self, pending):
+        """
+        Wait for downloads to finish, and return their results.
+        """
+        done = wait(pending, return_when=FIRST_COMPLETED)[0]
+        results = []
+        for future in done:
+            url, filename = pending.pop(future)
+            error = future.exception()
+            if error is not None:
+                LOG.debug("Downloading url %s failed: %s" % (url, error))
+            results.append((url, filename, error))
+        return results
+
+    def download(self, url, filename):
+        """
+        Download a file, trying again the failed transfers.
+        """
+        part = filename + PART_SUFFIX
+        attempt = 0
+        while True:
+            if self._stop.is_set():
+                raise DownloadError("cancelled")
+            try:
+                self._fetch(url, part)
+                break
+            except (OSError, http.client.HTTPException, TransientError):
+                attempt += 1
+                if attempt > self.retries or self._stop.is_set():
+                    raise
+                LOG.debug("Retrying url %s" % url)
+                if self._stop.wait(self.backoff * 2 ** (attempt - 1)):
+                    raise DownloadError("cancelled")
+        os.replace(part, filename)
+        remove_file(part + META_SUFFIX)
+
+    def _fetch(self, url, part):
+        """
+        Transfer a file into its part file, following the redirections.
+        """
+        origin = url
+        for redirect in range(MAX_REDIRECTS + 1):
+            if self._stop.is_set():
+                raise DownloadError("cancelled")
+            parts = urlsplit(url)
+            if parts.scheme not in ('http', 'https'):
+                raise DownloadError("unsupported url %s" % url)
+            try:
+                offset = os.path.getsize(part)
+            except OSError:
+                offset = 0
+            headers = {'Accept-Encoding': 'identity'}
+            if offset:
+                validator = read_validator(part, origin)
+                if validator is None:
+                    # Nothing tells that the part is from this file
+                    remove_file(part)
+                    offset = 0
+                else:
+                    headers['Range'] = 'bytes=%d-' % offset
+                    headers['If-Range'] = validator
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+
+            connection = self._connection(parts.scheme, parts.netloc)
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+            except (OSError, http.client.HTTPException):
+                # A connection kept open may have been closed by the host
+                connection.close()
+                raise
+            status = response.status
+            LOG.debug("GET %s: %d" % (url, status))
+
+            if status in (301, 302, 303, 307, 308):
+                location = response.getheader('Location')
+                response.read()
+                if not location:
+                    raise DownloadError("redirection without location")
+                url = urljoin(url, location)
+                continue
+            if status == 206 and offset:
+                content_range = response.getheader('Content-Range', '')
+                if not content_range.startswith('bytes %d-' % offset):
+                    response.read()
+                    remove_file(part)
+                    raise TransientError("unexpected range %s" % content_range)
+                mode = 'ab'
+            elif status == 200:
+                # The whole file: the part, if any, is replaced
+                save_validator(part, origin, response)
+                mode = 'wb'
+            elif status == 416 and offset:
+                # The part file does not match the file any more
+                response.read()
+                remove_file(part)
+                raise TransientError("range not satisfiable")
+            elif status in (408, 429) or status >= 500:
+                response.read()
+                raise TransientError("HTTP %d %s" % (status, response.reason))
+            else:
+                response.read()
+                raise DownloadError("HTTP %d %s" % (status, response.reason))
+
+            self._write(response, part, mode)
+            return
+        raise DownloadError("too many redirections")
+
+    def _write(self, response, part, mode):
+        """
+        Write the body of a response into the part file.
+        """
+        length = response.getheader('Content-Length')
+        received = 0
+        with open(part, mode) as part_file:
+            while True:
+                if self._stop.is_set():
+                    response.close()
+                    raise DownloadError("cancelled")
+                block = response.read(BLOCK_SIZE)
+                if not block:
+                    break
+                part_file.write(block)
+                received += len(block)
+        with self._lock:
+            self.bytes_read += received
+        if length is not None and received < int(length):
+            raise TransientError("incomplete transfer")
+
+    def _connection(self, scheme, netloc):
+        """
+        Return the connection of the current thread to a host.
+        """
+        connections = getattr(self._local, 'connections', None)
+        if connections is None:
+            connections = self._local.connections = {}
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            if scheme == 'https':
+                connection = http.client.HTTPSConnection(netloc,
+                                                         timeout=self.timeout)
+            else:
+                connection = http.client.HTTPConnection(netloc,
+                                                        timeout=self.timeout)
+            connections[(scheme, netloc)] = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self):
+        """
+        Close the connections kept open.
+        """
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+def remove_file(filename):
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+def read_validator(part, url):
+    """
+    Return the validator of a part file for If-Range, or None if there is
+    none or the part file is from another url.
+    """
+    try:
+        with open(part + META_SUFFIX) as meta:
+            data = json.load(meta)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('url') != url:
+        return None
+    return data.get('validator')
+
+def save_validator(part, url, response):
+    """
+    Keep the validator of a file being received into its part file: a
+    strong ETag, else the Last-Modified date.
+    """
+    validator = response.getheader('ETag')
+    if not validator or validator.startswith('W/'):
+        validator = response.getheader('Last-Modified')
+    if not validator:
+        remove_file(part + META_SUFFIX)
+        return
+    with open(part + META_SUFFIX, 'w') as meta:
+        json.dump({'url': url, 'validator': validator}, meta)
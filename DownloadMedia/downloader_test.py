@@ -0,0 +1,222 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2015       Tim G L Lyons
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+## python downloader_test.py
+
+"""
+Tests of the download engine against a local HTTP server.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+from downloader import Downloader, DownloadError, PART_SUFFIX, META_SUFFIX
+
+FILES = dict(('/image%d.jpg' % number, os.urandom(100000 + number))
+             for number in range(50))
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Serve FILES, with ranges checked by If-Range, and a few failing paths:
+    /flaky fails twice with 503, /truncated sends half of its body the
+    first time, /moved redirects to /image0.jpg.
+    """
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    requests = {}
+    lock = threading.Lock()
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        with self.lock:
+            Handler.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with self.lock:
+            count = self.requests[self.path] = self.requests.get(self.path, 0) + 1
+        if self.path == '/moved':
+            self.send_response(302)
+            self.send_header('Location', '/image0.jpg')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.path == '/flaky' and count <= 2:
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.path in ('/flaky', '/truncated'):
+            data = FILES['/image1.jpg']
+        elif self.path in FILES:
+            data = FILES[self.path]
+        else:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        etag = '"%x"' % hash(data)
+        start = 0
+        range_header = self.headers.get('Range')
+        if range_header and self.headers.get('If-Range') == etag:
+            start = int(range_header[len('bytes='):-1])
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' %
+                             (start, len(data) - 1, len(data)))
+        else:
+            self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(data) - start))
+        self.end_headers()
+        if self.path == '/truncated' and count == 1:
+            self.wfile.write(data[start:len(data) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(data[start:])
+
+class DownloaderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = Server(('127.0.0.1', 0), Handler)
+        cls.url = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+        thread = threading.Thread(target=cls.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        Handler.connections = 0
+        Handler.requests = {}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def download(self, paths, **kwargs):
+        downloader = Downloader(backoff=0.01, **kwargs)
+        jobs = [(self.url + path, os.path.join(self.directory,
+                                               path.strip('/') or 'index'))
+                for path in paths]
+        return dict((url[len(self.url):], (filename, error))
+                    for (url, filename, error)
+                    in downloader.download_files(jobs))
+
+    def read(self, filename):
+        with open(filename, 'rb') as data:
+            return data.read()
+
+    def test_files(self):
+        results = self.download(sorted(FILES), max_workers=4)
+        for path, data in FILES.items():
+            filename, error = results[path]
+            self.assertIsNone(error)
+            self.assertEqual(self.read(filename), data)
+        # One connection per thread
+        self.assertLessEqual(Handler.connections, 4)
+
+    def test_retry(self):
+        filename, error = self.download(['/flaky'])['/flaky']
+        self.assertIsNone(error)
+        self.assertEqual(self.read(filename), FILES['/image1.jpg'])
+        self.assertEqual(Handler.requests['/flaky'], 3)
+
+    def test_resume(self):
+        filename, error = self.download(['/truncated'])['/truncated']
+        self.assertIsNone(error)
+        self.assertEqual(self.read(filename), FILES['/image1.jpg'])
+        self.assertFalse(os.path.exists(filename + PART_SUFFIX))
+
+    def write_part(self, path, data, url=None, validator='"old"'):
+        part = os.path.join(self.directory, path.strip('/')) + PART_SUFFIX
+        with open(part, 'wb') as part_file:
+            part_file.write(data)
+        if url is not None:
+            with open(part + META_SUFFIX, 'w') as meta:
+                meta.write('{"url": "%s", "validator": %s}' % (
+                    url, json.dumps(validator)))
+
+    def test_changed(self):
+        # A part of the file before it changed on the server
+        self.write_part('/image2.jpg', b'x' * 1000, self.url + '/image2.jpg')
+        filename, error = self.download(['/image2.jpg'])['/image2.jpg']
+        self.assertIsNone(error)
+        self.assertEqual(self.read(filename), FILES['/image2.jpg'])
+        self.assertFalse(os.path.exists(filename + PART_SUFFIX + META_SUFFIX))
+
+    def test_other_url(self):
+        data = FILES['/image3.jpg']
+        etag = '"%x"' % hash(data)
+        # The part of another file, saved under the same name
+        self.write_part('/image3.jpg', data[:1000], self.url + '/image4.jpg',
+                        etag)
+        filename, error = self.download(['/image3.jpg'])['/image3.jpg']
+        self.assertIsNone(error)
+        self.assertEqual(self.read(filename), data)
+        # A part without validator is not resumed either
+        self.write_part('/image3.jpg', b'x' * 1000)
+        filename, error = self.download(['/image3.jpg'])['/image3.jpg']
+        self.assertEqual(self.read(filename), data)
+        # The part of this file is resumed
+        self.write_part('/image3.jpg', data[:1000], self.url + '/image3.jpg',
+                        etag)
+        filename, error = self.download(['/image3.jpg'])['/image3.jpg']
+        self.assertEqual(self.read(filename), data)
+
+    def test_cancelled(self):
+        downloader = Downloader()
+        downloader._stop.set()
+        filename = os.path.join(self.directory, 'image0.jpg')
+        self.assertRaises(DownloadError, downloader.download,
+                          self.url + '/image0.jpg', filename)
+        self.assertEqual(Handler.requests, {})
+
+    def test_redirect(self):
+        filename, error = self.download(['/moved'])['/moved']
+        self.assertIsNone(error)
+        self.assertEqual(self.read(filename), FILES['/image0.jpg'])
+
+    def test_not_found(self):
+        filename, error = self.download(['/missing'])['/missing']
+        self.assertIsInstance(error, DownloadError)
+        self.assertEqual(Handler.requests['/missing'], 1)
+        self.assertFalse(os.path.exists(filename))
+
+    def test_give_up(self):
+        filename, error = self.download(['/flaky'], retries=1)['/flaky']
+        self.assertIsInstance(error, DownloadError)
+        self.assertEqual(Handler.requests['/flaky'], 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -120,6 +120,10 @@ import codecs
 import tarfile
 import tempfile
 import colorsys
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 if sys.version_info[0] < 3:
 	from cStringIO import StringIO
 	string_types = basestring
@@ -353,10 +357,19 @@ INCLUDE_LIVING_VALUE = 99 #: Arbitrary number
 OBJDICT_NAME = 0
 OBJDICT_GID = 1
 OBJDICT_INDEX = 2
+OBJDICT_CHANGE = 3
 BKREF_CLASS = 0
 BKREF_HANDLE = 1
 BKREF_REFOBJ = 2
 
+#: File storing the data needed for incremental updates of the web site
+MANIFEST_FILE = "dwr_manifest.json"
+#: Version of the manifest file format
+MANIFEST_VERSION = 2
+
+#: Number of persons whose referenced objects are read together (see L{DynamicWebReport._prefetch_objects})
+PREFETCH_BATCH = 500
+
 
 _html_dbl_quotes = re.compile(r'([^"]*) " ([^"]*) " (.*)', re.VERBOSE)
 _html_sng_quotes = re.compile(r"([^']*) ' ([^']*) ' (.*)", re.VERBOSE)
@@ -464,6 +477,86 @@ def rmtree_fix(dirname):
 
 
 
+class _SnapshotDict(dict):
+	"""
+	Dictionary used for the snapshot of L{DynamicWebReport.obj_dict} and L{DynamicWebReport.bkref_dict}
+	Reading a missing key gives an empty default value, like a C{defaultdict},
+	but without inserting it. The snapshot is thus never modified when it is read by several threads.
+	"""
+	def __init__(self, data, default_factory):
+		dict.__init__(self, data)
+		self.default_factory = default_factory
+	def __missing__(self, key):
+		return(self.default_factory())
+
+
+class _SerializedDb(object):
+	"""
+	Wrapper of a Gramps database that serializes the calls to the database methods.
+	This allows the exporters to share the database when they are run in several threads.
+	"""
+	def __init__(self, database):
+		self.__database = database
+		self.__lock = threading.RLock()
+	def __getattr__(self, name):
+		attr = getattr(self.__database, name)
+		if (not callable(attr)): return(attr)
+		lock = self.__lock
+		def serialized(*args, **kwargs):
+			with lock:
+				return(attr(*args, **kwargs))
+		return(serialized)
+
+
+class _CachedDb(object):
+	"""
+	Wrapper of a Gramps database that keeps the objects read from their handle.
+	The objects are thus read only once per report generation,
+	when the objects of the report are collected (see L{DynamicWebReport._build_obj_dict}) and when they are exported.
+	The objects returned are shared, they should not be modified.
+	"""
+	CACHED_METHODS = (
+		"get_person_from_handle",
+		"get_family_from_handle",
+		"get_event_from_handle",
+		"get_place_from_handle",
+		"get_source_from_handle",
+		"get_citation_from_handle",
+		"get_object_from_handle",
+		"get_repository_from_handle",
+		"get_note_from_handle",
+	)
+	def __init__(self, database):
+		self.__database = database
+		self.__cache = dict((name, {}) for name in self.CACHED_METHODS)
+	def __getattr__(self, name):
+		attr = getattr(self.__database, name)
+		if (name not in self.CACHED_METHODS): return(attr)
+		cache = self.__cache[name]
+		def cached(handle):
+			try:
+				return(cache[handle])
+			except KeyError:
+				obj = attr(handle)
+				cache[handle] = obj
+				return(obj)
+		# Next calls do not go through __getattr__
+		setattr(self, name, cached)
+		return(cached)
+	def prefetch(self, method, handles):
+		"""
+		Read the objects from their handles with the method L{method}.
+		The objects not cached yet are read in handle order, for a better locality in the database tables.
+		@return: list of the objects found (without duplicates)
+		"""
+		get = getattr(self, method)
+		cache = self.__cache[method]
+		handles = set(handle for handle in handles if handle)
+		for handle in sorted(handles):
+			get(handle)
+		return([cache[handle] for handle in handles if cache[handle]])
+
+
 class DynamicWebReport(Report):
 	"""
 	Class DynamicWebReport
@@ -485,7 +578,8 @@ class DynamicWebReport(Report):
 	 - gramps id,
 	 - object index, starting from 0,
 	   only counting the objects selected,
-	   each object type is counted separately.
+	   each object type is counted separately,
+	 - object last change time.
 	
 	The references to objects are stored as dictionaries "bkref_dict[class][handle]",
 	indexed by the object class,
@@ -530,6 +624,9 @@ class DynamicWebReport(Report):
 		if livinginfo != INCLUDE_LIVING_VALUE:
 			self.database = LivingProxyDb(self.database, livinginfo, None, yearsafterdeath)
 
+		# Objects read are shared between the objects collection and the export
+		self.database = _CachedDb(self.database)
+
 		filters_option = menu.get_option_by_name('filter')
 		self.filter = filters_option.get_filter()
 
@@ -559,6 +656,9 @@ class DynamicWebReport(Report):
 		self.encoding = self.options['encoding']
 		self.copyright = self.options['copyright']
 		self.inc_gendex = self.options['inc_gendex']
+		self.jobs = self.options['jobs']
+		self.incremental = self.options['incremental']
+		self.shard_size = self.options['shardsize']
 		self.template = self.options['template']
 		self.pages_number = self.options['pages_number']
 		self.page_content = [
@@ -595,6 +695,8 @@ class DynamicWebReport(Report):
 		self.max_age = 0
 		self.min_period = 1e10
 		self.max_period = -1e10
+		self._stats_lock = threading.Lock()
+		self._files_lock = threading.Lock()
 
 
 	def write_report(self):
@@ -650,6 +752,7 @@ class DynamicWebReport(Report):
 
 		self._build_obj_dict()
 		self._sort_obj_dict()
+		self._init_incremental_build()
 
 		#################################################
 		# Pass 2 Generate the web pages
@@ -664,18 +767,22 @@ class DynamicWebReport(Report):
 			self.copy_template_files()
 			step()
 			# Export database as Javascript files
-			self._export_individuals()
-			step()
-			self._export_families()
-			step()
-			self._export_sources()
-			self._export_citations()
-			self._export_repositories()
-			step()
-			self._export_places()
-			step()
-			self._export_media()
-			step()
+			if (self.jobs > 1):
+				self._export_data_parallel(step)
+			else:
+				self._export_individuals()
+				step()
+				self._export_families()
+				step()
+				self._export_sources()
+				self._export_citations()
+				self._export_repositories()
+				step()
+				self._export_places()
+				step()
+				self._export_media()
+				step()
+			self._merge_previous_stats()
 			self._export_surnames()
 			step()
 			# Generate HTML files
@@ -687,6 +794,61 @@ class DynamicWebReport(Report):
 			# Create an archive file of the web site
 			self.create_archive()
 			step()
+			self._save_manifest()
+
+
+	def _export_data_parallel(self, step):
+		"""
+		Export the database as Javascript files, with the exporters running concurrently in L{self.jobs} threads.
+		The thumbnails are also created concurrently.
+		The exporters work on a snapshot of L{obj_dict} and L{bkref_dict},
+		and the database accesses are serialized (see L{_SerializedDb}).
+		@param step: progress step function, called in the calling thread each time an exporter is finished
+		"""
+		exporters = [
+			[self._export_individuals],
+			[self._export_families],
+			[self._export_sources, self._export_citations, self._export_repositories],
+			[self._export_places],
+			[self._export_media],
+		]
+		self.obj_dict = _SnapshotDict(
+			((cls, _SnapshotDict(objs, set)) for (cls, objs) in self.obj_dict.items()),
+			lambda: _SnapshotDict({}, set))
+		self.bkref_dict = _SnapshotDict(
+			((cls, _SnapshotDict(refs, set)) for (cls, refs) in self.bkref_dict.items()),
+			lambda: _SnapshotDict({}, set))
+		database = self.database
+		self.database = _SerializedDb(database)
+		try:
+			with ThreadPoolExecutor(max_workers = self.jobs) as executor:
+				futures = [executor.submit(self._run_exporters, group) for group in exporters]
+				thumbnails = [executor.submit(self.copy_thumbnail, media, region) for (media, region) in self._thumbnail_list()]
+				for future in as_completed(futures):
+					future.result()
+					step()
+				for future in thumbnails:
+					future.result()
+		finally:
+			self.database = database
+
+	def _run_exporters(self, exporters):
+		for exporter in exporters:
+			exporter()
+
+	def _thumbnail_list(self):
+		"""
+		Get the list of the thumbnails used in the web site, in the form (media, region)
+		"""
+		if (not self.inc_gallery): return([])
+		thumbnails = []
+		for media_handle in self.obj_dict[MediaObject]:
+			media = self.database.get_object_from_handle(media_handle)
+			regions = set([(0,0,100,100)])
+			for (bkref_class, bkref_handle, media_ref) in self.bkref_dict[MediaObject][media_handle]:
+				regions.add(tuple(media_ref.get_rectangle() or (0,0,100,100)))
+			thumbnails.extend((media, region) for region in regions)
+		return(thumbnails)
 
 
 	def _export_individuals(self):
@@ -748,65 +910,66 @@ class DynamicWebReport(Report):
 			"//   - A list of parents families in the form:\n"
 			"//       [index (in table 'F'), relation to father, relation to mother, notes, list of citations]\n"
 			"//   - A list of associations in the form:\n"
-			"//       [person index (in table 'I'), relationship, notes, list of citations (in table 'C')]\n"
-			"I = [")
-		sep = "\n"
+			"//       [person index (in table 'I'), relationship, notes, list of citations (in table 'C')]\n")
 		person_list = list(self.obj_dict[Person].keys())
 		person_list.sort(key = lambda x: self.obj_dict[Person][x][OBJDICT_INDEX])
-		for person_handle in person_list:
-			person = self.database.get_person_from_handle(person_handle)
-			sw.write(sep)
-			sw.write("[\"" + self.obj_dict[Person][person_handle][OBJDICT_GID] + "\",")
-			# Names
-			name = self.get_name(person) or ""
-			sw.write("\"" + script_escape(name) + "\",")
-			name = self.get_short_name(person) or ""
-			sw.write("\"" + script_escape(name) + "\",\n")
-			sw.write(self.get_name_data(person) + ",\n")
-			# Gender
-			gender = ""
-			if (person.get_gender() == Person.MALE): gender = "M"
-			if (person.get_gender() == Person.FEMALE): gender = "F"
-			if (person.get_gender() == Person.UNKNOWN): gender = "U"
-			sw.write("\"" + gender + "\",")
-			# Years
-			sw.write("\"" + self.get_birth_year(person) + "\",\n")
-			sw.write("\"" + self.get_birth_place(person) + "\",\n")
-			sw.write("\"" + self.get_death_year(person) + "\",\n")
-			sw.write("\"" + self.get_death_place(person) + "\",\n")
-			# Age at death
-			sw.write("\"" + script_escape(self.get_death_age(person)) + "\",\n")
-			# Events
-			sw.write("[\n" + self._data_events(person) + "\n],\n")
-			# Addresses
-			sw.write("[\n" + self._data_addresses(person) + "\n],\n")
-			# Get individual notes
-			sw.write("\"" + script_escape(self.get_notes_text(person)) + "\",\n")
-			# Get individual media
-			sw.write(self._data_media_reference_index(person))
-			sw.write(",\n")
-			# Get individual sources
-			sw.write(self._data_source_citation_index(person))
-			sw.write(",\n")
-			# Get individual attributes
-			sw.write(self._data_attributes(person))
-			sw.write(",\n")
-			# Get individual URL
-			sw.write(self._data_url_list(person))
-			sw.write(",\n")
-			# Families (partners)
-			sw.write(self._data_families_index(person))
-			sw.write(",\n")
-			# Families (parents)
-			sw.write(self._data_parents_families_index(person))
-			sw.write(",\n")
-			# Associations
-			sw.write(self._data_associations(person))
-			sw.write("\n]")
-			#
-			sep = ",\n"
-		sw.write("\n];\n")
-		self.update_file("dwr_db_indi.js", sw.getvalue())
+		self._write_table("dwr_db_indi.js", sw.getvalue(), "I", Person, person_list, self._data_person)
+
+
+	def _data_person(self, person_handle):
+		"""
+		Build the data of a person, as a string representing a Javascript Array (an element of table 'I')
+		"""
+		person = self.database.get_person_from_handle(person_handle)
+		sw = StringIO()
+		sw.write("[\"" + self.obj_dict[Person][person_handle][OBJDICT_GID] + "\",")
+		# Names
+		name = self.get_name(person) or ""
+		sw.write("\"" + script_escape(name) + "\",")
+		name = self.get_short_name(person) or ""
+		sw.write("\"" + script_escape(name) + "\",\n")
+		sw.write(self.get_name_data(person) + ",\n")
+		# Gender
+		gender = ""
+		if (person.get_gender() == Person.MALE): gender = "M"
+		if (person.get_gender() == Person.FEMALE): gender = "F"
+		if (person.get_gender() == Person.UNKNOWN): gender = "U"
+		sw.write("\"" + gender + "\",")
+		# Years
+		sw.write("\"" + self.get_birth_year(person) + "\",\n")
+		sw.write("\"" + self.get_birth_place(person) + "\",\n")
+		sw.write("\"" + self.get_death_year(person) + "\",\n")
+		sw.write("\"" + self.get_death_place(person) + "\",\n")
+		# Age at death
+		sw.write("\"" + script_escape(self.get_death_age(person)) + "\",\n")
+		# Events
+		sw.write("[\n" + self._data_events(person) + "\n],\n")
+		# Addresses
+		sw.write("[\n" + self._data_addresses(person) + "\n],\n")
+		# Get individual notes
+		sw.write("\"" + script_escape(self.get_notes_text(person)) + "\",\n")
+		# Get individual media
+		sw.write(self._data_media_reference_index(person))
+		sw.write(",\n")
+		# Get individual sources
+		sw.write(self._data_source_citation_index(person))
+		sw.write(",\n")
+		# Get individual attributes
+		sw.write(self._data_attributes(person))
+		sw.write(",\n")
+		# Get individual URL
+		sw.write(self._data_url_list(person))
+		sw.write(",\n")
+		# Families (partners)
+		sw.write(self._data_families_index(person))
+		sw.write(",\n")
+		# Families (parents)
+		sw.write(self._data_parents_families_index(person))
+		sw.write(",\n")
+		# Associations
+		sw.write(self._data_associations(person))
+		sw.write("\n]")
+		return(sw.getvalue())
 
 
 	def get_name_data(self, person):
@@ -940,45 +1103,46 @@ class DynamicWebReport(Report):
 			"//       [attribute, value, note, list of citations]\n"
 			"//   - A list of spouses index (in table 'I')\n"
 			"//   - A list of child in the form:\n"
-			"//       [index (in table 'I'), relation to father, relation to mother, notes, list of citations]\n"
-			"F = [")
-		sep = "\n"
+			"//       [index (in table 'I'), relation to father, relation to mother, notes, list of citations]\n")
 		family_list = list(self.obj_dict[Family].keys())
 		family_list.sort(key = lambda x: self.obj_dict[Family][x][OBJDICT_INDEX])
-		for family_handle in family_list:
-			family = self.database.get_family_from_handle(family_handle)
-			sw.write(sep)
-			sw.write("[\"" + self.obj_dict[Family][family_handle][OBJDICT_GID] + "\",")
-			# Names
-			name = self.get_family_name(family) or ""
-			sw.write("\"" + script_escape(name) + "\",\n")
-			sw.write("\"" + script_escape(str(family.get_relationship())) + "\",\n")
-			# Years
-			sw.write("\"" + self.get_marriage_year(family) + "\",\n")
-			sw.write("\"" + self.get_marriage_place(family) + "\",\n")
-			# Events
-			sw.write("[\n" + self._data_events(family) + "\n],\n")
-			# Get family notes
-			sw.write("\"" + script_escape(self.get_notes_text(family)) + "\",\n")
-			# Get family media
-			sw.write(self._data_media_reference_index(family))
-			sw.write(",\n")
-			# Get family sources
-			sw.write(self._data_source_citation_index(family))
-			sw.write(",\n")
-			# Get family attributes
-			sw.write(self._data_attributes(family))
-			sw.write(",\n")
-			# Partners
-			sw.write(self._data_partners_index(family))
-			sw.write(",\n")
-			# Children
-			sw.write(self._data_children_index(family))
-			sw.write("\n]")
-			#
-			sep = ",\n"
-		sw.write("\n];\n")
-		self.update_file("dwr_db_fam.js", sw.getvalue())
+		self._write_table("dwr_db_fam.js", sw.getvalue(), "F", Family, family_list, self._data_family)
+
+
+	def _data_family(self, family_handle):
+		"""
+		Build the data of a family, as a string representing a Javascript Array (an element of table 'F')
+		"""
+		family = self.database.get_family_from_handle(family_handle)
+		sw = StringIO()
+		sw.write("[\"" + self.obj_dict[Family][family_handle][OBJDICT_GID] + "\",")
+		# Names
+		name = self.get_family_name(family) or ""
+		sw.write("\"" + script_escape(name) + "\",\n")
+		sw.write("\"" + script_escape(str(family.get_relationship())) + "\",\n")
+		# Years
+		sw.write("\"" + self.get_marriage_year(family) + "\",\n")
+		sw.write("\"" + self.get_marriage_place(family) + "\",\n")
+		# Events
+		sw.write("[\n" + self._data_events(family) + "\n],\n")
+		# Get family notes
+		sw.write("\"" + script_escape(self.get_notes_text(family)) + "\",\n")
+		# Get family media
+		sw.write(self._data_media_reference_index(family))
+		sw.write(",\n")
+		# Get family sources
+		sw.write(self._data_source_citation_index(family))
+		sw.write(",\n")
+		# Get family attributes
+		sw.write(self._data_attributes(family))
+		sw.write(",\n")
+		# Partners
+		sw.write(self._data_partners_index(family))
+		sw.write(",\n")
+		# Children
+		sw.write(self._data_children_index(family))
+		sw.write("\n]")
+		return(sw.getvalue())
 
 
 	def _data_events(self, object):
@@ -1029,17 +1193,14 @@ class DynamicWebReport(Report):
 			if (evt_desc is None): evt_desc = ""
 			trow += "\"" + script_escape(html_escape(evt_desc)) + "\","
 			# Get event notes
-			notelist = event.get_note_list()
-			notelist.extend(event_ref.get_note_list())
-			attrlist = event.get_attribute_list()
-			attrlist.extend(event_ref.get_attribute_list())
+			notelist = event.get_note_list() + event_ref.get_note_list()
+			attrlist = event.get_attribute_list() + event_ref.get_attribute_list()
 			trow += "\"" + script_escape(self.get_notes_attributes_text(notelist, attrlist)) + "\","
 			# Get event media
 			trow += self._data_media_reference_index(event)
 			trow += ","
 			# Get event sources
-			citationlist = event.get_citation_list()
-			citationlist.extend(event_ref.get_citation_list())
+			citationlist = event.get_citation_list() + event_ref.get_citation_list()
 			for attr in attrlist: citationlist.extend(attr.get_citation_list())
 			trow += self._data_source_citation_index_from_list(citationlist)
 			#
@@ -1118,47 +1279,49 @@ class DynamicWebReport(Report):
 			"//       - call number\n"
 			"//       - notes of the repository reference\n"
 			"//   - The list of the sources attributes in the form:\n"
-			"//       [attribute, value, note, list of citations]\n"
-			"S = [")
-		sep = "\n"
+			"//       [attribute, value, note, list of citations]\n")
 		source_list = list(self.obj_dict[Source])
 		if (not self.inc_sources): source_list = []
 		source_list.sort(key = lambda x: self.obj_dict[Source][x][OBJDICT_INDEX])
-		for source_handle in source_list:
-			source = self.database.get_source_from_handle(source_handle)
-			sw.write(sep)
-			sw.write("[\"" + self.obj_dict[Source][source_handle][OBJDICT_GID] + "\",")
-			title = source.get_title() or ""
-			sw.write("\"" + script_escape(html_escape(title)) + "\",\n")
-			sw.write("\"")
-			for (label, value) in [
-				(_("Author"), source.get_author()),
-				(_("Abbreviation"), source.get_abbreviation()),
-				(_("Publication information"), source.get_publication_info())]:
-				if value:
-					html = Html("p") + Html("b", label + ": ") + value
-					sw.write(script_escape(html_text(html)))
-			sw.write("\",\n")
-			# Get source notes
-			sw.write("\"" + script_escape(self.get_notes_text(source)) + "\",\n")
-			# Get source media
-			sw.write(self._data_media_reference_index(source))
-			sw.write(",\n")
-			# Get source citations
-			sw.write(self._data_bkref_index(Source, source_handle, Citation))
-			sw.write(",\n")
-			# Get repositories references
-			sw.write(self._data_repo_reference_index(source))
-			sw.write(",\n")
-			# Get source attributes
-			if (DWR_VERSION_410):
-				sw.write(self._data_attributes_src(source))
-			else:
-				sw.write("[]")
-			sw.write("\n]")
-			sep = ",\n"
-		sw.write("\n];\n")
-		self.update_file("dwr_db_sour.js", sw.getvalue())
+		self._write_table("dwr_db_sour.js", sw.getvalue(), "S", Source, source_list, self._data_source)
+
+
+	def _data_source(self, source_handle):
+		"""
+		Build the data of a source, as a string representing a Javascript Array (an element of table 'S')
+		"""
+		source = self.database.get_source_from_handle(source_handle)
+		sw = StringIO()
+		sw.write("[\"" + self.obj_dict[Source][source_handle][OBJDICT_GID] + "\",")
+		title = source.get_title() or ""
+		sw.write("\"" + script_escape(html_escape(title)) + "\",\n")
+		sw.write("\"")
+		for (label, value) in [
+			(_("Author"), source.get_author()),
+			(_("Abbreviation"), source.get_abbreviation()),
+			(_("Publication information"), source.get_publication_info())]:
+			if value:
+				html = Html("p") + Html("b", label + ": ") + value
+				sw.write(script_escape(html_text(html)))
+		sw.write("\",\n")
+		# Get source notes
+		sw.write("\"" + script_escape(self.get_notes_text(source)) + "\",\n")
+		# Get source media
+		sw.write(self._data_media_reference_index(source))
+		sw.write(",\n")
+		# Get source citations
+		sw.write(self._data_bkref_index(Source, source_handle, Citation))
+		sw.write(",\n")
+		# Get repositories references
+		sw.write(self._data_repo_reference_index(source))
+		sw.write(",\n")
+		# Get source attributes
+		if (DWR_VERSION_410):
+			sw.write(self._data_attributes_src(source))
+		else:
+			sw.write("[]")
+		sw.write("\n]")
+		return(sw.getvalue())
 
 
 	def _export_citations(self):
@@ -1186,52 +1349,54 @@ class DynamicWebReport(Report):
 			"//     (including the media references referencing this citation)\n"
 			"//   - A list of the place index (in table 'P') referencing this citation\n"
 			"//     (including the media references referencing this citation)\n"
-			"//   - A list of the repository index (in table 'R') referencing this citation\n"
-			"C = [")
-		sep = "\n"
+			"//   - A list of the repository index (in table 'R') referencing this citation\n")
 		citation_list = list(self.obj_dict[Citation])
 		if (not self.inc_sources): citation_list = []
 		citation_list.sort(key = lambda x: self.obj_dict[Citation][x][OBJDICT_INDEX])
-		for citation_handle in citation_list:
-			citation = self.database.get_citation_from_handle(citation_handle)
-			source_handle = citation.get_reference_handle()
-			sw.write(sep)
-			sw.write("[\"" + self.obj_dict[Citation][citation_handle][OBJDICT_GID] + "\",")
-			sw.write(str(self.obj_dict[Source][source_handle][OBJDICT_INDEX])+ ",\n")
-			sw.write("\"")
-			confidence = citation.get_confidence_level()
-			if ((confidence in conf_strings) and confidence != Citation.CONF_NORMAL):
-				confidence = _(conf_strings[confidence])
-			else:
-				confidence = None
-			for (label, value) in [
-				(_("Date"), format_date(citation.get_date_object())),
-				(_("Page"), citation.get_page()),
-				(_("Confidence"), confidence),
-			]:
-				if value:
-					html = Html("p") + Html("b", label + ": ") + value
-					sw.write(script_escape(html_text(html)))
-			sw.write("\",\n")
-			# Get citation notes
-			sw.write("\"" + script_escape(self.get_notes_text(citation)) + "\",\n")
-			# Get citation media
-			sw.write(self._data_media_reference_index(citation))
-			sw.write(",\n")
-			# Get references
-			sw.write(self._data_bkref_index(Citation, citation_handle, Person))
-			sw.write(",\n")
-			sw.write(self._data_bkref_index(Citation, citation_handle, Family))
-			sw.write(",\n")
-			sw.write(self._data_bkref_index(Citation, citation_handle, MediaObject))
-			sw.write(",\n")
-			sw.write(self._data_bkref_index(Citation, citation_handle, Place))
-			sw.write(",\n")
-			sw.write(self._data_bkref_index(Citation, citation_handle, Repository))
-			sw.write("\n]")
-			sep = ",\n"
-		sw.write("\n];\n")
-		self.update_file("dwr_db_cita.js", sw.getvalue())
+		self._write_table("dwr_db_cita.js", sw.getvalue(), "C", Citation, citation_list, self._data_citation)
+
+
+	def _data_citation(self, citation_handle):
+		"""
+		Build the data of a source citation, as a string representing a Javascript Array (an element of table 'C')
+		"""
+		citation = self.database.get_citation_from_handle(citation_handle)
+		sw = StringIO()
+		source_handle = citation.get_reference_handle()
+		sw.write("[\"" + self.obj_dict[Citation][citation_handle][OBJDICT_GID] + "\",")
+		sw.write(str(self.obj_dict[Source][source_handle][OBJDICT_INDEX])+ ",\n")
+		sw.write("\"")
+		confidence = citation.get_confidence_level()
+		if ((confidence in conf_strings) and confidence != Citation.CONF_NORMAL):
+			confidence = _(conf_strings[confidence])
+		else:
+			confidence = None
+		for (label, value) in [
+			(_("Date"), format_date(citation.get_date_object())),
+			(_("Page"), citation.get_page()),
+			(_("Confidence"), confidence),
+		]:
+			if value:
+				html = Html("p") + Html("b", label + ": ") + value
+				sw.write(script_escape(html_text(html)))
+		sw.write("\",\n")
+		# Get citation notes
+		sw.write("\"" + script_escape(self.get_notes_text(citation)) + "\",\n")
+		# Get citation media
+		sw.write(self._data_media_reference_index(citation))
+		sw.write(",\n")
+		# Get references
+		sw.write(self._data_bkref_index(Citation, citation_handle, Person))
+		sw.write(",\n")
+		sw.write(self._data_bkref_index(Citation, citation_handle, Family))
+		sw.write(",\n")
+		sw.write(self._data_bkref_index(Citation, citation_handle, MediaObject))
+		sw.write(",\n")
+		sw.write(self._data_bkref_index(Citation, citation_handle, Place))
+		sw.write(",\n")
+		sw.write(self._data_bkref_index(Citation, citation_handle, Repository))
+		sw.write("\n]")
+		return(sw.getvalue())
 
 
 	def _export_repositories(self):
@@ -1261,33 +1426,35 @@ class DynamicWebReport(Report):
 			"//       - source index (in table 'S')\n"
 			"//       - media type\n"
 			"//       - call number\n"
-			"//       - notes of the repository reference\n"
-			"R = [")
-		sep = "\n"
+			"//       - notes of the repository reference\n")
 		repo_list = list(self.obj_dict[Repository])
 		if (not self.inc_repositories): repo_list = []
 		repo_list.sort(key = lambda x: self.obj_dict[Repository][x][OBJDICT_INDEX])
-		for repo_handle in repo_list:
-			repo = self.database.get_repository_from_handle(repo_handle)
-			sw.write(sep)
-			sw.write("[\"" + self.obj_dict[Repository][repo_handle][OBJDICT_GID] + "\",")
-			name = repo.get_name() or ""
-			sw.write("\"" + script_escape(name) + "\",\n")
-			type = repo.get_type() or ""
-			sw.write("\"" + script_escape(str(type)) + "\",\n")
-			# Addresses
-			sw.write("[\n" + self._data_addresses(repo) + "\n],\n")
-			# Get repository notes
-			sw.write("\"" + script_escape(self.get_notes_text(repo)) + "\",\n")
-			# Get repository URL
-			sw.write(self._data_url_list(repo))
-			sw.write(",\n")
-			# Get source references
-			sw.write(self._data_repo_backref_index(repo, Source))
-			sw.write("\n]")
-			sep = ",\n"
-		sw.write("\n];\n")
-		self.update_file("dwr_db_repo.js", sw.getvalue())
+		self._write_table("dwr_db_repo.js", sw.getvalue(), "R", Repository, repo_list, self._data_repository)
+
+
+	def _data_repository(self, repo_handle):
+		"""
+		Build the data of a repository, as a string representing a Javascript Array (an element of table 'R')
+		"""
+		repo = self.database.get_repository_from_handle(repo_handle)
+		sw = StringIO()
+		sw.write("[\"" + self.obj_dict[Repository][repo_handle][OBJDICT_GID] + "\",")
+		name = repo.get_name() or ""
+		sw.write("\"" + script_escape(name) + "\",\n")
+		type = repo.get_type() or ""
+		sw.write("\"" + script_escape(str(type)) + "\",\n")
+		# Addresses
+		sw.write("[\n" + self._data_addresses(repo) + "\n],\n")
+		# Get repository notes
+		sw.write("\"" + script_escape(self.get_notes_text(repo)) + "\",\n")
+		# Get repository URL
+		sw.write(self._data_url_list(repo))
+		sw.write(",\n")
+		# Get source references
+		sw.write(self._data_repo_backref_index(repo, Source))
+		sw.write("\n]")
+		return(sw.getvalue())
 
 
 	def _export_media(self):
@@ -1335,50 +1502,52 @@ class DynamicWebReport(Report):
 			"//       - media thumbnail path\n"
 			"//       - [x1, y1, x2, y2] of the media reference\n"
 			"//       - notes of the media reference\n"
-			"//       - list of the media reference source citations index (in table 'C')\n"
-			"M = [")
-		sep = "\n"
+			"//       - list of the media reference source citations index (in table 'C')\n")
 		media_list = list(self.obj_dict[MediaObject])
 		if (not self.inc_gallery): media_list = []
 		media_list.sort(key = lambda x: self.obj_dict[MediaObject][x][OBJDICT_INDEX])
-		for media_handle in media_list:
-			media = self.database.get_object_from_handle(media_handle)
-			sw.write(sep)
-			sw.write("[\"" + self.obj_dict[MediaObject][media_handle][OBJDICT_GID] + "\",")
-			title = media.get_description() or ""
-			sw.write("\"" + script_escape(html_escape(title)) + "\",\n")
-			sw.write("\"" + script_escape(media.get_path()) + "\",\n")
-			path = self.get_media_web_path(media)
-			sw.write("\"" + script_escape(path) + "\",\n")
-			sw.write("\"" + script_escape(media.get_mime_type()) + "\",\n")
-			# Get media date
-			date = format_date(media.get_date_object()) or ""
-			sw.write("\"" + date + "\",\n")
-			date = format_date(media.get_date_object(), True) or ""
-			sw.write("\"" + date + "\",\n")
-			# Get media notes
-			sw.write("\"" + script_escape(self.get_notes_text(media)) + "\",\n")
-			# Get media sources
-			sw.write(self._data_source_citation_index(media))
-			sw.write(",\n")
-			# Get media attributes
-			sw.write(self._data_attributes(media))
-			sw.write(",\n")
-			# Get media thumbnail
-			sw.write("\"" + self.copy_thumbnail(media, (0,0,100,100)) + "\",\n")
-			# Get media references
-			sw.write(self._data_media_backref_index(media, Person))
-			sw.write(",\n")
-			sw.write(self._data_media_backref_index(media, Family))
-			sw.write(",\n")
-			sw.write(self._data_media_backref_index(media, Source))
-			sw.write(",\n")
-			sw.write(self._data_media_backref_index(media, Place))
-			sw.write("\n")
-			sw.write("]")
-			sep = ",\n"
-		sw.write("\n];\n")
-		self.update_file("dwr_db_media.js", sw.getvalue())
+		self._write_table("dwr_db_media.js", sw.getvalue(), "M", MediaObject, media_list, self._data_media)
+
+
+	def _data_media(self, media_handle):
+		"""
+		Build the data of a media object, as a string representing a Javascript Array (an element of table 'M')
+		"""
+		media = self.database.get_object_from_handle(media_handle)
+		sw = StringIO()
+		sw.write("[\"" + self.obj_dict[MediaObject][media_handle][OBJDICT_GID] + "\",")
+		title = media.get_description() or ""
+		sw.write("\"" + script_escape(html_escape(title)) + "\",\n")
+		sw.write("\"" + script_escape(media.get_path()) + "\",\n")
+		path = self.get_media_web_path(media)
+		sw.write("\"" + script_escape(path) + "\",\n")
+		sw.write("\"" + script_escape(media.get_mime_type()) + "\",\n")
+		# Get media date
+		date = format_date(media.get_date_object()) or ""
+		sw.write("\"" + date + "\",\n")
+		date = format_date(media.get_date_object(), True) or ""
+		sw.write("\"" + date + "\",\n")
+		# Get media notes
+		sw.write("\"" + script_escape(self.get_notes_text(media)) + "\",\n")
+		# Get media sources
+		sw.write(self._data_source_citation_index(media))
+		sw.write(",\n")
+		# Get media attributes
+		sw.write(self._data_attributes(media))
+		sw.write(",\n")
+		# Get media thumbnail
+		sw.write("\"" + self.copy_thumbnail(media, (0,0,100,100)) + "\",\n")
+		# Get media references
+		sw.write(self._data_media_backref_index(media, Person))
+		sw.write(",\n")
+		sw.write(self._data_media_backref_index(media, Family))
+		sw.write(",\n")
+		sw.write(self._data_media_backref_index(media, Source))
+		sw.write(",\n")
+		sw.write(self._data_media_backref_index(media, Place))
+		sw.write("\n")
+		sw.write("]")
+		return(sw.getvalue())
 
 
 	def _export_places(self):
@@ -1403,85 +1572,86 @@ class DynamicWebReport(Report):
 			"//       [type, url, description]\n"
 			"//   - A list of the person index (in table 'I') for events referencing this place\n"
 			"//     (including the persons directly referencing this place)\n"
-			"//   - A list of the family index (in table 'F') for events referencing this place\n"
-			"P=[")
-		sep = "\n"
+			"//   - A list of the family index (in table 'F') for events referencing this place\n")
 		place_list = list(self.obj_dict[Place])
 		place_list.sort(key = lambda x: self.obj_dict[Place][x][OBJDICT_INDEX])
-		for place_handle in place_list:
-			place = self.database.get_place_from_handle(place_handle)
-			sw.write(sep)
-			sw.write("[\"" + self.obj_dict[Place][place_handle][OBJDICT_GID] + "\",")
-			place_name = report_utils.place_name(self.database, place_handle)
-			sw.write("\"" + script_escape(place_name) + "\"")
-			if (not self.inc_places):
-				sw.write("]")
-				sep = ",\n"
-				continue
-			sw.write(",\n")
-			locations = []
-			if (DWR_VERSION_410):
-				ml = get_main_location(self.database, place)
-				loc = Location()
-				loc.street = ml.get(PlaceType.STREET, '')
-				loc.locality = ml.get(PlaceType.LOCALITY, '')
-				loc.city = ml.get(PlaceType.CITY, '')
-				loc.parish = ml.get(PlaceType.PARISH, '')
-				loc.county = ml.get(PlaceType.COUNTY, '')
-				loc.state = ml.get(PlaceType.STATE, '')
-				loc.postal = place.get_code()
-				loc.country = ml.get(PlaceType.COUNTRY, '')
-				locations.append(loc)
-			else:
-				if (place.main_loc):
-					ml = place.get_main_location()
-					if (ml and not ml.is_empty()): locations.append(ml)
-			altloc = place.get_alternate_locations()
-			if (altloc):
-				altloc = [nonempt for nonempt in altloc if (not nonempt.is_empty())]
-				locations += altloc
-			loctabs = []
-			for loc in locations:
-				loctab = [
-					loc.street,
-					loc.locality,
-					loc.city,
-					loc.parish,
-					loc.county,
-					loc.state,
-					loc.postal,
-					loc.country,
-				]
-				loctab = [(data or "") for data in loctab]
-				loctab = ["\"" + script_escape(data) + "\"" for data in loctab]
-				loctabs.append("[" + ",".join(loctab) + "]")
-			sw.write("[" + ",".join(loctabs) + "],\n")
-			latitude = place.get_latitude()
-			longitude = place.get_longitude()
-			if (latitude and longitude):
-				coords = conv_lat_lon(latitude, longitude, "D.D8")
-			else:
-				coords = ("", "")
-			sw.write("[\"" + "\",\"".join(coords) + "\"]\n,")
-			# Get place notes
-			sw.write("\"" + script_escape(self.get_notes_text(place)) + "\",\n")
-			# Get place media
-			sw.write(self._data_media_reference_index(place))
-			sw.write(",\n")
-			# Get place sources
-			sw.write(self._data_source_citation_index(place))
-			sw.write(",\n")
-			# Get place URL
-			sw.write(self._data_url_list(place))
-			sw.write(",\n")
-			# Get back references
-			sw.write(self._data_bkref_index(Place, place_handle, Person))
-			sw.write(",\n")
-			sw.write(self._data_bkref_index(Place, place_handle, Family))
-			sw.write("\n]")
-			sep = ",\n"
-		sw.write("\n];\n")
-		self.update_file("dwr_db_place.js", sw.getvalue())
+		self._write_table("dwr_db_place.js", sw.getvalue(), "P", Place, place_list, self._data_place)
+
+
+	def _data_place(self, place_handle):
+		"""
+		Build the data of a place, as a string representing a Javascript Array (an element of table 'P')
+		"""
+		place = self.database.get_place_from_handle(place_handle)
+		sw = StringIO()
+		sw.write("[\"" + self.obj_dict[Place][place_handle][OBJDICT_GID] + "\",")
+		place_name = report_utils.place_name(self.database, place_handle)
+		sw.write("\"" + script_escape(place_name) + "\"")
+		if (not self.inc_places):
+			sw.write("]")
+			return(sw.getvalue())
+		sw.write(",\n")
+		locations = []
+		if (DWR_VERSION_410):
+			ml = get_main_location(self.database, place)
+			loc = Location()
+			loc.street = ml.get(PlaceType.STREET, '')
+			loc.locality = ml.get(PlaceType.LOCALITY, '')
+			loc.city = ml.get(PlaceType.CITY, '')
+			loc.parish = ml.get(PlaceType.PARISH, '')
+			loc.county = ml.get(PlaceType.COUNTY, '')
+			loc.state = ml.get(PlaceType.STATE, '')
+			loc.postal = place.get_code()
+			loc.country = ml.get(PlaceType.COUNTRY, '')
+			locations.append(loc)
+		else:
+			if (place.main_loc):
+				ml = place.get_main_location()
+				if (ml and not ml.is_empty()): locations.append(ml)
+		altloc = place.get_alternate_locations()
+		if (altloc):
+			altloc = [nonempt for nonempt in altloc if (not nonempt.is_empty())]
+			locations += altloc
+		loctabs = []
+		for loc in locations:
+			loctab = [
+				loc.street,
+				loc.locality,
+				loc.city,
+				loc.parish,
+				loc.county,
+				loc.state,
+				loc.postal,
+				loc.country,
+			]
+			loctab = [(data or "") for data in loctab]
+			loctab = ["\"" + script_escape(data) + "\"" for data in loctab]
+			loctabs.append("[" + ",".join(loctab) + "]")
+		sw.write("[" + ",".join(loctabs) + "],\n")
+		latitude = place.get_latitude()
+		longitude = place.get_longitude()
+		if (latitude and longitude):
+			coords = conv_lat_lon(latitude, longitude, "D.D8")
+		else:
+			coords = ("", "")
+		sw.write("[\"" + "\",\"".join(coords) + "\"]\n,")
+		# Get place notes
+		sw.write("\"" + script_escape(self.get_notes_text(place)) + "\",\n")
+		# Get place media
+		sw.write(self._data_media_reference_index(place))
+		sw.write(",\n")
+		# Get place sources
+		sw.write(self._data_source_citation_index(place))
+		sw.write(",\n")
+		# Get place URL
+		sw.write(self._data_url_list(place))
+		sw.write(",\n")
+		# Get back references
+		sw.write(self._data_bkref_index(Place, place_handle, Person))
+		sw.write(",\n")
+		sw.write(self._data_bkref_index(Place, place_handle, Family))
+		sw.write("\n]")
+		return(sw.getvalue())
 
 
 	def get_notes_text(self, object):
@@ -1705,7 +1875,7 @@ class DynamicWebReport(Report):
 		txt += "],"
 		attrlist = ref.get_attribute_list()
 		txt += "\"" + script_escape(self.get_notes_attributes_text(ref.get_note_list(), attrlist)) + "\","
-		citationlist = ref.get_citation_list()
+		citationlist = list(ref.get_citation_list())
 		for attr in attrlist: citationlist.extend(attr.get_citation_list())
 		# BUG: it seems that attribute references are given by both ref.get_citation_list and attr.get_citation_list
 		txt += self._data_source_citation_index_from_list(citationlist)
@@ -1727,9 +1897,11 @@ class DynamicWebReport(Report):
 					ext = os.path.splitext(norm_path)[1]
 					iname = str(media.get_handle()) + ext
 					iname = iname.lower()
-					if (iname not in self.images_copied):
-						self.copy_file(norm_path, iname, "image")
+					with self._files_lock:
+						to_copy = (iname not in self.images_copied)
 						self.images_copied.add(iname)
+					if (to_copy):
+						self.copy_file(norm_path, iname, "image")
 					web_path = "image/" + iname
 				else:
 					try:
@@ -1753,19 +1925,21 @@ class DynamicWebReport(Report):
 		if (region and region[0] == 0 and region[1] == 0 and region[2] == 100 and region[3] == 100):
 			region = None
 		handle = media.get_handle()
-		tname = handle + (("-%d,%d-%d,%d.png" % region) if region else ".png")
-		if (media.get_mime_type()):
-			from_path = get_thumbnail_path(
-				media_path_full(self.database, media.get_path()),
-				media.get_mime_type(),
-				region)
-			if not os.path.isfile(from_path):
+		tname = handle + (("-%d,%d-%d,%d.png" % tuple(region)) if region else ".png")
+		with self._files_lock:
+			to_create = (tname not in self.thumbnail_created)
+			self.thumbnail_created.add(tname)
+		if (to_create):
+			if (media.get_mime_type()):
+				from_path = get_thumbnail_path(
+					media_path_full(self.database, media.get_path()),
+					media.get_mime_type(),
+					region)
+				if not os.path.isfile(from_path):
+					from_path = os.path.join(IMAGE_DIR, "document.png")
+			else:
 				from_path = os.path.join(IMAGE_DIR, "document.png")
-		else:
-			from_path = os.path.join(IMAGE_DIR, "document.png")
-		if (tname not in self.thumbnail_created):
 			self.copy_file(from_path, tname, "thumb")
-			self.thumbnail_created.add(tname)
 		web_path = "thumb/" + tname
 		return(web_path)
 
@@ -1989,8 +2163,9 @@ class DynamicWebReport(Report):
 			start = date.get_start_date()
 			if (mod == Date.MOD_NONE and start != Date.EMPTY):
 				y = str(start[2])
-				self.min_period = min(self.min_period, start[2])
-				self.max_period = max(self.max_period, start[2])
+				with self._stats_lock:
+					self.min_period = min(self.min_period, start[2])
+					self.max_period = max(self.max_period, start[2])
 		return(y)
 
 	def get_birth_place(self, person):
@@ -2025,8 +2200,9 @@ class DynamicWebReport(Report):
 				age = int(nyears)
 				if (age):
 					age = round(abs(age) / 365.25)
-					self.min_age = min(self.min_age, age)
-					self.max_age = max(self.max_age, age)
+					with self._stats_lock:
+						self.min_age = min(self.min_age, age)
+						self.max_age = max(self.max_age, age)
 				return(str(nyears))
 		return("");
 
@@ -2428,6 +2604,11 @@ class DynamicWebReport(Report):
 			head += Html("link", rel = "stylesheet", href = style, type = "text/css")
 		for script in scripts:
 			head += Html("script", language = "javascript", src = script, charset = self.encoding)
+		if (self.shard_size > 0 and "dwr_db_indi.js" in scripts):
+			# The data shards needed by the page are loaded before running the page script
+			match = re.match(r"DwrMain\((\w+)\);$", cmd)
+			page_type = match.group(1) if match else "0"
+			cmd = "DwrShardsLoad(%s, '%s');" % (page_type, script_escape(cmd))
 		body += Html("script", cmd, language = "javascript")
 		self.update_file(filename, html_text(page))
 
@@ -2578,6 +2759,58 @@ class DynamicWebReport(Report):
 		return(text)
 
 
+	def _write_table(self, fout, header, table, cls, handle_list, data_function):
+		"""
+		Write the objects data in the Javascript Array L{table}.
+		If the option "shardsize" is set and the table is larger, the table is split in several files
+		"<fout>_<n>.js" (the shards), each one filling the table with L{self.shard_size} objects.
+		In that case, L{fout} only declares the table and its shards (see "DwrShardsLoad" in "dwr.js"),
+		and the shards are loaded by the pages when needed.
+		Only one shard is held in memory at a time.
+		@param fout: output file name
+		@param header: comments describing the table
+		@param table: Javascript table name
+		@param cls: objects class
+		@param handle_list: list of the objects handles, sorted by index
+		@param data_function: method "_data_***" building the object data
+		"""
+		if (self.shard_size <= 0 or len(handle_list) <= self.shard_size):
+			sw = StringIO()
+			sw.write(header)
+			sw.write(table + " = [")
+			sep = "\n"
+			for handle in handle_list:
+				sw.write(sep)
+				sw.write(self._get_fragment(cls, handle, data_function))
+				sep = ",\n"
+			sw.write("\n];\n")
+			self.update_file(fout, sw.getvalue())
+			return
+		base = fout[:-3]
+		count = (len(handle_list) + self.shard_size - 1) // self.shard_size
+		for shard in range(count):
+			start = shard * self.shard_size
+			sw = StringIO()
+			sw.write("// This file is generated\n\n")
+			sw.write("// Objects %i to %i of table '%s' (see '%s')\n" % (start, start + self.shard_size - 1, table, fout))
+			sw.write("DwrShard(%s, %i, [" % (table, start))
+			sep = "\n"
+			for handle in handle_list[start : start + self.shard_size]:
+				sw.write(sep)
+				sw.write(self._get_fragment(cls, handle, data_function))
+				sep = ",\n"
+			sw.write("\n]);\n")
+			self.update_file("%s_%i.js" % (base, shard), sw.getvalue())
+		sw = StringIO()
+		sw.write(header)
+		sw.write("// '%s' is split in %i files '%s_<n>.js' of %i objects\n" % (table, count, base, self.shard_size))
+		sw.write("%s = [];\n" % table)
+		sw.write("if (typeof(DB_SHARDS) == 'undefined') DB_SHARDS = {};\n")
+		sw.write("DB_SHARDS['%s'] = {file: '%s', size: %i, count: %i, length: %i};\n" %
+			(table, base, self.shard_size, count, len(handle_list)))
+		self.update_file(fout, sw.getvalue())
+
+
 	def update_file(self, fout, txt, encoding = None):
 		"""
 		Write a string in a file.
@@ -2589,6 +2822,13 @@ class DynamicWebReport(Report):
 		if (encoding is None): encoding = self.encoding
 		f = os.path.join(self.target_path, fout)
 		self.created_files.append(f)
+		if (self.incremental):
+			# Check the file contents hash without reading the file
+			digest = hashlib.md5(txt.encode(encoding, "xmlcharrefreplace")).hexdigest()
+			self.manifest["files"][fout] = digest
+			if (os.path.exists(f) and self.previous_manifest["files"].get(fout) == digest):
+				log.info("File \"%s\" not overwritten (unchanged)" % fout)
+				return
 		if (os.path.exists(f)):
 			try:
 				fr = codecs.open(f, "r", encoding = encoding, errors="xmlcharrefreplace")
@@ -2615,7 +2855,8 @@ class DynamicWebReport(Report):
 		'to_dir' is the relative path name in the destination root. It will
 		be prepended before 'to_fname'.
 		
-		The file is not copied if the contents of 'from_fname' 'to_fname' are identical
+		The file is not copied if the contents of 'from_fname' 'to_fname' are identical.
+		For incremental updates, the file is not copied (nor read) if 'from_fname' size and modification time did not change since it was last copied.
 		"""
 		# log.debug("copying '%s' to '%s/%s'" % (from_fname, to_dir, to_fname))
 		dest = os.path.join(self.target_path, to_dir, to_fname)
@@ -2625,6 +2866,15 @@ class DynamicWebReport(Report):
 
 		if from_fname != dest:
 			try:
+				if (self.incremental):
+					key = os.path.join(to_dir, to_fname).replace("\\", "/")
+					stat_src = os.stat(from_fname)
+					stamp = [from_fname, stat_src.st_size, int(stat_src.st_mtime)]
+					self.manifest["copies"][key] = stamp
+					if (os.path.exists(dest) and self.previous_manifest["copies"].get(key) == stamp):
+						self.created_files.append(dest)
+						log.info("File \"%s\" not copied (unchanged)" % dest)
+						return
 				dest_temp = dest + ".temp"
 				shutil.copyfile(from_fname, dest_temp)
 				self.created_files.append(dest)
@@ -2921,6 +3171,231 @@ class DynamicWebReport(Report):
 		return(object)
 
 
+	##############################################################################################
+	################################################################### Incremental update manifest
+	##############################################################################################
+
+	def _init_incremental_build(self):
+		"""
+		Load the manifest of the previous report generation (see L{MANIFEST_FILE}) for incremental updates.
+		
+		The manifest contains:
+		 - the report generation time,
+		 - a signature of the report options, and the index of each object in its table,
+		 - the data of each object, as built by the methods "_data_***",
+		 - the hash of the generated files contents,
+		 - the size and modification time of the copied files.
+		 
+		The data of an object is reused if the options did not change,
+		if neither the object, nor the objects referencing it or referenced by it (see L{bkref_dict}) changed since the previous generation,
+		and if the objects it references kept their index in the tables.
+		"""
+		self.manifest = {
+			"version": MANIFEST_VERSION,
+			"time": int(time.time()),
+			"options": self._get_options_signature(),
+			"indexes": self._get_object_indexes(),
+			"stats": None,
+			"fragments": defaultdict(dict),
+			"files": {},
+			"copies": {},
+		}
+		self.previous_manifest = {
+			"fragments": {},
+			"files": {},
+			"copies": {},
+		}
+		self.dirty_objects = set()
+		self.fragments_reused = 0
+		if (not self.incremental): return
+		path = os.path.join(self.target_path, MANIFEST_FILE)
+		if (not os.path.isfile(path)): return
+		try:
+			fr = codecs.open(path, "r", encoding = "UTF-8")
+			previous = json.load(fr)
+			fr.close()
+		except:
+			log.warning(_("Unable to read \"%(path)s\", the web site is fully generated") % {"path": path})
+			return
+		if (previous.get("version") != MANIFEST_VERSION): return
+		self.previous_manifest["files"] = previous.get("files", {})
+		self.previous_manifest["copies"] = previous.get("copies", {})
+		if (previous.get("options") != self.manifest["options"]):
+			log.info("Options changed since the previous generation, all objects are exported")
+			return
+		self.previous_manifest["fragments"] = previous.get("fragments", {})
+		self.previous_manifest["stats"] = previous.get("stats")
+		self.dirty_objects = self._get_changed_objects(previous["time"], previous.get("indexes", {}))
+		log.info("%i objects changed since the previous generation" % len(self.dirty_objects))
+
+
+	def _get_options_signature(self):
+		"""
+		Get a signature of the report options that have an impact on the exported data
+		"""
+		options = [
+			(name, str(value))
+			for (name, value) in self.options.items()
+			if (name not in ("jobs", "incremental", "shardsize"))
+		]
+		options.sort()
+		options.append(("gramps", VERSION))
+		options.append(("lang", glocale.lang))
+		return(hashlib.md5(repr(options).encode("UTF-8")).hexdigest())
+
+
+	def _get_object_indexes(self):
+		"""
+		Get the index of the objects in the tables, by class name and handle.
+		When the index of an object changes, the data of the objects referencing it is no longer valid.
+		"""
+		return(dict(
+			(cls.__name__, dict((handle, data[OBJDICT_INDEX]) for (handle, data) in self.obj_dict[cls].items()))
+			for cls in (Person, Family, Event, Place, Source, Citation, MediaObject, Repository)))
+
+
+	def _get_changed_objects(self, since, previous_indexes):
+		"""
+		Get the objects whose data should be exported again, because they changed since the time L{since},
+		or because the index of an object they reference is not the one in L{previous_indexes}
+		@return: set of (class, handle)
+		"""
+		class_names = {
+			"Person": Person,
+			"Family": Family,
+			"Event": Event,
+			"Place": Place,
+			"Source": Source,
+			"Citation": Citation,
+			"MediaObject": MediaObject,
+			"Media": MediaObject,
+			"Repository": Repository,
+		}
+		changed = set()
+		for (cls, objs) in self.obj_dict.items():
+			for (handle, data) in objs.items():
+				if (len(data) > OBJDICT_CHANGE and data[OBJDICT_CHANGE] >= since):
+					changed.add((cls, handle))
+		# The name of a place contains the names of the places enclosing it:
+		# the places enclosed by a changed place, at any depth, change too.
+		# The enclosing places are not always exported, so all the places are checked
+		places = [place.get_handle() for place in self.database.iter_places() if (place.get_change_time() >= since)]
+		enclosed = set(places)
+		while (places):
+			for (class_name, handle) in self.database.find_backlink_handles(places.pop(), include_classes = ["Place"]):
+				if (handle in enclosed): continue
+				enclosed.add(handle)
+				places.append(handle)
+		for handle in enclosed:
+			if (handle in self.obj_dict[Place]):
+				changed.add((Place, handle))
+		# The persons and families show the places of their events (birth place, etc.):
+		# follow the links place -> event -> person/family through all the objects referencing the events
+		events = set(handle for (cls, handle) in changed if (cls is Event))
+		for handle in enclosed:
+			events.update(handle for (class_name, handle) in self.database.find_backlink_handles(handle, include_classes = ["Event"]))
+		for event_handle in events:
+			for (class_name, handle) in self.database.find_backlink_handles(event_handle, include_classes = ["Person", "Family"]):
+				cls = class_names[class_name]
+				if (handle in self.obj_dict[cls]):
+					changed.add((cls, handle))
+		# The notes are not in obj_dict, but their text is exported with the objects referencing them
+		for note in self.database.iter_notes():
+			if (note.get_change_time() < since): continue
+			for (class_name, handle) in self.database.find_backlink_handles(note.get_handle()):
+				if (class_name in class_names):
+					changed.add((class_names[class_name], handle))
+		# The data of an object could contain data of the objects it references (place names, event dates, etc.),
+		# or data of the objects referencing it (family name, etc.)
+		references = defaultdict(set)
+		for (cls, bkrefs) in self.bkref_dict.items():
+			for (handle, refs) in bkrefs.items():
+				for ref in refs:
+					references[(cls, handle)].add((ref[BKREF_CLASS], ref[BKREF_HANDLE]))
+					references[(ref[BKREF_CLASS], ref[BKREF_HANDLE])].add((cls, handle))
+		dirty = set(changed)
+		for obj in changed:
+			dirty.update(references[obj])
+		# The data of an object contains the indexes of the objects it references
+		for (cls, objs) in self.obj_dict.items():
+			indexes = previous_indexes.get(cls.__name__, {})
+			for (handle, data) in objs.items():
+				index = indexes.get(handle)
+				if (index is not None and index != data[OBJDICT_INDEX]):
+					dirty.update(references[(cls, handle)])
+		return(dirty)
+
+
+	def _get_fragment(self, cls, handle, data_function):
+		"""
+		Get the data of an object, as built by L{data_function}.
+		For incremental updates, the data of the previous generation is reused if the object did not change.
+		@param cls: object class
+		@param handle: object handle
+		@param data_function: method "_data_***" building the object data
+		@return: object data as a string representing a Javascript Array
+		"""
+		fragment = None
+		if ((cls, handle) not in self.dirty_objects):
+			fragment = self.previous_manifest["fragments"].get(cls.__name__, {}).get(handle)
+		if (fragment is None):
+			fragment = data_function(handle)
+		else:
+			self.fragments_reused += 1
+		if (self.incremental):
+			self.manifest["fragments"][cls.__name__][handle] = fragment
+		return(fragment)
+
+
+	def _merge_previous_stats(self):
+		"""
+		Merge the ages and periods computed during the data export with the ones of the previous generation.
+		This is needed when the data of some objects is reused, since these data are computed when the objects are exported.
+		When persons or families of the previous generation were deleted or exported again,
+		the previous ages and periods could come from their old data: they are recomputed from the reused data instead.
+		"""
+		if (self.fragments_reused and self.previous_manifest.get("stats")):
+			stats_functions = (
+				(Person, self.database.get_person_from_handle, (self.get_birth_year, self.get_death_year, self.get_death_age)),
+				(Family, self.database.get_family_from_handle, (self.get_marriage_year,)),
+			)
+			stale = False
+			for (cls, get_object, functions) in stats_functions:
+				for handle in self.previous_manifest["fragments"].get(cls.__name__, {}):
+					if (handle not in self.obj_dict[cls] or (cls, handle) in self.dirty_objects):
+						stale = True
+						break
+			if (stale):
+				for (cls, get_object, functions) in stats_functions:
+					previous = self.previous_manifest["fragments"].get(cls.__name__, {})
+					for handle in self.obj_dict[cls]:
+						if (handle not in previous or (cls, handle) in self.dirty_objects): continue
+						obj = get_object(handle)
+						for function in functions:
+							function(obj)
+			else:
+				(min_age, max_age, min_period, max_period) = self.previous_manifest["stats"]
+				self.min_age = min(self.min_age, min_age)
+				self.max_age = max(self.max_age, max_age)
+				self.min_period = min(self.min_period, min_period)
+				self.max_period = max(self.max_period, max_period)
+		self.manifest["stats"] = [self.min_age, self.max_age, self.min_period, self.max_period]
+
+
+	def _save_manifest(self):
+		"""
+		Save the manifest used for the next incremental update
+		"""
+		if (not self.incremental): return
+		path = os.path.join(self.target_path, MANIFEST_FILE)
+		try:
+			fw = codecs.open(path, "w", encoding = "UTF-8")
+			json.dump(self.manifest, fw)
+			fw.close()
+		except:
+			log.warning(_("Unable to write \"%(path)s\"") % {"path": path})
+
+
 	##############################################################################################
 	################################################################################## GENDEX data
 	##############################################################################################
@@ -2999,6 +3474,7 @@ class DynamicWebReport(Report):
 		 - the gramps_id
 		 - the text name for the object
 		 - the index (number starting at 0)
+		 - the last change time of the object
 
 		For the bkref_dict, the value is a tuple containing:
 		 - the class of object that refers to the 'key' object
@@ -3029,16 +3505,21 @@ class DynamicWebReport(Report):
 			ind_list = self.filter.apply(self.database, ind_list,
 										 step)
 
+		# FIXME work around bug that self.database.iter under python 3
+		# returns (binary) data rather than text
+		ind_list = [
+			handle if isinstance(handle, UNITYPE) else handle.decode("UTF-8")
+			for handle in ind_list]
+
 		with self.user.progress(_("Dynamic Web Site Report"),
 								  _("Constructing list of other objects..."),
-								  sum(1 for _ in ind_list)) as step:
-			for handle in ind_list:
-				# FIXME work around bug that self.database.iter under python 3
-				# returns (binary) data rather than text
-				if (not isinstance(handle, UNITYPE)):
-					handle = handle.decode("UTF-8")
-				step()
-				self._add_person(handle, "", "")
+								  len(ind_list)) as step:
+			for start in range(0, len(ind_list), PREFETCH_BATCH):
+				batch = ind_list[start : start + PREFETCH_BATCH]
+				self._prefetch_objects(batch)
+				for handle in batch:
+					step()
+					self._add_person(handle, "", "")
 
 		log.debug("final object dictionary \n" +
 				  "".join(("%s: %s\n" % item) for item in self.obj_dict.items()))
@@ -3047,6 +3528,45 @@ class DynamicWebReport(Report):
 				  "".join(("%s: %s\n" % item) for item in self.bkref_dict.items()))
 
 
+	def _prefetch_objects(self, person_handles):
+		"""
+		Read a batch of persons and the objects they reference, generation by generation:
+		the persons, their families, the events, places, citations and media, then the sources and repositories.
+		The objects are kept by L{_CachedDb}, the methods "_add_***" and the export do not read them again.
+		"""
+		db = self.database
+		persons = db.prefetch("get_person_from_handle", person_handles)
+		families = db.prefetch("get_family_from_handle", [
+			family_handle
+			for person in persons
+			for family_handle in person.get_family_handle_list()])
+		db.prefetch("get_person_from_handle", [
+			spouse_handle
+			for family in families
+			for spouse_handle in (family.get_father_handle(), family.get_mother_handle())])
+		events = db.prefetch("get_event_from_handle", [
+			event_ref.ref
+			for obj in persons + families
+			for event_ref in obj.get_event_ref_list()])
+		db.prefetch("get_place_from_handle", [event.get_place_handle() for event in events])
+		if (self.inc_gallery):
+			db.prefetch("get_object_from_handle", [
+				media_ref.get_reference_handle()
+				for obj in persons + families + events
+				for media_ref in obj.get_media_list()])
+		if (not self.inc_sources): return
+		citations = db.prefetch("get_citation_from_handle", [
+			citation_handle
+			for obj in persons + families + events
+			for citation_handle in obj.get_citation_list()])
+		sources = db.prefetch("get_source_from_handle", [citation.get_reference_handle() for citation in citations])
+		if (self.inc_repositories):
+			db.prefetch("get_repository_from_handle", [
+				repo_ref.get_reference_handle()
+				for source in sources
+				for repo_ref in source.get_reporef_list()])
+
+
 	def _add_person(self, person_handle, bkref_class, bkref_handle):
 		"""
 		Add person_handle to the L{self.obj_dict}, and recursively all referenced objects
@@ -3059,7 +3579,7 @@ class DynamicWebReport(Report):
 		person = self.database.get_person_from_handle(person_handle)
 		if (not person): return
 		person_name = self.get_person_name(person)
-		self.obj_dict[Person][person_handle] = [person_name, person.gramps_id, len(self.obj_dict[Person])]
+		self.obj_dict[Person][person_handle] = [person_name, person.gramps_id, len(self.obj_dict[Person]), person.get_change_time()]
 		# Person events
 		evt_ref_list = person.get_event_ref_list()
 		if evt_ref_list:
@@ -3123,7 +3643,7 @@ class DynamicWebReport(Report):
 		# Add family in the dictionaries of objects
 		family = self.database.get_family_from_handle(family_handle)
 		family_name = self.get_family_name(family)
-		self.obj_dict[Family][family_handle] = [family_name, family.gramps_id, len(self.obj_dict[Family])]
+		self.obj_dict[Family][family_handle] = [family_name, family.gramps_id, len(self.obj_dict[Family]), family.get_change_time()]
 		# Family events
 		evt_ref_list = family.get_event_ref_list()
 		if evt_ref_list:
@@ -3212,7 +3732,7 @@ class DynamicWebReport(Report):
 		# is required to assert that the event happened.""
 		if not (event_desc == "" or event_desc is None or event_desc =="Y"):
 			event_name = event_name + ": " + event_desc
-		self.obj_dict[Event][event_handle] = [event_name, event.gramps_id, len(self.obj_dict[Event])]
+		self.obj_dict[Event][event_handle] = [event_name, event.gramps_id, len(self.obj_dict[Event]), event.get_change_time()]
 		# Event place
 		place_handle = event.get_place_handle()
 		if (place_handle):
@@ -3244,7 +3764,7 @@ class DynamicWebReport(Report):
 			place_name = _pd.display(self.database, place)
 		else:
 			place_name = place.get_title()
-		self.obj_dict[Place][place_handle] = [place_name, place.gramps_id, len(self.obj_dict[Place])]
+		self.obj_dict[Place][place_handle] = [place_name, place.gramps_id, len(self.obj_dict[Place]), place.get_change_time()]
 
 		if (self.inc_places):
 			# Place citations
@@ -3268,7 +3788,7 @@ class DynamicWebReport(Report):
 		# Add source in the dictionaries of objects
 		source = self.database.get_source_from_handle(source_handle)
 		source_name = source.get_title()
-		self.obj_dict[Source][source_handle] = [source_name, source.gramps_id, len(self.obj_dict[Source])]
+		self.obj_dict[Source][source_handle] = [source_name, source.gramps_id, len(self.obj_dict[Source]), source.get_change_time()]
 		# Source repository
 		if self.inc_repositories:
 			for repo_ref in source.get_reporef_list():
@@ -3293,7 +3813,7 @@ class DynamicWebReport(Report):
 		citation = self.database.get_citation_from_handle(citation_handle)
 		citation_name = citation.get_page() or ""
 		source_handle = citation.get_reference_handle()
-		self.obj_dict[Citation][citation_handle] = [citation_name, citation.gramps_id, len(self.obj_dict[Citation])]
+		self.obj_dict[Citation][citation_handle] = [citation_name, citation.gramps_id, len(self.obj_dict[Citation]), citation.get_change_time()]
 		# Citation source
 		self._add_source(source_handle, Citation, citation_handle)
 		# Citation media
@@ -3316,7 +3836,7 @@ class DynamicWebReport(Report):
 		# Update the dictionaries of objects back references
 		self.bkref_dict[MediaObject][media_handle].add((bkref_class, bkref_handle, media_ref))
 		# Citations for media reference, media reference attributes
-		citation_list = media_ref.get_citation_list()
+		citation_list = list(media_ref.get_citation_list())
 		for attr in media_ref.get_attribute_list():
 			citation_list.extend(attr.get_citation_list())
 		for citation_handle in citation_list:
@@ -3326,9 +3846,9 @@ class DynamicWebReport(Report):
 		# Add media in the dictionaries of objects
 		media = self.database.get_object_from_handle(media_handle)
 		media_name = "Media"
-		self.obj_dict[MediaObject][media_handle] = [media_name, media.gramps_id, len(self.obj_dict[MediaObject])]
+		self.obj_dict[MediaObject][media_handle] = [media_name, media.gramps_id, len(self.obj_dict[MediaObject]), media.get_change_time()]
 		# Citations for media, media attributes
-		citation_list = media.get_citation_list()
+		citation_list = list(media.get_citation_list())
 		for attr in media.get_attribute_list():
 			citation_list.extend(attr.get_citation_list())
 		for citation_handle in citation_list:
@@ -3353,7 +3873,7 @@ class DynamicWebReport(Report):
 		# Add repository in the dictionaries of objects
 		repo = self.database.get_repository_from_handle(repo_handle)
 		repo_name = repo.name
-		self.obj_dict[Repository][repo_handle] = [repo_name, repo.gramps_id, len(self.obj_dict[Repository])]
+		self.obj_dict[Repository][repo_handle] = [repo_name, repo.gramps_id, len(self.obj_dict[Repository]), repo.get_change_time()]
 		# Addresses citations
 		for addr in repo.get_address_list():
 			for citation_handle in addr.get_citation_list():
@@ -3742,6 +4262,18 @@ class DynamicWebOptions(MenuReportOptions):
 		inc_gendex.set_help(_('Whether to include a GENDEX file or not'))
 		addopt("inc_gendex", inc_gendex)
 
+		incremental = BooleanOption(_("Incremental update"), False)
+		incremental.set_help(_("Whether to only export again the objects modified since the previous generation of the web site. The data needed for the update is stored in the file \"%(file)s\"") % {"file": MANIFEST_FILE})
+		addopt("incremental", incremental)
+
+		jobs = NumberOption(_("Number of parallel jobs"), 1, 1, 64)
+		jobs.set_help(_("Number of threads used to export the database and to create the thumbnails. With 1 job, the export is sequential"))
+		addopt("jobs", jobs)
+
+		shardsize = NumberOption(_("Maximum number of objects per data file"), 0, 0, 1000000)
+		shardsize.set_help(_("For very large databases, the objects data is split in several files, and the pages only load the data they need. With 0, all the objects of a given type are stored in a single file"))
+		addopt("shardsize", shardsize)
+
 
 	def __add_trees_options(self, menu):
 		category_name = _("Trees")
@@ -2896,6 +2896,244 @@ function GitToIndex(gid, table, field)
 
 
 
+//=================================================================
+//===================================================== Data shards
+//=================================================================
+
+// For very large databases, the tables could be split in several files (the shards).
+// 'DB_SHARDS' gives for each split table:
+//   {file: shards base name, size: number of objects per shard, count: number of shards, length: table length}
+// The shards needed by a page are loaded before running the page script (see 'DwrShardsLoad'):
+//   - the pages showing an object load the objects referenced by this object, up to 'DB_SHARDS_DEPTH' references away,
+//   - the other pages (indexes, search, trees) load all the shards.
+
+// Maximum number of references between the page object and the objects loaded
+DB_SHARDS_DEPTH = 4;
+
+var DwrShardsLoaded = {}; // Shards files already loaded
+var DwrShardsPage = 0; // Type of the page being loaded
+var DwrShardsCmd = ''; // Page script to run when the shards are loaded
+
+function DwrShard(table, start, data)
+{
+	// Fill the table with the objects of a shard
+	for (var i = 0; i < data.length; i++) table[start + i] = data[i];
+}
+
+function DwrShardsLoad(page, cmd)
+{
+	// Load the shards needed by the page, then run the page script
+	// page: type of the page (PAGE_INDI, etc.), or 0 if all the shards are needed
+	// cmd: page script
+	DwrShardsPage = page;
+	DwrShardsCmd = cmd;
+	DwrShardsStep();
+}
+
+function DwrShardsStep()
+{
+	// Load the missing shards. When loaded, the shards are checked again, since they could reference other missing objects.
+	// The scripts are loaded with 'document.write', in order to be usable without web server
+	var files = [];
+	if (typeof(DB_SHARDS) != 'undefined') files = DwrShardsNeeded(DwrShardsPage);
+	var charset = document.characterSet || document.charset;
+	var html = '';
+	for (var i = 0; i < files.length; i++)
+	{
+		DwrShardsLoaded[files[i]] = true;
+		html += '<script language="javascript" src="' + files[i] + '" charset="' + charset + '"><\/script>';
+	}
+	if (files.length > 0)
+		html += '<script language="javascript">DwrShardsStep();<\/script>';
+	else
+		html += '<script language="javascript">' + DwrShardsCmd + '<\/script>';
+	document.write(html);
+}
+
+function DwrShardFile(t, idx)
+{
+	// Get the shard file containing the object 'idx' of table 't', or '' if the shard is already loaded
+	var sh = DB_SHARDS[t];
+	if (typeof(sh) == 'undefined' || idx < 0 || idx >= sh.length) return('');
+	var file = sh.file + '_' + Math.floor(idx / sh.size) + '.js';
+	if (DwrShardsLoaded[file]) return('');
+	return(file);
+}
+
+function DwrShardsNeeded(page)
+{
+	// Get the list of the shards files needed by the page, and not loaded yet
+	var needed = {};
+	var files = [];
+	var t, i;
+	function need(file)
+	{
+		if (file == '' || needed[file]) return;
+		needed[file] = true;
+		files.push(file);
+	}
+	function needAll(t)
+	{
+		var sh = DB_SHARDS[t];
+		if (typeof(sh) == 'undefined') return;
+		for (var n = 0; n < sh.count; n++) need(DwrShardFile(t, n * sh.size));
+	}
+	ParseSearchString();
+	// The whole table is needed to find an object from its Gramps ID
+	var gids = {I: search.Igid, F: search.Fgid, M: search.Mgid, S: search.Sgid, P: search.Pgid, R: search.Rgid};
+	for (t in gids) if (gids[t] != '') needAll(t);
+	if (files.length > 0) return(files);
+	ManageSearchStringGids();
+	// Get the object shown in the page
+	var seed = [];
+	if (page == PAGE_INDI) seed = ['I', search.Idx];
+	if (page == PAGE_FAM) seed = ['F', search.Fdx];
+	if (page == PAGE_SOURCE) seed = ['S', search.Sdx];
+	if (page == PAGE_MEDIA) seed = ['M', search.Mdx];
+	if (page == PAGE_PLACE) seed = ['P', search.Pdx];
+	if (page == PAGE_REPO) seed = ['R', search.Rdx];
+	if (seed.length == 0 || seed[1] < 0)
+	{
+		for (t in DB_SHARDS) needAll(t);
+		return(files);
+	}
+	// Breadth-first search of the objects referenced by the page object
+	// The back references (objects referencing an object) are only followed from the page object
+	// (and from its citations for a source), and the objects found this way are not searched further.
+	var bk_depth = (page == PAGE_SOURCE) ? 2 : 1;
+	var seen = {};
+	var queue = [[seed[0], seed[1], 0, false]];
+	for (var q = 0; q < queue.length; q++)
+	{
+		t = queue[q][0];
+		var idx = queue[q][1];
+		var depth = queue[q][2];
+		var bk = queue[q][3];
+		var key = t + idx + (bk ? 'b' : 'f');
+		if (seen[key]) continue;
+		seen[key] = true;
+		var table = window[t];
+		if (typeof(table) == 'undefined') continue;
+		if (typeof(table[idx]) == 'undefined')
+		{
+			need(DwrShardFile(t, idx));
+			continue;
+		}
+		var refs = DwrShardsRefs(t, table[idx], !bk && depth < DB_SHARDS_DEPTH, depth < bk_depth);
+		for (i = 0; i < refs.length; i++) queue.push([refs[i][0], refs[i][1], depth + 1, refs[i][2]]);
+	}
+	return(files);
+}
+
+function DwrShardsRefs(t, o, forward, backward)
+{
+	// Get the objects referenced by the object 'o' of table 't', as a list of [table, index, back reference]
+	// forward: whether to get the objects referenced by 'o'
+	// backward: whether to get the objects referencing 'o'
+	var refs = [];
+	function add(t2, list, bk)
+	{
+		if (!list) return;
+		for (var i = 0; i < list.length; i++)
+			refs.push([t2, (typeof(list[i]) == 'number') ? list[i] : list[i][0], bk]);
+	}
+	function addCita(list, field)
+	{
+		if (!list) return;
+		for (var i = 0; i < list.length; i++) add('C', list[i][field], false);
+	}
+	function addMedia(list)
+	{
+		add('M', list, false);
+		addCita(list, MR_CITA);
+	}
+	function addEvents(list)
+	{
+		if (!list) return;
+		for (var i = 0; i < list.length; i++)
+		{
+			refs.push(['P', list[i][E_PLACE], false]);
+			addMedia(list[i][E_MEDIA]);
+			add('C', list[i][E_CITA], false);
+		}
+	}
+	if (forward && t == 'I')
+	{
+		addCita(o[I_NAMES], N_CITA);
+		addEvents(o[I_EVENTS]);
+		addCita(o[I_ADDRS], AD_CITA);
+		addMedia(o[I_MEDIA]);
+		add('C', o[I_CITA], false);
+		addCita(o[I_ATTR], A_CITA);
+		add('F', o[I_FAMS], false);
+		add('F', o[I_FAMC], false);
+		addCita(o[I_FAMC], FC_CITA);
+		add('I', o[I_ASSOC], false);
+		addCita(o[I_ASSOC], AC_CITA);
+	}
+	if (forward && t == 'F')
+	{
+		addEvents(o[F_EVENTS]);
+		addMedia(o[F_MEDIA]);
+		add('C', o[F_CITA], false);
+		addCita(o[F_ATTR], A_CITA);
+		add('I', o[F_SPOU], false);
+		add('I', o[F_CHIL], false);
+		addCita(o[F_CHIL], FC_CITA);
+	}
+	if (forward && t == 'S')
+	{
+		addMedia(o[S_MEDIA]);
+		add('R', o[S_REPO], false);
+		addCita(o[S_ATTR], A_CITA);
+	}
+	if (forward && t == 'C')
+	{
+		refs.push(['S', o[C_SOURCE], false]);
+		addMedia(o[C_MEDIA]);
+	}
+	if (forward && t == 'M')
+	{
+		add('C', o[M_CITA], false);
+		addCita(o[M_ATTR], A_CITA);
+	}
+	if (forward && t == 'P')
+	{
+		addMedia(o[P_MEDIA]);
+		add('C', o[P_CITA], false);
+	}
+	if (backward && t == 'S')
+	{
+		add('C', o[S_BKC], true);
+	}
+	if (backward && t == 'C')
+	{
+		add('I', o[C_BKI], true);
+		add('F', o[C_BKF], true);
+		add('M', o[C_BKM], true);
+		add('P', o[C_BKP], true);
+		add('R', o[C_BKR], true);
+	}
+	if (backward && t == 'R')
+	{
+		add('S', o[R_BKS], true);
+	}
+	if (backward && t == 'M')
+	{
+		add('I', o[M_BKI], true);
+		add('F', o[M_BKF], true);
+		add('S', o[M_BKS], true);
+		add('P', o[M_BKP], true);
+	}
+	if (backward && t == 'P')
+	{
+		add('I', o[P_BKI], true);
+		add('F', o[P_BKF], true);
+	}
+	return(refs);
+}
+
+
 //=================================================================
 //============================================================ Main
 //=================================================================
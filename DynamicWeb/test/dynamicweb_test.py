@@ -85,6 +85,9 @@ default_options = {
 	# 'birthorder': False,
 	'bkref_type': True,
 	'inc_gendex': True,
+	'jobs': 1,
+	'incremental': False,
+	'shardsize': 0,
 	'graphgens': 10,
 	'svg_tree_type': DEFAULT_SVG_TREE_TYPE,
 	'svg_tree_shape': DEFAULT_SVG_TREE_SHAPE,
@@ -263,6 +266,79 @@ test_list = [
 		},
 	]
 },
+{
+	'title': "Example using template '%s', with parallel export" % WEB_TEMPLATE_LIST[0][1],
+	'level': 1,
+	'link': "person.html?igid=I0044",
+	'environ': {
+		'LANGUAGE': "en_US",
+		'LANG': "en_US.UTF-8",
+	},
+	'options': {
+		'template': 0,
+		'jobs': 4,
+	},
+	'procedures': [
+		{
+			'what': "Parallel export gives the same pages as the sequential export (compare with test 0)",
+			'path': "person.html?igid=I0044",
+		},
+		{
+			'what': "Thumbnails created in parallel",
+			'path': "medias.html",
+		},
+	]
+},
+{
+	'title': "Example using template '%s', with incremental update" % WEB_TEMPLATE_LIST[0][1],
+	'level': 1,
+	'link': "person.html?igid=I0044",
+	'environ': {
+		'LANGUAGE': "en_US",
+		'LANG': "en_US.UTF-8",
+	},
+	'options': {
+		'template': 0,
+		'incremental': True,
+	},
+	'procedures': [
+		{
+			'what': "Incremental update (run the test twice, the second run reuses \"%s\")" % MANIFEST_FILE,
+			'path': "person.html?igid=I0044",
+		},
+	]
+},
+{
+	'title': "Example using template '%s', with data split in shards" % WEB_TEMPLATE_LIST[0][1],
+	'level': 1,
+	'link': "person.html?idx=100",
+	'environ': {
+		'LANGUAGE': "en_US",
+		'LANG': "en_US.UTF-8",
+	},
+	'options': {
+		'template': 0,
+		'shardsize': 100,
+	},
+	'procedures': [
+		{
+			'what': "Person page loading only the shards needed",
+			'path': "person.html?idx=100",
+		},
+		{
+			'what': "Person page from a Gramps ID (loads all the persons shards)",
+			'path': "person.html?igid=I0044",
+		},
+		{
+			'what': "Index page loading all the shards",
+			'path': "persons.html",
+		},
+		{
+			'what': "Source page with its citations back references",
+			'path': "source.html?sdx=0",
+		},
+	]
+},
 ]
 
 
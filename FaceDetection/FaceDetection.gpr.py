@@ -2,7 +2,7 @@ register(GRAMPLET,
          id="Face Detection", 
          name=_("Face Detection"), 
          description = _("Gramplet for detecting and assigning faces"),
-         version = '1.0.17',
+         version = '1.0.18',
          gramps_target_version="5.0",
          status = UNSTABLE, # not yet tested with python 3
          fname="FaceDetection.py",
@@ -11,3 +11,20 @@ register(GRAMPLET,
          gramplet_title=_("Faces"),
          navtypes=["Media"],
          )
+
+register(TOOL,
+         id = 'facedetectiontool',
+         name = _("Face Detection"),
+         description = _("Detects the faces in all the images of the "
+                         "media collection"),
+         version = '1.0.18',
+         gramps_target_version = "5.0",
+         status = UNSTABLE,
+         fname = 'FaceDetectionTool.py',
+         authors = ["Nick Hall", "Doug Blank"],
+         authors_email = ["nick__hall@hotmail.com", "doug.blank@gmail.com"],
+         category = TOOL_UTILS,
+         toolclass = 'FaceDetectionTool',
+         optionclass = 'FaceDetectionToolOptions',
+         tool_modes = [TOOL_MODE_GUI, TOOL_MODE_CLI]
+         )
@@ -24,11 +24,6 @@ from gramps.gen.plug import Gramplet
 from gramps.gui.widgets import Photo
 from gramps.gen.utils.file import media_path_full
 from gi.repository import Gtk
-import os
-import cv
-import Image
-import ImageDraw
-import StringIO
 
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 try:
@@ -37,8 +32,17 @@ except ValueError:
     _trans = glocale.translation
 _ = _trans.gettext
 
-path, filename = os.path.split(__file__)
-HAARCASCADE_PATH = os.path.join(path, 'haarcascade_frontalface_alt.xml')
+from detectfaces import (computer_vision_available, detect_faces,
+                         parse_faces)
+from FaceDetectionTool import find_faces_attribute
+
+def to_fractions(rect):
+    """
+    Convert a rectangle (x1, y1, x2, y2) in percent to (x, y, width, height)
+    in fractions of the image size.
+    """
+    x1, y1, x2, y2 = rect
+    return (x1/100.0, y1/100.0, (x2 - x1)/100.0, (y2 - y1)/100.0)
 
 class FaceDetection(Gramplet):
     """
@@ -85,7 +89,7 @@ class FaceDetection(Gramplet):
         media = self.dbstate.db.get_object_from_handle(active_handle)
         self.top.hide()
         if media:
-            self.detect_button.set_sensitive(True)
+            self.detect_button.set_sensitive(computer_vision_available)
             self.load_image(media)
             self.set_has_data(True)
         else:
@@ -102,9 +106,15 @@ class FaceDetection(Gramplet):
                                                media.get_path())
         self.mime_type = media.get_mime_type()
         self.photo.set_image(self.full_path, self.mime_type)
-        # show where image parts are used by people:
+        # show where image parts are used by people, and the faces found
+        # by the batch tool:
         rects = self.find_references()
-        self.draw_rectangles([], rects)
+        attribute = find_faces_attribute(media)
+        faces = []
+        if attribute is not None:
+            faces = [to_fractions(face)
+                     for face in parse_faces(attribute.get_value())]
+        self.draw_rectangles(faces, rects)
 
     def find_references(self):
         """
@@ -123,10 +133,7 @@ class FaceDetection(Gramplet):
                         if media_ref.ref != active_handle: continue
                         rect = media_ref.get_rectangle()
                         if rect:
-                            x1, y1, x2, y2 = rect
-                            # make percentages
-                            rects.append((x1/100.0, y1/100.0, 
-                                          (x2 - x1)/100.0, (y2 - y1)/100.0))
+                            rects.append(to_fractions(rect))
         return rects
 
     def detect(self, obj, event):
@@ -134,21 +141,9 @@ class FaceDetection(Gramplet):
         active_handle = self.get_active('Media')
         media = self.dbstate.db.get_object_from_handle(active_handle)
         self.load_image(media)
-        min_face_size = (50,50) # FIXME: get from setting
-        self.cv_image = cv.LoadImage(self.full_path, cv.CV_LOAD_IMAGE_GRAYSCALE)
-        o_width, o_height = self.cv_image.width, self.cv_image.height
-        cv.EqualizeHist(self.cv_image, self.cv_image)
-        cascade = cv.Load(HAARCASCADE_PATH)
-        faces = cv.HaarDetectObjects(self.cv_image, cascade, 
-                                     cv.CreateMemStorage(0),
-                                     1.2, 2, cv.CV_HAAR_DO_CANNY_PRUNING, 
-                                     min_face_size)
+        faces = detect_faces(self.full_path) or []
         references = self.find_references()
-        rects = []
-        o_width, o_height = [float(t) for t in (self.cv_image.width, self.cv_image.height)]
-        for ((x, y, width, height), neighbors) in faces:
-            # percentages:
-            rects.append((x/o_width, y/o_height, width/o_width, height/o_height))
+        rects = [to_fractions(face) for face in faces]
         self.draw_rectangles(rects, references)
 
     def draw_rectangles(self, faces, references):
@@ -0,0 +1,210 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2011 Nick Hall
+#           (c) 2011 Doug Blank <doug.blank@gmail.com>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+"""Tools/Utilities/Face Detection"""
+
+#-------------------------------------------------------------------------
+#
+# Python modules
+#
+#-------------------------------------------------------------------------
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from gramps.gui.plug import tool
+from gramps.gui.utils import ProgressMeter
+from gramps.gen.db import DbTxn
+from gramps.gen.lib import Attribute
+from gramps.gen.utils.file import media_path_full
+
+from gramps.gen.const import GRAMPS_LOCALE as glocale
+try:
+    _trans = glocale.get_addon_translator(__file__)
+except ValueError:
+    _trans = glocale.translation
+_ = _trans.gettext
+
+from detectfaces import (computer_vision_available, find_faces, format_faces,
+                         MIN_FACE_SIZE)
+
+#-------------------------------------------------------------------------
+#
+# Constants
+#
+#-------------------------------------------------------------------------
+# Type of the media attribute holding the faces found, as rectangles in
+# percent "x1,y1,x2,y2;x1,y1,x2,y2" (empty when no face was found)
+FACES_ATTRIBUTE = 'Detected faces'
+# Number of media updated in a transaction
+COMMIT_STEP = 100
+
+def find_faces_attribute(media):
+    """
+    Return the attribute holding the faces detected in a media, if any.
+    """
+    for attribute in media.get_attribute_list():
+        if str(attribute.get_type()) == FACES_ATTRIBUTE:
+            return attribute
+    return None
+
+#-------------------------------------------------------------------------
+#
+# Face Detection Tool
+#
+#-------------------------------------------------------------------------
+class FaceDetectionTool(tool.Tool):
+    """
+    Detect the faces in all the images of the media collection.
+
+    The images are processed by a pool of threads, one per core, each
+    loading the classifier once: OpenCV releases the GIL while it reads
+    the images and detects the faces. The faces found are stored in an
+    attribute of the media, as candidate rectangles for the media
+    references; the images having this attribute are skipped by the
+    following runs, unless asked to detect the faces again.
+    """
+    def __init__(self, dbstate, user, options_class, name, callback=None):
+        tool.Tool.__init__(self, dbstate, options_class, name)
+
+        if not computer_vision_available:
+            user.notify_error(_('Face Detection'),
+                              _('OpenCV for Python (cv2) is required.'))
+            return
+        if dbstate.db.readonly:
+            return
+
+        self.db = dbstate.db
+        opts = self.options.handler.options_dict
+        self.redetect = bool(opts['redetect'])
+        self.min_face_size = max(1, int(opts['min_face_size']))
+
+        self.found = self.failed = 0
+        progress = ProgressMeter(_('Face Detection'), can_cancel=True)
+        jobs = self.collect_jobs(progress)
+        if jobs is not None:
+            done = self.detect_jobs(jobs, progress)
+        progress.close()
+        if jobs is not None:
+            user.info(_('Face Detection'),
+                      _('Images processed: %(done)d of %(total)d\n'
+                        'Faces found: %(found)d\n'
+                        'Images that could not be read: %(failed)d') %
+                      {'done': done, 'total': len(jobs),
+                       'found': self.found, 'failed': self.failed})
+
+    def collect_jobs(self, progress):
+        """
+        Return the list of the images to process, or None if cancelled.
+        """
+        jobs = []
+        length = self.db.get_number_of_media_objects()
+        progress.set_pass(_('Collecting images'), length)
+        for media in self.db.iter_media_objects():
+            mime_type = media.get_mime_type()
+            if (mime_type and mime_type.startswith('image/') and
+                    (self.redetect or find_faces_attribute(media) is None)):
+                full_path = media_path_full(self.db, media.get_path())
+                jobs.append((media.get_handle(), full_path,
+                             self.min_face_size))
+            progress.step()
+            if progress.get_cancelled():
+                return None
+        return jobs
+
+    def detect_jobs(self, jobs, progress):
+        """
+        Detect the faces of the images in a thread pool, and store them by
+        groups of COMMIT_STEP media. Return the number of images processed.
+        """
+        progress.set_pass(_('Detecting faces'), len(jobs))
+        done = 0
+        results = []
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            futures = [pool.submit(find_faces, job) for job in jobs]
+            for future in as_completed(futures):
+                handle, faces = future.result()
+                done += 1
+                if faces is None:
+                    self.failed += 1
+                else:
+                    results.append((handle, faces))
+                    if len(results) == COMMIT_STEP:
+                        self.store_faces(results)
+                        results = []
+                progress.step()
+                if progress.get_cancelled():
+                    for future in futures:
+                        future.cancel()
+                    break
+        self.store_faces(results)
+        return done
+
+    def store_faces(self, results):
+        """
+        Store the faces found in the attribute of their media.
+        """
+        if not results:
+            return
+        with DbTxn(_("Detect faces"), self.db) as trans:
+            for handle, faces in results:
+                media = self.db.get_object_from_handle(handle)
+                if media is None:
+                    continue
+                attribute = find_faces_attribute(media)
+                if attribute is None:
+                    attribute = Attribute()
+                    attribute.set_type(FACES_ATTRIBUTE)
+                    media.add_attribute(attribute)
+                attribute.set_value(format_faces(faces))
+                self.db.commit_media_object(media, trans)
+                self.found += len(faces)
+
+#------------------------------------------------------------------------
+#
+# Face Detection Tool Options
+#
+#------------------------------------------------------------------------
+class FaceDetectionToolOptions(tool.ToolOptions):
+    """
+    Defines options and provides handling interface.
+    """
+    def __init__(self, name, person_id=None):
+        tool.ToolOptions.__init__(self, name, person_id)
+
+        self.options_dict = {
+            'redetect': 0,
+            'min_face_size': MIN_FACE_SIZE,
+        }
+        self.options_help = {
+            'redetect': ("=0/1",
+                         "Whether to detect again the faces of the images "
+                         "already processed",
+                         ["Skip processed images", "Detect again"],
+                         True),
+            'min_face_size': ("=num",
+                              "Smallest face detected, in pixels",
+                              "Integer number"),
+        }
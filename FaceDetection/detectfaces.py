@@ -0,0 +1,114 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2011 Nick Hall
+#           (c) 2011 Doug Blank <doug.blank@gmail.com>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+"""
+Face detection with the Haar cascade of OpenCV, shared by the gramplet
+and the batch tool. This module imports no Gramps or GTK module.
+"""
+
+import os
+import threading
+
+try:
+    import cv2
+    computer_vision_available = True
+except ImportError:
+    computer_vision_available = False
+
+path, filename = os.path.split(__file__)
+HAARCASCADE_PATH = os.path.join(path, 'haarcascade_frontalface_alt.xml')
+
+# Longest side, in pixels, of the images the faces are detected in: the
+# larger images are reduced first, the detection time growing with the
+# number of pixels
+DETECTION_SIZE = 1024
+# Smallest face detected, in pixels of the original image
+MIN_FACE_SIZE = 50
+
+_local = threading.local()
+
+def get_cascade():
+    """
+    Return the classifier, loaded once per thread: a classifier cannot be
+    used by several threads at the same time.
+    """
+    cascade = getattr(_local, 'cascade', None)
+    if cascade is None:
+        cascade = _local.cascade = cv2.CascadeClassifier(HAARCASCADE_PATH)
+    return cascade
+
+def detect_faces(full_path, min_face_size=MIN_FACE_SIZE,
+                 detection_size=DETECTION_SIZE):
+    """
+    Return the faces found in an image, as rectangles (x1, y1, x2, y2) in
+    percent of the image size like the rectangles of the media references,
+    or None if the image cannot be read.
+    """
+    image = cv2.imread(full_path, cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        return None
+    height, width = image.shape[:2]
+    scale = min(1.0, detection_size / max(width, height))
+    if scale < 1.0:
+        width = max(1, int(width * scale))
+        height = max(1, int(height * scale))
+        image = cv2.resize(image, (width, height),
+                           interpolation=cv2.INTER_AREA)
+    image = cv2.equalizeHist(image)
+    size = max(1, int(min_face_size * scale))
+    faces = get_cascade().detectMultiScale(image, scaleFactor=1.2,
+                                           minNeighbors=2,
+                                           minSize=(size, size))
+    return [(int(100 * x / width), int(100 * y / height),
+             min(100, int(round(100 * (x + w) / width))),
+             min(100, int(round(100 * (y + h) / height))))
+            for (x, y, w, h) in faces]
+
+def find_faces(job):
+    """
+    Detect the faces of a media, in a worker thread. The job is a tuple
+    (handle, full path, smallest face size); the handle is returned with
+    the faces.
+    """
+    handle, full_path, min_face_size = job
+    try:
+        return handle, detect_faces(full_path, min_face_size)
+    except (cv2.error, OSError):
+        return handle, None
+
+def format_faces(faces):
+    """
+    Text of the faces, as stored in a media attribute.
+    """
+    return ";".join("%d,%d,%d,%d" % face for face in faces)
+
+def parse_faces(text):
+    """
+    Faces stored in a media attribute.
+    """
+    faces = []
+    for face in text.split(";"):
+        try:
+            x1, y1, x2, y2 = [int(value) for value in face.split(",")]
+        except ValueError:
+            continue
+        faces.append((x1, y1, x2, y2))
+    return faces
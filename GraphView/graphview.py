@@ -32,6 +32,7 @@
 #
 #-------------------------------------------------------------------------
 import os
+import json
 from xml.parsers.expat import ExpatError, ParserCreate
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 try:
@@ -80,6 +81,18 @@ if not _DOT_FOUND:
     raise Exception("GraphViz (http://www.graphviz.org) is "
                     "required for this view to work")
 
+# This dictionary maps various specific fonts to their generic font
+# types. Will need to include any truetype fonts here.
+_FONT_FAMILY_MAP = {"Times New Roman,serif"   : "Times",
+                    "Times Roman,serif"       : "Times",
+                    "Times-Roman"             : "Times",
+                    "Times,serif"             : "Times",
+                    "Arial"                   : "Helvetica"}
+
+# Size, in points, of the square tiles used to decide which parts of the
+# graph are close enough to the visible area to have canvas items created.
+_TILE_SIZE = 512
+
 
 #-------------------------------------------------------------------------
 #
@@ -341,11 +354,16 @@ class GraphWidget(object):
         self.dbstate = dbstate
         self.uistate = uistate
         self.active_person_handle = None
+        self.parser = None
 
         scrolled_win = Gtk.ScrolledWindow()
         scrolled_win.set_shadow_type(Gtk.ShadowType.IN)
         self.hadjustment = scrolled_win.get_hadjustment()
         self.vadjustment = scrolled_win.get_vadjustment()
+        self.hadjustment.connect("value-changed", self.viewport_changed)
+        self.vadjustment.connect("value-changed", self.viewport_changed)
+        self.hadjustment.connect("changed", self.viewport_changed)
+        self.vadjustment.connect("changed", self.viewport_changed)
 
         self.canvas = GooCanvas.Canvas()
         self.canvas.props.units = Gtk.Unit.POINTS
@@ -375,13 +393,30 @@ class GraphWidget(object):
         self.active_person_handle = active_person
         dot.build_graph(active_person)
 
-        # Build the rest of the widget by parsing SVG data from Graphviz
+        # Build the rest of the widget from the layout computed by Graphviz.
+        # The JSON geometry is preferred as it can be converted in bulk and
+        # only the visible part of the graph needs canvas items. Older
+        # versions of Graphviz without JSON output fall back to SVG.
         dot_data = dot.get_dot().encode('utf8')
-        svg_data = Popen(['dot', '-Tsvg'], 
-                    stdin=PIPE, stdout=PIPE).communicate(input=dot_data)[0]
-        parser = GraphvizSvgParser(self, self.view)
-        parser.parse(svg_data)
-        window = self.canvas.get_parent()
+        self.parser = None
+        proc = Popen(['dot', '-Tjson'], stdin=PIPE, stdout=PIPE, stderr=PIPE)
+        json_data = proc.communicate(input=dot_data)[0]
+        if proc.returncode == 0:
+            try:
+                parser = GraphvizJsonParser(self, self.view)
+                parser.parse(json_data)
+            except (ValueError, KeyError):
+                parser = None
+        else:
+            parser = None
+
+        if parser is None:
+            svg_data = Popen(['dot', '-Tsvg'],
+                        stdin=PIPE, stdout=PIPE).communicate(input=dot_data)[0]
+            parser = GraphvizSvgParser(self, self.view)
+            parser.parse(svg_data)
+        else:
+            self.parser = parser
 
         # The scroll_to method will try and put the active person in the top
         # left part of the screen. We want it in the middle, so make an offset
@@ -395,6 +430,8 @@ class GraphWidget(object):
         if parser.active_person_item:
             self.canvas.scroll_to(parser.get_active_person_x() - h_offset,
                                   parser.get_active_person_y())
+        if self.parser:
+            self.parser.realize_visible()
 
         # Update the status bar
         self.view.change_page()
@@ -403,6 +440,7 @@ class GraphWidget(object):
         """
         Clear the graph by creating a new root item
         """
+        self.parser = None
         self.canvas.set_root_item(GooCanvas.CanvasGroup())
 
     def get_widget(self):
@@ -454,6 +492,28 @@ class GraphWidget(object):
         Zoom the canvas widget
         """
         self.canvas.set_scale(adj.get_value())
+        self.viewport_changed(adj)
+
+    def viewport_changed(self, adj):
+        """
+        Create the canvas items that have scrolled into view
+        """
+        if self.parser:
+            self.parser.realize_visible()
+
+    def get_visible_bounds(self):
+        """
+        Return the area of the canvas currently shown in the scrolled window
+        as (left, top, right, bottom) in canvas units.
+        """
+        x_pos = self.hadjustment.get_value()
+        y_pos = self.vadjustment.get_value()
+        width = self.hadjustment.get_page_size()
+        height = self.vadjustment.get_page_size()
+        left, top = self.canvas.convert_from_pixels(x_pos, y_pos)
+        right, bottom = self.canvas.convert_from_pixels(x_pos + width,
+                                                        y_pos + height)
+        return (left, top, right, bottom)
 
     def select_node(self, item, target, event):
         """
@@ -568,13 +628,7 @@ class GraphvizSvgParser(object):
         # which Goocanvas object to link the next object to.
         self.item_hier = [] 
 
-        # This dictionary maps various specific fonts to their generic font
-        # types. Will need to include any truetype fonts here.
-        self.font_family_map = {"Times New Roman,serif"   : "Times",
-                                "Times Roman,serif"       : "Times",
-                                "Times-Roman"             : "Times",
-                                "Times,serif"             : "Times",
-                                "Arial"                   : "Helvetica"}
+        self.font_family_map = _FONT_FAMILY_MAP
         self.active_person_item = None
 
     def parse(self, ifile):
@@ -917,6 +971,276 @@ class GraphvizSvgParser(object):
         """
         return self.active_person_item.props.y
 
+#-------------------------------------------------------------------------
+#
+# GraphvizJsonParser
+#
+#-------------------------------------------------------------------------
+class GraphvizJsonParser(object):
+    """
+    Converts the JSON (xdot) geometry produced by Graphviz into plain drawing
+    records in a single pass, then adds GooCanvas items to the canvas only
+    for the parts of the graph that are in or near the visible area.
+    """
+
+    def __init__(self, widget, view):
+        """
+        Initialise the GraphvizJsonParser class
+        """
+        self.widget = widget
+        self.canvas = widget.canvas
+        self.view = view
+        self.highlight_home_person = self.view._config.get(
+                                   'interface.graphview-highlight-home-person')
+        self.home_person_color = self.view._config.get(
+                                 'interface.graphview-home-person-color')
+        self.text_anchor_map = {"l" : GooCanvas.CanvasAnchorType.WEST,
+                                "c" : GooCanvas.CanvasAnchorType.CENTER,
+                                "r" : GooCanvas.CanvasAnchorType.EAST,}
+        self.font_family_map = _FONT_FAMILY_MAP
+        self.home_handle = None
+        self.height = 0.0
+        # Drawing records, one per node or edge, and the tiles they overlap
+        self.records = []
+        self.tiles = {}
+        self.realized_tiles = set()
+        self.realized_records = set()
+        self.active_person_item = None
+        self.root = None
+
+    def parse(self, data):
+        """
+        Parse the JSON output of Graphviz. Raises ValueError or KeyError if
+        the data can not be understood.
+        """
+        graph = json.loads(data.decode('utf-8'))
+        left, bottom, right, top = [float(i)
+                                    for i in graph['bb'].split(',')]
+        self.height = top
+        self.canvas.set_bounds(left, 0, right, top - bottom)
+
+        if self.highlight_home_person:
+            home_person = self.widget.dbstate.db.get_default_person()
+            if home_person:
+                self.home_handle = home_person.handle
+
+        for obj in graph.get('objects', []):
+            # Subgraphs are listed along with the nodes, but are invisible
+            if 'nodes' in obj or 'subgraphs' in obj:
+                continue
+            handle = obj['name'].lstrip('_')
+            ops = obj.get('_draw_', []) + obj.get('_ldraw_', [])
+            record = self.make_record(handle, 'node', ops)
+            if handle == self.widget.active_person_handle and 'pos' in obj:
+                pos_x, pos_y = [float(i) for i in obj['pos'].split(',')]
+                record['pos'] = (pos_x, self.height - pos_y)
+                self.active_person_item = record
+            self.add_record(record)
+
+        for edge in graph.get('edges', []):
+            ops = (edge.get('_draw_', []) + edge.get('_hdraw_', []) +
+                   edge.get('_tdraw_', []) + edge.get('_ldraw_', []))
+            self.add_record(self.make_record(None, 'edge', ops))
+
+        root = self.canvas.get_root_item()
+        root.connect("button-press-event", self.widget.button_press)
+        root.connect("button-release-event", self.widget.button_release)
+        root.connect("motion-notify-event", self.widget.motion_notify_event)
+        self.root = root
+
+    def make_record(self, handle, kind, ops):
+        """
+        Convert a list of xdot drawing operations into a drawing record.
+        Colours, fonts and coordinates are resolved here so that creating
+        the canvas items later is as cheap as possible.
+        """
+        stroke_color = 'black'
+        fill_color = 'black'
+        font = 'Times 14.00'
+        is_dashed = False
+        items = []
+        xs = []
+        ys = []
+        height = self.height
+
+        if handle == self.widget.active_person_handle:
+            line_width = 3  # Thick box
+        else:
+            line_width = 1  # Thin box
+
+        for op in ops:
+            code = op['op']
+            if code == 'c':
+                stroke_color = op['color']
+            elif code == 'C':
+                fill_color = op['color']
+                # Highlight the home person
+                if handle and handle == self.home_handle:
+                    fill_color = self.home_person_color
+            elif code == 'S':
+                is_dashed = op['style'] in ('dashed', 'dotted')
+            elif code == 'F':
+                font_family = self.font_family_map.get(op['face'], op['face'])
+                font = "%s %.2f" % (font_family, op['size'])
+            elif code in ('p', 'P', 'L'):
+                points = [(x, height - y) for x, y in op['points']]
+                xs.extend(pnt[0] for pnt in points)
+                ys.extend(pnt[1] for pnt in points)
+                items.append(('polygon', points, code != 'L',
+                              fill_color if code == 'P' else None,
+                              stroke_color, line_width))
+            elif code in ('e', 'E'):
+                center_x, center_y, radius_x, radius_y = op['rect']
+                center_y = height - center_y
+                xs.extend((center_x - radius_x, center_x + radius_x))
+                ys.extend((center_y - radius_y, center_y + radius_y))
+                kind = 'familynode' if kind == 'node' else kind
+                items.append(('ellipse', center_x, center_y, radius_x,
+                              radius_y, fill_color if code == 'E' else None,
+                              stroke_color))
+            elif code in ('b', 'B'):
+                points = [(x, height - y) for x, y in op['points']]
+                xs.extend(pnt[0] for pnt in points)
+                ys.extend(pnt[1] for pnt in points)
+                p_data = ["M %f,%f C" % points[0]]
+                p_data.extend("%f,%f" % pnt for pnt in points[1:])
+                # See the note in GraphvizSvgParser.start_path on dashes
+                items.append(('path', ' '.join(p_data),
+                              'Red' if is_dashed else stroke_color))
+            elif code == 'T':
+                pos_x, pos_y = op['pt']
+                pos_y = height - pos_y
+                width = op.get('width', 0)
+                xs.extend((pos_x - width, pos_x + width))
+                ys.append(pos_y)
+                items.append(('text', op['text'], pos_x, pos_y,
+                              self.text_anchor_map.get(op['align'],
+                                  GooCanvas.CanvasAnchorType.CENTER),
+                              font))
+            elif code == 'I':
+                pos_x, pos_y = op['pos']
+                width, img_height = op['size']
+                pos_y = height - pos_y - img_height
+                xs.extend((pos_x, pos_x + width))
+                ys.extend((pos_y, pos_y + img_height))
+                items.append(('image', op['name'], pos_x, pos_y,
+                              int(width), int(img_height)))
+
+        if xs:
+            bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            bounds = None
+        return {'handle': handle, 'kind': kind, 'bounds': bounds,
+                'items': items}
+
+    def add_record(self, record):
+        """
+        Store a drawing record and index it by the tiles that it overlaps.
+        """
+        if record['bounds'] is None:
+            return
+        index = len(self.records)
+        self.records.append(record)
+        left, top, right, bottom = record['bounds']
+        for tile_x in range(int(left // _TILE_SIZE),
+                            int(right // _TILE_SIZE) + 1):
+            for tile_y in range(int(top // _TILE_SIZE),
+                                int(bottom // _TILE_SIZE) + 1):
+                self.tiles.setdefault((tile_x, tile_y), []).append(index)
+
+    def realize_visible(self):
+        """
+        Create canvas items for every record in the tiles that intersect the
+        visible area, plus a margin of one tile, that have not been created
+        yet.
+        """
+        if self.root is None:
+            return
+        left, top, right, bottom = self.widget.get_visible_bounds()
+        for tile_x in range(int(left // _TILE_SIZE) - 1,
+                            int(right // _TILE_SIZE) + 2):
+            for tile_y in range(int(top // _TILE_SIZE) - 1,
+                                int(bottom // _TILE_SIZE) + 2):
+                tile = (tile_x, tile_y)
+                if tile in self.realized_tiles:
+                    continue
+                self.realized_tiles.add(tile)
+                for index in self.tiles.get(tile, []):
+                    if index not in self.realized_records:
+                        self.realized_records.add(index)
+                        self.create_items(self.records[index])
+
+    def create_items(self, record):
+        """
+        Create the GooCanvas items for a single drawing record.
+        """
+        group = GooCanvas.CanvasGroup(parent=self.root)
+        group.title = record['handle']
+        group.description = record['kind']
+        group.connect("button-press-event", self.widget.select_node)
+
+        for item in record['items']:
+            if item[0] == 'polygon':
+                (points, close_path, fill_color, stroke_color,
+                 line_width) = item[1:]
+                c_points = GooCanvas.CanvasPoints.new(len(points))
+                for n, (coord_x, coord_y) in enumerate(points):
+                    c_points.set_point(n, coord_x, coord_y)
+                GooCanvas.CanvasPolyline(parent=group,
+                                         points=c_points,
+                                         close_path=close_path,
+                                         fill_color=fill_color,
+                                         line_width=line_width,
+                                         stroke_color=stroke_color)
+            elif item[0] == 'ellipse':
+                (center_x, center_y, radius_x, radius_y, fill_color,
+                 stroke_color) = item[1:]
+                GooCanvas.CanvasEllipse(parent=group,
+                                        center_x=center_x,
+                                        center_y=center_y,
+                                        radius_x=radius_x,
+                                        radius_y=radius_y,
+                                        fill_color=fill_color,
+                                        stroke_color=stroke_color,
+                                        line_width=1)
+            elif item[0] == 'path':
+                GooCanvas.CanvasPath(parent=group,
+                                     data=item[1],
+                                     stroke_color=item[2],
+                                     line_width=1)
+            elif item[0] == 'text':
+                text, pos_x, pos_y, anchor, text_font = item[1:]
+                GooCanvas.CanvasText(parent=group,
+                                     text=text,
+                                     x=pos_x,
+                                     y=pos_y,
+                                     anchor=anchor,
+                                     use_markup=False,
+                                     font=text_font)
+            elif item[0] == 'image':
+                path, pos_x, pos_y, width, height = item[1:]
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
+                GooCanvas.CanvasImage(parent=group,
+                                      x=pos_x,
+                                      y=pos_y,
+                                      height=height,
+                                      width=width,
+                                      pixbuf=pixbuf)
+
+    def get_active_person_x(self):
+        """
+        Find the position of the centre of the active person in the horizontal
+        dimension
+        """
+        return self.active_person_item['pos'][0]
+
+    def get_active_person_y(self):
+        """
+        Find the position of the centre of the active person in the vertical
+        dimension
+        """
+        return self.active_person_item['pos'][1]
+
 #------------------------------------------------------------------------
 #
 # DotGenerator
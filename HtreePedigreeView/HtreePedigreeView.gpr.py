@@ -34,8 +34,9 @@ id    = 'HtreePedigreeView',
 name  = _("H-Tree Pedigree"),
 category = ("Ancestry", _("Ancestry")),
 description =  _("The view shows a space-efficient pedigree with ancestors of the selected person"),
-version = '0.0.8',
+version = '0.0.10',
 gramps_target_version = "5.0",
+depends_on = ["libthumbnails"],
 status = UNSTABLE,
 fname = 'HtreePedigreeView.py',
 authors = ["Pat Lefebre"],
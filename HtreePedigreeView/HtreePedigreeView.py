@@ -29,7 +29,6 @@
 #-------------------------------------------------------------------------
 from cgi import escape
 import math
-import os
 import pickle
 
 #-------------------------------------------------------------------------
@@ -37,12 +36,12 @@ import pickle
 # GTK/Gnome modules
 #
 #-------------------------------------------------------------------------
+from gi.repository import GLib
 from gi.repository import GObject
 from gi.repository import Gdk
 from gi.repository import Gtk
 from gi.repository import GdkPixbuf
 from gi.repository import PangoCairo
-import cairo
 
 #-------------------------------------------------------------------------
 #
@@ -54,10 +53,8 @@ from gramps.gui.views.navigationview import NavigationView
 from gramps.gui.editors import FilterEditor
 from gramps.gen.display.name import displayer as name_displayer
 from gramps.gen.utils.alive import probably_alive
-from gramps.gen.utils.file import media_path_full
 from gramps.gen.utils.db import find_children, find_parents, find_witnessed_people
 from gramps.gen.utils.libformatting import FormattingHelper
-from gramps.gui.thumbnails import get_thumbnail_path
 from gramps.gen.errors import WindowActiveError
 from gramps.gui.editors import EditPerson, EditFamily
 from gramps.gui.ddtargets import DdTargets
@@ -70,6 +67,7 @@ from gramps.gui.utils import color_graph_box, hex_to_rgb_float, is_right_click
 from gramps.gen.constfunc import lin
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
+from libthumbnails import get_thumbnail_service
 
 #-------------------------------------------------------------------------
 #
@@ -85,26 +83,169 @@ _CHRI = _('short for christened|chr.')
 _BURI = _('short for buried|bur.')
 _CREM = _('short for cremated|crem.')
 
+# H-tree positions of the boxes, for a tree of 6 generations (by PL).
+# A smaller tree of n generations uses the 2**n - 1 first positions.
+# A position definition is a tuple of nodes.
+# Each node consists of a tuple of:
+#     (person box rectangle, connection, marriage box rectangle)
+# A rectangle is a tuple of the format (x, y, width, height)
+# A connectcion is either a line or a tuple of two lines.
+# A line is of the format (x, y, height).  Lines have a width of 1.
+_HTREE_POSITIONS = (
+    ((13,14,4,4), None, None),
+    ((13,6,4,4), None, None),
+    ((13,22,4,4), None, None),
+    ((5,6,4,4), None, None),
+    ((21,6,4,4), None, None),
+    ((5,22,4,4), None, None),
+    ((21,22,4,4), None, None),
+    ((5,2,4,4), None, None),
+    ((5,10,4,4), None, None),
+    ((21,2,4,4), None, None),
+    ((21,10,4,4), None, None),
+    ((5,18,4,4), None, None),
+    ((5,26,4,4), None, None),
+    ((21,18,4,4), None, None),
+    ((21,26,4,4), None, None),
+    ((0,2,4,4), None, None),
+    ((10,2,4,4), None, None),
+    ((0,10,4,4), None, None),
+    ((10,10,4,4), None, None),
+    ((16,2,4,4), None, None),
+    ((26,2,4,4), None, None),
+    ((16,10,4,4), None, None),
+    ((26,10,4,4), None, None),
+    ((0,18,4,4), None, None),
+    ((10,18,4,4), None, None),
+    ((0,26,4,4), None, None),
+    ((10,26,4,4), None, None),
+    ((16,18,4,4), None, None),
+    ((26,18,4,4), None, None),
+    ((16,26,4,4), None, None),
+    ((26,26,4,4), None, None),
+    ((0,0,4,1), None, None),
+    ((0,4,4,1), None, None),
+    ((10,0,4,1), None, None),
+    ((10,4,4,1), None, None),
+    ((0,8,4,1), None, None),
+    ((0,12,4,1), None, None),
+    ((10,8,4,1), None, None),
+    ((10,12,4,1), None, None),
+    ((16,0,4,1), None, None),
+    ((16,4,4,1), None, None),
+    ((26,0,4,1), None, None),
+    ((26,4,4,1), None, None),
+    ((16,8,4,1), None, None),
+    ((16,12,4,1), None, None),
+    ((26,8,4,1), None, None),
+    ((26,12,4,1), None, None),
+    ((0,16,4,1), None, None),
+    ((0,20,4,1), None, None),
+    ((10,16,4,1), None, None),
+    ((10,20,4,1), None, None),
+    ((0,24,4,1), None, None),
+    ((0,28,4,1), None, None),
+    ((10,24,4,1), None, None),
+    ((10,28,4,1), None, None),
+    ((16,16,4,1), None, None),
+    ((16,20,4,1), None, None),
+    ((26,16,4,1), None, None),
+    ((26,20,4,1), None, None),
+    ((16,24,4,1), None, None),
+    ((16,28,4,1), None, None),
+    ((26,24,4,1), None, None),
+    ((26,28,4,1), None, None),
+    )
+
+# Maximum number of people kept in the cache of the view
+_CACHE_SIZE = 5000
+# Size of the placeholder shown while an image is loaded
+_IMAGE_PLACEHOLDER = 32
+
+class _WidgetPool(object):
+    """
+    Widgets of the tree kept for reuse: a new tree takes the widgets
+    of the previous tree and updates their data, instead of creating
+    all its widgets again.
+    """
+    def __init__(self):
+        self.free = {}
+        self.used = set()
+
+    def get(self, cls, *args):
+        """
+        Get a free widget of class cls, or else a new widget cls(*args).
+        """
+        free = self.free.get(cls)
+        if free:
+            widget = free.pop()
+        else:
+            widget = cls(*args)
+        self.used.add(widget)
+        return widget
+
+    def release(self, table):
+        """
+        Remove all the widgets from table. The widgets of the pool are
+        kept for reuse, the others are destroyed.
+        """
+        for child in table.get_children():
+            table.remove(child)
+            if child in self.used:
+                self.free.setdefault(type(child), []).append(child)
+            else:
+                child.destroy()
+        self.used = set()
+
+class _PressCallback(object):
+    """
+    Button press callback of a reused widget, which is set again each time
+    the widget is used.
+    """
+    press_callback = None
+
+    def set_press_callback(self, callback=None, *args):
+        """
+        The callback is called as callback(widget, event, *args).
+        """
+        if callback:
+            self.press_callback = (callback, args)
+        else:
+            self.press_callback = None
+
+    def cb_on_press(self, widget, event):
+        if self.press_callback:
+            callback, args = self.press_callback
+            return callback(widget, event, *args)
+        return False
+
 class _PersonWidgetBase(Gtk.DrawingArea):
     """
     Default set up for person widgets.
     Set up drag options and button release events.
     """
-    
+
     def __init__(self, view, format_helper, person):
         GObject.GObject.__init__(self)
         self.view = view
         self.format_helper = format_helper
-        self.person = person
+        self.person = None
         self.force_mouse_over = False
         self.in_drag = False
         self.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
         self.add_events(Gdk.EventMask.BUTTON_RELEASE_MASK)
+        self.connect("button-release-event", self.cb_on_button_release)
+        self.connect("drag_data_get", self.cb_drag_data_get)
+        self.connect("drag_begin", self.cb_drag_begin)
+        self.connect("drag_end", self.cb_drag_end)
+        self.set_person(person)
+
+    def set_person(self, person):
+        """
+        Set the person of the widget, enabling drag if there is a person.
+        """
+        self.person = person
         if self.person:
-            self.connect("button-release-event", self.cb_on_button_release)
-            self.connect("drag_data_get", self.cb_drag_data_get)
-            self.connect("drag_begin", self.cb_drag_begin)
-            self.connect("drag_end", self.cb_drag_end)
             # Enable drag
             self.drag_source_set(Gdk.ModifierType.BUTTON1_MASK,
                                 [],
@@ -116,6 +257,8 @@ class _PersonWidgetBase(Gtk.DrawingArea):
             #allow drag to a text document, info on drag_get will be 0L !
             tglist.add_text_targets(0)
             self.drag_source_set_target_list(tglist)
+        else:
+            self.drag_source_unset()
 
     def cb_drag_begin(self, widget, data):
         """Set up some inital conditions for drag. Set up icon."""
@@ -144,48 +287,45 @@ class _PersonWidgetBase(Gtk.DrawingArea):
         Default action for release event from mouse.
         Change active person to current.
         """
-        if self.in_drag:
+        if self.in_drag or not self.person:
             return False
         if event.button == 1 and event.type == Gdk.EventType.BUTTON_RELEASE:
             self.view.cb_childmenu_changed(None, self.person.get_handle())
             return True
         return False
-        
-    def get_image(self, dbstate, person):
-        """
-        Return a thumbnail image for the given person.
-        """
-        image_path = None
-        media_list = person.get_media_list()
-        if media_list:
-            photo = media_list[0]
-            object_handle = photo.get_reference_handle()
-            obj = dbstate.db.get_object_from_handle(
-                object_handle)
-            if obj:
-                mtype = obj.get_mime_type()
-                if mtype and mtype[0:5] == "image":
-                    image_path = get_thumbnail_path(
-                                media_path_full(
-                                            dbstate.db,
-                                            obj.get_path()),
-                                rectangle=photo.get_rectangle())
-        return image_path
-
-class PersonBoxWidgetCairo(_PersonWidgetBase):
+
+class PersonBoxWidgetCairo(_PersonWidgetBase, _PressCallback):
     """Draw person box using cairo library"""
-    def __init__(self, view, format_helper, dbstate, person, alive, maxlines,
-                image=None):
+    def __init__(self, view, format_helper, dbstate, person=None, alive=False,
+                 maxlines=0, image=None):
         _PersonWidgetBase.__init__(self, view, format_helper, person)
-        self.set_size_request(120, 25)
+        self.dbstate = dbstate
         # Required for tooltip and mouse-over
         self.add_events(Gdk.EventMask.ENTER_NOTIFY_MASK)
         # Required for tooltip and mouse-over
         self.add_events(Gdk.EventMask.LEAVE_NOTIFY_MASK)
+        self.connect("draw", self.draw)
+        self.connect("button-press-event", self.cb_on_press)
+        # enable mouse-over
+        self.connect("enter-notify-event", self.cb_on_enter)
+        # enable mouse-out
+        self.connect("leave-notify-event", self.cb_on_leave)
+        self.context = None
+        self.update(person, alive, maxlines, image)
+
+    def update(self, person, alive, maxlines, image=None):
+        """
+        Show a person (or an empty box if person is None) in the widget,
+        which may have shown another person before.
+        """
+        self.set_person(person)
+        self.set_size_request(120, 25)
+        self.set_tooltip_text(None)
+        self.set_press_callback(None)
+        self.force_mouse_over = False
         self.alive = alive
         self.maxlines = maxlines
         self.hightlight = False
-        self.connect("draw", self.draw)
         self.text = ""
         if self.person:
             self.text = self.format_helper.format_person(self.person,
@@ -197,19 +337,29 @@ class PersonBoxWidgetCairo(_PersonWidgetBase):
         self.bgcolor = hex_to_rgb_float(self.bgcolor)
         self.bordercolor = hex_to_rgb_float(self.bordercolor)
 
-        self.img_surf = None    
+        # Image shown, or placeholder shown until the image is loaded
+        self.img_surf = None
+        self.img_pending = False
+        self.img_token = object()
         if image:
-            image_path = self.get_image(dbstate, person)
-            if image_path and os.path.exists(image_path):
-                with open(image_path, 'rb') as image:
-                    self.img_surf = cairo.ImageSurface.create_from_png(image)
+            token = self.img_token
+            known, self.img_surf = self.view.thumbnails.load(
+                self.dbstate.db, person,
+                lambda pixbuf: self.cb_image_loaded(token, pixbuf))
+            self.img_pending = not known
 
-        # enable mouse-over
-        self.connect("enter-notify-event", self.cb_on_enter)
-        # enable mouse-out
-        self.connect("leave-notify-event", self.cb_on_leave)
-        self.context = None
         self.textlayout = None
+        self.queue_draw()
+
+    def cb_image_loaded(self, token, pixbuf):
+        """
+        Show the image loaded in the background, unless the widget shows
+        another person now.
+        """
+        if token is self.img_token:
+            self.img_surf = pixbuf
+            self.img_pending = False
+            self.queue_draw()
 
     def cb_on_enter(self, widget, event):
         """On mouse-over highlight border"""
@@ -262,6 +412,9 @@ class PersonBoxWidgetCairo(_PersonWidgetBase):
         if self.img_surf:
             xmin += self.img_surf.get_width()
             ymin = max(ymin, self.img_surf.get_height()+4)
+        elif self.img_pending:
+            xmin += _IMAGE_PLACEHOLDER
+            ymin = max(ymin, _IMAGE_PLACEHOLDER+4)
         self.set_size_request(max(xmin, minw), max(ymin, minh))
 
         alloc = self.get_allocation()
@@ -300,9 +453,14 @@ class PersonBoxWidgetCairo(_PersonWidgetBase):
 
         # image
         if self.img_surf:
-            context.set_source_surface(self.img_surf,
+            Gdk.cairo_set_source_pixbuf(context, self.img_surf,
                 alloc.width-4-self.img_surf.get_width(), 1)
             context.paint()
+        elif self.img_pending:
+            context.rectangle(alloc.width-4-_IMAGE_PLACEHOLDER, 1,
+                              _IMAGE_PLACEHOLDER, _IMAGE_PLACEHOLDER)
+            context.set_source_rgba(*(self.bordercolor[:3] + (0.2,)))
+            context.fill()
 
         # Mark deceased
         context.new_path()
@@ -331,21 +489,35 @@ class PersonBoxWidgetCairo(_PersonWidgetBase):
         context.restore()
         context.get_target().flush()
 
-class LineWidget(Gtk.DrawingArea):
+class LineWidget(Gtk.DrawingArea, _PressCallback):
     """
     Draw lines linking Person boxes - Types A and C.
     """
     def __init__(self, child, father, frel, mother, mrel, direction):
         GObject.GObject.__init__(self)
+        # Required for popup menu
+        self.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
+        # Required for tooltip and mouse-over
+        self.add_events(Gdk.EventMask.ENTER_NOTIFY_MASK)
+        # Required for tooltip and mouse-over
+        self.add_events(Gdk.EventMask.LEAVE_NOTIFY_MASK)
+        self.connect("draw", self.expose)
+        self.connect("button-press-event", self.cb_on_press)
+        self.update(child, father, frel, mother, mrel, direction)
 
+    def update(self, child, father, frel, mother, mrel, direction):
+        """
+        Link other boxes, when the widget is reused.
+        """
         self.child_box = child
         self.father_box = father
         self.mother_box = mother
         self.frel = frel
         self.mrel = mrel
         self.direction = direction
-        
-        self.connect("draw", self.expose)
+        self.set_tooltip_text(None)
+        self.set_press_callback(None)
+        self.queue_draw()
 
     def expose(self, widget, context):
         """
@@ -423,18 +595,27 @@ class LineWidget(Gtk.DrawingArea):
                 cr.move_to(y_from, x_from)
             cr.line_to(y_to, x_to)
 
-class LineWidget2(Gtk.DrawingArea):
+class LineWidget2(Gtk.DrawingArea, _PressCallback):
     """
     Draw lines linking Person boxes - Type B.
     """
     def __init__(self, male, rela, direction):
         GObject.GObject.__init__(self)
+        # Required for popup menu
+        self.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
+        self.connect("draw", self.expose)
+        self.connect("button-press-event", self.cb_on_press)
+        self.update(male, rela, direction)
 
+    def update(self, male, rela, direction):
+        """
+        Draw another link, when the widget is reused.
+        """
         self.male = male
         self.rela = rela
         self.direction = direction
-
-        self.connect("draw", self.expose)
+        self.set_press_callback(None)
+        self.queue_draw()
 
     def expose(self, widget, context):
         """
@@ -534,6 +715,14 @@ class HtreePedigreeView(NavigationView):
         # GTK objects
         self.scrolledwindow = None
         self.table = None
+        self.pool = _WidgetPool()
+        # People, families, etc. read for the tree, kept until the database
+        # changes (see _clear_cache)
+        self._people = {}
+        self._families = {}
+        self._alive = {}
+        self.thumbnails = get_thumbnail_service()
+        self._prefetch_id = None
 
         self.additional_uis.append(self.additional_ui())
 
@@ -710,6 +899,7 @@ class HtreePedigreeView(NavigationView):
         from self.state.db
         """
         self._change_db(db)
+        self._clear_cache()
         if self.active:
             self.bookmarks.redraw()
         self.build_tree()
@@ -756,6 +946,7 @@ class HtreePedigreeView(NavigationView):
     def person_rebuild(self, dummy=None):
         """Callback function for signals of change database."""
         self.format_helper.clear_cache()
+        self._clear_cache()
         self.dirty = True
         if self.active:
             self.rebuild_trees(self.get_active())
@@ -767,145 +958,15 @@ class HtreePedigreeView(NavigationView):
         """
         person = None
         if person_handle:
-            person = self.dbstate.db.get_person_from_handle(person_handle)
+            person = self._get_person(person_handle)
 
         self.dirty = False
         # Increase self.force_size to 6 to allow 6 gen h-tree (by PL)
         if self.tree_style == 1 and (
            self.force_size > 6 or self.force_size == 0):
             self.force_size = 6
-        ############ Replaced all tuples with H-tree tuples and added 6 gen level (by PL) ########
-        # A position definition is a tuple of nodes.
-        # Each node consists of a tuple of:
-        #     (person box rectangle, connection, marriage box rectangle)
-        # A rectangle is a tuple of the format (x, y, width, height)
-        # A connectcion is either a line or a tuple of two lines.
-        # A line is of the format (x, y, height).  Lines have a width of 1.
         if self.tree_style == 1:
-            if self.force_size == 2:
-                pos = (((13,14,4,4), None, None),
-                      ((13,6,4,4), None, None),
-                      ((13,22,4,4), None, None))
-            elif self.force_size == 3:
-                pos = (((13,14,4,4), None, None),
-                      ((13,6,4,4), None, None),
-                      ((13,22,4,4), None, None),
-                      ((5,6,4,4), None, None),
-                      ((21,6,4,4), None, None),
-                      ((5,22,4,4), None, None),
-                      ((21,22,4,4), None, None))
-            elif self.force_size == 4:
-                pos = (((13,14,4,4), None, None),
-                      ((13,6,4,4), None, None),
-                      ((13,22,4,4), None, None),
-                      ((5,6,4,4), None, None),
-                      ((21,6,4,4), None, None),
-                      ((5,22,4,4), None, None),
-                      ((21,22,4,4), None, None),
-                      ((5,2,4,4), None, None),
-                      ((5,10,4,4), None, None),
-                      ((21,2,4,4), None, None),
-                      ((21,10,4,4), None, None),
-                      ((5,18,4,4), None, None),
-                      ((5,26,4,4), None, None),
-                      ((21,18,4,4), None, None),
-                      ((21,26,4,4), None, None))
-            elif self.force_size == 5:
-                pos = (((13,14,4,4), None, None),
-                      ((13,6,4,4), None, None),
-                      ((13,22,4,4), None, None),
-                      ((5,6,4,4), None, None),
-                      ((21,6,4,4), None, None),
-                      ((5,22,4,4), None, None),
-                      ((21,22,4,4), None, None),
-                      ((5,2,4,4), None, None),
-                      ((5,10,4,4), None, None),
-                      ((21,2,4,4), None, None),
-                      ((21,10,4,4), None, None),
-                      ((5,18,4,4), None, None),
-                      ((5,26,4,4), None, None),
-                      ((21,18,4,4), None, None),
-                      ((21,26,4,4), None, None),
-                      ((0,2,4,4), None, None),
-                      ((10,2,4,4), None, None),
-                      ((0,10,4,4), None, None),
-                      ((10,10,4,4), None, None),
-                      ((16,2,4,4), None, None),
-                      ((26,2,4,4), None, None),
-                      ((16,10,4,4), None, None),
-                      ((26,10,4,4), None, None),
-                      ((0,18,4,4), None, None),
-                      ((10,18,4,4), None, None),
-                      ((0,26,4,4), None, None),
-                      ((10,26,4,4), None, None),
-                      ((16,18,4,4), None, None),
-                      ((26,18,4,4), None, None),
-                      ((16,26,4,4), None, None),
-                      ((26,26,4,4), None, None))
-            elif self.force_size == 6:
-                pos = (((13,14,4,4), None, None),
-                      ((13,6,4,4), None, None),
-                      ((13,22,4,4), None, None),
-                      ((5,6,4,4), None, None),
-                      ((21,6,4,4), None, None),
-                      ((5,22,4,4), None, None),
-                      ((21,22,4,4), None, None),
-                      ((5,2,4,4), None, None),
-                      ((5,10,4,4), None, None),
-                      ((21,2,4,4), None, None),
-                      ((21,10,4,4), None, None),
-                      ((5,18,4,4), None, None),
-                      ((5,26,4,4), None, None),
-                      ((21,18,4,4), None, None),
-                      ((21,26,4,4), None, None),
-                      ((0,2,4,4), None, None),
-                      ((10,2,4,4), None, None),
-                      ((0,10,4,4), None, None),
-                      ((10,10,4,4), None, None),
-                      ((16,2,4,4), None, None),
-                      ((26,2,4,4), None, None),
-                      ((16,10,4,4), None, None),
-                      ((26,10,4,4), None, None),
-                      ((0,18,4,4), None, None),
-                      ((10,18,4,4), None, None),
-                      ((0,26,4,4), None, None),
-                      ((10,26,4,4), None, None),
-                      ((16,18,4,4), None, None),
-                      ((26,18,4,4), None, None),
-                      ((16,26,4,4), None, None),
-                      ((26,26,4,4), None, None),
-                      ((0,0,4,1), None, None),
-                      ((0,4,4,1), None, None),
-                      ((10,0,4,1), None, None),
-                      ((10,4,4,1), None, None),
-                      ((0,8,4,1), None, None),
-                      ((0,12,4,1), None, None),
-                      ((10,8,4,1), None, None),
-                      ((10,12,4,1), None, None),
-                      ((16,0,4,1), None, None),
-                      ((16,4,4,1), None, None),
-                      ((26,0,4,1), None, None),
-                      ((26,4,4,1), None, None),
-                      ((16,8,4,1), None, None),
-                      ((16,12,4,1), None, None),
-                      ((26,8,4,1), None, None),
-                      ((26,12,4,1), None, None),
-                      ((0,16,4,1), None, None),
-                      ((0,20,4,1), None, None),
-                      ((10,16,4,1), None, None),
-                      ((10,20,4,1), None, None),
-                      ((0,24,4,1), None, None),
-                      ((0,28,4,1), None, None),
-                      ((10,24,4,1), None, None),
-                      ((10,28,4,1), None, None),
-                      ((16,16,4,1), None, None),
-                      ((16,20,4,1), None, None),
-                      ((26,16,4,1), None, None),
-                      ((26,20,4,1), None, None),
-                      ((16,24,4,1), None, None),
-                      ((16,28,4,1), None, None),
-                      ((26,24,4,1), None, None),
-                      ((26,28,4,1), None, None))
+            pos = _HTREE_POSITIONS[:2**self.force_size - 1]
         else:
             pos = None
 
@@ -914,13 +975,13 @@ class HtreePedigreeView(NavigationView):
         lst = [None] * (2**self.force_size)
         self.find_tree(person, 0, 1, lst)
 
-        # Purge current table content
-        for child in self.table.get_children():
-            child.destroy()
+        # Purge current table content, keeping the widgets for reuse
+        self.pool.release(self.table)
         ##self.table = Gtk.Grid()
 
         if person:
             self.rebuild(self.table, pos, lst, self.force_size)
+            self._start_prefetch(lst)
 
     def rebuild(self, table_widget, positions, lst, size):
         """
@@ -989,8 +1050,9 @@ class HtreePedigreeView(NavigationView):
                 #
                 # No person -> show empty box
                 #
-                pbw = PersonBoxWidgetCairo(self, self.format_helper,
-                        self.dbstate, None, False, 0, None)
+                pbw = self.pool.get(PersonBoxWidgetCairo, self,
+                                    self.format_helper, self.dbstate)
+                pbw.update(None, False, 0, None)
 
                 if i > 0 and lst[((i+1) // 2) - 1]:
                     fam_h = None
@@ -998,7 +1060,7 @@ class HtreePedigreeView(NavigationView):
                     if fam:
                         fam_h = fam.get_handle()
                     if not self.dbstate.db.readonly:
-                        pbw.connect("button-press-event",
+                        pbw.set_press_callback(
                                     self.cb_missing_parent_button_press,
                                     lst[((i+1) // 2) - 1][0].get_handle(), fam_h)
                         pbw.force_mouse_over = True
@@ -1012,8 +1074,9 @@ class HtreePedigreeView(NavigationView):
                    i < ((2**size-1) // 2) or self.tree_style == 2):
                     image = True
 
-                pbw = PersonBoxWidgetCairo(self, self.format_helper,
-                        self.dbstate, lst[i][0], lst[i][3], height, image)
+                pbw = self.pool.get(PersonBoxWidgetCairo, self,
+                                    self.format_helper, self.dbstate)
+                pbw.update(lst[i][0], lst[i][3], height, image)
                 lst[i][4] = pbw
                 if height < 7:
                     pbw.set_tooltip_text(self.format_helper.format_person(
@@ -1022,9 +1085,8 @@ class HtreePedigreeView(NavigationView):
                 fam_h = None
                 if lst[i][2]:
                     fam_h = lst[i][2].get_handle()
-                pbw.connect("button-press-event",
-                            self.cb_person_button_press,
-                            lst[i][0].get_handle(), fam_h)
+                pbw.set_press_callback(self.cb_person_button_press,
+                                       lst[i][0].get_handle(), fam_h)
 
             if pbw:
                 self.attach_widget(table_widget, pbw, xmax,
@@ -1044,14 +1106,13 @@ class HtreePedigreeView(NavigationView):
                 rela = False
                 if lst[2*i+1]: # Father
                     rela = lst[2*i+1][1]
-                line = LineWidget2(1, rela, self.tree_direction)
+                line = self.pool.get(LineWidget2, 1, rela,
+                                     self.tree_direction)
+                line.update(1, rela, self.tree_direction)
 
                 if lst[i] and lst[i][2]:
-                    # Required for popup menu
-                    line.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
-                    line.connect("button-press-event",
-                                 self.cb_relation_button_press,
-                                 lst[i][2].get_handle())
+                    line.set_press_callback(self.cb_relation_button_press,
+                                            lst[i][2].get_handle())
                                  
                 self.attach_widget(table_widget, line, xmax,
                                     x_pos, x_pos+width, y_pos, y_pos+height)
@@ -1062,14 +1123,13 @@ class HtreePedigreeView(NavigationView):
                 rela = False
                 if lst[2*i+2]: # Mother
                     rela = lst[2*i+2][1]
-                line = LineWidget2(0,  rela, self.tree_direction)
+                line = self.pool.get(LineWidget2, 0, rela,
+                                     self.tree_direction)
+                line.update(0, rela, self.tree_direction)
 
                 if lst[i] and lst[i][2]:
-                    # Required for popup menu
-                    line.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
-                    line.connect("button-press-event",
-                                 self.cb_relation_button_press,
-                                 lst[i][2].get_handle())
+                    line.set_press_callback(self.cb_relation_button_press,
+                                            lst[i][2].get_handle())
 
                 self.attach_widget(table_widget, line, xmax,
                                     x_pos, x_pos+width, y_pos, y_pos+height)
@@ -1092,21 +1152,14 @@ class HtreePedigreeView(NavigationView):
                     if lst[i - 1]:
                         mrela = lst[i-1][1]
 
-                    line = LineWidget(lst[((i+1) // 2) - 1][4],
-                                      last_pbw, frela,
-                                      pbw, mrela,
-                                      self.tree_direction)
-                        
+                    args = (lst[((i+1) // 2) - 1][4], last_pbw, frela,
+                            pbw, mrela, self.tree_direction)
+                    line = self.pool.get(LineWidget, *args)
+                    line.update(*args)
+
                     if lst[i] and lst[i][2]:
-                        # Required for popup menu
-                        line.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
-                        line.connect("button-press-event",
-                                     self.cb_relation_button_press,
+                        line.set_press_callback(self.cb_relation_button_press,
                                      lst[((i+1) // 2) - 1][2].get_handle())
-                        # Required for tooltip and mouse-over
-                        line.add_events(Gdk.EventMask.ENTER_NOTIFY_MASK)
-                        # Required for tooltip and mouse-over
-                        line.add_events(Gdk.EventMask.LEAVE_NOTIFY_MASK)
                         line.set_tooltip_text(
                             self.format_helper.format_relation(
                                                 lst[((i+1) // 2) - 1][2], 11))
@@ -1124,7 +1177,8 @@ class HtreePedigreeView(NavigationView):
                     text = self.format_helper.format_relation(lst[i][2], 1, True)
                 else:
                     text = " "
-                label = Gtk.Label(label=text)
+                label = self.pool.get(Gtk.Label)
+                label.set_label(text)
                 label.set_justify(Gtk.Justification.LEFT)
                 label.set_use_markup(True)
                 label.set_line_wrap(True)
@@ -1556,7 +1610,7 @@ class HtreePedigreeView(NavigationView):
             self._depth = depth
 
         try:
-            alive = probably_alive(person, self.dbstate.db)
+            alive = self._is_alive(person)
         except RuntimeError:
             ErrorDialog(_('Relationship loop detected'),
                         _('A person was found to be his/her own ancestor.'))
@@ -1571,24 +1625,118 @@ class HtreePedigreeView(NavigationView):
 
         mrel = True
         frel = True
-        family = self.dbstate.db.get_family_from_handle(family_handle)
+        family = self._get_family(family_handle)
         if family:
             for child_ref in family.get_child_ref_list():
                 if child_ref.ref == person.handle:
                     mrel = child_ref.mrel == ChildRefType.BIRTH
                     frel = child_ref.frel == ChildRefType.BIRTH
                     lst[index] = [person, val, family, alive, None]
+                    if depth == self.force_size:
+                        # The parents are not shown
+                        break
                     father_handle = family.get_father_handle()
                     if father_handle:
-                        father = self.dbstate.db.get_person_from_handle(
-                                    father_handle)
+                        father = self._get_person(father_handle)
                         self.find_tree(father, (2*index)+1, depth+1, lst, frel)
                     mother_handle = family.get_mother_handle()
                     if mother_handle:
-                        mother = self.dbstate.db.get_person_from_handle(
-                                    mother_handle)
+                        mother = self._get_person(mother_handle)
                         self.find_tree(mother, (2*index)+2, depth+1, lst, mrel)
 
+    def _clear_cache(self):
+        """
+        Forget the people, families, etc. read, and stop the prefetch.
+        """
+        self._people.clear()
+        self._families.clear()
+        self._alive.clear()
+        if self._prefetch_id is not None:
+            GLib.source_remove(self._prefetch_id)
+            self._prefetch_id = None
+
+    def _get_person(self, handle):
+        """
+        Get a person from the cache, or else from the database.
+        """
+        if handle not in self._people:
+            if len(self._people) > _CACHE_SIZE:
+                self._clear_cache()
+            self._people[handle] = self.dbstate.db.get_person_from_handle(
+                                                                    handle)
+        return self._people[handle]
+
+    def _get_family(self, handle):
+        """
+        Get a family from the cache, or else from the database.
+        """
+        if handle not in self._families:
+            self._families[handle] = self.dbstate.db.get_family_from_handle(
+                                                                    handle)
+        return self._families[handle]
+
+    def _is_alive(self, person):
+        """
+        Whether a person is probably alive, from the cache if known.
+        """
+        if person.handle not in self._alive:
+            self._alive[person.handle] = probably_alive(person,
+                                                        self.dbstate.db)
+        return self._alive[person.handle]
+
+    def _start_prefetch(self, lst):
+        """
+        Read in idle time the people likely to be shown next.
+        """
+        if self._prefetch_id is not None:
+            GLib.source_remove(self._prefetch_id)
+        self._prefetch_id = GLib.idle_add(self._prefetch_step,
+                                          self._prefetch(lst))
+
+    def _prefetch_step(self, todo):
+        """
+        Read one person (see _prefetch), while the GUI is idle.
+        """
+        if next(todo, False):
+            return True
+        self._prefetch_id = None
+        return False
+
+    def _prefetch(self, lst):
+        """
+        Generator reading the people shown when the user moves to a parent
+        or a child: the parents of the last generation of the tree and the
+        children of the root person, with their parent family, thumbnail,
+        etc. The thumbnails are loaded in the background. It yields True
+        after each person.
+        """
+        handles = []
+        if lst[0]:
+            for family_handle in lst[0][0].get_family_handle_list():
+                family = self._get_family(family_handle)
+                if family:
+                    handles.extend(child_ref.ref
+                                   for child_ref in family.get_child_ref_list())
+        last = 2 ** (self.force_size - 1) - 1
+        for data in lst[last:]:
+            if data and data[2]:
+                handles.extend(handle for handle in
+                               (data[2].get_father_handle(),
+                                data[2].get_mother_handle()) if handle)
+        for handle in handles:
+            person = self._get_person(handle)
+            if person:
+                try:
+                    self._is_alive(person)
+                except RuntimeError:
+                    pass
+                for family_handle in person.get_parent_family_handle_list()[:1]:
+                    self._get_family(family_handle)
+                if self.show_images:
+                    self.thumbnails.load(self.dbstate.db, person)
+            yield True
+        yield False
+
     def add_nav_portion_to_menu(self, menu):
         """
         This function adds a common history-navigation portion
@@ -29,7 +29,7 @@ register(TOOL,
 id = 'mediaverify',
 name = _("Media Verify"),
 description = _("Verify that media is present in the correct path"),
-version = '1.0.8',
+version = '1.0.9',
 gramps_target_version = "5.0",
 status = STABLE,
 fname = 'MediaVerify.py',
@@ -28,7 +28,10 @@
 #-------------------------------------------------------------------------
 import os
 import io
+import json
+import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 #-------------------------------------------------------------------------
 #
@@ -53,6 +56,7 @@ from gramps.gui.dialog import WarningDialog
 from gramps.gui.editors import EditMedia
 from gramps.gen.errors import WindowActiveError
 from gramps.gen.constfunc import conv_to_unicode
+from gramps.gen.const import USER_PLUGINS
 
 #------------------------------------------------------------------------
 #
@@ -66,6 +70,157 @@ except ValueError:
     _trans = glocale.translation
 _ = _trans.gettext
 
+#-------------------------------------------------------------------------
+#
+# Constants
+#
+#-------------------------------------------------------------------------
+# Digest algorithms offered, the first one being the default
+ALGORITHMS = [algorithm for algorithm in ('md5', 'sha1', 'sha256', 'blake2b')
+              if algorithm in hashlib.algorithms_available]
+# Size of the chunks in which the files are read
+CHUNK_SIZE = 1024 * 1024
+# Number of files hashed at the same time
+MAX_WORKERS = 4
+# Digests of the files already hashed
+INDEX_PATH = os.path.join(USER_PLUGINS, 'MediaVerify', 'hash_index.json')
+
+#-------------------------------------------------------------------------
+#
+# Hashing
+#
+#-------------------------------------------------------------------------
+def hash_file(full_path, algorithm):
+    """
+    Return the digest of a file, read in chunks.
+    """
+    digest = hashlib.new(algorithm)
+    with io.open(full_path, 'rb') as media_file:
+        for chunk in iter(lambda: media_file.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class HashIndex(object):
+    """
+    Persistent index of the digests of files by path, size and
+    modification time, so that unchanged files are not read again.
+    """
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        try:
+            with io.open(path, 'r') as index_file:
+                self.entries = json.load(index_file)
+        except (IOError, OSError, ValueError):
+            self.entries = {}
+
+    def lookup(self, full_path, stat, algorithm):
+        """
+        Return the digest of an unchanged file, or None.
+        """
+        entry = self.entries.get(full_path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2].get(algorithm)
+        return None
+
+    def store(self, full_path, stat, algorithm, digest):
+        entry = self.entries.get(full_path)
+        if not entry or entry[0] != stat.st_size or entry[1] != stat.st_mtime_ns:
+            entry = self.entries[full_path] = [stat.st_size, stat.st_mtime_ns, {}]
+        entry[2][algorithm] = digest
+
+    def save(self):
+        """
+        Save the index, without the files that no longer exist.
+        """
+        self.entries = dict((full_path, entry)
+                            for (full_path, entry) in self.entries.items()
+                            if os.path.isfile(full_path))
+        try:
+            with io.open(self.path + '.tmp', 'w') as index_file:
+                index_file.write(json.dumps(self.entries))
+            os.replace(self.path + '.tmp', self.path)
+        except (IOError, OSError):
+            pass
+
+class FileHasher(object):
+    """
+    Hash files in a pool of threads, taking the digests of the unchanged
+    files from the index. The size of the files read and the time taken
+    are kept to report the throughput.
+    """
+    def __init__(self, index, algorithm, max_workers=MAX_WORKERS):
+        self.index = index
+        self.algorithm = algorithm
+        self.max_workers = max_workers
+        self.files_read = 0
+        self.bytes_read = 0
+        self.files_indexed = 0
+        self.seconds = 0.0
+
+    def hash_files(self, paths):
+        """
+        Generator of (path, digest, error) for the given paths, in the
+        order the digests are found. Only a few files are hashed ahead,
+        so that the generator can be closed at any time.
+        """
+        start = time.time()
+        try:
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                pending = {}
+                for full_path in paths:
+                    try:
+                        stat = os.stat(full_path)
+                    except OSError as err:
+                        yield (full_path, None, err)
+                        continue
+                    digest = self.index.lookup(full_path, stat, self.algorithm)
+                    if digest:
+                        self.files_indexed += 1
+                        yield (full_path, digest, None)
+                        continue
+                    future = executor.submit(hash_file, full_path,
+                                             self.algorithm)
+                    pending[future] = (full_path, stat)
+                    if len(pending) >= 2 * self.max_workers:
+                        for result in self._finished(pending, FIRST_COMPLETED):
+                            yield result
+                while pending:
+                    for result in self._finished(pending, FIRST_COMPLETED):
+                        yield result
+        finally:
+            self.seconds += time.time() - start
+
+    def _finished(self, pending, return_when):
+        """
+        Wait for hashes to finish, and return their results.
+        """
+        done = wait(pending, return_when=return_when)[0]
+        results = []
+        for future in done:
+            full_path, stat = pending.pop(future)
+            try:
+                digest = future.result()
+            except (IOError, OSError) as err:
+                results.append((full_path, None, err))
+                continue
+            self.index.store(full_path, stat, self.algorithm, digest)
+            self.files_read += 1
+            self.bytes_read += stat.st_size
+            results.append((full_path, digest, None))
+        return results
+
+    def throughput(self):
+        """
+        Return a text giving the amount of data hashed and the throughput.
+        """
+        megabytes = self.bytes_read / (1024.0 * 1024.0)
+        return (_('%(files)d files hashed, %(size).1f MB in %(time).1f s '
+                  '(%(rate).1f MB/s), %(indexed)d unchanged files') %
+                {'files': self.files_read, 'size': megabytes,
+                 'time': self.seconds,
+                 'rate': megabytes / self.seconds if self.seconds else 0,
+                 'indexed': self.files_indexed})
+
 #-------------------------------------------------------------------------
 #
 # Media Verify
@@ -84,9 +239,10 @@ class MediaVerify(tool.Tool, ManagedWindow):
         self.moved_files = []
         self.titles = [_('Moved/Renamed Files'), _('Missing Files'),  
                        _('Duplicate Files'), _('Extra Files'), 
-                       _('No md5 Generated'), _('Errors')]
+                       _('No Hash Generated'), _('Errors')]
         self.models = []
         self.views = []
+        self.index = HashIndex()
 
         window = Gtk.Window()
         vbox = Gtk.VBox()
@@ -102,8 +258,17 @@ class MediaVerify(tool.Tool, ManagedWindow):
         close = Gtk.Button(_('Close'))
         close.set_tooltip_text(_('Close the Media Verify Tool'))
         close.connect('clicked', self.close)
+        self.algorithm = Gtk.ComboBoxText()
+        self.algorithm.set_tooltip_text(_('Digest algorithm of the hashes'))
+        for algorithm in ALGORITHMS:
+            self.algorithm.append_text(algorithm)
+        algorithm = self.options.handler.options_dict['algorithm']
+        if algorithm in ALGORITHMS:
+            self.algorithm.set_active(ALGORITHMS.index(algorithm))
+        else:
+            self.algorithm.set_active(0)
         generate = Gtk.Button(_('Generate'))
-        generate.set_tooltip_text(_('Generate md5 hashes for media objects'))
+        generate.set_tooltip_text(_('Generate hashes for media objects'))
         generate.connect('clicked', self.generate_md5)
         verify = Gtk.Button(_('Verify'))
         verify.set_tooltip_text(_('Check media paths and report missing, '
@@ -115,7 +280,10 @@ class MediaVerify(tool.Tool, ManagedWindow):
         fix = Gtk.Button(_('Fix'))
         fix.set_tooltip_text(_('Fix media paths of moved and renamed files'))
         fix.connect('clicked', self.fix_media)
+        self.status = Gtk.Label()
+        vbox.pack_start(self.status, False, False, 0)
         bbox.add(close)
+        bbox.add(self.algorithm)
         bbox.add(generate)
         bbox.add(verify)
         bbox.add(export)
@@ -130,7 +298,7 @@ class MediaVerify(tool.Tool, ManagedWindow):
         self.show_tabs()
 
     def build_menu_names(self, obj):
-        return (_('Verify Gramps media using md5 hashes'), 
+        return (_('Verify Gramps media using hashes'), 
                 self.window_name)
 
     def create_tab(self, title):
@@ -248,12 +416,29 @@ class MediaVerify(tool.Tool, ManagedWindow):
         for model in self.models:
             model.clear()
 
+    def get_hasher(self):
+        """
+        Return a file hasher for the selected digest algorithm.
+        """
+        algorithm = self.algorithm.get_active_text()
+        self.options.handler.options_dict['algorithm'] = algorithm
+        self.options.handler.save_options()
+        return FileHasher(self.index, algorithm)
+
+    def show_throughput(self, hasher):
+        """
+        Save the hash index, and show the throughput of the hashing.
+        """
+        self.index.save()
+        self.status.set_text(hasher.throughput())
+
     def generate_md5(self, button):
         """
-        Generate md5 hashes for media files and attach them as attributes to
+        Generate hashes for media files and attach them as attributes to
         media objects.
         """
         self.clear_models()
+        hasher = self.get_hasher()
 
         progress = ProgressMeter(self.window_name, can_cancel=True,
                                  parent=self.window)
@@ -261,38 +446,44 @@ class MediaVerify(tool.Tool, ManagedWindow):
         length = self.db.get_number_of_media_objects()
         progress.set_pass(_('Generating media hashes'), length)
 
-        with DbTxn(_("Set media hashes"), self.db, batch=True) as trans:
+        # Media objects by file: the files are read once
+        media_files = {}
+        for handle in self.db.get_media_object_handles():
+            media = self.db.get_object_from_handle(handle)
+            full_path = media_path_full(self.db, media.get_path())
+            media_files.setdefault(full_path, []).append(handle)
 
-            for handle in self.db.get_media_object_handles():
-                media = self.db.get_object_from_handle(handle)
+        with DbTxn(_("Set media hashes"), self.db, batch=True) as trans:
 
-                full_path = media_path_full(self.db, media.get_path())
-                try:
-                    with io.open(full_path, 'rb') as media_file:
-                        md5sum = hashlib.md5(media_file.read()).hexdigest()
-                except IOError as err:
+            for full_path, digest, err in hasher.hash_files(list(media_files)):
+                handles = media_files[full_path]
+                if err:
                     error_msg = '%s: %s' % (err.strerror, full_path)
                     self.models[5].append((error_msg, None))
-                    progress.step()
+                    for handle in handles:
+                        progress.step()
                     continue
 
-                for attr in media.get_attribute_list():
-                    if str(attr.get_type()) == 'md5':
-                        media.remove_attribute(attr)
-                        break
+                for handle in handles:
+                    media = self.db.get_object_from_handle(handle)
+                    for attr in media.get_attribute_list():
+                        if str(attr.get_type()) == hasher.algorithm:
+                            media.remove_attribute(attr)
+                            break
 
-                attr = Attribute()
-                attr.set_type(AttributeType('md5'))
-                attr.set_value(md5sum)
+                    attr = Attribute()
+                    attr.set_type(AttributeType(hasher.algorithm))
+                    attr.set_value(digest)
 
-                media.add_attribute(attr)
-                
-                self.db.commit_media_object(media, trans)
+                    media.add_attribute(attr)
 
-                progress.step()
+                    self.db.commit_media_object(media, trans)
+
+                    progress.step()
                 if progress.get_cancelled():
                     break
 
+        self.show_throughput(hasher)
         self.show_tabs()
         progress.close()
 
@@ -313,49 +504,46 @@ class MediaVerify(tool.Tool, ManagedWindow):
                             self.window)
             return
 
+        hasher = self.get_hasher()
         progress = ProgressMeter(self.window_name, can_cancel=True,
                                  parent=self.window)
 
-        length = 0
+        paths = []
         for root, dirs, files in os.walk(media_path):
-            length += len(files)
-        progress.set_pass(_('Finding files'), length)
+            paths.extend(os.path.join(root, file_name) for file_name in files)
+        progress.set_pass(_('Finding files'), len(paths))
 
         all_files = {}
-        for root, dirs, files in os.walk(media_path):
-            for file_name in files:
-                full_path = os.path.join(root, file_name)
-                try:
-                    with io.open(full_path, 'rb') as media_file:
-                        md5sum = hashlib.md5(media_file.read()).hexdigest()
-                except IOError as err:
-                    error_msg = '%s: %s' % (err.strerror, full_path)
-                    self.models[5].append((error_msg, None))
-                    progress.step()
-                    continue
+        for full_path, md5sum, err in hasher.hash_files(paths):
+            if err:
+                error_msg = '%s: %s' % (err.strerror, full_path)
+                self.models[5].append((error_msg, None))
+                progress.step()
+                continue
 
-                rel_path = relative_path(full_path, media_path)
-                if md5sum in all_files:
-                    all_files[md5sum].append(rel_path)
-                else:
-                    all_files[md5sum] = [rel_path]
+            rel_path = relative_path(full_path, media_path)
+            if md5sum in all_files:
+                all_files[md5sum].append(rel_path)
+            else:
+                all_files[md5sum] = [rel_path]
 
-                progress.step()
-                if progress.get_cancelled():
-                    break
+            progress.step()
+            if progress.get_cancelled():
+                break
+        self.show_throughput(hasher)
 
         length = self.db.get_number_of_media_objects()
         progress.set_pass(_('Checking paths'), length)
 
-        in_gramps = []
+        in_gramps = set()
         for handle in self.db.get_media_object_handles():
             media = self.db.get_object_from_handle(handle)
 
             md5sum = None
             for attr in media.get_attribute_list():
-                if str(attr.get_type()) == 'md5':
+                if str(attr.get_type()) == hasher.algorithm:
                     md5sum = attr.get_value()
-                    in_gramps.append(md5sum)
+                    in_gramps.add(md5sum)
                     break
 
             # Moved files
@@ -430,3 +618,11 @@ class MediaVerifyOptions(tool.ToolOptions):
     """
     def __init__(self, name, person_id=None):
         tool.ToolOptions.__init__(self, name, person_id)
+
+        self.options_dict = {
+            'algorithm' : ALGORITHMS[0],
+            }
+        self.options_help = {
+            'algorithm' : ("=str", "Digest algorithm of the hashes",
+                           ALGORITHMS),
+            }
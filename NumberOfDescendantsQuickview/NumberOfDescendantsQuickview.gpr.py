@@ -2,8 +2,9 @@ register(QUICKREPORT,
          id    = 'NumberOfDescendantsQuickview',
          name  = _("Number of descendants"),
          description= _("Shows the number of descendants of the current person"),
-         version = '3.4.21',
+         version = '3.4.22',
          gramps_target_version = "5.0",
+         depends_on = ['libdescendants'],
          status = STABLE,
          fname = 'NumberOfDescendantsQuickview.py',
          authors = ["Reinhard Mueller"],
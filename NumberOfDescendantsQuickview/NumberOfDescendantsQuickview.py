@@ -41,6 +41,7 @@ from gramps.gen.simple import SimpleDoc
 from gramps.gui.plug.quick import QuickTable
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 from gramps.gen.utils.alive import probably_alive
+from libdescendants import DescendantGraph
 try:
     _trans = glocale.get_addon_translator(__file__)
 except ValueError:
@@ -68,7 +69,7 @@ def run(database, document, person):
     alive    = []
     handles  = []
 
-    _count_descendants(database, person, death_date, 0,
+    _count_descendants(database, person, death_date,
             total, seen, outlived, alive, handles)
 
     # Bring all lists to the same length. No list can be longer than "total".
@@ -127,21 +128,23 @@ def run(database, document, person):
 
 #------------------------------------------------------------------------
 #
-# Recursively count descendants
+# Count descendants, generation by generation
 #
 #------------------------------------------------------------------------
-def _count_descendants(database, person, root_death_date, generation,
+def _count_descendants(database, person, root_death_date,
         total, seen, outlived, alive, handles):
 
     # "total", "seen", "outlived" and "alive" are lists with the respective
     # descendant count per generation. "handles" is a list of lists of person
     # handles per generation. These parameters are modified by this function!
+    # A descendant is counted once, in the first generation he is found.
 
-    for family_handle in person.get_family_handle_list():
-        family = database.get_family_from_handle(family_handle)
-
-        for child_ref in family.get_child_ref_list():
-            child = database.get_person_from_handle(child_ref.ref)
+    graph = DescendantGraph.from_person(database, person.handle)
+    for (generation, numbers) in enumerate(graph.generations()):
+        for number in numbers:
+            child = database.get_person_from_handle(graph.handles[number])
+            if child is None:
+                continue
 
             birth_date = _get_date(database, child.get_birth_ref())
             death_date = _get_date(database, child.get_death_ref())
@@ -166,9 +169,6 @@ def _count_descendants(database, person, root_death_date, generation,
             # Handle to this descendant.
             _increment(handles, [], [child.handle], generation)
 
-            _count_descendants(database, child, root_death_date, generation + 1,
-                    total, seen, outlived, alive, handles)
-
 
 # Helper function to increment the nth item of a list, and if necessary expand
 # the length of the list to n items beforehand.
@@ -24,7 +24,7 @@ register(TOOL,
 id    = 'PlaceCompletion',
 name  = _("PlaceCompletion"),
 description =  _("Provides a browsable list of selected places, with possibility to complete/parse/set the attribute fields."),
-version = '0.0.28',
+version = '0.0.30',
 gramps_target_version = "5.0",
 status = STABLE, # not yet tested with python 3,
 fname = 'PlaceCompletion.py',
@@ -31,6 +31,7 @@
 import os
 import stat
 import re
+import sqlite3
 
 #------------------------------------------------------------------------
 #
@@ -77,6 +78,8 @@ if hasattr(gramps.gui.utils, "ProgressMeter"):
 else:
     raise ImportError("can't find ProgressMeter")
 
+from gazetteer import Gazetteer, compile_pattern
+
 #------------------------------------------------------------------------
 #
 # 
@@ -207,8 +210,9 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
                     ('county'), ('state'), ('country'), ('zip'), ('title')]
         
         #some extra init of needed datafields
-        self.latlonfile_datastr = None
+        self.gazetteer = None
         self.county_lookup = {}
+        self.place_nodes = {}
 
 #set translated labels
         labelids = ['label28', 'label29','label30', 'label31', 'label33', 'label34'
@@ -395,12 +399,13 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
         
         # Compile Regex file search partially
         self.matchlatlon = None
+        self.latlonpattern = findregex
         self.extrafindgroup = []  #find always finds lat/lon, what extra groups?
         possibleextrafindgroups=[('county'), ('state')]
         if findregex :
             try:
-                #compile regex aware of locale and unicode
-                self.matchlatlon = re.compile(findregex,re.U|re.L|re.M)
+                #compile the regex the lat/lon file is indexed with
+                self.matchlatlon = compile_pattern(findregex)[0]
                 latlongroup = ['lat', 'lon'] 
                 for group in latlongroup :
                     if findregex.find(r'(?P<'+group+r'>') == -1 :
@@ -431,8 +436,14 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
     def make_new_model(self):
         # model contains 4 colums: text to show, place handle, action, color
         self.model = Gtk.TreeStore(str, object, object, str)
-        self.tree.set_model(self.model)
+        # parent node of each place handle, the iters of a TreeStore remain
+        # valid as long as their row exists
+        self.place_nodes = {}
+        # the model is filled before it is shown, so that the view does not
+        # follow every insertion
+        self.tree.set_model(None)
         self.populate_tree()
+        self.tree.set_model(self.model)
         self.tree.expand_all()
 
     def populate_tree(self):
@@ -487,19 +498,24 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
             if self.check_errors(filename):
                 return
             # check if file is a text file is not possible, assume it is
-            progress.set_pass(_('Loading lat/lon file in Memory...'),1)
-            self.load_latlon_file(filename)
+            progress.set_pass(_('Indexing lat/lon file...'), 100)
+            if not self.load_latlon_file(filename, progress):
+                progress.close()
+                return
             self.load_counties_file()
-            progress.step()
             
         #do all the checks and fill up model
         progress.set_pass(_('Examining places'),self.nrplaces_in_tree)
         
+        # read the places in one pass over the table, and not one by one
+        handles = set(ind_list)
+        places = dict((place.get_handle(), place)
+                      for place in self.db.iter_places()
+                      if place.get_handle() in handles)
         sib_id = None
         for handle in ind_list :
             progress.step()
-            place = self.db.get_place_from_handle(handle)
-            sib_id = self.insert_place_in_tree(sib_id, place)
+            sib_id = self.insert_place_in_tree(sib_id, places[handle])
                 
         progress.close()
     
@@ -555,6 +571,7 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
         
     def insert_place_in_tree(self, prev_id, place) :
         sib_id = self.model.insert_after(None, prev_id)
+        self.place_nodes[place.get_handle()] = sib_id
         self.set_parent_model_text(sib_id, place)
         prev_id = None
         overwrite = False
@@ -604,15 +621,14 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
                         place = self.group_set(place, action[0], action[1] )
                 else :
                     #we are in a parent node, go over children nodes if present
-                    index = 0
-                    while store.iter_nth_child(node, index):
-                        nodechild = store.iter_nth_child(node, index)
+                    nodechild = store.iter_children(node)
+                    while nodechild:
                         action = store.get_value(nodechild,2)
                         if action :
                             if action[1] != None :
                                 place = self.group_set(place, 
                                                 action[0], action[1] )
-                        index += 1
+                        nodechild = store.iter_next(nodechild)
                             
                 try :
                     EditPlace(self.dbstate, self.uistate, self.track, place,
@@ -626,6 +642,8 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
             store, node = selection.get_selected()
             if node :
                 path = store.get_path(node)
+                if store.iter_parent(node) is None:
+                    del self.place_nodes[store.get_value(node, 1)]
                 store.remove(node)
                 # set selection to the next item
                 selection.select_path(path)
@@ -677,52 +695,41 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
         '''execute all the actions in the treeview
         '''
         modified = 0
-        save_place = False
-
-        with DbTxn(_("Set Tag"), self.db, batch=True) as self.trans:
-            self.db.disable_signals()
-            progress = ProgressMeter(_('Doing Place changes'),'')
-            #we do not know how many places in the treeview, and counting would
-            # mean transversing the tree. Set the progress to the possible maximum
-            progress.set_pass('',self.db.get_number_of_places())
+        store = self.tree.get_model()
+        if not store:
+            return
+        progress = ProgressMeter(_('Doing Place changes'),'')
+        progress.set_pass('', store.iter_n_children(None))
 
-            store = self.tree.get_model()
-            if store:
-                node  = store.get_iter_first()
-            else:
-                node = None
-            while node :
-                save_place = False
-                place_handle = store.get_value(node, 1)
-                place = self.db.get_place_from_handle(place_handle)
-                action = store.get_value(node,2)
-                if action :
-                    #action None means do nothing
-                    if action[1] != None :
-                        place = self.group_set(place, action[0], action[1] )
-                        save_place = True
-                else :
-                    #we are in a parent node, go over children nodes if present
-                    index = 0
-                    while store.iter_nth_child(node, index):
-                        nodechild = store.iter_nth_child(node, index)
-                        action = store.get_value(nodechild,2)
-                        if action :
-                            if action[1] != None :
-                                place = self.group_set(place, action[0], action[1] )
-                                save_place = True
-                        index += 1
-            
-                if save_place:
-                    modified += 1
-                    self.db.commit_place(place,self.trans)
+        # all changes in one batch transaction, without a signal per place:
+        # the views are rebuilt once at the end
+        self.db.disable_signals()
+        try:
+            with DbTxn(_("Change places"), self.db, batch=True) as trans:
+                node = store.get_iter_first()
+                while node :
                     progress.step()
-                #go to next on same level
-                node = store.iter_next(node)
-                
-            progress.close()
+                    save_place = False
+                    place_handle = store.get_value(node, 1)
+                    place = self.db.get_place_from_handle(place_handle)
+                    #go over children nodes if present
+                    nodechild = store.iter_children(node)
+                    while nodechild:
+                        action = store.get_value(nodechild,2)
+                        #action None means do nothing
+                        if action and action[1] != None :
+                            place = self.group_set(place, action[0], action[1] )
+                            save_place = True
+                        nodechild = store.iter_next(nodechild)
+                    if save_place:
+                        modified += 1
+                        self.db.commit_place(place, trans)
+                    #go to next on same level
+                    node = store.iter_next(node)
+        finally:
             self.db.enable_signals()
             self.db.request_rebuild()
+            progress.close()
         
         if modified == 0:
             msg = _("No place record was modified.")
@@ -735,6 +742,7 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
         #populate the tree --> CHANGE !! empty the tree model instead!
         #self.make_new_model()
         self.tree.set_model(None)
+        self.place_nodes = {}
 
     def this_callback(self, obj):
         '''after edit place, this is called: remake the tree place entry with
@@ -748,9 +756,12 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
             # we rerun the actions on this model and change the rows if needed
             self.set_parent_model_text(node,obj)
             overwrite = False
-            index = 0
-            while store.iter_nth_child(node, index):
-                nodechild = store.iter_nth_child(node, index)
+            children = []
+            nodechild = store.iter_children(node)
+            while nodechild:
+                children.append(nodechild)
+                nodechild = store.iter_next(nodechild)
+            for nodechild in children:
                 action = store.get_value(nodechild,2)
                 if action : 
                     dataold = self.group_get(obj, action[0])
@@ -758,13 +769,11 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
                     if dataold == action[1] :
                         #remove this line as nothing changes anymore
                         store.remove(nodechild)
-                        #go to next child, index remains the same due to deletion
                         continue
                     if action[1] == None :
                         #remove this line, the line was text, user must do 
                         # find again to have the text reappear correctly
                         store.remove(nodechild)
-                        #go to next child, index remains the same due to deletion
                         continue
                     if action[0] == '#latlon' :
                         dataold = dataold[0]+r'/'+dataold[1]
@@ -774,7 +783,6 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
                     # update the object in memory
                     if action[1] != None :
                         obj = self.group_set(obj, action[0], action[1] )
-                    index += 1
             # if overwrite, set color of parent node
             if overwrite :
                 self.model.set(node, 3, self.coloroverwrite)
@@ -784,14 +792,7 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
         ''' returns a treeiter pointing at parent node corresponding to handle
             or None if not found
         '''
-        store = self.tree.get_model()
-        node  = store.get_iter_first()
-        while node:
-            handleparent = store.get_value(node,1)
-            if handleparent == handle :
-                return node
-            node = store.iter_next(node)
-        return None
+        return self.place_nodes.get(handle)
         
     def check_errors(self,filename):
         """
@@ -839,77 +840,82 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
             line = county_file.readline()
         county_file.close()
 
-    def load_latlon_file(self, filename):
-        import codecs
-        if self.latlonfile_datastr :
-            # free the space in memory  --- HOW ???
-            self.latlonfile_datastr = None
-        #codecs.open( "someFile", "r", "utf-8" )
+    def load_latlon_file(self, filename, progress):
+        '''
+        Open the index of the lat/lon file for the search pattern, parsing
+        the file only if it changed since the index was built.
+        Returns False if the index could not be built.
+        '''
+        if self.gazetteer :
+            self.gazetteer.close()
+        self.gazetteer = Gazetteer(filename, self.latlonpattern,
+                                   os.path.dirname(__file__))
+        steps = [0]
+        def step(fraction):
+            while steps[0] < int(fraction * 100):
+                steps[0] += 1
+                progress.step()
         try :
-            infile = codecs.open(filename, 'r',"utf-8")
-            self.latlonfile_datastr = infile.read()
-        except UnicodeDecodeError as err:
-            #mention problem, and try to continue:
-            msg = 'There was a problem reading the file: ' + err.reason + '\n' \
-                    +'A second attempt will be made, ignoring errors...'
-            OkDialog(_('Problem reading file'),msg,self.window)
-            infile = codecs.open(filename, 'r',"utf-8",errors='ignore')
-            self.latlonfile_datastr = infile.read()
-        infile.close()
+            try :
+                self.gazetteer.open(step)
+            except UnicodeDecodeError as err:
+                #mention problem, and try to continue:
+                msg = 'There was a problem reading the file: ' + err.reason + '\n' \
+                        +'A second attempt will be made, ignoring errors...'
+                OkDialog(_('Problem reading file'),msg,self.window)
+                steps[0] = 0
+                self.gazetteer.open(step, errors='ignore')
+        except (IOError, sqlite3.Error) as err:
+            ErrorDialog(_('Cannot open file'), str(err))
+            self.gazetteer = None
+            return False
+        return True
     
     def find_latlon(self, place) :
         valoud = []
         valnew = []
         valaction = []
-        if not self.matchlatlon :
+        if not (self.matchlatlon and self.gazetteer) :
             return valoud, valnew, valaction, place
-        # we need to lookup the latitude and longitude, construct regex:
-        pattern = self.matchlatlon.pattern
+        # we need to lookup the latitude and longitude in the index
+        fields = self.gazetteer.fields
+        values = {}
         loc = get_main_location(self.db, place)
         city = loc.get(PlaceType.CITY, '').strip()
         state = loc.get(PlaceType.STATE, '').strip()
         parish = loc.get(PlaceType.PARISH, '').strip()
         county = loc.get(PlaceType.COUNTY, '').strip()
-        if re.search(('CITY'), pattern) :
+        if 'CITY' in fields :
             if city == '' :
                 return valoud, valnew, valaction, place
-            pattern = re.sub(('CITY'), city, pattern)
-        if re.search(('TITLEBEGIN'), pattern) :
+            values['CITY'] = city
+        if 'TITLEBEGIN' in fields :
             tit = place.get_title().strip()
             titb= tit.split(',')[0].strip()
             if titb == '' :
                 return valoud, valnew, valaction, place
-            pattern = re.sub(('TITLEBEGIN'), titb, pattern)
-        if re.search(('TITLE'), pattern) :
+            values['TITLEBEGIN'] = titb
+        if 'TITLE' in fields :
             if place.get_title().strip() == '':
                 return valoud, valnew, valaction, place
-            pattern = re.sub(('TITLE'), loc.get_title().strip(), pattern)
-        if re.search(('STATE'), pattern):
+            values['TITLE'] = place.get_title().strip()
+        if 'STATE' in fields :
             if state == '' :
                 return valoud, valnew, valaction, place
-            pattern = re.sub(('STATE'), state, pattern)
-        if re.search(('PARISH'), pattern):
+            values['STATE'] = state
+        if 'PARISH' in fields :
             if parish == '' :
                 return valoud, valnew, valaction, place
-            pattern = re.sub(('PARISH'), parish, pattern)
-        if re.search(('COUNTY'), pattern):
+            values['PARISH'] = parish
+        if 'COUNTY' in fields :
             if county not in self.county_lookup:
                 return valoud, valnew, valaction, place
-            codes = self.county_lookup[county]
-            pattern = re.sub(('COUNTY'), '(' + '|'.join(codes) + ')', pattern)
-        #print 'DEBUG info: pattern for search is ' , pattern
-        regexll = re.compile(pattern,re.U|re.L|re.M)
-        latlongroup = ['lat', 'lon'] 
+            values['COUNTY'] = self.county_lookup[county]
         #find all occurences in the data file
-        iterator = regexll.finditer(self.latlonfile_datastr)
-        for result in iterator : 
+        for lat, lon, groups in self.gazetteer.lookup(values) : 
             lato =self.group_get(place, ('latitude'))
             lono =self.group_get(place, ('longitude'))
                        
-            lat = result.group(latlongroup[0])
-            lon = result.group(latlongroup[1])
-            if not(lat and lon):
-                continue
             if lato or lono :
                 valoud.append(lat+r'/'+ lon)
             else : 
@@ -921,11 +927,11 @@ class PlaceCompletion(Tool.Tool, ManagedWindow):
             # check for other groups present in the regex :
             for groupname in self.extrafindgroup :
                 valoud.append(self.group_get(place, groupname))
-                valnew.append(result.group(groupname))
-                valaction.append([groupname, result.group(groupname)])
+                valnew.append(groups[groupname])
+                valaction.append([groupname, groups[groupname]])
                 #do the action on the place in memory:
                 place = self.group_set(place, groupname, 
-                                            result.group(groupname))
+                                            groups[groupname])
         return valoud, valnew, valaction, place
         
     def convert_latlon(self,place) :
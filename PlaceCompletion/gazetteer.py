@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C)2007-2009  B. Malengier
+# Copyright (C) 2012       Eric Doutreleau
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+"""
+Index of a lat/lon file (gazetteer) for PlaceCompletion.
+
+The search patterns of PlaceCompletion are regexes with placeholders
+(CITY, COUNTY, ...) standing for the place looked up. Instead of running
+the pattern over the whole file for every place, the file is parsed once:
+each placeholder becomes a capturing group, and every match is stored in
+an sqlite index under the normalized values of the placeholders. The
+index is kept next to the file, and rebuilt when the file or the pattern
+changes.
+"""
+
+#------------------------------------------------------------------------
+#
+# standard python modules
+#
+#------------------------------------------------------------------------
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import itertools
+import unicodedata
+
+#------------------------------------------------------------------------
+#
+# Constants
+#
+#------------------------------------------------------------------------
+# Placeholders of the search patterns, TITLEBEGIN before TITLE
+PLACEHOLDERS = ('TITLEBEGIN', 'TITLE', 'CITY', 'STATE', 'PARISH', 'COUNTY')
+INDEX_SUFFIX = '.gazetteer.sqlite'
+# Changing the way the index is built must change its version
+INDEX_VERSION = '1'
+# Bytes of the file parsed at once, cut at a line end
+CHUNK_SIZE = 16 * 1024 * 1024
+# Separator of the values of the placeholders in the keys
+KEY_SEPARATOR = '\x1f'
+
+_placeholder = re.compile('|'.join(PLACEHOLDERS))
+
+def normalize(text):
+    """
+    Key of a name: NFC form, case folded, white space collapsed.
+    """
+    text = unicodedata.normalize('NFC', ' '.join(text.split()))
+    return text.casefold()
+
+def compile_pattern(pattern):
+    """
+    Return the regex parsing the file for a search pattern, and the
+    placeholders it contains, in the order of the key.
+
+    Each placeholder becomes a named group. Raise re.error if the pattern
+    is not valid.
+    """
+    fields = []
+    def replace(match):
+        field = match.group(0)
+        group = 'gz_' + field.lower()
+        if field in fields:
+            return '(?P=%s)' % group
+        fields.append(field)
+        return r'(?P<%s>[^\t\n]+?)' % group
+    regex = _placeholder.sub(replace, pattern)
+    return re.compile(regex, re.U | re.M), fields
+
+def find_overlapping(regex, text):
+    """
+    Iterate over the matches of a regex in a text, overlapping ones
+    included, as the names of a list of variants: a search starts at each
+    position following the start of a match.
+    """
+    match = regex.search(text)
+    while match:
+        yield match
+        match = regex.search(text, match.start() + 1)
+
+#------------------------------------------------------------------------
+#
+# Gazetteer
+#
+#------------------------------------------------------------------------
+class Gazetteer(object):
+    """
+    Lat/lon file indexed for a search pattern.
+
+    open() builds the index if needed; lookup() then returns, in the order
+    of the file, the (lat, lon, groups) of the entries matching the values
+    of the placeholders, groups holding the other named groups of the
+    pattern.
+    """
+    def __init__(self, filename, pattern, cache_dir=None):
+        self.filename = filename
+        self.pattern = pattern
+        self.regex, self.fields = compile_pattern(pattern)
+        self.digest = hashlib.sha1(
+            (INDEX_VERSION + pattern).encode('utf-8')).hexdigest()
+        self.cache_dir = cache_dir
+        self.index_path = None
+        self._conn = None
+
+    def index_paths(self):
+        """
+        Places tried for the index: next to the file, then in the cache
+        directory, then in memory.
+        """
+        paths = [self.filename + INDEX_SUFFIX]
+        if self.cache_dir:
+            name = hashlib.sha1(os.path.abspath(
+                self.filename).encode('utf-8')).hexdigest()[:12]
+            paths.append(os.path.join(self.cache_dir, '%s-%s%s' % (
+                os.path.basename(self.filename), name, INDEX_SUFFIX)))
+        paths.append(':memory:')
+        return paths
+
+    def _connect(self, paths):
+        for path in paths:
+            try:
+                conn = sqlite3.connect(path)
+                conn.execute('CREATE TABLE IF NOT EXISTS source '
+                             '(pattern TEXT PRIMARY KEY, size INTEGER, '
+                             'mtime REAL)')
+                conn.execute('CREATE TABLE IF NOT EXISTS entry '
+                             '(pattern TEXT, key TEXT, lat TEXT, lon TEXT, '
+                             'groups TEXT)')
+                conn.execute('CREATE INDEX IF NOT EXISTS entry_key '
+                             'ON entry (pattern, key)')
+                conn.commit()
+            except sqlite3.Error:
+                continue
+            self.index_path = path
+            return conn
+
+    def is_current(self):
+        """
+        Whether the index holds the file as it is now.
+        """
+        info = os.stat(self.filename)
+        row = self._conn.execute(
+            'SELECT size, mtime FROM source WHERE pattern = ?',
+            (self.digest,)).fetchone()
+        return row is not None and tuple(row) == (info.st_size,
+                                                  info.st_mtime)
+
+    def open(self, progress=None, errors='strict'):
+        """
+        Open the index, building it if the file or the pattern changed.
+        Return whether it was built.
+
+        The progress function, if any, is called with the fraction of the
+        file parsed. A UnicodeDecodeError is raised if the file is not
+        UTF-8, unless errors is 'ignore' or 'replace'.
+        """
+        if self._conn is None:
+            self._conn = self._connect(self.index_paths())
+        if self.is_current():
+            return False
+        try:
+            self.build(progress, errors)
+        except sqlite3.OperationalError:
+            if self.index_path == ':memory:':
+                raise
+            # The index could not be written there: build it in memory
+            self.close()
+            self._conn = self._connect([':memory:'])
+            self.build(progress, errors)
+        return True
+
+    def build(self, progress=None, errors='strict'):
+        """
+        Parse the file and store its entries, in one transaction.
+        """
+        info = os.stat(self.filename)
+        groups = [name for name in self.regex.groupindex
+                  if name not in ('lat', 'lon') and not name.startswith('gz_')]
+        keys = ['gz_' + field.lower() for field in self.fields]
+        conn = self._conn
+        try:
+            conn.execute('DELETE FROM entry WHERE pattern = ?', (self.digest,))
+            conn.execute('DELETE FROM source WHERE pattern = ?',
+                         (self.digest,))
+            with open(self.filename, 'rb') as source:
+                while True:
+                    lines = source.readlines(CHUNK_SIZE)
+                    if not lines:
+                        break
+                    text = b''.join(lines).decode('utf-8', errors)
+                    rows = []
+                    for match in find_overlapping(self.regex, text):
+                        lat = match.group('lat')
+                        lon = match.group('lon')
+                        if not (lat and lon):
+                            continue
+                        key = KEY_SEPARATOR.join(
+                            normalize(match.group(name)) for name in keys)
+                        extra = None
+                        if groups:
+                            extra = json.dumps(dict(
+                                (name, match.group(name)) for name in groups))
+                        rows.append((self.digest, key, lat, lon, extra))
+                    conn.executemany('INSERT INTO entry VALUES (?, ?, ?, ?, ?)',
+                                     rows)
+                    if progress is not None and info.st_size:
+                        progress(min(1.0, source.tell() / info.st_size))
+            conn.execute('INSERT INTO source VALUES (?, ?, ?)',
+                         (self.digest, info.st_size, info.st_mtime))
+            conn.commit()
+        except:
+            conn.rollback()
+            raise
+
+    def lookup(self, values):
+        """
+        Return the entries for values of the placeholders, by placeholder.
+        A value may be a list of alternatives, as the codes of a county.
+        """
+        alternatives = []
+        for field in self.fields:
+            value = values[field]
+            if isinstance(value, str):
+                value = [value]
+            alternatives.append([normalize(item) for item in value])
+        keys = [KEY_SEPARATOR.join(key)
+                for key in itertools.product(*alternatives)]
+        results = []
+        for key in keys:
+            results.extend(self._conn.execute(
+                'SELECT rowid, lat, lon, groups FROM entry '
+                'WHERE pattern = ? AND key = ?', (self.digest, key)))
+        results.sort()
+        return [(lat, lon, json.loads(groups) if groups else {})
+                for rowid, lat, lon, groups in results]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C)2007-2009  B. Malengier
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+## python gazetteer_test.py
+
+"""
+Tests of the lat/lon file index, with patterns of PlaceCompletion.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from gazetteer import Gazetteer, INDEX_SUFFIX
+
+LAT = r'(?P<lat>[\d+-][^\t]*)\t(?P<lon>[\d+-][^\t]*)'
+# GeoNames country file: city, variants and county/city searches
+CITY = r'\tCITY\t[^\t]*\t[^\t]*\t' + LAT + r'\tP'
+VARIANTS = r'[\t,]CITY[,\t][^\t\d]*\t?' + LAT + r'\tP'
+COUNTY = CITY + r'\t[^\t]*\t[^\t]*\t[^\t]*\t[^\t]*\tCOUNTY\t'
+USA = (r'\|CITY\|Populated Place\|[^\|]*\|[^\|]*\|(?P<county>[^\|]*)'
+       r'\|[^\|]*\|[^\|]*\|[^\|]*\|(?P<lat>[\d+-][^\|]*)\|'
+       r'(?P<lon>[\d+-][^\|]*)')
+
+GEONAMES = (
+    u"1\tGent\tGent\tGand,Gante\t51.05\t3.71667\tP\tPPLA2\tBE\t\tVLG\tVOV\t\n"
+    u"2\tBrugge\tBrugge\tBruges,Brujas\t51.20892\t3.22424\tP\tPPLA2\tBE\t\tVLG\tVWV\t\n"
+    u"3\tGent\tGent\t\t50.8\t4.1\tP\tPPL\tBE\t\tVLG\tVBR\t\n"
+    u"4\tSint-Martens-Latem\tSint-Martens-Latem\t\t51.01\t3.63\tP\tPPL\tBE\t\tVLG\tVOV\t\n"
+    u"5\tLeie\tLeie\tLys\t50.9\t3.0\tH\tSTM\tBE\t\tVLG\tVOV\t\n"
+    u"6\tKöln\tKoeln\tCologne,Colonia\t50.93333\t6.95\tP\tPPLA2\tDE\t\t07\t053\t\n")
+
+class GazetteerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'BE.txt')
+        self.write(GEONAMES)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, text, filename=None):
+        with open(filename or self.filename, 'wb') as data:
+            data.write(text.encode('utf-8'))
+
+    def lookup(self, pattern, values, filename=None):
+        gazetteer = Gazetteer(filename or self.filename, pattern)
+        try:
+            gazetteer.open()
+            return [(lat, lon) for lat, lon, groups
+                    in gazetteer.lookup(values)]
+        finally:
+            gazetteer.close()
+
+    def test_city(self):
+        self.assertEqual(self.lookup(CITY, {'CITY': 'Gent'}),
+                         [('51.05', '3.71667'), ('50.8', '4.1')])
+        # Not a populated place
+        self.assertEqual(self.lookup(CITY, {'CITY': 'Leie'}), [])
+        # Variants are not searched
+        self.assertEqual(self.lookup(CITY, {'CITY': 'Bruges'}), [])
+
+    def test_normalized(self):
+        self.assertEqual(self.lookup(CITY, {'CITY': ' sint-martens-LATEM'}),
+                         [('51.01', '3.63')])
+        # Decomposed o umlaut
+        self.assertEqual(self.lookup(CITY, {'CITY': u'Ko\u0308ln'}),
+                         [('50.93333', '6.95')])
+
+    def test_variants(self):
+        for name in ('Gand', 'Gante', 'Brujas', 'Colonia'):
+            self.assertEqual(len(self.lookup(VARIANTS, {'CITY': name})), 1,
+                             name)
+
+    def test_county_codes(self):
+        self.assertEqual(self.lookup(COUNTY, {'CITY': 'Gent',
+                                              'COUNTY': ['VWV', 'VOV']}),
+                         [('51.05', '3.71667')])
+
+    def test_groups(self):
+        filename = os.path.join(self.directory, 'usa.txt')
+        self.write(u"1|Springfield|Populated Place|IL|17|Sangamon|167|"
+                   u"394801N|0893904W|39.80|-89.64|\n", filename)
+        gazetteer = Gazetteer(filename, USA)
+        gazetteer.open()
+        self.assertEqual(gazetteer.lookup({'CITY': 'Springfield'}),
+                         [('39.80', '-89.64', {'county': 'Sangamon'})])
+        gazetteer.close()
+
+    def test_index_reused(self):
+        gazetteer = Gazetteer(self.filename, CITY)
+        self.assertTrue(gazetteer.open())
+        gazetteer.close()
+        self.assertTrue(os.path.exists(self.filename + INDEX_SUFFIX))
+        gazetteer = Gazetteer(self.filename, CITY)
+        self.assertFalse(gazetteer.open())
+        gazetteer.close()
+        # Another pattern has its own entries
+        gazetteer = Gazetteer(self.filename, VARIANTS)
+        self.assertTrue(gazetteer.open())
+        gazetteer.close()
+        # A changed file is indexed again
+        self.write(GEONAMES.replace('51.05', '51.06'))
+        os.utime(self.filename, (0, 0))
+        self.assertEqual(self.lookup(CITY, {'CITY': 'Gent'}),
+                         [('51.06', '3.71667'), ('50.8', '4.1')])
+
+    def test_not_utf8(self):
+        with open(self.filename, 'ab') as data:
+            data.write(b'7\tZ\xfcrich\tZurich\t\t47.3\t8.5\tP\tPPL\n')
+        gazetteer = Gazetteer(self.filename, CITY)
+        self.assertRaises(UnicodeDecodeError, gazetteer.open)
+        self.assertTrue(gazetteer.open(errors='replace'))
+        self.assertEqual(len(gazetteer.lookup({'CITY': u'Z\ufffdrich'})), 1)
+        gazetteer.close()
+
+if __name__ == "__main__":
+    unittest.main()
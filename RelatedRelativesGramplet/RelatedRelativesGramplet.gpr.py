@@ -8,7 +8,8 @@ register(GRAMPLET,
         expand=True,
         gramplet = 'RelatedRelativesGramplet',
         gramplet_title=_("Related Relatives"),
-        version = '1.0.22',
+        version = '1.0.23',
         gramps_target_version="5.0",
+        depends_on = ["libdescendants"],
         help_url = "RelatedRelativesGramplet",
         )
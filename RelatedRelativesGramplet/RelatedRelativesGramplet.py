@@ -41,6 +41,7 @@ _ = _trans.gettext
 from gramps.gen.utils.file import media_path_full
 from gramps.gen.relationship import get_relationship_calculator
 import gramps.gen.datehandler
+from libdescendants import DescendantGraph
 
 #------------------------------------------------------------------------
 #
@@ -51,39 +52,98 @@ class RelatedRelativesGramplet(Gramplet):
     def init(self):
         self.set_text(_("No Family Tree loaded."))
 #         self.set_tooltip(_("Double-click item to see matches"))
+        # Related partners found, kept until the database changes
+        self.pairs = None
 
 #
 # Register database triggers for updates
 #
     def db_changed(self):
-        self.dbstate.db.connect('person-add', self.update)
-        self.dbstate.db.connect('person-delete', self.update)
-        self.dbstate.db.connect('family-add', self.update)
-        self.dbstate.db.connect('family-delete', self.update)
-        self.dbstate.db.connect('person-rebuild', self.update)
-        self.dbstate.db.connect('family-rebuild', self.update)
+        self.pairs = None
+        for signal in ('person-add', 'person-update', 'person-delete',
+                       'person-rebuild', 'family-add', 'family-update',
+                       'family-delete', 'family-rebuild'):
+            self.dbstate.db.connect(signal, self.invalidate)
 
+    def invalidate(self, *args):
+        self.pairs = None
+        self.update()
+
+#
+#   Find the partners descending from a same base family (a family whose
+#   parents have no parents). This is a generator, yielding every step
+#   families. The pairs found are stored in self.pairs, as
+#   (person handle, partner handle, relationships person to partner,
+#   relationships partner to person, common ancestors).
 #
-#   Function that recursively adds all descendants of a person to the
-#   person_handle_list
-#
-    def addDescendants(self, ancestorHandle):
-        # If this person is not yet in the list, add person (and its descendants
-        # to descendants list.
-        if ancestorHandle not in self.person_handle_list:
-            self.person_handle_list.append(ancestorHandle)
-#           Check if person is father or mother in a family
-            ancestor = self.dbstate.db.get_person_from_handle(ancestorHandle)
-            if ancestor:
-                for family_handle in ancestor.get_family_handle_list():
-                    if family_handle:
-                        family = self.dbstate.db.get_family_from_handle(family_handle)
-                        if family:
-#                           Add all children of the person  to the list by
-#                           recursively calling this function for each one.
-                            childlist = family.get_child_ref_list()[:]
-                            for child_ref in childlist:
-                                self.addDescendants(child_ref.ref)
+    def find_pairs(self, step=500):
+        database = self.dbstate.db
+        rel_calc = get_relationship_calculator()
+        handles = list(database.iter_person_handles())
+        index = dict((handle, number)
+                     for (number, handle) in enumerate(handles))
+        # Read the families once: the parent -> child links, the couples
+        # and the people having parents
+        edges = []
+        couples = []
+        children = set()
+        for count, family in enumerate(database.iter_families()):
+            parents = (index.get(family.get_father_handle()),
+                       index.get(family.get_mother_handle()))
+            kids = [index[child_ref.ref]
+                    for child_ref in family.get_child_ref_list()
+                    if child_ref.ref in index]
+            children.update(kids)
+            edges.extend((parent, kid) for parent in parents
+                         if parent is not None for kid in kids)
+            couples.append(parents)
+            if count % step == 0:
+                yield True
+        graph = DescendantGraph(handles, edges)
+        yield True
+
+        # Give one bit to each base family, set on its parents. The bits of
+        # the parents are then inherited by all their descendants, so that
+        # the base families a person descends from are known at once.
+        bits = [0] * len(handles)
+        base_families = set()
+        for (number, parents) in enumerate(couples):
+            parents = [parent for parent in parents if parent is not None]
+            if any(parent in children for parent in parents):
+                continue
+            bit = 1 << len(base_families)
+            base_families.add(number)
+            for parent in parents:
+                bits[parent] |= bit
+        bits = graph.inherit(bits)
+        yield True
+
+        # Two partners are related if they descend from a same base family.
+        # A and B may be partners in several families: list them once.
+        pairs = []
+        seen = set()
+        for (number, (father, mother)) in enumerate(couples):
+            if number % step == 0:
+                yield True
+            if number in base_families or father is None or mother is None:
+                continue
+            if not bits[father] & bits[mother]:
+                continue
+            key = frozenset((father, mother))
+            if key in seen:
+                continue
+            seen.add(key)
+            person = database.get_person_from_handle(handles[father])
+            partner = database.get_person_from_handle(handles[mother])
+            # Find relation between the partners by use of the relationship
+            # calculator: all relationships A to B and B to A.
+            rel_strings, common_an = \
+                rel_calc.get_all_relationships(database, person, partner)
+            rel_strings1, common_an1 = \
+                rel_calc.get_all_relationships(database, partner, person)
+            pairs.append((handles[father], handles[mother],
+                          rel_strings, rel_strings1, common_an))
+        self.pairs = pairs
 
 #
 #   Main function, called when the gramplet is opened or updated
@@ -91,165 +151,49 @@ class RelatedRelativesGramplet(Gramplet):
     def main(self):
         # Write heading text to gramplet
         self.set_text(_("Relations of related people in your database:"))
-        # Define basic variables
         database = self.dbstate.db
-        rel_calc = get_relationship_calculator()
-        family_handle_list = [] # Will keep list of families with no ancestors
+        if self.pairs is None:
+            for step in self.find_pairs():
+                yield True
+        pairs = self.pairs
 
-        # Find all base families with no ancestors in the database.
-        flist = database.iter_family_handles()
-        for familyhandle in flist:
-            family = database.get_family_from_handle(familyhandle)
-            # Check if mother of this family is child of another family
-            # If this is the case, skip this family
-            ancestorHandle = family.get_mother_handle()
-            if ancestorHandle:
-                mother = database.get_person_from_handle(ancestorHandle)
-                parent_handle_list = mother.get_parent_family_handle_list()
-                if parent_handle_list:
+        for (handle, handlepartner, rel_strings, rel_strings1,
+             common_an) in pairs:
+            if len(rel_strings) <= 1:
+                continue
+            person = database.get_person_from_handle(handle)
+            partner = database.get_person_from_handle(handlepartner)
+            if not person or not partner:
+                continue
+            # Output names of both partners as links
+            p1name = name_displayer.display(person)
+            self.append_text("\n\n")
+            self.link(p1name, 'Person', handle)
+            p2name = name_displayer.display(partner)
+            self.append_text(" " + _("and") + " ")
+            self.link(p2name, 'Person', handlepartner)
+            self.append_text(" " + _("are partners and") + ":")
+            # Omit the first relationship from list
+            for x in range(1, len(rel_strings)):
+                self.append_text("\n%s" % rel_strings[x])
+                try:
+                    self.append_text(" & %s" % rel_strings1[x])
+                except:
                     continue
-            # Check if father of this family is child of another family
-            # If this is the case, skip this family
-            ancestorHandle = family.get_father_handle()
-            if ancestorHandle:
-                father = database.get_person_from_handle(ancestorHandle)
-                parent_handle_list = father.get_parent_family_handle_list()
-                if parent_handle_list:
-                  continue
-            # Members of this family have no ancestors. Add family to base
-            # family handle list
-            family_handle_list.append(familyhandle)
+                # Print list of common ancestors for the found relation.
+                # Remove duplicate ancestors
+                anc_list = list(set(common_an[x]))
+                for anc in anc_list:
+                    ancestor = database.get_person_from_handle(anc)
+                    if ancestor:
+                        # Print ancestor as link
+                        pname = name_displayer.display(ancestor)
+                        self.append_text("\n\t" + _("Common ancestor") + " ")
+                        self.link(pname, 'Person', anc)
             yield True
-
-        # The base family handle list now contains all families that have
-        # no ancestors. Now iterate through found families. For each family
-        # first find all descendants and then check if one person in this
-        # family tree is partner of another person in the same tree.
-        #
-        # Related relatives may be found more than once from different base
-        # families. Therefore we hold a list of all found pairs to avoid
-        # listing them more than once
-        pair_p1_list = [] # List of all 1st related partners for all families
-        pair_p2_list = [] # List of all 2nd related partners for all families
-        for familyhandle in family_handle_list:
-            # Build list of all related persons (descendants) of this family.
-            self.person_handle_list = []
-            family = database.get_family_from_handle(familyhandle)
-            # Add all descendants of the father to person list of this family
-            father_handle = family.get_father_handle()
-            if father_handle:
-                father = database.get_person_from_handle(father_handle)
-                # Add all descendants of the father
-                self.addDescendants(father_handle)
-            mother_handle = family.get_mother_handle()
-            # Add all descendants of the mother to person list of this family
-            if mother_handle:
-                mother = database.get_person_from_handle(mother_handle)
-                # Add all descendants of the mother
-                self.addDescendants(mother_handle)
-
-            # The person list of all descendants for this family is complete.
-            # Now check for every person in the list if it has a partner that
-            # is also in this list
-            for checkHandle in self.person_handle_list:
-                person = database.get_person_from_handle(checkHandle)
-                if person:
-                    pfamily_handle_list = person.get_family_handle_list()
-                    if pfamily_handle_list:
-                        for family_handle in pfamily_handle_list:
-                            # Skip the family if it is listed in the base
-                            # families list (which should be quite short).
-                            if family_handle in family_handle_list:
-                                continue
-
-                            # If current person is father or mother in a family
-                            # find the handle of the partner
-                            family = database.get_family_from_handle(family_handle)
-                            father_handle = family.get_father_handle()
-                            mother_handle = family.get_mother_handle()
-                            if checkHandle == father_handle:
-                                handlepartner = mother_handle
-                            else:
-                                handlepartner = father_handle
-
-                            # If the partner is in our list of persons of this
-                            # family tree, both are related.
-                            if handlepartner in self.person_handle_list:
-                                newEntry = True;
-                                # Check if this pair is already in the lists of
-                                # related partners. A and B will also appear as
-                                # B and A. So we have to cross check
-                                for ii in range(len(pair_p1_list)):
-                                    if checkHandle == pair_p1_list[ii]:
-                                        if  handlepartner == pair_p2_list[ii]:
-                                            newEntry = False
-                                    if checkHandle == pair_p2_list[ii]:
-                                        if handlepartner == pair_p1_list[ii]:
-                                            newEntry = False
-
-                                # If this pair is not yet listed, add them to
-                                # the list and show their relationship in the
-                                # gramplet window.
-                                if newEntry:
-                                    # Add pair to list of found related relatives
-                                    pair_p1_list.append(checkHandle)
-                                    pair_p2_list.append(handlepartner)
-                                    partner = self.dbstate.db. \
-                                        get_person_from_handle(handlepartner)
-                                    # Find relation between the partners by use
-                                    # of the relationship calculator. Print all
-                                    # relationships A to B and B to A.
-                                    rel_strings, common_an = \
-                                        rel_calc.get_all_relationships(database,
-                                                                       person,
-                                                                       partner)
-                                    rel_strings1, common_an1 = \
-                                        rel_calc.get_all_relationships(database,
-                                                                       partner,
-                                                                       person)
-                                    if len(rel_strings) > 1:
-                                        # Output names of both partners as links
-                                        p1name = name_displayer.display(person)
-                                        self.append_text("\n\n")
-                                        self.link(p1name, 'Person', checkHandle)
-                                        p2name = name_displayer.display(partner)
-                                        self.append_text(" " + _("and") + " ")
-                                        self.link(p2name, 'Person', handlepartner)
-                                        self.append_text(" " + \
-                                                         _("are partners and") + \
-                                                         ":")
-                                        # Omit the first relationship from list
-                                        for x in range(1, len(rel_strings)):
-                                            self.append_text("\n%s" %
-                                                             rel_strings[x])
-                                            try:
-                                                self.append_text(" & %s" %
-                                                                 rel_strings1[x])
-                                            except:
-                                                continue
-                                            # Print list of common ancestors for
-                                            # the found relation.
-                                            # Remove duplicate ancestors
-                                            anc_list = list(set(common_an[x]))
-                                            for anc in anc_list:
-                                                person = database. \
-                                                    get_person_from_handle(anc)
-                                                if person:
-                                                    # Print ancestor as link
-                                                    pname = name_displayer. \
-                                                        display(person)
-                                                    self.append_text("\n\t" \
-                                                        + _("Common ancestor") \
-                                                        + " ")
-                                                    self.link(pname, 'Person',
-                                                              anc)
-
-                        # After the check for each persons family allow other
-                        # threads to do some work.
-                        yield True
         # If the list of related pairs is empty we did not find any related
         # relatives in the database.
-        if len(pair_p1_list) == 0:
+        if len(pairs) == 0:
             self.append_text("\n" + _("No relatives in a relation found") + ".\n")
         self.append_text("\n\n" + _("END") + "\n")
         return
@@ -21,6 +21,14 @@
 
 """Tools/Utilities/Thumbnail Generator"""
 
+#-------------------------------------------------------------------------
+#
+# Python modules
+#
+#-------------------------------------------------------------------------
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 #-------------------------------------------------------------------------
 #
 # Gramps modules
@@ -28,7 +36,7 @@
 #-------------------------------------------------------------------------
 from gramps.gui.plug import tool
 from gramps.gui.utils import ProgressMeter
-from gramps.gui.thumbnails import get_thumbnail_image, SIZE_NORMAL, SIZE_LARGE
+from gramps.gui.thumbnails import get_thumbnail_path, SIZE_NORMAL, SIZE_LARGE
 from gramps.gen.utils.file import media_path_full
 
 from gramps.gen.const import GRAMPS_LOCALE as glocale
@@ -44,90 +52,106 @@ _ = _trans.gettext
 #
 #-------------------------------------------------------------------------
 class ThumbnailGenerator(tool.Tool):
+    """
+    Generate the thumbnails of all the media files and media references.
+
+    The distinct thumbnails (path, mime type, rectangle, size) are
+    collected first, so that a file referenced many times is only done
+    once. A pool of threads, one per core, then calls get_thumbnail_path
+    for each of them: it only generates the thumbnails missing or older
+    than their file, so that a cancelled run resumes where it stopped.
+    """
     def __init__(self, dbstate, user, options_class, name, callback=None):
         uistate = user.uistate
 
         tool.Tool.__init__(self, dbstate, options_class, name)
 
         self.db = dbstate.db
+        self.media = {}
         progress = ProgressMeter(_('Thumbnail Generator'), can_cancel=True)
-            
-        length = self.db.get_number_of_media_objects()
-        progress.set_pass(_('Generating media thumbnails'),
-                               length)
-        for media in dbstate.db.iter_media_objects():
-            full_path = media_path_full(dbstate.db, media.get_path())
-            mime_type = media.get_mime_type()
-            generate_thumbnail(full_path, mime_type)
-            progress.step()
-            if progress.get_cancelled():
-                break
-            
-        length = self.db.get_number_of_people()
-        progress.set_pass(_('Generating thumbnails for person references'),
-                               length)
-        for person in dbstate.db.iter_people():
-            self.generate_thumbnails(person)
-            progress.step()
-            if progress.get_cancelled():
-                break
-
-        length = self.db.get_number_of_families()
-        progress.set_pass(_('Generating thumbnails for family references'),
-                               length)
-        for family in dbstate.db.iter_families():
-            self.generate_thumbnails(family)
-            progress.step()
-            if progress.get_cancelled():
-                break
-
-        length = self.db.get_number_of_events()
-        progress.set_pass(_('Generating thumbnails for event references'),
-                               length)
-        for event in dbstate.db.iter_events():
-            self.generate_thumbnails(event)
-            progress.step()
-            if progress.get_cancelled():
-                break
+        jobs = self.collect_jobs(progress)
+        if jobs is not None:
+            self.generate_jobs(jobs, progress)
+        progress.close()
 
-        length = self.db.get_number_of_places()
-        progress.set_pass(_('Generating thumbnails for place references'),
-                               length)
-        for place in dbstate.db.iter_places():
-            self.generate_thumbnails(place)
+    def collect_jobs(self, progress):
+        """
+        Return the list of the thumbnails to generate, or None if
+        cancelled.
+        """
+        jobs = {}
+        length = self.db.get_number_of_media_objects()
+        progress.set_pass(_('Collecting media thumbnails'), length)
+        for media in self.db.iter_media_objects():
+            full_path = media_path_full(self.db, media.get_path())
+            self.media[media.get_handle()] = (full_path, media.get_mime_type())
+            add_jobs(jobs, full_path, media.get_mime_type())
             progress.step()
             if progress.get_cancelled():
-                break
+                return None
 
-        length = self.db.get_number_of_sources()
-        progress.set_pass(_('Generating thumbnails for source references'),
-                               length)
-        for source in dbstate.db.iter_sources():
-            self.generate_thumbnails(source)
-            progress.step()
-            if progress.get_cancelled():
-                break
+        for (title, length, objects) in (
+                (_('Collecting thumbnails for person references'),
+                 self.db.get_number_of_people(), self.db.iter_people()),
+                (_('Collecting thumbnails for family references'),
+                 self.db.get_number_of_families(), self.db.iter_families()),
+                (_('Collecting thumbnails for event references'),
+                 self.db.get_number_of_events(), self.db.iter_events()),
+                (_('Collecting thumbnails for place references'),
+                 self.db.get_number_of_places(), self.db.iter_places()),
+                (_('Collecting thumbnails for source references'),
+                 self.db.get_number_of_sources(), self.db.iter_sources())):
+            progress.set_pass(title, length)
+            for obj in objects:
+                self.collect_references(jobs, obj)
+                progress.step()
+                if progress.get_cancelled():
+                    return None
+        return list(jobs.values())
 
-        progress.close()
-
-    def generate_thumbnails(self, obj):
+    def collect_references(self, jobs, obj):
         """
-        Generate thumbnails for media references of a given object. 
+        Add the thumbnails of the media references of a given object.
         """
         for media_ref in obj.get_media_list():
-            handle = media_ref.get_reference_handle()
-            media = self.db.get_object_from_handle(handle)
-            full_path = media_path_full(self.db, media.get_path())
-            mime_type = media.get_mime_type()
-            rectangle = media_ref.get_rectangle()
-            generate_thumbnail(full_path, mime_type, rectangle)
+            media = self.media.get(media_ref.get_reference_handle())
+            if media:
+                add_jobs(jobs, media[0], media[1], media_ref.get_rectangle())
+
+    def generate_jobs(self, jobs, progress):
+        """
+        Generate the thumbnails that are not up to date, in a thread pool:
+        GdkPixbuf releases the GIL while it loads and scales the images.
+        """
+        progress.set_pass(_('Generating thumbnails'), len(jobs))
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            futures = [pool.submit(render_thumbnail, job) for job in jobs]
+            for future in as_completed(futures):
+                future.result()
+                progress.step()
+                if progress.get_cancelled():
+                    for future in futures:
+                        future.cancel()
+                    return
+
+def add_jobs(jobs, full_path, mime_type, rectangle=None):
+    """
+    Add the thumbnails of an image rectangle. The rectangle is kept as
+    given, since Gramps names a thumbnail after its text; the thumbnails
+    are told apart by this text.
+    """
+    for size in (SIZE_NORMAL, SIZE_LARGE):
+        key = (full_path, mime_type, str(rectangle), size)
+        if key not in jobs:
+            jobs[key] = (full_path, mime_type, rectangle, size)
 
-def generate_thumbnail(full_path, mime_type, rectangle=None):
+def render_thumbnail(job):
     """
-    Generate thumbnails for an image rectangle.
+    Generate a thumbnail if it is missing or older than its file, in a
+    worker thread.
     """
-    get_thumbnail_image(full_path, mime_type, rectangle, SIZE_NORMAL)
-    get_thumbnail_image(full_path, mime_type, rectangle, SIZE_LARGE)
+    full_path, mime_type, rectangle, size = job
+    get_thumbnail_path(full_path, mime_type, rectangle, size)
 
 #------------------------------------------------------------------------
 #
@@ -33,8 +33,9 @@ id    = 'TimelinePedigreeView',
 name  = _("Timeline Pedigree"),
 category = ("Ancestry", _("Ancestry")),
 description =  _("The view shows a timeline pedigree with ancestors and descendants of the selected person"),
-version = '0.1.36',
+version = '0.1.39',
 gramps_target_version = "5.0",
+depends_on = ["libthumbnails"],
 status = STABLE,
 fname = 'TimelinePedigreeView.py',
 authors = ["Felix Heß"],
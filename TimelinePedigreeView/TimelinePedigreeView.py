@@ -29,6 +29,7 @@
 #
 #-------------------------------------------------------------------------
 from cgi import escape
+from collections import defaultdict
 import pickle
 
 #-------------------------------------------------------------------------
@@ -36,9 +37,8 @@ import pickle
 # GTK/GI modules
 #
 #-------------------------------------------------------------------------
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk, Gdk, GLib
 from gi.repository import PangoCairo
-import cairo
 
 #-------------------------------------------------------------------------
 #
@@ -49,11 +49,9 @@ import gramps.gen.lib
 from gramps.gui.views.navigationview import NavigationView
 from gramps.gen.display.name import displayer as name_displayer
 from gramps.gen.utils.alive import probably_alive
-from gramps.gen.utils.file import media_path_full
 from gramps.gen.utils.db import (get_birth_or_fallback, get_death_or_fallback, 
                           find_children, find_parents, find_witnessed_people)
 from gramps.gen.utils.libformatting import FormattingHelper
-from gramps.gui.thumbnails import get_thumbnail_path
 from gramps.gen.errors import WindowActiveError
 from gramps.gui.editors import EditPerson, EditFamily
 from gramps.gui.ddtargets import DdTargets
@@ -68,6 +66,7 @@ except ValueError:
     trans = glocale.translation
 _ = trans.gettext
 ngettext = trans.ngettext
+from libthumbnails import get_thumbnail_service
 
 #-------------------------------------------------------------------------
 #
@@ -81,6 +80,42 @@ _BAPT = _('short for baptized|bap.')
 _CHRI = _('short for chistianized|chr.')
 _BURI = _('short for buried|bur.')
 _CREM = _('short for cremated|crem.')
+# Size of the placeholder shown while an image is loaded
+_IMAGE_PLACEHOLDER = 32
+# Size of the cells of the grid used to find the boxes in the viewport
+_GRID_CELL = 256
+# Margin around the viewport in which the widgets of the boxes are created
+_VIEWPORT_MARGIN = 200
+
+
+def _person_colors(person, alive):
+    """Background and border colors of the box of a person."""
+    if person:
+        if alive and person.get_gender() == gramps.gen.lib.Person.MALE:
+            return ((185/256.0, 207/256.0, 231/256.0), (32/256.0, 74/256.0, 135/256.0))
+        elif alive and person.get_gender() == gramps.gen.lib.Person.FEMALE:
+            return ((255/256.0, 205/256.0, 241/256.0), (135/256.0, 32/256.0, 106/256.0))
+        elif alive:
+            return ((244/256.0, 220/256.0, 183/256.0), (143/256.0, 89/256.0, 2/256.0))
+        elif person.get_gender() == gramps.gen.lib.Person.MALE:
+            return ((185/256.0, 207/256.0, 231/256.0), (0, 0, 0))
+        elif person.get_gender() == gramps.gen.lib.Person.FEMALE:
+            return ((255/256.0, 205/256.0, 241/256.0), (0, 0, 0))
+        else:
+            return ((244/256.0, 220/256.0, 183/256.0), (0, 0, 0))
+    return ((211/256.0, 215/256.0, 207/256.0), (0, 0, 0))
+
+def _person_box_size(text_size, image_size=None):
+    """
+    Size of a person box showing a text of text_size (width, height) and
+    an image of image_size.
+    """
+    xmin = text_size[0] + 12
+    ymin = text_size[1] + 11
+    if image_size:
+        xmin += image_size[0]
+        ymin = max(ymin, image_size[1]+4)
+    return (max(xmin, 120), max(ymin, 25))
 
 
 class _PersonWidgetBase(object):
@@ -152,38 +187,40 @@ class PersonBoxWidgetCairo(Gtk.DrawingArea, _PersonWidgetBase):
         self.text = ""
         if self.person:
             self.text = self.format_helper.format_person(self.person, self.maxlines, True)
-            if alive and self.person.get_gender() == gramps.gen.lib.Person.MALE:
-                self.bgcolor = (185/256.0, 207/256.0, 231/256.0)
-                self.bordercolor = (32/256.0, 74/256.0, 135/256.0)
-            elif alive and self.person.get_gender() == gramps.gen.lib.Person.FEMALE:
-                self.bgcolor = (255/256.0, 205/256.0, 241/256.0)
-                self.bordercolor = (135/256.0, 32/256.0, 106/256.0)
-            elif alive:
-                self.bgcolor = (244/256.0, 220/256.0, 183/256.0)
-                self.bordercolor = (143/256.0, 89/256.0, 2/256.0)
-            elif self.person.get_gender() == gramps.gen.lib.Person.MALE:
-                self.bgcolor = (185/256.0, 207/256.0, 231/256.0)
-                self.bordercolor = (0, 0, 0)
-            elif self.person.get_gender() == gramps.gen.lib.Person.FEMALE:
-                self.bgcolor = (255/256.0, 205/256.0, 241/256.0)
-                self.bordercolor = (0, 0, 0)
-            else:
-                self.bgcolor = (244/256.0, 220/256.0, 183/256.0)
-                self.bordercolor = (0, 0, 0)
-        else:
-            self.bgcolor = (211/256.0, 215/256.0, 207/256.0)
-            self.bordercolor = (0, 0, 0)
-        self.image = image
-        try:
-            with open(image, 'rb') as fh: # this is to avoid bug with cairo 1.8.8
-                self.img_surf = cairo.ImageSurface.create_from_png(fh)
-        except:
-            self.image = False
+        self.bgcolor, self.bordercolor = _person_colors(self.person, alive)
+        # The image is loaded in the background: a placeholder is shown
+        # until it is loaded
+        self.image = False
+        self.img_surf = None
+        self.img_pending = False
+        # The view destroys the widgets scrolled out of the viewport, maybe
+        # before their image is loaded
+        self.destroyed = False
+        self.connect("destroy", self.on_destroy_cb)
+        if image and self.person:
+            known, self.img_surf = view.thumbnails.load(view.dbstate.db,
+                                                        self.person,
+                                                        self.image_loaded_cb)
+            self.image = self.img_surf is not None
+            self.img_pending = not known
         # enable mouse-over
         self.connect("enter-notify-event", self.on_enter_cb)
         # enable mouse-out
         self.connect("leave-notify-event", self.on_leave_cb)
 
+    def on_destroy_cb(self, widget):
+        self.destroyed = True
+
+    def image_loaded_cb(self, pixbuf):
+        """Show the image loaded in the background"""
+        if self.destroyed:
+            return
+        self.img_surf = pixbuf
+        self.image = pixbuf is not None
+        self.img_pending = False
+        self.queue_resize()
+        self.queue_draw()
+
     def on_enter_cb(self, widget, event):
         """On mouse-over highlight border"""
         if self.person or self.force_mouse_over:
@@ -202,15 +239,13 @@ class PersonBoxWidgetCairo(Gtk.DrawingArea, _PersonWidgetBase):
         textlayout = self.create_pango_layout(self.text)
         textlayout.set_font_description(self.get_style().font_desc)
         textlayout.set_markup(self.text)
-        size = textlayout.get_pixel_size()
-        xmin = size[0] + 12
-        ymin = size[1] + 11
+        image_size = None
         if self.image:
-            xmin += self.img_surf.get_width()
-            ymin = max(ymin, self.img_surf.get_height()+4)
-
-        requisition.width = max(xmin, 120)
-        requisition.height =  max(ymin, 25)
+            image_size = (self.img_surf.get_width(), self.img_surf.get_height())
+        elif self.img_pending:
+            image_size = (_IMAGE_PLACEHOLDER, _IMAGE_PLACEHOLDER)
+        requisition.width, requisition.height = _person_box_size(
+            textlayout.get_pixel_size(), image_size)
 
     def do_get_preferred_width(self):
         """ GTK3 uses width for height sizing model. This method will 
@@ -283,9 +318,14 @@ class PersonBoxWidgetCairo(Gtk.DrawingArea, _PersonWidgetBase):
 
         # image
         if self.image:
-            context.set_source_surface(self.img_surf,
+            Gdk.cairo_set_source_pixbuf(context, self.img_surf,
                 alloc.width-4-self.img_surf.get_width(), 1)
             context.paint()
+        elif self.img_pending:
+            context.rectangle(alloc.width-4-_IMAGE_PLACEHOLDER, 1,
+                              _IMAGE_PLACEHOLDER, _IMAGE_PLACEHOLDER)
+            context.set_source_rgba(*(self.bordercolor[:3] + (0.2,)))
+            context.fill()
 
         # text
         context.move_to(5, 4)
@@ -318,6 +358,409 @@ class PersonBoxWidgetCairo(Gtk.DrawingArea, _PersonWidgetBase):
         context.set_source_rgb(*self.bordercolor[:3])
         context.stroke()
 
+#-------------------------------------------------------------------------
+#
+# TimelineLayout
+#
+#-------------------------------------------------------------------------
+class _TreeItem(object):
+    """
+    Geometry of a widget of the tree: a person box, or the marriage label
+    of a family when text is set. The widget of the item only exists while
+    the item is in the viewport.
+    """
+    __slots__ = ('x', 'y', 'width', 'height', 'person', 'relative',
+                 'maxlines', 'alive', 'image', 'text', 'family_handle',
+                 'widget')
+
+    def __init__(self, width, height, person=None, relative=None, maxlines=0,
+                 alive=True, image=False, text=None, family_handle=None):
+        self.x = 0
+        self.y = 0
+        self.width = width
+        self.height = height
+        self.person = person
+        self.relative = relative
+        self.maxlines = maxlines
+        self.alive = alive
+        self.image = image
+        self.text = text
+        self.family_handle = family_handle
+        self.widget = None
+
+
+class _TreeIndex(object):
+    """
+    Grid of the items of the tree, to find the items in a rectangle
+    without looking at all of them.
+    """
+    def __init__(self, items, cell=_GRID_CELL):
+        self.cell = cell
+        self.grid = defaultdict(list)
+        for item in items:
+            for key in self._cells(item.x, item.y, item.x + item.width,
+                                   item.y + item.height):
+                self.grid[key].append(item)
+
+    def _cells(self, x0, y0, x1, y1):
+        return [(column, row)
+                for column in range(int(x0) // self.cell, int(x1) // self.cell + 1)
+                for row in range(int(y0) // self.cell, int(y1) // self.cell + 1)]
+
+    def find(self, x0, y0, x1, y1):
+        """Set of the items intersecting a rectangle."""
+        found = set()
+        for key in self._cells(x0, y0, x1, y1):
+            for item in self.grid.get(key, ()):
+                if (item.x < x1 and item.x + item.width > x0 and
+                        item.y < y1 and item.y + item.height > y0):
+                    found.add(item)
+        return found
+
+
+class TimelineLayout(object):
+    """
+    Geometry of the timeline pedigree of a person, computed as data: the
+    person boxes and marriage labels (items), the connection lines and
+    the lifespan boxes. No widget is created here, so that the view only
+    creates the widgets of the items in its viewport.
+
+    text_size(text, markup) gives the (width, height) of a text in pixels,
+    estimate_birth(person) the (estimated) birth date of a person.
+    image_size(person) gives the (width, height) of the image of a person,
+    None if there is none, or the size of the placeholder while the image
+    is loaded.
+    """
+    def __init__(self, db, format_helper, text_size, estimate_birth,
+                 use_timeline=True, show_lifespan=True,
+                 show_marriage_data=False, show_images=False,
+                 image_size=None):
+        self.db = db
+        self.format_helper = format_helper
+        self.text_size = text_size
+        self.estimate_birth = estimate_birth
+        self.use_timeline = use_timeline
+        self.show_lifespan = show_lifespan
+        self.show_marriage_data = show_marriage_data
+        self.show_images = show_images
+        self.image_size = image_size
+        self.items = []
+        self.lines = []
+        self.boxes = []
+        # Labels of the time line, as [year, x]
+        self.ticks = []
+        self.timeline_height = 0
+        self.width = 0
+        self.height = 0
+        # A person was found to be his own ancestor
+        self.loop_found = False
+
+    def build(self, person, generations):
+        """
+        Compute the tree of a person, with generations[0] descendant and
+        generations[1] ancestor generations.
+        """
+        LstDescendants = self.find_relatives(person, 0, generations[0], 1)
+        LstAncestors   = self.find_relatives(person, 0, generations[1], -1, LstDescendants[1])
+
+        TimeLineHeight = 0
+        if self.use_timeline:
+            TimeLineHeight = 40
+        self.timeline_height = TimeLineHeight
+
+        ActivePersonX = 10 + max(LstAncestors[2][2], LstDescendants[2][0]) + 10
+        ActivePersonY = TimeLineHeight + max( LstAncestors[2][4], LstDescendants[2][4])
+        A_Top = ActivePersonY - LstAncestors[2][4]
+        D_Top = ActivePersonY - LstDescendants[2][4]
+
+        RequiredHeight = max(A_Top+LstAncestors[2][1], D_Top+LstDescendants[2][1])
+        RequiredWidth  = 10 + LstAncestors[2][0] + ActivePersonX
+        self.width = int(RequiredWidth)
+        self.height = int(RequiredHeight)
+
+        if True:    # Draw Border of the layout for debugging
+            self.lines.append([1,1,1, RequiredHeight-1])
+            self.lines.append([1,1, RequiredWidth-1, 1])
+            self.lines.append([RequiredWidth-1,RequiredHeight-1, RequiredWidth-1, 1])
+            self.lines.append([RequiredWidth-1,RequiredHeight-1, 1, RequiredHeight-1])
+
+        # Move boxes to their desired position, draw connection lines, etc.
+        self.move_branch(LstAncestors,   ActivePersonX, A_Top, -1, 0)
+        self.move_branch(LstDescendants, ActivePersonX, D_Top, 1, 0)
+
+        # Draw time line at top
+        # FIXME see bug #5148
+        # hardcoded gregorian calendar
+        # cal = config.get('preferences.calendar-format-report')
+        birthdate = self.estimate_birth(LstDescendants[0])
+        if self.use_timeline and birthdate:
+            self.lines.append([10, 3*TimeLineHeight/4, RequiredWidth-10, 3*TimeLineHeight/4, 1])
+            Pos50 = ActivePersonX + ( birthdate.to_calendar("gregorian").get_year() - 1950 ) * 11
+            Ticks = [ [1950, Pos50] ]
+            for k in range(1,10):
+                Ticks.append( [1950 + k*50, Pos50 - k * 11 * 50] )          # 50 year - tick
+                Ticks.append( [1950 - k*50, Pos50 + k * 11 * 50] )
+                for i in range(1,9):
+                    Ticks.append( [None, Pos50 - ((k-1)*50 + i*10) * 11 ] )      # 10 year - tick
+                    Ticks.append( [None, Pos50 + ((k-1)*50 + i*10) * 11 ] )
+
+            for Tick in Ticks:
+                if Tick[1] > 0 and Tick[1] < RequiredWidth:
+                    self.lines.append([Tick[1], int(5*TimeLineHeight/8), Tick[1], int(7*TimeLineHeight/8), 1])
+                    if Tick[0]:
+                        self.ticks.append(Tick)
+        return self
+
+    def move_branch(self, BranchData, BoxRight, BranchTop, Direction, genDepth):
+        """
+            Recursively move all person boxes in a branch to its destination
+        """
+        BoxSizes = self.box_sizes(genDepth)
+        DistX = BoxSizes[2]
+
+        if False:        # draw Branch-Border for debugging
+            self.lines.append([BoxRight, BranchTop+1, BoxRight-Direction*BranchData[2][0], BranchTop+1])
+            self.lines.append([BoxRight, BranchTop+BranchData[2][1]-1, BoxRight-Direction*BranchData[2][0], BranchTop+BranchData[2][1]-1])
+
+        # Move personbox to its required position
+        item = BranchData[1]
+
+        xBox = BoxRight - item.width
+        yBox = BranchTop + BranchData[2][4]
+        item.x = int(xBox)
+        item.y = int(yBox)
+
+        # Add livespan to personbox
+        if self.use_timeline and self.show_lifespan and BranchData[0] and not (Direction < 0 and genDepth == 0):
+            lifespan = BranchData[5]
+            color = _person_colors(BranchData[0], item.alive)[0][:3] + (0.7,)
+            self.boxes.append([xBox - lifespan * 11 + item.width, yBox, xBox + 5, yBox+item.height, color])   # +5 for overlapping with the box
+
+        # Calculate position of connection point of this box
+        yBoxConnection = yBox + item.height/2
+        xBoxConnection = BoxRight
+        if Direction > 0:
+            xBoxConnection -= item.width
+
+        # calculate x-position of vertical line
+        xvline = xBoxConnection - Direction * DistX/2           # default for descendants and if date of marriage not known
+        if self.use_timeline and Direction<0 and BranchData[0]:
+            family_handle = BranchData[0].get_main_parents_family_handle()
+            family = self.db.get_family_from_handle(family_handle)
+            if family:
+                marriagedate = self.get_date_marriage(family)
+                if marriagedate:
+                    mDate = marriagedate.get_date_object()
+                    bDate = self.estimate_birth(BranchData[0])
+                    if bDate is not None and mDate is not None:
+                        timespan = bDate.to_calendar("gregorian").get_year() - mDate.to_calendar("gregorian").get_year()
+                        xvline = xBoxConnection - Direction * 11 * timespan
+
+        # Move all relatives in this branch
+        ChildBranchTop = BranchTop + BranchData[2][5]
+        yChildBoxConnection = [ yBoxConnection ]
+        for branch in BranchData[3]:
+            ChildBoxRight      = BoxRight - Direction * branch[4]
+            ChildBoxConnection = self.move_branch(branch, ChildBoxRight, ChildBranchTop, Direction, genDepth+1)
+            ChildBranchTop    += branch[2][1]
+            yChildBoxConnection.append( ChildBoxConnection[1] )
+        # Draw connection lines
+            self.lines.append([ xvline, ChildBoxConnection[1], ChildBoxConnection[0],ChildBoxConnection[1] ])
+
+        if len(BranchData[3])>0:    # There are relatives, so Connection lines must be drawn
+            self.lines.append([ xvline, min(yChildBoxConnection), xvline, max(yChildBoxConnection) ])
+            self.lines.append([ xBoxConnection, yBoxConnection, xvline, yBoxConnection ])
+
+        # Direction<0 -> Drawing ancestors: Show Marriage Info
+        if Direction<0 and len(BranchData[3])>0 and self.show_marriage_data and BoxSizes[4] > 0:
+            text = " "
+            family_handle = None
+            if BranchData[0]:
+                family_handle = BranchData[0].get_main_parents_family_handle()
+                family = self.db.get_family_from_handle(family_handle)
+                if family:
+                    text = self.format_helper.format_relation( family, BoxSizes[4])
+            width, height = self.text_size(text, False)
+            label = _TreeItem(width, height, text=text, family_handle=family_handle)
+            label.x = int(xvline + 5)
+            label.y = int(yBoxConnection - height/2)
+            self.items.append(label)
+
+        return [xBoxConnection, yBoxConnection]
+
+    def get_date_marriage(self, family):
+        for event_ref in family.get_event_ref_list():
+            event = self.db.get_event_from_handle(event_ref.ref)
+            if event and event.get_type() == gramps.gen.lib.EventType.MARRIAGE and \
+            (event_ref.get_role() == gramps.gen.lib.EventRoleType.FAMILY or
+            event_ref.get_role() == gramps.gen.lib.EventRoleType.PRIMARY ):
+                return event
+        return None
+
+    def box_sizes(self, genDepth):
+        BoxHeight = 50
+        BoxWidth = 120
+        DistX = 50
+        DistY = 14
+        MarriageLines = 3
+        BoxMaxLines = 5
+
+        if genDepth > 1:
+            MarriageLines = 1
+
+        if genDepth > 2:
+            BoxMaxLines = 3
+
+        if genDepth > 3:
+            BoxHeight = 10
+            BoxMaxLines = 1
+
+        return [BoxHeight, BoxWidth, DistX, DistY, MarriageLines, BoxMaxLines]
+
+    def person_item(self, person, maxlines, Relative):
+        """
+            Create the item of a person box, with the size of the box
+        """
+        image = False
+        alive = True
+        text = ""
+        if person:
+            if maxlines>3 and self.show_images:
+                image = True
+            try:
+                alive = probably_alive(person, self.db)
+            except RuntimeError:
+                self.loop_found = True
+                alive = False
+            text = self.format_helper.format_person(person, maxlines, True)
+        image_size = None
+        if image and self.image_size:
+            image_size = self.image_size(person)
+        width, height = _person_box_size(self.text_size(text, True), image_size)
+        item = _TreeItem(width, height, person, Relative, maxlines, alive, image)
+        self.items.append(item)
+        return item
+
+    def find_relatives(self, person, genDepth, genMax, Direction, item = None, CalledFromPerson = None):
+        """
+            Recursively find descendants or ancestors
+            Create the item of the PersonBox
+            Calculate height of each tree branch
+            Calculate width of each tree branch
+        """
+        RelPersons = []                                 # depending on Direction find descendants / ancestors
+        if genMax-genDepth > 0 and Direction > 0:       # find descendants
+            if person:
+                family_handles = person.get_family_handle_list()
+                for family_handle in family_handles:
+                    family = self.db.get_family_from_handle(family_handle)
+                    if family is not None:
+                        for child_ref in family.get_child_ref_list():
+                            child = self.db.get_person_from_handle(child_ref.ref)
+                            if child is not None:
+                                RelPersons.append(child)
+
+        elif genMax-genDepth > 0 and Direction < 0:     # find ancestors
+            if person:
+                family_handle = person.get_main_parents_family_handle()
+                family = self.db.get_family_from_handle(family_handle)
+                if family is not None:
+                    father_handle = family.get_father_handle()
+                    if father_handle is not None:
+                        RelPersons.append(self.db.get_person_from_handle(father_handle))
+                    else:
+                        RelPersons.append(None)
+                    mother_handle = family.get_mother_handle()
+                    if mother_handle is not None:
+                        RelPersons.append(self.db.get_person_from_handle(mother_handle))
+                    else:
+                        RelPersons.append(None)
+                else:
+                    RelPersons.append(None)
+                    RelPersons.append(None)
+
+        BoxSizes = self.box_sizes(genDepth)
+        DistX = BoxSizes[2]
+        DistY = BoxSizes[3]
+        BoxMaxLines = BoxSizes[5]
+
+        if item is None:
+            item = self.person_item(person, BoxMaxLines, CalledFromPerson)
+
+        birthyear = None
+        birthdate = self.estimate_birth(person)
+        if birthdate:
+            birthyear = birthdate.to_calendar("gregorian").get_year()
+
+        # Calculate lifespan
+        lifespan = 0
+        if self.show_lifespan and person:
+            death = get_death_or_fallback(self.db, person)
+            if death and birthdate:
+                deathdate = death.get_date_object()
+                lifespan = deathdate.to_calendar("gregorian").get_year() - birthdate.to_calendar("gregorian").get_year()
+
+        negWidth = 11 * lifespan
+
+        Branch_Width = 0
+        if Direction > 0:
+            Branch_Width = item.width
+
+        Child_Branch_Height = 0
+        RelLst = []
+        MaxRelWidth = 0
+        yRelBranchTop = 0
+        yRelConnect = []
+        for Relative in RelPersons:
+            Ret = self.find_relatives(Relative, genDepth+1, genMax, Direction, None, person)
+            if Ret[4] and birthyear:
+                DeltaX =  int(11 * abs( Ret[4]-birthyear ))
+            else:
+                DeltaX = 220
+            Child_Branch_Height += Ret[2][1]
+            Branch_Width  = max(Branch_Width, Ret[2][0] + DeltaX )
+            negWidth = max(negWidth, Ret[2][2] - DeltaX)
+            Ret[4] = DeltaX
+            RelLst.append(Ret);
+
+            MaxRelWidth = max(MaxRelWidth, Ret[1].width)
+
+            yRelConnect.append( yRelBranchTop + Ret[2][4] + Ret[1].height/2 )
+            yRelBranchTop = yRelBranchTop + Ret[2][1]
+
+        yPersonBoxTop = DistY / 2       # y-Position of PersonBox relative to BranchTop
+        if len( yRelConnect ) > 0:
+            yPersonBoxTop = (max(yRelConnect) + min(yRelConnect)) / 2 - item.height/2
+
+        if self.use_timeline and Direction > 0:
+            Branch_Width = max(Branch_Width, lifespan * 11)
+        elif not self.use_timeline:
+            negWidth = 0
+            if Direction > 0:
+                DeltaX = DistX + item.width
+            else:
+                DeltaX = DistX + MaxRelWidth
+
+            Branch_Width = 0
+            if Direction > 0:
+                Branch_Width = item.width
+
+            for Ret in RelLst:
+                Branch_Width = max(Branch_Width, Ret[2][0] + DeltaX)
+                Ret[4] = DeltaX
+
+        Branch_Height = Child_Branch_Height
+        yChildBranchTop = 0
+        if yPersonBoxTop < DistY/2:
+            DeltaY = DistY/2 - yPersonBoxTop
+            yPersonBoxTop = DistY/2
+            yChildBranchTop = DeltaY
+            Branch_Height += DeltaY
+
+        Branch_Height = max(Branch_Height, yPersonBoxTop + item.height + DistY/2)
+
+        return [ person, item, (Branch_Width, Branch_Height, negWidth, Child_Branch_Height, yPersonBoxTop, yChildBranchTop), RelLst, birthyear, lifespan ]
+
 #-------------------------------------------------------------------------
 #
 # PedigreeView
@@ -394,6 +837,8 @@ class TimelinePedigreeView(NavigationView):
         self.show_unknown_peoples = self.cman.get('interface.show-unknown-people')
         
         self.format_helper = FormattingHelper(self.dbstate)
+        # Thumbnails of the people, loaded in the background
+        self.thumbnails = get_thumbnail_service()
         
         # Depth of tree.
         self._depth = 1
@@ -407,7 +852,22 @@ class TimelinePedigreeView(NavigationView):
         self.gtklayout = None
         self.gtklayout_lines = []
         self.gtklayout_boxes = []
+        # Items of the tree (see TimelineLayout), and the ones with a widget
+        self.tree_items = []
+        self.tree_index = None
+        self.tree_shown = set()
+        # Labels of the time line
+        self.tree_ticks = []
+        self._viewport_update = None
+        self._text_layout = None
+        # Person handle -> estimated birth date, see Tree_EstimateBirths
         self._birth_cache = {}
+        # Person handle -> size of the image, None if there is none, see
+        # Tree_ImageSize
+        self._image_sizes = {}
+        self._rebuild_pending = None
+        # Person whose tree has a loop, reported once
+        self._loop_person = None
 
     def on_delete(self):
         """Save the configuration settings on shutdown."""
@@ -454,6 +914,10 @@ class TimelinePedigreeView(NavigationView):
         self.gtklayout.connect("motion-notify-event", self.bg_motion_notify_event_cb)
 
         self.scrolledwindow.add(self.gtklayout)
+        for adjustment in (self.scrolledwindow.get_hadjustment(),
+                           self.scrolledwindow.get_vadjustment()):
+            adjustment.connect("value-changed", self.Tree_QueueViewport)
+            adjustment.connect("changed", self.Tree_QueueViewport)
 
         return self.scrolledwindow
 
@@ -549,6 +1013,8 @@ class TimelinePedigreeView(NavigationView):
         self.bookmarks.update_bookmarks(self.dbstate.db.get_bookmarks())
         if self.active:
             self.bookmarks.redraw()
+        self._birth_cache.clear()
+        self._image_sizes = {}
         self.build_tree()
 
     def navigation_type(self):
@@ -569,16 +1035,21 @@ class TimelinePedigreeView(NavigationView):
     def person_rebuild(self, dummy=None):
         """Callback function for signals of change database."""
         self.format_helper.clear_cache()
+        self._birth_cache.clear()
+        self._image_sizes = {}
         self.dirty = True
         self.Tree_Rebuild()
 
     def Tree_Rebuild(self):
-        """ 
+        """
         Build and draw full tree from the database with root person_handle
         Called from many fuctions, when need a full redraw of the tree.
         """
-        
+
         self.dirty = False
+        if self._rebuild_pending is not None:
+            GLib.source_remove(self._rebuild_pending)
+            self._rebuild_pending = None
 
         person = None
         if self.get_active():
@@ -587,425 +1058,318 @@ class TimelinePedigreeView(NavigationView):
                 person = self.dbstate.db.get_person_from_handle(person_handle)
         if person is None:
             return
-        
+
         layout_widget = self.gtklayout
-        
+
         generations = self.generations_in_tree       # Descendant and Ancestor generations
-        
+
         # Purge current view content
         self.gtklayout_lines = []
         self.gtklayout_boxes = []
+        self.tree_items = []
+        self.tree_index = None
+        self.tree_shown = set()
+        self.tree_ticks = []
+        self._text_layout = None
         for child in layout_widget.get_children():
             child.destroy()
-        
-        layout_widget.set_size(600, 600)        # set it to a dummy size
-        
-        # Create PersonBoxes, do calculations later needed for positioning
-        LstDescendants = self.Tree_Find_Relatives(layout_widget, person, 0, generations[0], 1)
-        LstAncestors   = self.Tree_Find_Relatives(layout_widget, person, 0, generations[1], -1, LstDescendants[1])
-        # print ("LstDescendants[0] is " + name_displayer.display(LstDescendants[0]))
-        
-        TimeLineHeight = 0
-        if self.use_timeline:
-            TimeLineHeight = 40
-        
-        ActivePersonX = 10 + max(LstAncestors[2][2], LstDescendants[2][0]) + 10
-        ActivePersonY = TimeLineHeight + max( LstAncestors[2][4], LstDescendants[2][4])
-        A_Top = ActivePersonY - LstAncestors[2][4]
-        D_Top = ActivePersonY - LstDescendants[2][4]
-        
-        RequiredHeight = max(A_Top+LstAncestors[2][1], D_Top+LstDescendants[2][1])
-        RequiredWidth  = 10 + LstAncestors[2][0] + ActivePersonX
-        
-        # The required size is known now
-        layout_widget.set_size(RequiredWidth, RequiredHeight)
-        
-        if True:    # Draw Border of the layout for debugging
-            self.gtklayout_lines.append([1,1,1, RequiredHeight-1])
-            self.gtklayout_lines.append([1,1, RequiredWidth-1, 1])
-            self.gtklayout_lines.append([RequiredWidth-1,RequiredHeight-1, RequiredWidth-1, 1])
-            self.gtklayout_lines.append([RequiredWidth-1,RequiredHeight-1, 1, RequiredHeight-1])
-        
-        # Move boxes to their desired position, draw connection lines, etc.
-        self.Tree_MoveBranchBoxes(layout_widget, LstAncestors,   ActivePersonX, A_Top, -1, 0)
-        self.Tree_MoveBranchBoxes(layout_widget, LstDescendants, ActivePersonX, D_Top, 1, 0)
-        
-        # Draw time line at top
-        # FIXME see bug #5148
-        # hardcoded gregorian calendar
-        # cal = config.get('preferences.calendar-format-report')
-        if self.use_timeline and self.Tree_EstimateBirth( LstDescendants[0]):
-            self.gtklayout_lines.append([10, 3*TimeLineHeight/4, RequiredWidth-10, 3*TimeLineHeight/4, 1])
-            Pos50 = ActivePersonX + ( self.Tree_EstimateBirth( LstDescendants[0] ).to_calendar("gregorian").get_year() - 1950 ) * 11
-            Ticks = [ [1950, Pos50] ]
-            for k in range(1,10):
-                Ticks.append( [1950 + k*50, Pos50 - k * 11 * 50] )          # 50 year - tick
-                Ticks.append( [1950 - k*50, Pos50 + k * 11 * 50] )
-                for i in range(1,9):
-                    Ticks.append( [None, Pos50 - ((k-1)*50 + i*10) * 11 ] )      # 10 year - tick
-                    Ticks.append( [None, Pos50 + ((k-1)*50 + i*10) * 11 ] )
-                
-            for Tick in Ticks:
-                if Tick[1] > 0 and Tick[1] < RequiredWidth:
-                    self.gtklayout_lines.append([Tick[1], int(5*TimeLineHeight/8), Tick[1], int(7*TimeLineHeight/8), 1])
-                    if Tick[0]:
-                        label = Gtk.Label(Tick[0])
-                        label.set_justify(Gtk.Justification.CENTER)
-                        label.show()
-                        layout_widget.put(label, int(Tick[1]-label.get_preferred_size()[0].width/2), 1*TimeLineHeight/4)
-            
-        
-        layout_widget.show_all()
-        layout_widget.queue_draw()      # widget needs redraw for connection lines
-        
-    def Tree_MoveBranchBoxes(self, layout_widget, BranchData, BoxRight, BranchTop, Direction, genDepth):
-        """ 
-            Recursively move all person boxes in a branch to its destination
-        """
-        BoxSizes = self.GetBoxSizes(genDepth)
-        DistX = BoxSizes[2]
 
-        if False:        # draw Branch-Border for debugging
-            self.gtklayout_lines.append([BoxRight, BranchTop+1, BoxRight-Direction*BranchData[2][0], BranchTop+1])
-            self.gtklayout_lines.append([BoxRight, BranchTop+BranchData[2][1]-1, BoxRight-Direction*BranchData[2][0], BranchTop+BranchData[2][1]-1])
+        # Estimate the birth dates of all shown people at once
+        self.Tree_EstimateBirths(person, generations)
 
-        # Move personbox to its required position
-        pbwSize = BranchData[1].get_preferred_size()[0]
-        
-        xBox = BoxRight - pbwSize.width
-        yBox = BranchTop + BranchData[2][4]
-        layout_widget.move(BranchData[1], int(xBox), int(yBox))
+        tree = self.Tree_Layout(person, generations)
+        if tree.loop_found and self._loop_person != person_handle:
+            ErrorDialog(_('Relationship loop detected'),
+                        _('A person was found to be his/her own ancestor.'))
+        self._loop_person = person_handle if tree.loop_found else None
+        self.Tree_Place(tree)
 
-        # Add livespan to personbox
-        if self.use_timeline and self.show_lifespan and BranchData[0] and not (Direction < 0 and genDepth == 0):
-            lifespan = BranchData[5]
-            try:
-                color = BranchData[1].bgcolor[:3] + (0.7,)
-            except AttributeError:
-                color = (211/256.0, 215/256.0, 207/256.0)[:3] + (0.7,)
-            self.gtklayout_boxes.append([xBox - lifespan * 11 + pbwSize.width, yBox, xBox + 5, yBox+pbwSize.height, color])   # +5 for overlapping with the box
-        
-        # Calculate position of connection point of this box
-        yBoxConnection = yBox + BranchData[1].get_preferred_size()[0].height/2
-        xBoxConnection = BoxRight
-        if Direction > 0:
-            xBoxConnection -= pbwSize.width
-        
-        # calculate x-position of vertical line
-        xvline = xBoxConnection - Direction * DistX/2           # default for descendants and if date of marriage not known
-        if self.use_timeline and Direction<0 and BranchData[0]:
-            family_handle = BranchData[0].get_main_parents_family_handle()
-            family = self.dbstate.db.get_family_from_handle(family_handle)
-            if family: 
-                marriagedate = self.get_date_marriage(family)
-                if marriagedate:
-                    mDate = marriagedate.get_date_object()
-                    bDate = self.Tree_EstimateBirth(BranchData[0])
-                    if bDate is not None and mDate is not None:
-                        timespan = bDate.to_calendar("gregorian").get_year() - mDate.to_calendar("gregorian").get_year()
-                        xvline = xBoxConnection - Direction * 11 * timespan
-                    
-        # Move all relatives in this branch
-        ChildBranchTop = BranchTop + BranchData[2][5]
-        yChildBoxConnection = [ yBoxConnection ]
-        for branch in BranchData[3]:
-            ChildBoxRight      = BoxRight - Direction * branch[4]
-            ChildBoxConnection = self.Tree_MoveBranchBoxes(layout_widget, branch, ChildBoxRight, ChildBranchTop, Direction, genDepth+1)
-            ChildBranchTop    += branch[2][1]
-            yChildBoxConnection.append( ChildBoxConnection[1] )
-        # Draw connection lines
-            self.gtklayout_lines.append([ xvline, ChildBoxConnection[1], ChildBoxConnection[0],ChildBoxConnection[1] ])
-        
-        if len(BranchData[3])>0:    # There are relatives, so Connection lines must be drawn
-            self.gtklayout_lines.append([ xvline, min(yChildBoxConnection), xvline, max(yChildBoxConnection) ])
-            self.gtklayout_lines.append([ xBoxConnection, yBoxConnection, xvline, yBoxConnection ])
-        
-        # Direction<0 -> Drawing ancestors: Show Marriage Info    
-        if Direction<0 and len(BranchData[3])>0 and self.show_marriage_data and BoxSizes[4] > 0:
-            text = " "
-            family_handle = None
-            if BranchData[0]:
-                family_handle = BranchData[0].get_main_parents_family_handle()
-                family = self.dbstate.db.get_family_from_handle(family_handle)
-                if family:
-                    text = self.format_helper.format_relation( family, BoxSizes[4])
-            label = Gtk.Label(text)
-            label.set_justify(Gtk.Justification.LEFT)
-            label.set_line_wrap(True)
-            label.set_alignment(0.1,0.5)
-            if family_handle:
-                label.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
-                label.add_events(Gdk.EventMask.BUTTON_RELEASE_MASK)
-                label.connect("button-press-event", self.family_button_press_cb, family_handle)
+    def Tree_Layout(self, person, generations):
+        """
+        Compute the geometry of the tree, the widgets are only created
+        for the part of the tree in the viewport
+        """
+        tree = TimelineLayout(self.dbstate.db, self.format_helper,
+                              self.Tree_TextSize, self.Tree_EstimateBirth,
+                              self.use_timeline, self.show_lifespan,
+                              self.show_marriage_data, self.show_images,
+                              self.Tree_ImageSize)
+        return tree.build(person, generations)
+
+    def Tree_Place(self, tree):
+        """
+        Show a tree laid out: lines, labels of the time line, and the
+        widgets of the items in the viewport
+        """
+        layout_widget = self.gtklayout
+        self.gtklayout_lines = tree.lines
+        self.gtklayout_boxes = tree.boxes
+        layout_widget.set_size(tree.width, tree.height)
+
+        # Labels of the time line at top
+        for Tick in tree.ticks:
+            label = Gtk.Label(Tick[0])
+            label.set_justify(Gtk.Justification.CENTER)
             label.show()
-            
-            layout_widget.put(label, xvline + 5, int(yBoxConnection-label.get_preferred_size()[0].height/2))
-        
-        return [xBoxConnection, yBoxConnection]
-        
-    def get_date_marriage(self, family):
-        for event_ref in family.get_event_ref_list():
-            event = self.dbstate.db.get_event_from_handle(event_ref.ref)
-            if event and event.get_type() == gramps.gen.lib.EventType.MARRIAGE and \
-            (event_ref.get_role() == gramps.gen.lib.EventRoleType.FAMILY or 
-            event_ref.get_role() == gramps.gen.lib.EventRoleType.PRIMARY ):
-                return event
-        return None
+            layout_widget.put(label, int(Tick[1]-label.get_preferred_size()[0].width/2), 1*tree.timeline_height/4)
+            self.tree_ticks.append(label)
 
+        self.tree_items = tree.items
+        self.tree_index = _TreeIndex(tree.items)
+        self.Tree_UpdateViewport()
 
-    def GetBoxSizes(self, genDepth):
-        BoxHeight = 50
-        BoxWidth = 120
-        DistX = 50
-        DistY = 14
-        MarriageLines = 3
-        BoxMaxLines = 5
-        
-        if genDepth > 1:
-            MarriageLines = 1
-            
-        if genDepth > 2:            
-            BoxMaxLines = 3
-        
-        if genDepth > 3:
-            BoxHeight = 10
-            BoxMaxLines = 1
-        
-        return [BoxHeight, BoxWidth, DistX, DistY, MarriageLines, BoxMaxLines]
-    
-    def Tree_Create_PersonBox( self, layout_widget, person, x, y, maxlines, Relative):
-        # Get foto
-        image = None
-        if person:
-            if maxlines>3 and self.show_images: # and i < ((len(positions)-1)/2) and  positions[i][0][3] > 1:
-                media_list = person.get_media_list()
-                if media_list:
-                    photo = media_list[0]
-                    object_handle = photo.get_reference_handle()
-                    obj = self.dbstate.db.get_object_from_handle(object_handle)
-                    if obj:
-                        mtype = obj.get_mime_type()
-                        if mtype and mtype[0:5] == "image":
-                            image = get_thumbnail_path(
-                                        media_path_full(
-                                                    self.dbstate.db,
-                                                    obj.get_path()),
-                                        rectangle=photo.get_rectangle())
+        layout_widget.show_all()
+        layout_widget.queue_draw()      # widget needs redraw for connection lines
 
-            try:
-                alive = probably_alive(person, self.dbstate.db)
-            except RuntimeError:
-                ErrorDialog(_('Relationship loop detected'),
-                            _('A person was found to be his/her own ancestor.'))
-                alive = False
+    def Tree_Relayout(self):
+        """
+        Lay the tree out again with the sizes of the images loaded since,
+        moving the widgets shown instead of creating them again
+        """
+        self._rebuild_pending = None
+        person = None
+        if self.tree_index is not None and self.get_active():
+            person = self.dbstate.db.get_person_from_handle(self.get_active())
+        if person is None:
+            return False
+        tree = self.Tree_Layout(person, self.generations_in_tree)
+        if len(tree.items) != len(self.tree_items):
+            # The items are not the same ones: the tree changed
+            self.Tree_Rebuild()
+            return False
+        # The layout visits the relatives in the same order: the items
+        # of both trees match by position
+        shown = set()
+        for old, new in zip(self.tree_items, tree.items):
+            if old.widget is not None:
+                new.widget = old.widget
+                self.gtklayout.move(new.widget, new.x, new.y)
+                shown.add(new)
+        self.tree_shown = shown
+        for label in self.tree_ticks:
+            label.destroy()
+        self.tree_ticks = []
+        self.Tree_Place(tree)
+        return False
+
+    def Tree_TextSize(self, text, markup):
+        """
+            Size in pixels of a text shown in the tree
+        """
+        if self._text_layout is None:
+            self._text_layout = self.gtklayout.create_pango_layout("")
+            self._text_layout.set_font_description(self.gtklayout.get_style().font_desc)
+        if markup:
+            self._text_layout.set_markup(text, -1)
         else:
-            alive = True
+            self._text_layout.set_text(text, -1)
+        return self._text_layout.get_pixel_size()
 
-        pbw = PersonBoxWidgetCairo( self, self.format_helper, person, alive, maxlines, image);
-        if maxlines < 7:
+    def Tree_ImageSize(self, person):
+        """
+            Size in pixels of the image of a person, known once the
+            thumbnail is loaded: until then the size of the placeholder is
+            used, and the tree is laid out again when it is loaded
+        """
+        handle = person.get_handle()
+        if handle in self._image_sizes:
+            return self._image_sizes[handle]
+        sizes = self._image_sizes
+        known, pixbuf = self.thumbnails.load(
+            self.dbstate.db, person,
+            lambda pixbuf: self.Tree_ImageLoaded(sizes, handle, pixbuf))
+        if not known:
+            return (_IMAGE_PLACEHOLDER, _IMAGE_PLACEHOLDER)
+        size = None
+        if pixbuf is not None:
+            size = (pixbuf.get_width(), pixbuf.get_height())
+        sizes[handle] = size
+        return size
+
+    def Tree_ImageLoaded(self, sizes, handle, pixbuf):
+        """
+            Keep the size of an image loaded, and lay the tree out again
+            (once for all the images loaded meanwhile, see Tree_Relayout)
+        """
+        if sizes is not self._image_sizes:
+            return      # the tree was rebuilt for another database
+        size = None
+        if pixbuf is not None:
+            size = (pixbuf.get_width(), pixbuf.get_height())
+        sizes[handle] = size
+        if size != (_IMAGE_PLACEHOLDER, _IMAGE_PLACEHOLDER) and \
+                self._rebuild_pending is None:
+            self._rebuild_pending = GLib.idle_add(self.Tree_Relayout)
+
+    def Tree_QueueViewport(self, *dummy):
+        """
+            Update the widgets of the viewport once the scrolling or the
+            resizing is done, before the redraw
+        """
+        if self._viewport_update is None:
+            self._viewport_update = GLib.idle_add(self.Tree_UpdateViewport,
+                                                  priority=GLib.PRIORITY_HIGH_IDLE)
+
+    def Tree_UpdateViewport(self):
+        """
+            Create the widgets of the tree items in the viewport (and a
+            margin around it), destroy the widgets of the items out of it
+        """
+        self._viewport_update = None
+        if self.tree_index is None:
+            return False
+        hadjustment = self.scrolledwindow.get_hadjustment()
+        vadjustment = self.scrolledwindow.get_vadjustment()
+        x = hadjustment.get_value()
+        y = vadjustment.get_value()
+        visible = self.tree_index.find(x - _VIEWPORT_MARGIN, y - _VIEWPORT_MARGIN,
+                                       x + hadjustment.get_page_size() + _VIEWPORT_MARGIN,
+                                       y + vadjustment.get_page_size() + _VIEWPORT_MARGIN)
+        for item in self.tree_shown - visible:
+            item.widget.destroy()
+            item.widget = None
+        for item in visible - self.tree_shown:
+            if item.text is None:
+                item.widget = self.Tree_Create_PersonBox(self.gtklayout, item)
+            else:
+                item.widget = self.Tree_Create_FamilyLabel(self.gtklayout, item)
+        self.tree_shown = visible
+        return False
+
+    def Tree_Create_PersonBox( self, layout_widget, item):
+        person = item.person
+        pbw = PersonBoxWidgetCairo( self, self.format_helper, person, item.alive, item.maxlines, item.image);
+        if item.maxlines < 7:
             pbw.set_tooltip_text(self.format_helper.format_person(person, 11))
 
         if person:
             pbw.connect("button-press-event", self.person_button_press_cb, person.get_handle(), None)
-        elif Relative:
-            family_handle = Relative.get_main_parents_family_handle()
+        elif item.relative:
+            family_handle = item.relative.get_main_parents_family_handle()
             if not self.dbstate.db.readonly:
                 pbw.connect("button-press-event",
                             self.missing_parent_button_press_cb,
-                            Relative.get_handle(), family_handle)
+                            item.relative.get_handle(), family_handle)
                 pbw.force_mouse_over = True
-        layout_widget.put(pbw, x, y)
+        layout_widget.put(pbw, item.x, item.y)
         pbw.show()
 
         return pbw
+
+    def Tree_Create_FamilyLabel( self, layout_widget, item):
+        label = Gtk.Label(item.text)
+        label.set_justify(Gtk.Justification.LEFT)
+        label.set_line_wrap(True)
+        label.set_alignment(0.1,0.5)
+        if item.family_handle:
+            label.add_events(Gdk.EventMask.BUTTON_PRESS_MASK)
+            label.add_events(Gdk.EventMask.BUTTON_RELEASE_MASK)
+            label.connect("button-press-event", self.family_button_press_cb, item.family_handle)
+        layout_widget.put(label, item.x, item.y)
+        label.show()
+
+        return label
+
+    def Tree_EstimateBirth(self, person):
+        """
+            Return the estimated birth date of a person, from the birth
+            cache filled by Tree_EstimateBirths
+        """
+        if not person:
+            return None
+        if person.handle not in self._birth_cache:
+            self.Tree_EstimateBirths(person, (1, 1))
+        return self._birth_cache[person.handle]
     
-    def Tree_Find_Relatives(self, layout_widget, person, genDepth, genMax, Direction, Widget = None, CalledFromPerson = None):
+    def Tree_EstimateBirths(self, person, generations):
         """ 
-            Recursively find descendants or ancestors
-            Create PersonBox-Widget
-            Calculate height of each tree branch
-            Calculate width of each tree branch
-        """
-        RelPersons = []                                 # depending on Direction find descendants / ancestors
-        if genMax-genDepth > 0 and Direction > 0:       # find descendants
-            if person:
-                family_handles = person.get_family_handle_list()
-                for family_handle in family_handles:
-                    family = self.dbstate.db.get_family_from_handle(family_handle)
-                    if family is not None:
-                        for child_ref in family.get_child_ref_list():
-                            child = self.dbstate.db.get_person_from_handle(child_ref.ref)
-                            if child is not None:
-                                RelPersons.append(child)
-
-        elif genMax-genDepth > 0 and Direction < 0:     # find ancestors
-            if person:
-                family_handle = person.get_main_parents_family_handle()
-                family = self.dbstate.db.get_family_from_handle(family_handle)
-                if family is not None:
-                    father_handle = family.get_father_handle()
-                    if father_handle is not None:
-                        RelPersons.append(self.dbstate.db.get_person_from_handle(father_handle))
-                    else:
-                        RelPersons.append(None)
-                    mother_handle = family.get_mother_handle()
-                    if mother_handle is not None:
-                        RelPersons.append(self.dbstate.db.get_person_from_handle(mother_handle))
-                    else:
-                        RelPersons.append(None) 
-                else:
-                    RelPersons.append(None)
-                    RelPersons.append(None)
-        
-        BoxSizes = self.GetBoxSizes(genDepth)
-        DistX = BoxSizes[2]
-        DistY = BoxSizes[3]
-        BoxMaxLines = BoxSizes[5]
-        
-        if Widget:
-            pbw = Widget
-        else:
-            pbw = self.Tree_Create_PersonBox( layout_widget, person, 100, 100, BoxMaxLines, CalledFromPerson)
-        
-        pbwSize = pbw.get_preferred_size()[0]
-        
-        birthyear = None
-        birthdate = self.Tree_EstimateBirth(person)
-        if birthdate:
-            birthyear = birthdate.to_calendar("gregorian").get_year()
+            Estimate the birth dates of the people shown in the tree of a
+            person, and keep them in the birth cache
             
-        # Calculate lifespan
-        lifespan = 0
-        if self.show_lifespan and person:
-            death = get_death_or_fallback(self.dbstate.db, person)
-            if death:
-                deathdate = death.get_date_object()
-                lifespan = deathdate.to_calendar("gregorian").get_year() - birthdate.to_calendar("gregorian").get_year()
-        
-        negWidth = 11 * lifespan
-        
-        Branch_Width = 0
-        if Direction > 0:
-            Branch_Width = pbwSize.width
-               
-        Child_Branch_Height = 0
-        RelLst = []
-        MaxRelWidth = 0
-        yRelBranchTop = 0
-        yRelConnect = []
-        for Relative in RelPersons:
-            Ret = self.Tree_Find_Relatives(layout_widget, Relative, genDepth+1, genMax, Direction, None, person)
-            if Ret[4] and birthyear:
-                DeltaX =  int(11 * abs( Ret[4]-birthyear ))
-            else:
-                DeltaX = 220
-            Child_Branch_Height += Ret[2][1]
-            Branch_Width  = max(Branch_Width, Ret[2][0] + DeltaX )
-            negWidth = max(negWidth, Ret[2][2] - DeltaX)
-            Ret[4] = DeltaX
-            RelLst.append(Ret);
-            
-            MaxRelWidth = max(MaxRelWidth, Ret[1].get_preferred_size()[0].width)
-            
-            yRelConnect.append( yRelBranchTop + Ret[2][4] + Ret[1].get_preferred_size()[0].height/2 )
-            yRelBranchTop = yRelBranchTop + Ret[2][1]
-
-        yPersonBoxTop = DistY / 2       # y-Position of PersonBox relative to BranchTop
-        if len( yRelConnect ) > 0:
-            yPersonBoxTop = (max(yRelConnect) + min(yRelConnect)) / 2 - pbwSize.height/2
-
-        if self.use_timeline and Direction > 0:
-            Branch_Width = max(Branch_Width, lifespan * 11)
-        elif not self.use_timeline:
-            negWidth = 0
-            if Direction > 0:
-                DeltaX = DistX + pbwSize.width
-            else:
-                DeltaX = DistX + MaxRelWidth
-            
-            Branch_Width = 0
-            if Direction > 0:
-                Branch_Width = pbwSize.width
-            
-            for Ret in RelLst:
-                Branch_Width = max(Branch_Width, Ret[2][0] + DeltaX)
-                Ret[4] = DeltaX
-                
-        Branch_Height = Child_Branch_Height
-        yChildBranchTop = 0
-        if yPersonBoxTop < DistY/2:
-            DeltaY = DistY/2 - yPersonBoxTop
-            yPersonBoxTop = DistY/2
-            yChildBranchTop = DeltaY
-            Branch_Height += DeltaY
+            The shown descendants (generations[0]) and ancestors
+            (generations[1]) are collected without recursion. The known
+            birth dates are then propagated in two passes: from the
+            children to the parents (born 25 years before their first
+            child), then from the parents to the children (born 25 years
+            after their first parent). People already estimated in the
+            cache keep their estimate; the cache is cleared when the
+            database changes.
+        """
+        db = self.dbstate.db
+        people = {person.handle: person}
+        children = defaultdict(set)         # parent handle -> child handles
+        parents = defaultdict(set)          # child handle -> parent handles
+        for Direction, genMax in ((1, generations[0]), (-1, generations[1])):
+            current = [person]
+            for genDepth in range(genMax):
+                following = []
+                for member in current:
+                    for parent, child in self.Tree_ParentLinks(member, Direction):
+                        children[parent.handle].add(child.handle)
+                        parents[child.handle].add(parent.handle)
+                        relative = child if Direction > 0 else parent
+                        if relative.handle not in people:
+                            people[relative.handle] = relative
+                            following.append(relative)
+                current = following
         
-        Branch_Height = max(Branch_Height, yPersonBoxTop + pbwSize.height + DistY/2) 
+        # Parents before children (the people of a loop in the data last)
+        pending = dict((handle, len(parents[handle])) for handle in people)
+        order = [handle for handle in people if not pending[handle]]
+        for handle in order:
+            for child in children[handle]:
+                pending[child] -= 1
+                if not pending[child]:
+                    order.append(child)
+        if len(order) < len(people):
+            placed = set(order)
+            order.extend(handle for handle in people if handle not in placed)
         
-        return [ person, pbw, (Branch_Width, Branch_Height, negWidth, Child_Branch_Height, yPersonBoxTop, yChildBranchTop), RelLst, birthyear, lifespan ]
+        cache = self._birth_cache
+        upward = {}
+        for handle in reversed(order):      # children to parents
+            birthdate = cache.get(handle)
+            if birthdate is None:
+                birth = get_birth_or_fallback(db, people[handle])
+                if birth:
+                    birthdate = birth.get_date_object()
+            if birthdate is None:
+                ChildBirthDates = [upward[child] for child in children[handle]
+                                   if upward.get(child) is not None]
+                if ChildBirthDates:
+                    birthdate = min(ChildBirthDates) - 25
+            upward[handle] = birthdate
+        for handle in order:                # parents to children
+            birthdate = upward[handle]
+            if birthdate is None:
+                ParentDates = [cache[parent] for parent in parents[handle]
+                               if cache.get(parent) is not None]
+                if ParentDates:
+                    birthdate = min(ParentDates) + 25
+            cache[handle] = birthdate
     
-    def Tree_EstimateBirth(self, person, callerHandles = []):
-        if not person:
-            # print ("Estimate Birth called with no person")
-            return None
-        
-        if person.handle in self._birth_cache:
-            return self._birth_cache[person.handle]
-        
-        callerHandleList = callerHandles[:]             # Create a copy of the list
-        callerHandleList.append(person.handle)
-        
-        birthdate = None
-        birth = get_birth_or_fallback(self.dbstate.db, person)
-        if birth:
-            birthdate = birth.get_date_object()
-        else:
-            #if len(callerHandleList) == 1:
-            #    print ("==== Birth estimate requested for " + name_displayer.display(person))
-            #print ("Estimate birthdate by looking at children of " + name_displayer.display(person))
-            ChildBirthDates = []        # Estimate birth by looking at children
-            family_handles = person.get_family_handle_list()
-            for family_handle in family_handles:
+    def Tree_ParentLinks(self, person, Direction):
+        """ 
+            Generate the (parent, child) pairs of a person and his children
+            (Direction > 0) or of his main parents and himself (Direction < 0)
+        """
+        if Direction > 0:
+            for family_handle in person.get_family_handle_list():
                 family = self.dbstate.db.get_family_from_handle(family_handle)
                 if family is not None:
                     for child_ref in family.get_child_ref_list():
                         child = self.dbstate.db.get_person_from_handle(child_ref.ref)
                         if child is not None:
-                            if child.handle not in callerHandleList:
-                                childDate = self.Tree_EstimateBirth(child, callerHandleList)
-                                if childDate is not None:
-                                    ChildBirthDates.append(childDate)
-            if len(ChildBirthDates) > 0:
-                birthdate = min( ChildBirthDates ) - 25
-            else:                   # Estimate by looking at parents if there was no success
-                #print ("Estimate birthdate by looking at parents of " + name_displayer.display(person))
-                ParentDates = []
-                family_handle = person.get_main_parents_family_handle()
-                family = self.dbstate.db.get_family_from_handle(family_handle)
-                # pdb.set_trace()
-                if family is not None:
-                    father_handle = family.get_father_handle()
-                    if father_handle is not None and father_handle not in callerHandleList:
-                        ParentDate = self.Tree_EstimateBirth(self.dbstate.db.get_person_from_handle(father_handle), callerHandleList)
-                        if ParentDate is not None:
-                            ParentDates.append( ParentDate )
-                    mother_handle = family.get_mother_handle()
-                    if mother_handle is not None and mother_handle not in callerHandleList:
-                        ParentDate = self.Tree_EstimateBirth(self.dbstate.db.get_person_from_handle(mother_handle), callerHandleList)
-                        if ParentDate is not None:
-                            ParentDates.append( ParentDate )
-                if len(ParentDates) > 0:
-                    birthdate = min( ParentDates ) + 25
-        
-        if len(callerHandleList) == 1 and birthdate is None:
-            print ("Cannot estimate birth of " + name_displayer.display(person))
-        
-        if len(callerHandleList) == 1:
-            self._birth_cache[person.handle] = birthdate
-                
-        #elif callerHandle == 0:
-        #    print ("Estimate for " + name_displayer.display(person) + " is", birthdate)
-        
-        return birthdate
+                            yield (person, child)
+        else:
+            family_handle = person.get_main_parents_family_handle()
+            family = self.dbstate.db.get_family_from_handle(family_handle)
+            if family is not None:
+                for parent_handle in (family.get_father_handle(), family.get_mother_handle()):
+                    if parent_handle is not None:
+                        parent = self.dbstate.db.get_person_from_handle(parent_handle)
+                        if parent is not None:
+                            yield (parent, person)
                     
     def gtklayout_draw(self, layout, cr):
         cr.save()
@@ -1013,14 +1377,22 @@ class TimelinePedigreeView(NavigationView):
         x = self.scrolledwindow.get_hadjustment().get_value()
         y = self.scrolledwindow.get_vadjustment().get_value()
         cr.translate(-x, -y)
+        # Only draw what is in the area to redraw
+        x0, y0, x1, y1 = cr.clip_extents()
 
         for box in self.gtklayout_boxes:
+            if (max(box[0], box[2]) < x0 or min(box[0], box[2]) > x1 or
+                    max(box[1], box[3]) < y0 or min(box[1], box[3]) > y1):
+                continue
             cr.set_source_rgba(box[4][0], box[4][1], box[4][2], box[4][3])
             cr.rectangle(int(box[0]), int(box[1]), int(box[2]-box[0]), int(box[3]-box[1]))
             cr.fill()
 
         cr.set_source_rgb(0.0, 0.0, 0.0)
         for line in self.gtklayout_lines:
+            if (max(line[0], line[2]) < x0 or min(line[0], line[2]) > x1 or
+                    max(line[1], line[3]) < y0 or min(line[1], line[3]) > y1):
+                continue
             cr.move_to(int(line[0]), int(line[1]))
             cr.line_to(int(line[2]), int(line[3]))
             cr.stroke()
@@ -0,0 +1,172 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+
+## PYTHONPATH=/PATHTO/gramps/master:../libthumbnails GRAMPS_RESOURCES=/PATHTO/gramps/master/ python layout_benchmark.py
+
+"""
+Benchmark of the layout of the timeline pedigree view, on a synthetic
+tree of 10 ancestor and 10 descendant generations (every person having
+two children).
+
+For each setting, it gives the time to compute the geometry of the tree,
+the time to index it, and the number of boxes in a viewport: these are
+the only boxes the view creates a widget for. A fixed width font is
+assumed to measure the texts.
+"""
+
+import time
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import make_database
+from gramps.gen.dbstate import DbState
+from gramps.gen.lib import (Person, Family, ChildRef, Event, EventRef,
+                            EventType, Date)
+from gramps.gen.utils.db import get_birth_or_fallback
+from gramps.gen.utils.libformatting import FormattingHelper
+
+from TimelinePedigreeView import TimelineLayout, _TreeIndex
+
+GENERATIONS = 10
+VIEWPORT = (1200, 800)
+SCROLLS = 100
+
+def add_person(db, trans, name, gender, year):
+    """Add a person, born in year (no birth event if year is None)."""
+    person = Person()
+    person.set_gender(gender)
+    person.get_primary_name().set_first_name(name)
+    if year is not None:
+        event = Event()
+        event.set_type(EventType.BIRTH)
+        event.set_date_object(Date(year))
+        db.add_event(event, trans)
+        event_ref = EventRef()
+        event_ref.set_reference_handle(event.handle)
+        person.add_event_ref(event_ref)
+        person.set_birth_ref(event_ref)
+    db.add_person(person, trans)
+    return person
+
+def add_family(db, trans, father, mother, children):
+    family = Family()
+    if father:
+        family.set_father_handle(father.handle)
+        father.add_family_handle(family.handle)
+    if mother:
+        family.set_mother_handle(mother.handle)
+        mother.add_family_handle(family.handle)
+    for child in children:
+        child_ref = ChildRef()
+        child_ref.set_reference_handle(child.handle)
+        family.add_child_ref(child_ref)
+    db.add_family(family, trans)
+    for child in children:
+        child.add_parent_family_handle(family.handle)
+    return family
+
+def build_tree(db):
+    """
+    Build the synthetic tree and return its root person. One person in
+    three has no birth date, so that the birth dates are estimated.
+    """
+    count = [0]
+    def year(base):
+        count[0] += 1
+        return None if count[0] % 3 == 0 else base
+
+    people = []
+    with DbTxn("Benchmark", db) as trans:
+        root = add_person(db, trans, "Root", Person.MALE, 1900)
+        people.append(root)
+        # Ancestors
+        current = [(root, 1900)]
+        for generation in range(GENERATIONS):
+            following = []
+            for child, born in current:
+                father = add_person(db, trans, "Father", Person.MALE, year(born - 30))
+                mother = add_person(db, trans, "Mother", Person.FEMALE, year(born - 27))
+                add_family(db, trans, father, mother, [child])
+                people.extend((father, mother))
+                following.extend(((father, born - 30), (mother, born - 27)))
+            current = following
+        # Descendants
+        current = [(root, 1900)]
+        for generation in range(GENERATIONS):
+            following = []
+            for parent, born in current:
+                children = [add_person(db, trans, "Child", gender, year(born + 25 + number))
+                            for number, gender in enumerate((Person.MALE, Person.FEMALE))]
+                add_family(db, trans, parent, None, children)
+                people.extend(children)
+                following.extend((child, born + 25) for child in children)
+            current = following
+        for person in people:
+            db.commit_person(person, trans)
+    return root
+
+def text_size(text, markup):
+    lines = text.split("\n")
+    return (7 * max(len(line) for line in lines), 15 * len(lines))
+
+def main():
+    db = make_database("inmemorydb")
+    db.load(None)
+    root = build_tree(db)
+    root = db.get_person_from_handle(root.handle)
+    dbstate = DbState()
+    dbstate.change_database(db)
+    format_helper = FormattingHelper(dbstate)
+
+    def estimate_birth(person):
+        birth = get_birth_or_fallback(db, person) if person else None
+        return birth.get_date_object() if birth else None
+
+    print("%d people" % db.get_number_of_people())
+    for use_timeline in (True, False):
+        for generations in ((GENERATIONS, 0), (0, GENERATIONS),
+                            (GENERATIONS, GENERATIONS)):
+            start = time.perf_counter()
+            tree = TimelineLayout(db, format_helper, text_size, estimate_birth,
+                                  use_timeline, True, True, False)
+            tree.build(root, generations)
+            layout_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index = _TreeIndex(tree.items)
+            index_time = time.perf_counter() - start
+
+            # Scroll the viewport over the tree, starting at the root
+            item = tree.items[0]
+            shown = 0
+            start = time.perf_counter()
+            for step in range(SCROLLS):
+                x = (item.x - VIEWPORT[0] / 2 + step * 37) % max(tree.width, 1)
+                y = (item.y - VIEWPORT[1] / 2 + step * 53) % max(tree.height, 1)
+                shown = max(shown, len(index.find(x, y, x + VIEWPORT[0],
+                                                  y + VIEWPORT[1])))
+            scroll_time = (time.perf_counter() - start) / SCROLLS
+
+            print("timeline=%-5s generations=%-8s %5d items %5d lines "
+                  "%6dx%-6d layout %.3f s, index %.3f s, "
+                  "viewport %.2f ms, at most %d items shown" %
+                  (use_timeline, generations, len(tree.items), len(tree.lines),
+                   tree.width, tree.height, layout_time, index_time,
+                   scroll_time * 1000, shown))
+
+if __name__ == "__main__":
+    main()
@@ -51,6 +51,7 @@ Additionals goals:
 """
 
 from gramps.gen.db import DbTxn
+from gramps.gen.errors import HandleError
 
 import itertools
 
@@ -69,6 +70,9 @@ def init(db):
 def update():
     #database.enable_signals()
     database.request_rebuild()
+    # init() disabled the signals that keep the indexes up to date
+    for index in indexes:
+        index.invalidate()
 
 def nth(g, n):
     """
@@ -112,6 +116,48 @@ class Null(object):
 
 NONE = Null()
 
+indexes = []
+
+class HandleIndex(object):
+    """
+    Row number (starting with 1) to handle array of a table, built with
+    one pass of its cursor on first use, and dropped when objects are
+    added or deleted. init() disables the signals, so the array is also
+    dropped when the number of objects of the table changed.
+    """
+    def __init__(self, kind, plural):
+        self.kind = kind
+        self.plural = plural
+        self.db = None
+        self.handles = None
+        indexes.append(self)
+
+    def invalidate(self, *args):
+        self.handles = None
+
+    def get_object(self, row):
+        """
+        Get the object of a row, or None.
+        """
+        if self.db is not database:
+            self.db = database
+            self.handles = None
+            for signal in ("add", "delete", "rebuild"):
+                database.connect("%s-%s" % (self.kind, signal),
+                                 self.invalidate)
+        count = getattr(database, "get_number_of_%s" % self.plural)()
+        if self.handles is None or len(self.handles) != count:
+            self.handles = list(getattr(database,
+                                        "iter_%s_handles" % self.kind)())
+        if 1 <= row <= len(self.handles):
+            try:
+                return getattr(database, "get_%s_from_handle" % self.kind)(
+                    self.handles[row - 1])
+            except HandleError:
+                # deleted since the array was built
+                self.handles = None
+        return None
+
 class Object(object):
     """
     Base delayed object that defines methods for looking objects up,
@@ -119,19 +165,25 @@ class Object(object):
     """
     query = {}
     fields = {}
+    setters = {}
+    # cursor over the objects of the table, used by all()
+    iterate = None
 
     def __init__(self, instance=None, **kwargs):
+        # values given to the constructor, and values of the fields,
+        # computed once by object
+        object.__setattr__(self, "_values", kwargs)
+        object.__setattr__(self, "_cache", {})
         self.instance = instance
-        for keyword in kwargs:
-            self.fields[keyword] = kwargs[keyword]
 
     def __getattr__(self, attr):
+        if attr in self._values:
+            return self._values[attr]
+        if attr in self._cache:
+            return self._cache[attr]
         if attr in self.fields:
-            if callable(self.fields[attr]):
-                # cache it if it is not an object
-                #self.fields[attr] = self.fields[attr](self)
-                pass
-            return self.fields[attr](self)
+            value = self._cache[attr] = self.fields[attr](self)
+            return value
         return NONE
 
     def __setattr__(self, attr, value):
@@ -140,6 +192,7 @@ class Object(object):
         elif attr in self.setters:
             if callable(self.setters[attr]):
                 self.setters[attr](self, value)
+                self._cache.clear()
             else:
                 raise Exception("setter needs to be a callable")
         else:
@@ -149,16 +202,23 @@ class Object(object):
     def get(self, **kwargs):
         for attr in kwargs:
             if attr in self.query:
-                return self(self.query[attr](kwargs[attr]))
+                try:
+                    instance = self.query[attr](kwargs[attr])
+                except HandleError:
+                    return NONE
+                if instance is None:
+                    return NONE
+                return self(instance)
         return NONE
 
     @classmethod
     def all(self):
-        if "id" in self.query:
-            count = 1
-            while True:
-                yield self(self.query["id"](count))
-                count += 1
+        """
+        Iterate over all the objects, through the cursor of the table.
+        """
+        if self.iterate is None:
+            return iter(())
+        return map(self, self.iterate())
 
 class ListOf(object):
     def __init__(self, obj, ltype, list):
@@ -216,7 +276,7 @@ class Name(Object):
         if attr == "given":
             self.instance.set_first_name(value)
         with DbTxn(_("libaccess edit name"), database, batch=batch) as trans:
-            database.commit_person(self.fields["person"], trans)
+            database.commit_person(self.person, trans)
 
     def __repr__(self):
         return "%s, %s" % (self.surname, self.given)
@@ -228,9 +288,9 @@ class Person(Object):
 
     query will be give to self(result) to create a return object.
     """
+    index = HandleIndex("person", "people")
     query = {
-        "id": lambda id: database.get_person_from_handle(
-            nth(database.iter_person_handles(), id)),
+        "id": lambda id: Person.index.get_object(id),
         "handle": lambda handle: database.get_person_from_handle(handle),
         "gramps_id": lambda gramps_id: database.get_person_from_gramps_id(gramps_id),
         }
@@ -249,8 +309,9 @@ class Person(Object):
 
     setters = {
         "handle": lambda self, value: self.setit("handle", value),
-        "gramps_id": lambda self: self.setit("gramps_id", value),
+        "gramps_id": lambda self, value: self.setit("gramps_id", value),
         }
+    iterate = staticmethod(lambda: database.iter_people())
 
     def setit(self, attr, value):
         if attr == "handle":
@@ -270,10 +331,6 @@ class Person(Object):
         else:
             return "%s, %s" % (self.name.surname, self.name.given)
 
-    @classmethod
-    def all(self):
-        return itertools.imap(Person, database.iter_people())
-
     def __get_names(self):
         if self.instance:
             name = self.__get_primary_name()
@@ -319,8 +376,9 @@ class Event(Object):
     """
     query will be give to self(result) to create a return object.
     """
+    index = HandleIndex("event", "events")
     query = {
-        "id": lambda id: nth(database.iter_event_handles(), id),
+        "id": lambda id: Event.index.get_object(id),
         "handle": lambda handle: database.get_event_from_handle(handle),
         "gramps_id": lambda gramps_id: database.get_event_from_gramps_id(gramps_id),
         }
@@ -329,10 +387,7 @@ class Event(Object):
         "date": lambda self: Date(self.instance.get_date_object()),
         "type": lambda self: str(self.instance.get_type()),
         }
-
-    @classmethod
-    def all(self):
-        return itertools.imap(Event, database.iter_events())
+    iterate = staticmethod(lambda: database.iter_events())
 
 #class Type(Object):
 #    fields = {
@@ -351,8 +406,9 @@ class Date(Object):
         return "%s/%s/%s" % (self.year, self.month, self.day)
 
 class Family(Object):
+    index = HandleIndex("family", "families")
     query = {
-        "id": lambda id: nth(database.iter_family_handles(), id),
+        "id": lambda id: Family.index.get_object(id),
         "handle": lambda handle: database.get_family_from_handle(handle),
         "gramps_id": lambda gramps_id: database.get_family_from_gramps_id(gramps_id),
         }
@@ -362,3 +418,4 @@ class Family(Object):
         "events": lambda self: ListOf(self, Event, [Event(database.get_event_from_handle(h)) 
                                                     for h in self.instance.get_event_ref_list()]),
         }
+    iterate = staticmethod(lambda: database.iter_families())
@@ -0,0 +1,16 @@
+#------------------------------------------------------------------------
+#
+# Register the Addon
+#
+#------------------------------------------------------------------------
+
+register(GENERAL,
+         id="libdescendants",
+         name="libdescendants",
+         description = _("Library for counting the descendants of people"),
+         status = STABLE,
+         version = '1.0.1',
+         gramps_target_version = "5.0",
+         fname="libdescendants.py",
+         load_on_reg = True,
+         )
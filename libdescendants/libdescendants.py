@@ -0,0 +1,291 @@
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+"""
+Descendant counting on an in-memory parent -> child graph.
+
+>>> from libdescendants import DescendantGraph
+>>> graph = DescendantGraph.from_database(db)
+>>> counts = graph.count_descendants()
+>>> counts[graph.index[person_handle]]
+42
+
+People are numbered from 0, and the children of each person are stored
+in two arrays (offsets and targets), so that the graph of a large
+database stays compact. The graph is never walked recursively:
+
+* count_descendants gives the number of distinct descendants of every
+  person, a descendant reachable along several lines (pedigree collapse)
+  being counted once. The descendants are merged as bitsets, from the
+  children to the parents, and a bitset is freed as soon as all the
+  parents have used it. When the bitsets held exceed a maximum size, the
+  remaining people are counted by walking the graph.
+
+* generations gives the distinct descendants of a person, generation by
+  generation.
+
+* inherit gives, for every person, the union of bitsets attached to the
+  person and to all his ancestors (for example the ancestral families
+  a person descends from).
+
+A person being his own ancestor (a loop in the data) is handled: the
+people of a loop are all descendants of each other.
+"""
+
+from array import array
+
+#: Default maximum size (in bytes) of the descendants bitsets held
+MAX_BYTES = 512 * 1024 * 1024
+
+try:
+    _popcount = int.bit_count
+except AttributeError:
+    def _popcount(bits):
+        return bin(bits).count("1")
+
+def _size(bits):
+    return (bits.bit_length() + 7) // 8
+
+class DescendantGraph(object):
+    """
+    Parent -> child graph of people.
+    """
+    def __init__(self, handles, edges):
+        """
+        handles: list of the person handles, the index in the list being
+                 the person number
+        edges: iterable of (parent number, child number)
+        """
+        self.handles = handles
+        self.index = dict((handle, number)
+                          for (number, handle) in enumerate(handles))
+        size = len(handles)
+        edges = sorted(set(edges))
+        self.offsets = array('l', [0] * (size + 1))
+        for (parent, child) in edges:
+            self.offsets[parent + 1] += 1
+        for number in range(size):
+            self.offsets[number + 1] += self.offsets[number]
+        self.targets = array('l', (child for (parent, child) in edges))
+
+    @classmethod
+    def from_database(cls, db):
+        """
+        Graph of all the people of the database.
+        """
+        handles = list(db.iter_person_handles())
+        index = dict((handle, number)
+                     for (number, handle) in enumerate(handles))
+        edges = []
+        for family in db.iter_families():
+            parents = [index[handle]
+                       for handle in (family.get_father_handle(),
+                                      family.get_mother_handle())
+                       if handle in index]
+            for child_ref in family.get_child_ref_list():
+                child = index.get(child_ref.ref)
+                if child is not None:
+                    edges.extend((parent, child) for parent in parents)
+        return cls(handles, edges)
+
+    @classmethod
+    def from_person(cls, db, person_handle):
+        """
+        Graph of a person (number 0) and his descendants.
+        """
+        handles = [person_handle]
+        index = {person_handle: 0}
+        edges = []
+        todo = [person_handle]
+        while todo:
+            handle = todo.pop()
+            person = db.get_person_from_handle(handle)
+            if person is None:
+                continue
+            for family_handle in person.get_family_handle_list():
+                family = db.get_family_from_handle(family_handle)
+                if family is None:
+                    continue
+                for child_ref in family.get_child_ref_list():
+                    if child_ref.ref not in index:
+                        index[child_ref.ref] = len(handles)
+                        handles.append(child_ref.ref)
+                        todo.append(child_ref.ref)
+                    edges.append((index[handle], index[child_ref.ref]))
+        return cls(handles, edges)
+
+    def children(self, number):
+        """
+        Numbers of the children of a person.
+        """
+        return self.targets[self.offsets[number]:self.offsets[number + 1]]
+
+    def generations(self, number=0):
+        """
+        Generator of the lists of the descendants of a person, generation
+        by generation. A descendant is only given in the first generation
+        he is found.
+        """
+        seen = set([number])
+        current = [number]
+        while current:
+            following = []
+            for parent in current:
+                for child in self.children(parent):
+                    if child not in seen:
+                        seen.add(child)
+                        following.append(child)
+            if following:
+                yield following
+            current = following
+
+    def inherit(self, bits):
+        """
+        Bitsets of every person, OR-ed with the bitsets of all his
+        ancestors, as a list indexed by the person number.
+
+        bits: list of the bitsets (integers) of the people, indexed by the
+              person number
+        """
+        result = list(bits)
+        for members in reversed(self.components()):
+            value = 0
+            for member in members:
+                value |= result[member]
+            for member in members:
+                result[member] = value
+                for child in self.children(member):
+                    result[child] |= value
+        return result
+
+    def components(self):
+        """
+        Strongly connected components of the graph (iterative Tarjan
+        algorithm). A component is a single person, or the people of a
+        loop. The components are given children first.
+        """
+        size = len(self.handles)
+        order = [-1] * size
+        low = [0] * size
+        on_stack = [False] * size
+        stack = []
+        components = []
+        counter = 0
+        for root in range(size):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [[root, self.offsets[root]]]
+            while work:
+                node, position = work[-1]
+                if position < self.offsets[node + 1]:
+                    work[-1][1] += 1
+                    child = self.targets[position]
+                    if order[child] == -1:
+                        order[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack[child] = True
+                        work.append([child, self.offsets[child]])
+                    elif on_stack[child]:
+                        low[node] = min(low[node], order[child])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def count_descendants(self, max_bytes=MAX_BYTES):
+        """
+        Number of distinct descendants of every person, as a list indexed
+        by the person number.
+        """
+        components = self.components()
+        component_of = [0] * len(self.handles)
+        # Bits of the members of each component in the descendants bitsets:
+        # the descendants of a component have lower bits than the component
+        masks = []
+        position = 0
+        for (number, members) in enumerate(components):
+            for member in members:
+                component_of[member] = number
+            masks.append(((1 << len(members)) - 1) << position)
+            position += len(members)
+        # Child components, and number of parent components still
+        # needing the descendants of each component
+        kids = []
+        pending = [0] * len(components)
+        for (number, members) in enumerate(components):
+            kids.append(set(component_of[child]
+                            for member in members
+                            for child in self.children(member)))
+            for kid in kids[number]:
+                if kid != number:
+                    pending[kid] += 1
+        counts = [0] * len(self.handles)
+        # Component -> bitset of the component and all its descendants,
+        # while needed by a parent component
+        reach = {}
+        held = 0
+        for (number, members) in enumerate(components):
+            cyclic = number in kids[number]
+            kids[number].discard(number)
+            if held <= max_bytes and all(kid in reach for kid in kids[number]):
+                descendants = 0
+                for kid in kids[number]:
+                    descendants |= reach[kid]
+                if cyclic:
+                    descendants |= masks[number]
+                count = _popcount(descendants) - (1 if cyclic else 0)
+                if pending[number]:
+                    reach[number] = descendants | masks[number]
+                    held += _size(reach[number])
+            else:
+                count = self._count_from(members[0])
+            for member in members:
+                counts[member] = count
+            for kid in kids[number]:
+                pending[kid] -= 1
+                if not pending[kid] and kid in reach:
+                    held -= _size(reach.pop(kid))
+        return counts
+
+    def _count_from(self, number):
+        """
+        Number of distinct descendants of a person, by walking the graph.
+        """
+        seen = set()
+        todo = [number]
+        while todo:
+            for child in self.children(todo.pop()):
+                if child not in seen:
+                    seen.add(child)
+                    todo.append(child)
+        seen.discard(number)
+        return len(seen)
@@ -0,0 +1,17 @@
+#------------------------------------------------------------------------
+#
+# Register the Addon
+#
+#------------------------------------------------------------------------
+
+register(GENERAL,
+         id="libthumbnails",
+         name="libthumbnails",
+         description = _("Library for loading the thumbnails of the people "
+                         "in the background"),
+         status = STABLE,
+         version = '1.0.0',
+         gramps_target_version = "5.0",
+         fname="libthumbnails.py",
+         load_on_reg = True,
+         )
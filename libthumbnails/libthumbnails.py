@@ -0,0 +1,155 @@
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+"""
+Thumbnails of the people, loaded in the background.
+
+>>> from libthumbnails import get_thumbnail_service
+>>> service = get_thumbnail_service()
+>>> known, pixbuf = service.load(db, person, callback)
+
+The thumbnail of the first image of a person is searched (and created
+if needed) and decoded in worker threads, so that a view is not stalled
+by slow media (network drives, etc.). The view shows a placeholder, and
+callback(pixbuf) is called from the GTK main loop when the thumbnail is
+loaded. The decoded thumbnails are kept in a cache of limited size,
+shared by all the views.
+"""
+
+#-------------------------------------------------------------------------
+#
+# Python modules
+#
+#-------------------------------------------------------------------------
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+#-------------------------------------------------------------------------
+#
+# GTK modules
+#
+#-------------------------------------------------------------------------
+from gi.repository import GLib
+from gi.repository import GdkPixbuf
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from gramps.gen.utils.file import media_path_full
+from gramps.gui.thumbnails import get_thumbnail_path, SIZE_NORMAL
+
+#: Number of worker threads loading the thumbnails
+MAX_WORKERS = 4
+#: Maximum number of thumbnails kept in the cache
+CACHE_SIZE = 500
+
+def _load_thumbnail(path, rectangle, size):
+    """
+    Get the pixbuf of a thumbnail, creating the thumbnail if needed.
+    This runs in a worker thread.
+    """
+    try:
+        thumbnail = get_thumbnail_path(path, rectangle=rectangle, size=size)
+        if thumbnail and os.path.exists(thumbnail):
+            return GdkPixbuf.Pixbuf.new_from_file(thumbnail)
+    except Exception:
+        pass
+    return None
+
+class ThumbnailService(object):
+    """
+    Load thumbnails in worker threads, and keep the pixbufs in a least
+    recently used cache, by (media handle, rectangle, size).
+    """
+    def __init__(self, max_workers=MAX_WORKERS, cache_size=CACHE_SIZE):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.cache_size = cache_size
+        # key -> (media path, pixbuf or None)
+        self.cache = OrderedDict()
+        # key -> (media path, callbacks), for the thumbnails being loaded
+        self.pending = {}
+
+    def load(self, db, person, callback=None, size=SIZE_NORMAL):
+        """
+        Get the thumbnail of the first image of a person.
+
+        Returns (True, pixbuf) if the thumbnail is known, pixbuf being None
+        if there is no thumbnail. Otherwise returns (False, None): the
+        thumbnail is loaded in the background, then callback(pixbuf) is
+        called from the GTK main loop.
+        """
+        media_list = person.get_media_list() if person else None
+        if not media_list:
+            return (True, None)
+        photo = media_list[0]
+        obj = db.get_object_from_handle(photo.get_reference_handle())
+        if not obj:
+            return (True, None)
+        mtype = obj.get_mime_type()
+        if not mtype or mtype[0:5] != "image":
+            return (True, None)
+        path = media_path_full(db, obj.get_path())
+        rectangle = photo.get_rectangle()
+        key = (obj.handle, rectangle, size)
+        if key in self.cache and self.cache[key][0] == path:
+            self.cache.move_to_end(key)
+            return (True, self.cache[key][1])
+        if key in self.pending and self.pending[key][0] == path:
+            if callback:
+                self.pending[key][1].append(callback)
+            return (False, None)
+        self.pending[key] = (path, [callback] if callback else [])
+        future = self.executor.submit(_load_thumbnail, path, rectangle, size)
+        future.add_done_callback(
+            lambda future: GLib.idle_add(self._loaded, key, path, future))
+        return (False, None)
+
+    def _loaded(self, key, path, future):
+        """
+        Keep a thumbnail loaded, and give it to the callbacks waiting for
+        it. This is called from the GTK main loop.
+        """
+        pixbuf = future.result()
+        self.cache[key] = (path, pixbuf)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        pending = self.pending.get(key)
+        if pending and pending[0] == path:
+            del self.pending[key]
+            for callback in pending[1]:
+                callback(pixbuf)
+        return False
+
+    def clear(self):
+        """
+        Forget the thumbnails loaded.
+        """
+        self.cache.clear()
+
+_SERVICE = None
+
+def get_thumbnail_service():
+    """
+    Get the thumbnail service shared by all the views.
+    """
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = ThumbnailService()
+    return _SERVICE
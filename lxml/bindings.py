@@ -0,0 +1,132 @@
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2011-2012   Jerome Rapinat
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+# $Id: $
+
+"""
+Lazy loader of the generateDS bindings of the Gramps XML schema.
+
+The bindings are generated in three variants, which only differ by the
+member specifications of the classes: a list (superclasses_list.py), a
+dict (superclasses_dict.py) or none (superclasses.py). Only the list variant
+is kept as source: the other ones are built from its code, compiled once,
+by converting or removing the member specifications.
+
+Nothing is loaded until a binding is used, e.g.:
+
+    import bindings
+    bindings.person             # loads the list variant
+    bindings.get_class('person', 'dict')
+"""
+
+#------------------------------------------------------------------------
+#
+# Python modules
+#
+#------------------------------------------------------------------------
+import sys
+import types
+import importlib.util
+
+#-------------------------------------------------------------------------
+#
+# Constants
+#
+#-------------------------------------------------------------------------
+SOURCE = 'superclasses_list'
+# Module name of each variant
+VARIANTS = {
+    'list': 'superclasses_list',
+    'dict': 'superclasses_dict',
+    'plain': 'superclasses',
+}
+DEFAULT_VARIANT = 'list'
+
+_code = None
+_modules = {}
+
+def _get_code():
+    """
+    Code of the bindings, compiled (or read from the bytecode cache) once.
+    """
+    global _code
+    if _code is None:
+        spec = importlib.util.find_spec(SOURCE)
+        _code = spec.loader.get_code(SOURCE), spec.origin
+    return _code
+
+def load_bindings(variant=DEFAULT_VARIANT):
+    """
+    Return the module of a variant of the bindings, loaded on first use.
+    """
+    module = _modules.get(variant)
+    if module is not None:
+        return module
+    name = VARIANTS[variant]
+    if variant == 'list' and name in sys.modules:
+        module = sys.modules[name]
+    else:
+        code, origin = _get_code()
+        module = types.ModuleType(name)
+        module.__file__ = origin
+        exec(code, module.__dict__)
+        for obj in list(module.__dict__.values()):
+            if not isinstance(obj, type):
+                continue
+            specs = obj.__dict__.get('member_data_items_')
+            if specs is None:
+                continue
+            if variant == 'dict':
+                obj.member_data_items_ = dict((spec.get_name(), spec)
+                                              for spec in specs)
+            elif variant == 'plain':
+                del obj.member_data_items_
+        if variant == 'list':
+            sys.modules[name] = module
+    _modules[variant] = module
+    return module
+
+def get_class(name, variant=DEFAULT_VARIANT):
+    """
+    Return the binding class of an element, or None.
+    """
+    module = load_bindings(variant)
+    cls = module.GDSClassesMapping.get(name)
+    if cls is None:
+        cls = getattr(module, name.replace('-', '_'), None)
+    return cls
+
+def __getattr__(name):
+    """
+    Resolve the names of the default variant on first use.
+    """
+    if name.startswith('__'):
+        raise AttributeError(name)
+    try:
+        value = getattr(load_bindings(), name)
+    except AttributeError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+if sys.version_info < (3, 7):
+    # No module __getattr__ (PEP 562) before Python 3.7
+    class _LazyModule(types.ModuleType):
+        def __getattr__(self, name):
+            return __getattr__(name)
+    sys.modules[__name__].__class__ = _LazyModule
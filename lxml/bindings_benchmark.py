@@ -0,0 +1,89 @@
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2011-2012   Jerome Rapinat
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+# $Id: $
+
+## python bindings_benchmark.py
+
+"""
+Benchmark of the import of the bindings: time and memory (maximum resident
+set size) added to a Python interpreter having already imported lxml, for
+the import of the lazy loader alone, and for the first use of one and of
+all the variants. Each case runs in a new interpreter.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+
+RUNS = 5
+
+CASES = [
+    ("import bindings", "import bindings"),
+    ("first use, list variant", "import bindings; bindings.database"),
+    ("first use, all variants",
+     "import bindings; [bindings.load_bindings(v) for v in bindings.VARIANTS]"),
+]
+
+MEASURE = """
+import resource, time
+from lxml import etree
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+%s
+print(time.perf_counter() - start,
+      resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)
+"""
+
+def measure(statement, env):
+    """
+    Return the best time (s) and memory (KiB) of a statement.
+    """
+    results = []
+    for run in range(RUNS):
+        output = subprocess.check_output(
+            [sys.executable, '-c', MEASURE % statement],
+            cwd=os.path.dirname(os.path.abspath(__file__)), env=env)
+        seconds, rss = output.split()
+        results.append((float(seconds), int(rss)))
+    return min(results)
+
+def main():
+    # Without bytecode cache, as for an addon installed read-only: an
+    # empty cache directory is used, and nothing is written into it
+    empty = tempfile.mkdtemp()
+    try:
+        for cache in (True, False):
+            env = dict(os.environ)
+            if cache:
+                env.pop('PYTHONDONTWRITEBYTECODE', None)
+            else:
+                env['PYTHONDONTWRITEBYTECODE'] = '1'
+                env['PYTHONPYCACHEPREFIX'] = empty
+            print("bytecode cache %s" % ("used" if cache else "not used"))
+            for name, statement in CASES:
+                seconds, rss = measure(statement, env)
+                print("  %-28s %8.1f ms %8.1f MiB" % (name, seconds * 1000,
+                                                      rss / 1024.0))
+    finally:
+        shutil.rmtree(empty)
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ id="lxml Gramplet",
 name=_("lxml Gramplet"),
 description = _("Gramplet for testing lxml and XSLT"),
 status = STABLE, # not yet tested with python 3
-version = '1.0.0',
+version = '1.0.2',
 gramps_target_version = "5.0",
 include_in_listing = False,
 height = 300,
@@ -27,9 +27,7 @@
 #------------------------------------------------------------------------
 import sys
 import os
-from shutil import copy
 from gi.repository import Gtk
-#import subprocess
 
 import logging
 
@@ -54,19 +52,6 @@ _ = _trans.gettext
 
 LOG = logging.getLogger("lxml")
 
-#-------------------------------------------------------------------------
-#
-# Try to detect the presence of gzip
-#
-#-------------------------------------------------------------------------
-try:
-    import gzip
-    GZIP_OK = True
-except:
-    GZIP_OK = False
-    ErrorDialog(_('Where is gzip?'), _('"gzip" is missing'))
-    LOG.error('No gzip')
-    
 #-------------------------------------------------------------------------
 #
 # Try to detect the presence of lxml (only for using XPATH/XSLT)
@@ -75,7 +60,7 @@ except:
 #
 #-------------------------------------------------------------------------
 try:
-    from lxml import etree, objectify
+    from lxml import etree
     LXML_OK = True
     # current code is working with:
     # LXML_VERSION (3, 3, 3)
@@ -88,6 +73,10 @@ except:
     LXML_OK = False
     ErrorDialog(_('Missing python3 lxml'), _('Please, try to install "python3 lxml" package.'))
     LOG.error('No lxml')
+
+if LXML_OK:
+    from lxmlsummary import summarize, read_doctype
+    from lxmlvalidation import ValidationService, CHECKS, TREE_CHECKS
     
 #-------------------------------------------------------------------------
 #
@@ -124,6 +113,8 @@ def epoch(t):
 
 NAMESPACE = '{http://gramps-project.org/xml/1.7.1/}'
 
+CHECK_NAMES = {'xsd': 'XSD', 'dtd': 'DTD', 'rng': 'RelaxNG'}
+
 class lxmlGramplet(Gramplet):
     """
     Gramplet for testing lxml
@@ -139,6 +130,9 @@ class lxmlGramplet(Gramplet):
         
         self.__base_path = USER_HOME
         self.__file_name = "test.gramps"
+        self.__service = None
+        self.__status = None
+        self.__xsd = None
         self.entry = Gtk.Entry()
         self.entry.set_text(os.path.join(self.__base_path, self.__file_name))
         
@@ -168,9 +162,9 @@ class lxmlGramplet(Gramplet):
         
         # button
         
-        button = Gtk.Button(_("Run"))
-        button.connect("clicked", self.run)
-        vbox.pack_start(button, False, False, 0) # v2
+        self.run_button = Gtk.Button(_("Run"))
+        self.run_button.connect("clicked", self.run)
+        vbox.pack_start(self.run_button, False, False, 0) # v2
         
         # build
         
@@ -232,230 +226,155 @@ class lxmlGramplet(Gramplet):
     def run(self, obj):
         """
         Method that is run when you click the Run button.
+        The buttons are insensitive during the run: ShowProgress handles
+        the pending events, clicks included.
         """
         
         entry = self.entry.get_text()
-        if ' ' in entry:
-            ErrorDialog(_('Space character on filename'), _('Please fix space on "%s"') % entry)
-            LOG.error('Space on filename')
-            return
         
-        self.ReadXML(entry)
+        self.run_button.set_sensitive(False)
+        self.button.set_sensitive(False)
+        try:
+            self.ReadXML(entry)
+        finally:
+            self.run_button.set_sensitive(True)
+            self.button.set_sensitive(True)
                                                        
         
     def ReadXML(self, entry):
         """
-        Read the .gramps
+        Read the .gramps, compressed or not, in one streaming pass
         """
         
-        if GZIP_OK:
-            use_gzip = 1
-            try:
-                test = gzip.open(entry, "r")
-                test.read(1)
-                test.close()
-            except IOError:
-                use_gzip = 0
-            except ValueError:
-                use_gzip = 1
-        else:
-            use_gzip = 0
-         
-        # lazy ...
-        if os.name != 'posix' and os.name != 'nt':
-            
-            # GtkTextView
-            
-            self.text.set_text(_('Sorry, no support for your OS yet!'))
-            LOG.error('Not tested under this OS')
+        if not LXML_OK:
+            LOG.error('lxml is missing')
             return
-
-        filename = os.path.join(USER_PLUGINS, 'lxml', 'test.xml')
-                
-        if LXML_OK and use_gzip == 1:
-            try:
-                os.system('gunzip < %s > %s' % (entry, filename))
-            except:
-                ErrorDialog(_('Is it a compressed .gramps?'), _('Cannot uncompress "%s"') % entry)
-                LOG.error('Cannot use gunzip command')
-                return
-            sys.stdout.write(_('From:\n "%(file1)s"\n to:\n "%(file2)s".\n') % {'file1': entry, 'file2': filename})
-        elif LXML_OK and use_gzip == 0:
-            try:
-                copy(entry, filename)
-            except:
-                ErrorDialog('Is it a .gramps ?', _('Cannot copy "%s"') % entry)
-                LOG.error('Cannot copy the file')
-                return
-            sys.stdout.write(_('From:\n "%(file1)s"\n to:\n "%(file2)s".\n') % {'file1': entry, 'file2': filename})
-        else:
-            LOG.error('lxml or gzip is missing')
-            return
-        
-        # XSD structure via lxml
-        
-        xsd = os.path.join(USER_PLUGINS, 'lxml', 'grampsxml.xsd')
-        try:
-            self.xsd(xsd, filename)
-            #pass
-        except:
-            ErrorDialog(_('XSD validation (lxml)'), _('Cannot validate "%(file)s" !') % {'file': entry})
-            LOG.debug(self.xsd(xsd, filename))
-            
-        # DTD syntax via xmllint (libxml2-utils)
         
         try:
-            self.check_valid(filename)
-        except:
-            LOG.info(_('xmllint: skip DTD validation for "%(file)s"') % {'file': entry})
-                    
-        # RNG validation via xmllint (libxml2-utils)
+            doctype = read_doctype(entry)
+        except (IOError, OSError):
+            ErrorDialog(_('File issue'), _('Cannot read "%(file)s"') % {'file': entry})
+            LOG.error('Cannot read the file')
+            return
+        except etree.XMLSyntaxError as e:
+            ErrorDialog(_('File issue'), _('Cannot parse "%(file)s" via etree') % {'file': entry})
+            LOG.debug(e.error_log.last_error)
+            return
+        current = '<!DOCTYPE database PUBLIC "-//Gramps//DTD Gramps XML 1.7.1//EN" "http://gramps-project.org/xml/1.7.1/grampsxml.dtd">'
+        if doctype != current:
+            ErrorDialog(_('Gramps version'), _('Wrong namespace\nNeed: %s') % current)
+            LOG.error('Namespace is wrong')
+            return
         
-        rng = os.path.join(USER_PLUGINS, 'lxml', 'grampsxml.rng')
+        # DTD and RelaxNG validations of the parsed tree, in a worker
+        # thread, while the summary is computed
         
+        if self.__service is None:
+            self.__service = ValidationService(os.path.join(USER_PLUGINS, 'lxml'))
+        self.__status = None
+        self.__xsd = None
         try:
-            if os.name == 'nt':
-                os.system('xmllint --relaxng %s --noout %s' % (rng, filename))
-            else:
-                os.system('xmllint --relaxng file://%s --noout %s' % (rng, filename))
-        except:
-            LOG.info(_('xmllint: skip RelaxNG validation for "%(file)s"') % {'file': entry})
-                
-        try:
-            #tree = etree.ElementTree(file=filename)
-            tree = etree.parse(filename)
-            doctype = tree.docinfo.doctype
-            current = '<!DOCTYPE database PUBLIC "-//Gramps//DTD Gramps XML 1.7.1//EN" "http://gramps-project.org/xml/1.7.1/grampsxml.dtd">'
-            if self.RNGValidation(tree, rng) == True:
-                try:
-                    self.ParseXML(tree, filename)
-                except:
-                    ErrorDialog(_('Parsing issue'), _('Cannot parse content of "%(file)s"') % {'file': filename})
-                    LOG.error('Cannot parse the content of the XML copy')
-                    return
-            elif doctype != current:
-                ErrorDialog(_('Gramps version'), _('Wrong namespace\nNeed: %s') % current)
-                LOG.error('Namespace is wrong')
-                return
-            else:
-                ErrorDialog(_('RelaxNG validation'), _('Cannot validate "%(file)s" via RelaxNG schema') % {'file': entry})
-                LOG.error('RelaxNG validation failed')
-                return
+            self.__service.start(entry)
+            
+            # XSD structure via lxml, in the pass computing the summary
+            
+            summary = summarize(entry, schema=self.__service.xsd(),
+                                progress=self.ShowProgress)
+            self.__xsd = True
+            while not self.__service.finished():
+                self.ShowProgress(summary, 0.1)
         except etree.XMLSyntaxError as e:
-            ErrorDialog(_('File issue'), _('Cannot parse "%(file)s" via etree') % {'file': entry})
-            log = e.error_log.filter_from_level(etree.ErrorLevels.FATAL)
-            LOG.debug(log)
+            self.__service.close()
             debug = e.error_log.last_error
-            LOG.debug(debug.domain_name)
-            LOG.debug(debug.type_name)
-            LOG.debug(debug.filename)
+            if debug is not None and debug.domain_name == 'SCHEMASV':
+                ErrorDialog(_('XSD validation (lxml)'), _('Cannot validate "%(file)s" !') % {'file': entry})
+            else:
+                ErrorDialog(_('File issue'), _('Cannot parse "%(file)s" via etree') % {'file': entry})
+            LOG.debug(e)
             return
-            
-        
-    def ParseXML(self, tree, filename):
-        """
-        Parse the validated .gramps
-        """
-        root = tree.getroot()
-
-        # GtkTextView ; buffer limitation ...
-
-        self.text.set_text(_('Parsing file...'))
-
-        #LOG.info(etree.tostring(root, pretty_print=True))
-
-        # namespace issues !
-
-        namespace = root.nsmap
-
-        surname_tag = etree.SubElement(root, NAMESPACE + 'surname')
-        pname_tag = etree.SubElement(root, NAMESPACE + 'pname')
+        except (IOError, OSError):
+            self.__service.close()
+            ErrorDialog(_('File issue'), _('Cannot read "%(file)s"') % {'file': entry})
+            LOG.error('Cannot read the file')
+            return
+        LOG.info(_('Matches XSD schema.'))
         
-        # variable
+        results = self.__service.results
+        for check in TREE_CHECKS:
+            valid, message = results[check]
+            if valid is None:
+                LOG.info('skip %s validation: %s' % (check, message))
+            elif not valid:
+                LOG.debug('%s: %s' % (check, message))
         
-        expr = "//*[local-name() = $name]"
-
-        # count function
-        # float and seems to also count the parent tag: name[0] !
+        # DTD syntax, only for information
         
-        count_elements = etree.XPath("count(//*[local-name() = $name])")
+        if results['dtd'][0] is False:
+            LOG.warning('DTD validation failed')
         
-        # textual children strings function
+        if results['rng'][0] is False:
+            ErrorDialog(_('RelaxNG validation'), _('Cannot validate "%(file)s" via RelaxNG schema') % {'file': entry})
+            LOG.error('RelaxNG validation failed')
+            return
         
-        desc = etree.XPath('descendant-or-self::text()')
+        filename = os.path.join(USER_PLUGINS, 'lxml', 'test.xml')
+        self.ParseXML(summary, filename)
+            
         
-        # TODO: cleanup !
-        # quick but not a nice method ...
+    def ShowProgress(self, summary, timeout=0):
+        """
+        Show the elements parsed so far, and the progress of the
+        validations
+        """
         
-        msg = []
-        #tags = []
-        places = []
-        sources = []
-        surnames = []
-        timestamp = []
-        thumbs = []
+        for stage, size in self.__service.poll(timeout):
+            if stage == 'hashing':
+                self.__status = _('hashing...')
+            elif stage == 'parsing':
+                self.__status = _('parsing... (%d MB)') % (size // 1048576)
+            else:
+                self.__status = _('validating...')
+        lines = [_('Parsing file...'),
+                 _('%(elements)d elements (%(rate)d/s)') %
+                 {'elements': summary.elements, 'rate': summary.rate()}]
+        for check in CHECKS:
+            if check == 'xsd' and self.__xsd is None:
+                status = _('validating...')
+            elif check in TREE_CHECKS and check not in self.__service.results:
+                status = self.__status or _('waiting...')
+            else:
+                status = self.ValidationStatus(check)
+            lines.append('%s: %s' % (CHECK_NAMES[check], status))
+        self.text.set_text('\n'.join(lines))
+        while Gtk.events_pending():
+            Gtk.main_iteration()
+            
         
-        LOG.info('start iteration')
+    def ValidationStatus(self, check):
+        """
+        Result of a validation, as shown
+        """
         
-        for one in root.iter():
-            
-            #(tag, item) = one.tag, one.items()
-            #print(tag, item)
+        if check == 'xsd':
+            return _('valid')
+        valid = self.__service.results[check][0]
+        if valid is None:
+            status = _('skipped')
+        elif valid:
+            status = _('valid')
+        else:
+            status = _('not valid')
+        if check in self.__service.cached:
+            status += ' ' + _('(cached)')
+        return status
             
-            for two in one.iter():
-                
-                #tags.append(two.tag)
-                                
-                msg.append(two.items())
-                
-                if two.tag == NAMESPACE + 'mediapath':
-                    mediapath = two.text
-                else:
-                    mediapath = ''
-                
-                # search ptitle and time log
-                
-                for three in two.iter():
-                                                            
-                    # timestamp
-                    if two.get('change'):
-                        timestamp.append(two.get('change'))
-                        
-                    # with namespace ...              
-                    #print(desc(three))
-                    (tag, items) = three.tag, three.items()
-
-                    if three.tag == NAMESPACE + 'pname':
-                        text = str(items)
-                        if text not in places:
-                            places.append(text) # temp display
-                    if three.tag == NAMESPACE + 'stitle' and three.text not in sources:
-                        sources.append(three.text)
-                    if three.tag == NAMESPACE + 'file' and three.items() not in thumbs:
-                        thumbs.append(three.items())
-                        
-                    # search last name
-                    
-                    for four in three.iter():
-                        
-                        # with namespace ...
-                        
-                        if four.tag == NAMESPACE + 'surname' and four.text != None:
-                            surnames.append(four.text)
-        
-        LOG.info('end of loops')
-                            
-                    
-        # All tags
-        #print(tags)
         
-        # keys, values; no textual data; 
-        # root child level items as keys for revision control ???
-        #revision = msg
+    def ParseXML(self, summary, filename):
+        """
+        Show and write the summary of the validated .gramps
+        """
         
-        #print(revision)
-                
-        log = msg[2]
+        log = summary.created
         if not log:
             ErrorDialog(_('Missing header'), _('Not a valid .gramps.\n'
                                     'Cannot run the gramplet...\n'
@@ -464,37 +383,18 @@ class lxmlGramplet(Gramplet):
             LOG.error('header missing')
             return
         
-        # dirty XML write method ...
-        # need to create a fake entry !
-        
-        if int(count_elements(root, name = 'surname')) > 1:
-            nb_surnames = int(count_elements(root, name = 'surname'))
-        else:
-            nb_surnames = surnames = [_('0')]
-            
-        if int(count_elements(root, name = 'pname')) > 1:
-            nb_pnames = int(count_elements(root, name = 'pname'))
-        else:
-            nb_pnames = places = [_('0')]
-            
-        if int(count_elements(root, name = 'note')) > 1:
-            nb_notes = int(count_elements(root, name = 'note'))
-        else:
-            nb_notes = _('0')
-            
-        if int(count_elements(root, name = 'stitle')) > 1:
-            nb_sources = int(count_elements(root, name = 'stitle'))
-        else:
-            nb_sources = _('0')
+        nb_surnames = summary.counts['surname']
+        nb_pnames = summary.counts['pname']
+        nb_notes = summary.counts['note']
+        nb_sources = summary.counts['stitle']
+        surnames = summary.surnames
+        places = summary.places
+        sources = summary.sources
             
         # time logs
         
-        timestamp.sort()
-        start = timestamp[0]
-        end = timestamp[-1]
-        timestamp = []
-        first = epoch(start)
-        last = epoch(end)
+        first = epoch(summary.first)
+        last = epoch(summary.last)
 
         header = _('File parsed with') + ' LXML' + str(LXML_VERSION) + '\n\n'
         
@@ -510,78 +410,33 @@ class lxmlGramplet(Gramplet):
         
         counters = su + p + n + so
         
+        speed = (_('%(elements)d elements parsed in %(seconds).1f s (%(rate)d elements/s)') %
+                 {'elements': summary.elements, 'seconds': summary.seconds,
+                  'rate': summary.rate()}) + '\n\n'
+        
+        validation = '\n'.join('%s: %s' % (CHECK_NAMES[check], self.ValidationStatus(check))
+                               for check in CHECKS) + '\n\n'
+        
         libs = 'LIBXML' + str(LIBXML_VERSION) + '\tLIBXSLT' + str(LIBXSLT_VERSION)
         
         # GtkTextView
         
-        self.text.set_text(header + file_info + period + counters + libs)
+        self.text.set_text(header + file_info + period + counters + speed + validation + libs)
                 
         LOG.info('### NEW FILES ###')
-        LOG.info('content parsed and copied')
+        LOG.info('content parsed')
         
         self.WriteXML(log, first, last, surnames, places, sources)
         
-        self.PrintMedia(thumbs, mediapath)
+        self.PrintMedia(summary.thumbs, summary.mediapath)
         images = os.path.join(USER_PLUGINS, 'lxml', _('Gallery.html'))
         sys.stdout.write(_('2. Has generated a media index on "%(file)s".\n') % {'file': images})
         
+        root = etree.Element(summary.root_tag, nsmap=summary.nsmap)
         self.WriteBackXML(filename, root, surnames, places, sources)
         sys.stdout.write(_('3. Has written entries into "%(file)s".\n') % {'file': filename})
         
 
-    def xsd(self, xsd, filename):
-        """
-        Look at schema, validation, conform, structure, content, etc...
-        Code for 1.7.1 and +
-        """    
-        
-        # syntax check against XSD for file format
-        
-        schema = etree.XMLSchema(file=xsd)
-        
-        parser = objectify.makeparser(schema = schema)
-        
-        tree = etree.parse(filename)
-        root = tree.getroot()
-        
-        database = objectify.fromstring(etree.tostring(root, encoding="UTF-8"), parser)
-        LOG.info(_('Matches XSD schema.'))
-        
-        #dump = objectify.dump(database)
-        #print(dump)
-
-    def check_valid(self, filename):
-        """
-        Look at schema, validation, conform, etc...
-        Code for 1.7.1 and +
-        """    
-        
-        # syntax check against DTD for file format
-        # xmllint --loaddtd --dtdvalid --valid --shell --noout ...
-        
-        dtd = os.path.join(USER_PLUGINS, 'lxml', 'grampsxml.dtd')
-        try:
-            if os.name == 'nt':
-                os.system('xmllint --dtdvalid %(dtd)s --noout --dropdtd %(file)s' % {'dtd': dtd, 'file': filename})
-            else:
-                os.system('xmllint --dtdvalid file://%(dtd)s --noout --dropdtd %(file)s' % {'dtd': dtd, 'file': filename})
-        except:
-            LOG.info(_('xmllint: skip DTD validation'))
-    
-    
-    def RNGValidation(self, tree, rng):
-        """
-        RNG Validation with ElementTree
-        """    
-        
-        # validity check against scheme for file format
-                
-        valid = etree.ElementTree(file=rng)          
-        schema = etree.RelaxNG(valid)
-                
-        return(schema.validate(tree))
-        
-                    
     def WriteXML(self, log, first, last, surnames, places, sources):
         """
         Write the result of the query for distributed, shared protocols
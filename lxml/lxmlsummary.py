@@ -0,0 +1,171 @@
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2011-2012   Jerome Rapinat
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+# $Id: $
+
+"""
+Streaming summary of a .gramps file, for the lxml gramplet.
+
+The file is read through gzip when compressed, and parsed with
+etree.iterparse: every element is cleared once it has been looked at, so
+that the memory used does not grow with the size of the file.
+"""
+
+#------------------------------------------------------------------------
+#
+# Python modules
+#
+#------------------------------------------------------------------------
+import gzip
+import time
+
+from lxml import etree
+
+#-------------------------------------------------------------------------
+#
+# Constants
+#
+#-------------------------------------------------------------------------
+NAMESPACE = '{http://gramps-project.org/xml/1.7.1/}'
+# Number of elements parsed between two calls of the progress function
+PROGRESS_STEP = 50000
+
+def open_gramps(filename):
+    """
+    Open a .gramps file for reading, uncompressed on the fly if needed.
+    """
+    with open(filename, 'rb') as gramps_file:
+        magic = gramps_file.read(2)
+    if magic == b'\x1f\x8b':
+        return gzip.open(filename, 'rb')
+    return open(filename, 'rb')
+
+def read_doctype(filename):
+    """
+    Return the document type declaration of a .gramps file, reading no
+    further than its root element.
+    """
+    with open_gramps(filename) as source:
+        for event, element in etree.iterparse(source, events=('start',)):
+            return element.getroottree().docinfo.doctype
+    return None
+
+class Summary(object):
+    """
+    What the gramplet shows of a .gramps file.
+    """
+    def __init__(self):
+        self.root_tag = None
+        self.nsmap = {}
+        self.doctype = None
+        self.created = []       # (name, value) of header/created
+        self.mediapath = ''
+        self.first = None       # oldest and newest change timestamps
+        self.last = None
+        self.surnames = []
+        self.places = []
+        self.sources = []
+        self.thumbs = []        # (name, value) of each distinct file
+        self.counts = {'surname': 0, 'pname': 0, 'note': 0, 'stitle': 0}
+        self.elements = 0
+        self.seconds = 0.0
+
+    def rate(self):
+        """
+        Number of elements parsed by second.
+        """
+        if self.seconds:
+            return self.elements / self.seconds
+        return 0.0
+
+def summarize(filename, schema=None, namespace=NAMESPACE, progress=None):
+    """
+    Parse a .gramps file in one pass, and return its Summary.
+
+    If schema (an etree.XMLSchema) is given, the file is validated in the
+    same pass, an etree.XMLSyntaxError being raised at the first error.
+    The progress function, if any, is called with the summary from time
+    to time.
+    """
+    summary = Summary()
+    places = set()
+    sources = set()
+    thumbs = set()
+    prefix = len(namespace)
+    start = time.time()
+    with open_gramps(filename) as source:
+        context = etree.iterparse(source, events=('start', 'end'),
+                                  schema=schema)
+        for event, element in context:
+            if event == 'start':
+                if summary.root_tag is None:
+                    summary.root_tag = element.tag
+                    summary.nsmap = element.nsmap
+                    summary.doctype = element.getroottree().docinfo.doctype
+                continue
+
+            summary.elements += 1
+            tag = element.tag
+            if isinstance(tag, str) and tag.startswith(namespace):
+                tag = tag[prefix:]
+
+            change = element.get('change')
+            if change:
+                change = int(change)
+                if summary.first is None or change < summary.first:
+                    summary.first = change
+                if summary.last is None or change > summary.last:
+                    summary.last = change
+
+            if tag in summary.counts:
+                summary.counts[tag] += 1
+            if tag == 'surname':
+                if element.text is not None:
+                    summary.surnames.append(element.text)
+            elif tag == 'pname':
+                text = str(element.items())
+                if text not in places:
+                    places.add(text)
+                    summary.places.append(text)
+            elif tag == 'stitle':
+                if element.text not in sources:
+                    sources.add(element.text)
+                    summary.sources.append(element.text)
+            elif tag == 'file':
+                items = tuple(element.items())
+                if items not in thumbs:
+                    thumbs.add(items)
+                    summary.thumbs.append(items)
+            elif tag == 'mediapath':
+                summary.mediapath = element.text or ''
+            elif tag == 'created':
+                summary.created = element.items()
+
+            # The element is done: free it, and its previous siblings
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+            if progress is not None and summary.elements % PROGRESS_STEP == 0:
+                summary.seconds = time.time() - start
+                progress(summary)
+        del context
+    summary.seconds = time.time() - start
+    return summary
@@ -0,0 +1,278 @@
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2011-2012   Jerome Rapinat
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+# $Id: $
+
+"""
+Validation service of the lxml gramplet.
+
+The XSD check runs in the streaming pass computing the summary (see
+lxmlsummary.summarize). The DTD and RelaxNG checks need the whole tree:
+a worker thread hashes the file, parses it once, and runs both
+validators on this one tree at the same time (lxml releases the GIL
+while it parses and validates). Their results are cached by digest of
+the file and of the schema, so that an unchanged file is not checked
+again.
+"""
+
+#------------------------------------------------------------------------
+#
+# Python modules
+#
+#------------------------------------------------------------------------
+import os
+import io
+import json
+import queue
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from lxml import etree
+
+from lxmlsummary import open_gramps
+
+#-------------------------------------------------------------------------
+#
+# Constants
+#
+#-------------------------------------------------------------------------
+# Schema file of each check
+SCHEMAS = {
+    'xsd': 'grampsxml.xsd',
+    'dtd': 'grampsxml.dtd',
+    'rng': 'grampsxml.rng',
+}
+CHECKS = ('xsd', 'dtd', 'rng')
+# Checks run by the service, on the parsed tree
+TREE_CHECKS = ('dtd', 'rng')
+CACHE_FILE = 'validation-cache.json'
+# Number of files whose results are kept in the cache
+CACHE_SIZE = 50
+# Size of the chunks in which the files are hashed and parsed
+CHUNK_SIZE = 1024 * 1024
+
+def file_digest(filename, stop=None):
+    """
+    Return the SHA-256 digest of a file, read in chunks, or None if the
+    stop event is set before the end.
+    """
+    digest = hashlib.sha256()
+    with io.open(filename, 'rb') as data:
+        for chunk in iter(lambda: data.read(CHUNK_SIZE), b''):
+            if stop is not None and stop.is_set():
+                return None
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def parse_tree(filename, progress, stop):
+    """
+    Parse a .gramps file into a tree, feeding the parser by chunks so that
+    the stop event is seen. Return None if it is set before the end.
+    """
+    parser = etree.XMLParser()
+    size = 0
+    with open_gramps(filename) as source:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+            if stop.is_set():
+                return None
+            parser.feed(chunk)
+            size += len(chunk)
+            progress.put(('parsing', size))
+    return etree.ElementTree(parser.close())
+
+def validate(check, tree, schema_file):
+    """
+    Validate a tree against a schema, in a worker thread. Return whether
+    the tree is valid, and the last error.
+    """
+    try:
+        if check == 'dtd':
+            validator = etree.DTD(schema_file)
+        else:
+            validator = etree.RelaxNG(file=schema_file)
+        if validator.validate(tree):
+            return True, ''
+        return False, str(validator.error_log.last_error)
+    except (etree.LxmlError, IOError, OSError) as err:
+        return None, str(err)
+
+#-------------------------------------------------------------------------
+#
+# Validation service
+#
+#-------------------------------------------------------------------------
+class ValidationService(object):
+    """
+    Check files against the DTD and RelaxNG schemas of Gramps XML, in a
+    worker thread.
+
+    start() starts the checks; poll() returns their progress, as (stage,
+    bytes) with stage 'hashing', 'parsing' or 'validating'; results holds
+    (valid, message) by check once finished, valid being None if the
+    check could not be run, and cached the checks found in the cache.
+    """
+    def __init__(self, schema_dir, cache_path=None):
+        self.schema_dir = schema_dir
+        self.cache_path = cache_path or os.path.join(schema_dir, CACHE_FILE)
+        self.schema_digests = dict(
+            (check, file_digest(os.path.join(schema_dir, SCHEMAS[check])))
+            for check in TREE_CHECKS)
+        self.results = {}
+        self.cached = set()
+        self.digest = None
+        self._pool = None
+        self._future = None
+        self._queue = None
+        self._stop = None
+        self._xsd = None
+
+    def xsd(self):
+        """
+        Return the XSD schema, for lxmlsummary.summarize.
+        """
+        if self._xsd is None:
+            self._xsd = etree.XMLSchema(
+                file=os.path.join(self.schema_dir, SCHEMAS['xsd']))
+        return self._xsd
+
+    def start(self, filename, checks=TREE_CHECKS):
+        """
+        Start the checks of a file.
+        """
+        self.close()
+        self.results = {}
+        self.cached = set()
+        self.digest = None
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._future = self._pool.submit(self._run, filename, checks,
+                                         self._queue, self._stop)
+
+    def _run(self, filename, checks, progress, stop):
+        """
+        Check a file, in the worker thread. Return the digest of the file,
+        the results and the checks found in the cache, or None if stopped.
+        """
+        progress.put(('hashing', None))
+        try:
+            digest = file_digest(filename, stop)
+        except (IOError, OSError) as err:
+            return None, dict((check, (None, str(err))) for check in checks), set()
+        if digest is None:
+            return None
+        entry = self._load_cache().get(digest, {})
+        results = {}
+        cached = set()
+        todo = []
+        for check in checks:
+            result = entry.get(check)
+            if result and result[2] == self.schema_digests[check]:
+                results[check] = (result[0], result[1])
+                cached.add(check)
+            else:
+                todo.append(check)
+        if not todo:
+            return digest, results, cached
+        try:
+            tree = parse_tree(filename, progress, stop)
+        except etree.XMLSyntaxError as err:
+            results.update((check, (False, str(err))) for check in todo)
+        except (etree.LxmlError, IOError, OSError) as err:
+            results.update((check, (None, str(err))) for check in todo)
+        else:
+            if tree is None:
+                return None
+            progress.put(('validating', None))
+            with ThreadPoolExecutor(max_workers=len(todo)) as pool:
+                futures = dict(
+                    (check, pool.submit(validate, check, tree, os.path.join(
+                        self.schema_dir, SCHEMAS[check])))
+                    for check in todo)
+            results.update((check, future.result())
+                           for check, future in futures.items())
+            del tree
+        if stop.is_set():
+            return None
+        self._save_cache(digest, results)
+        return digest, results, cached
+
+    def poll(self, timeout=0):
+        """
+        Return the progress reported since the last call, waiting at most
+        timeout seconds for some, and collect the results when finished.
+        """
+        events = []
+        if self._queue is not None:
+            try:
+                events.append(self._queue.get(timeout=timeout)
+                              if timeout else self._queue.get_nowait())
+                while True:
+                    events.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+        if self._future is not None and self._future.done():
+            result = self._future.result()
+            if result is not None:
+                self.digest, self.results, self.cached = result
+            self.close()
+        return events
+
+    def finished(self):
+        return self._future is None
+
+    def close(self):
+        """
+        Stop the checks in progress, and wait for the worker thread. The
+        hashing and the parsing stop at the next chunk; a validation that
+        already started cannot be interrupted, and is waited for.
+        """
+        if self._pool is not None:
+            self._stop.set()
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._future = None
+        self._queue = None
+
+    def _load_cache(self):
+        try:
+            with io.open(self.cache_path, 'r') as cache:
+                return json.load(cache)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _save_cache(self, digest, results):
+        """
+        Add the results of a file checked to the cache, forgetting the
+        oldest files. The checks that could not be run are not kept.
+        """
+        data = self._load_cache()
+        entry = data.pop(digest, {})
+        for check, (valid, message) in results.items():
+            if valid is not None:
+                entry[check] = [valid, message, self.schema_digests[check]]
+        data[digest] = entry
+        while len(data) > CACHE_SIZE:
+            del data[next(iter(data))]
+        try:
+            with io.open(self.cache_path + '.tmp', 'w') as cache:
+                cache.write(json.dumps(data))
+            os.replace(self.cache_path + '.tmp', self.cache_path)
+        except (IOError, OSError):
+            pass
@@ -7,7 +7,7 @@
 import sys
 from lxml import etree as etree_
 
-import ??? as supermod
+import bindings as supermod
 
 def parsexml_(infile, parser=None, **kwargs):
     if parser is None: